@@ -0,0 +1,166 @@
+#include <arpa/inet.h>
+#include <errno.h>
+#include <string.h>
+#include <netlink/addr.h>
+#include <netlink/cache.h>
+#include <netlink/netfilter/nfnl.h>
+#include <netlink/netfilter/ct.h>
+
+#include "logger.h"
+#include "conntrackbatch.h"
+
+using namespace std;
+using namespace swss;
+
+static bool parseAddress(const string &str, bool &has_addr, struct in_addr &addr)
+{
+    has_addr = !str.empty();
+    return !has_addr || inet_pton(AF_INET, str.c_str(), &addr) == 1;
+}
+
+static bool matchAddress(struct nl_addr *addr, const struct in_addr &expected)
+{
+    return addr && nl_addr_get_family(addr) == AF_INET && nl_addr_get_len(addr) == sizeof(expected)
+        && memcmp(nl_addr_get_binary_addr(addr), &expected, sizeof(expected)) == 0;
+}
+
+bool ConntrackBatch::update(const ConntrackFilter &filter, uint32_t timeout)
+{
+    return queue(filter, false, timeout);
+}
+
+bool ConntrackBatch::remove(const ConntrackFilter &filter)
+{
+    return queue(filter, true, 0);
+}
+
+void ConntrackBatch::begin()
+{
+    m_open = true;
+}
+
+bool ConntrackBatch::end()
+{
+    vector<Operation> ops;
+    ops.swap(m_ops);
+    m_open = false;
+
+    return ops.empty() || commit(ops);
+}
+
+bool ConntrackBatch::queue(const ConntrackFilter &filter, bool remove, uint32_t timeout)
+{
+    SWSS_LOG_ENTER();
+
+    Operation op;
+
+    memset(&op, 0, sizeof(op));
+    if (!parseAddress(filter.src, op.has_src, op.src)
+        || !parseAddress(filter.dst, op.has_dst, op.dst)
+        || !parseAddress(filter.reply_dst, op.has_reply_dst, op.reply_dst))
+    {
+        SWSS_LOG_ERROR("Invalid conntrack filter address %s, %s, %s",
+                       filter.src.c_str(), filter.dst.c_str(), filter.reply_dst.c_str());
+        return false;
+    }
+
+    op.protocol = filter.protocol;
+    op.src_port = filter.src_port;
+    op.dst_port = filter.dst_port;
+    op.remove = remove;
+    op.timeout = timeout;
+
+    if (m_open)
+    {
+        m_ops.push_back(op);
+        return true;
+    }
+
+    return commit({ op });
+}
+
+bool ConntrackBatch::commit(const vector<Operation> &ops)
+{
+    SWSS_LOG_ENTER();
+
+    struct nl_sock *sock = nl_socket_alloc();
+    if (!sock)
+    {
+        SWSS_LOG_ERROR("Failed to allocate conntrack netlink socket");
+        return false;
+    }
+
+    int err = nfnl_connect(sock);
+    if (err < 0)
+    {
+        SWSS_LOG_ERROR("Failed to connect conntrack netlink socket: %s", nl_geterror(err));
+        nl_socket_free(sock);
+        return false;
+    }
+
+    struct nl_cache *cache = nullptr;
+    err = nfnl_ct_alloc_cache(sock, &cache);
+    if (err < 0)
+    {
+        SWSS_LOG_ERROR("Failed to read the conntrack table: %s", nl_geterror(err));
+        nl_socket_free(sock);
+        return false;
+    }
+
+    bool success = true;
+    size_t updated = 0, deleted = 0;
+
+    for (struct nl_object *obj = nl_cache_get_first(cache); obj; obj = nl_cache_get_next(obj))
+    {
+        struct nfnl_ct *ct = reinterpret_cast<struct nfnl_ct *>(obj);
+
+        if (nfnl_ct_get_family(ct) != AF_INET)
+        {
+            continue;
+        }
+
+        /* Operations apply in order, as if done one after the other */
+        for (const auto &op : ops)
+        {
+            if ((op.protocol && nfnl_ct_get_proto(ct) != op.protocol)
+                || (op.has_src && !matchAddress(nfnl_ct_get_src(ct, 0), op.src))
+                || (op.has_dst && !matchAddress(nfnl_ct_get_dst(ct, 0), op.dst))
+                || (op.has_reply_dst && !matchAddress(nfnl_ct_get_dst(ct, 1), op.reply_dst))
+                || (op.src_port && nfnl_ct_get_src_port(ct, 0) != op.src_port)
+                || (op.dst_port && nfnl_ct_get_dst_port(ct, 0) != op.dst_port))
+            {
+                continue;
+            }
+
+            if (op.remove)
+            {
+                err = nfnl_ct_del(sock, ct, 0);
+            }
+            else
+            {
+                nfnl_ct_set_timeout(ct, op.timeout);
+                err = nfnl_ct_add(sock, ct, 0);
+            }
+
+            /* The entry may have expired since the table was read */
+            if (err < 0 && err != -NLE_OBJ_NOTFOUND)
+            {
+                SWSS_LOG_ERROR("Failed to %s conntrack entry: %s", op.remove ? "delete" : "update", nl_geterror(err));
+                success = false;
+            }
+
+            if (op.remove)
+            {
+                deleted++;
+                break;
+            }
+            updated++;
+        }
+    }
+
+    nl_cache_free(cache);
+    nl_socket_free(sock);
+
+    SWSS_LOG_INFO("Updated %zu and deleted %zu conntrack entries for %zu filters", updated, deleted, ops.size());
+    return success;
+}
@@ -0,0 +1,65 @@
+#ifndef __CONNTRACKBATCH__
+#define __CONNTRACKBATCH__
+
+#include <netinet/in.h>
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+namespace swss {
+
+/* IPv4 conntrack entries selected like with the filter options of conntrack -U and -D */
+struct ConntrackFilter
+{
+    uint8_t protocol = 0;       // IPPROTO_*, 0 for any protocol
+    std::string src;            // Original source address, empty for any
+    std::string dst;            // Original destination address, empty for any
+    uint16_t src_port = 0;      // Original source port, 0 for any
+    uint16_t dst_port = 0;      // Original destination port, 0 for any
+    std::string reply_dst;      // Reply destination address i.e. the translated source, empty for any
+};
+
+/*
+ * Conntrack entry updates and deletions over netfilter netlink, in place of
+ * running the conntrack tool for each of them.
+ *
+ * Every conntrack -U or -D reads the whole conntrack table. Between begin()
+ * and end(), the updates and deletions are queued and end() reads the table
+ * once for all of them, then changes the matching entries over the same
+ * socket. Outside of a batch they are done right away.
+ */
+class ConntrackBatch
+{
+public:
+    /* Set the timeout of the matching entries, in seconds */
+    bool update(const ConntrackFilter &filter, uint32_t timeout);
+    bool remove(const ConntrackFilter &filter);
+
+    /* Queue the updates and deletions done until end() */
+    void begin();
+
+    /* Apply the queued updates and deletions, returns false if any of them failed */
+    bool end();
+
+private:
+    struct Operation
+    {
+        uint8_t protocol;
+        bool has_src, has_dst, has_reply_dst;
+        struct in_addr src, dst, reply_dst;
+        uint16_t src_port, dst_port;
+        bool remove;
+        uint32_t timeout;
+    };
+
+    bool queue(const ConntrackFilter &filter, bool remove, uint32_t timeout);
+    static bool commit(const std::vector<Operation> &ops);
+
+    bool m_open = false;
+    std::vector<Operation> m_ops;
+};
+
+}
+
+#endif /* __CONNTRACKBATCH__ */
@@ -0,0 +1,160 @@
+#include <errno.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <unistd.h>
+
+#include <algorithm>
+
+#include "logger.h"
+#include "exec.h"
+#include "shellcmd.h"
+#include "iptablesbatch.h"
+
+using namespace std;
+using namespace swss;
+
+#define IPTABLES_RESTORE_FILE_TEMPLATE "/tmp/iptables-restore.XXXXXX"
+
+bool IptablesBatch::apply(const string &table, const vector<string> &rules)
+{
+    SWSS_LOG_ENTER();
+
+    if (rules.empty())
+    {
+        return true;
+    }
+
+    if (m_open)
+    {
+        m_groups.push_back({ table, rules });
+        return true;
+    }
+
+    Group group = { table, rules };
+    return restore(table, { &group });
+}
+
+void IptablesBatch::begin()
+{
+    m_open = true;
+}
+
+bool IptablesBatch::end()
+{
+    SWSS_LOG_ENTER();
+
+    vector<Group> groups;
+    groups.swap(m_groups);
+    m_open = false;
+
+    /* One iptables-restore per table, keeping the order of the groups within each of them */
+    vector<string> tables;
+    for (const auto &group : groups)
+    {
+        if (find(tables.begin(), tables.end(), group.table) == tables.end())
+        {
+            tables.push_back(group.table);
+        }
+    }
+
+    bool success = true;
+    for (const auto &table : tables)
+    {
+        vector<const Group *> batch;
+        for (const auto &group : groups)
+        {
+            if (group.table == table)
+            {
+                batch.push_back(&group);
+            }
+        }
+
+        if (restore(table, batch))
+        {
+            continue;
+        }
+
+        if (batch.size() == 1)
+        {
+            success = false;
+            continue;
+        }
+
+        /* Nothing was applied, retry the entries one by one to apply all the valid ones */
+        SWSS_LOG_WARN("Failed to apply %zu iptables %s table entries together, applying them one by one",
+                      batch.size(), table.c_str());
+
+        for (const auto *group : batch)
+        {
+            success = restore(table, { group }) && success;
+        }
+    }
+
+    return success;
+}
+
+bool IptablesBatch::restore(const string &table, const vector<const Group *> &groups)
+{
+    SWSS_LOG_ENTER();
+
+    char path[] = IPTABLES_RESTORE_FILE_TEMPLATE;
+    int fd = mkstemp(path);
+    if (fd < 0)
+    {
+        SWSS_LOG_ERROR("Failed to create iptables-restore file: %s", strerror(errno));
+        return false;
+    }
+
+    FILE *file = fdopen(fd, "w");
+    if (!file)
+    {
+        SWSS_LOG_ERROR("Failed to open iptables-restore file %s: %s", path, strerror(errno));
+        close(fd);
+        unlink(path);
+        return false;
+    }
+
+    size_t count = 0;
+    string rules = "*" + table + "\n";
+    for (const auto *group : groups)
+    {
+        for (const auto &rule : group->rules)
+        {
+            rules += rule + "\n";
+            count++;
+        }
+    }
+    rules += "COMMIT\n";
+
+    bool written = fwrite(rules.data(), 1, rules.size(), file) == rules.size();
+    if (fclose(file) != 0 || !written)
+    {
+        SWSS_LOG_ERROR("Failed to write iptables-restore file %s", path);
+        unlink(path);
+        return false;
+    }
+
+    string res;
+    const string cmd = string("") + IPTABLES_RESTORE_CMD + " --noflush < " + path + " 2>&1";
+    int ret = swss::exec(cmd, res);
+    unlink(path);
+
+    if (ret)
+    {
+        if (groups.size() == 1)
+        {
+            SWSS_LOG_ERROR("Failed to apply iptables %s table rules with rc %d: %s%s",
+                           table.c_str(), ret, rules.c_str(), res.c_str());
+        }
+        else
+        {
+            SWSS_LOG_INFO("Failed to apply %zu iptables %s table rules with rc %d: %s",
+                          count, table.c_str(), ret, res.c_str());
+        }
+        return false;
+    }
+
+    SWSS_LOG_DEBUG("Applied %zu iptables %s table rules", count, table.c_str());
+    return true;
+}
@@ -0,0 +1,51 @@
+#ifndef __IPTABLESBATCH__
+#define __IPTABLESBATCH__
+
+#include <string>
+#include <vector>
+
+namespace swss {
+
+/*
+ * iptables rules applied with iptables-restore --noflush, in place of running
+ * iptables once per rule.
+ *
+ * Rules are given as iptables arguments without the table, e.g.
+ * "-A POSTROUTING -p udp -j SNAT --to-source 1.1.1.1", grouped by the entry
+ * they belong to. The rules of a group are applied together and atomically,
+ * either all or none of them. Between begin() and end(), the groups are
+ * queued and applied by end() with one iptables-restore per table. If the
+ * kernel rejects the batch, its groups are applied one at a time so that one
+ * failing entry does not hold back the others.
+ */
+class IptablesBatch
+{
+public:
+    /*
+     * Apply the rules of one entry, or queue them if a batch is open.
+     * Returns false if they were applied and failed.
+     */
+    bool apply(const std::string &table, const std::vector<std::string> &rules);
+
+    /* Queue the rules applied until end() */
+    void begin();
+
+    /* Apply the queued rules, returns false if any of them failed */
+    bool end();
+
+private:
+    struct Group
+    {
+        std::string table;
+        std::vector<std::string> rules;
+    };
+
+    static bool restore(const std::string &table, const std::vector<const Group *> &groups);
+
+    bool m_open = false;
+    std::vector<Group> m_groups;
+};
+
+}
+
+#endif /* __IPTABLESBATCH__ */
@@ -279,6 +279,24 @@ void NatMgr::cleanupMangleIpTables(void)
     }
 }
 
+/* This is ideally called on docker stop, removing all the NAT iptables rules at once */
+void NatMgr::cleanupIptables(void)
+{
+    SWSS_LOG_INFO("Cleaning the NAT IpTables");
+
+    m_iptables.begin();
+
+    removeStaticNatIptables();
+    removeStaticNaptIptables();
+    removeDynamicNatRules();
+    cleanupMangleIpTables();
+
+    if (!m_iptables.end())
+    {
+        SWSS_LOG_ERROR("Failed to remove some of the NAT iptables rules");
+    }
+}
+
 /* To Add/Delete NAPT pool ip table to APPL_DB */
 void NatMgr::setNaptPoolIpTable(const string &opCmd, const string &ip_range, const string &port_range)
 {
@@ -369,19 +387,31 @@ void NatMgr::flushAllNatEntries(void)
     }
 }
 
+/* IPPROTO_* value of a NAPT protocol for the conntrack filters */
+static uint8_t getConntrackProtocol(const string &prototype)
+{
+    if (prototype == IP_PROTOCOL_TCP)
+    {
+        return IPPROTO_TCP;
+    }
+    else if (prototype == IP_PROTOCOL_UDP)
+    {
+        return IPPROTO_UDP;
+    }
+    return 0;
+}
+
 /* To Update a conntrack entry for the Dynamic Single NAT entry in the kernel */
 void NatMgr::updateDynamicSingleNatConnTrackTimeout(string key, int timeout)
 {
-    std::string res;
-    std::string cmds = std::string("") + CONNTRACK_CMD;
-    IpAddress   ip_address = IpAddress(key);
+    ConntrackFilter filter;
+    IpAddress       ip_address = IpAddress(key);
 
-    cmds += (" -U -s " + ip_address.to_string() + " -t " + to_string(timeout) + REDIRECT_TO_DEV_NULL);
-    int ret = swss::exec(cmds, res);
+    filter.src = ip_address.to_string();
 
-    if (ret)
+    if (!m_conntrack.update(filter, timeout))
     {
-        SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
+        SWSS_LOG_ERROR("Failed to update the active NAT conntrack entry with src-ip %s", ip_address.to_string().c_str());
     }
     else
     {
@@ -393,19 +423,20 @@ void NatMgr::updateDynamicSingleNatConnTrackTimeout(string key, int timeout)
 /* To Update a conntrack entry for the Dynamic Single NAPT entry in the kernel */
 void NatMgr::updateDynamicSingleNaptConnTrackTimeout(string key, int timeout)
 {
-    std::string     res;
+    ConntrackFilter filter;
     vector<string>  keys = tokenize(key, ':');
     IpAddress       ip_address = IpAddress(keys[1]);
     int             l4_port = stoi(keys[2]);
     string          prototype = ((keys[0] == string("TCP")) ? "tcp" : "udp");
-    std::string     cmds = std::string("") + CONNTRACK_CMD;
-    
-    cmds += (" -U -s " + ip_address.to_string() + " -p " + prototype + " --orig-port-src " + to_string(l4_port) + " -t " + to_string(timeout) + REDIRECT_TO_DEV_NULL);
-    int ret = swss::exec(cmds, res);
 
-    if (ret)
+    filter.protocol = getConntrackProtocol(prototype);
+    filter.src = ip_address.to_string();
+    filter.src_port = static_cast<uint16_t>(l4_port);
+
+    if (!m_conntrack.update(filter, timeout))
     {
-        SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
+        SWSS_LOG_ERROR("Failed to update active NAPT conntrack entry with protocol %s, src-ip %s, src-port %d",
+                       prototype.c_str(), ip_address.to_string().c_str(), l4_port);
     }
     else
     {
@@ -417,15 +448,15 @@ void NatMgr::updateDynamicSingleNaptConnTrackTimeout(string key, int timeout)
 /* To Update a conntrack entry for the Dynamic Twice NAT entry in the kernel */
 void NatMgr::updateDynamicTwiceNatConnTrackTimeout(string key, int timeout)
 {
-    std::string     res;
-    std::string     cmd = std::string("") + CONNTRACK_CMD;
+    ConntrackFilter filter;
     vector<string>  keys = tokenize(key, ':');
     IpAddress       src_ip = IpAddress(keys[1]);
     IpAddress       dst_ip = IpAddress(keys[1]);
 
-    cmd += (" -U -s " + src_ip.to_string() + " -d " + dst_ip.to_string() + " -t " + std::to_string(timeout) + REDIRECT_TO_DEV_NULL);
+    filter.src = src_ip.to_string();
+    filter.dst = dst_ip.to_string();
 
-    swss::exec(cmd, res);
+    m_conntrack.update(filter, timeout);
 
     SWSS_LOG_INFO("Updated active Twice NAT conntrack entry with src-ip %s, dst-ip %s, timeout %u",
                   src_ip.to_string().c_str(), dst_ip.to_string().c_str(), timeout);
@@ -434,8 +465,7 @@ void NatMgr::updateDynamicTwiceNatConnTrackTimeout(string key, int timeout)
 /* To Update a conntrack entry for the Dynamic Twice NAPT entry in the kernel */
 void NatMgr::updateDynamicTwiceNaptConnTrackTimeout(string key, int timeout)
 {
-    std::string     res;
-    std::string     cmd = std::string("") + CONNTRACK_CMD;
+    ConntrackFilter filter;
     vector<string>  keys = tokenize(key, ':');
     IpAddress       src_ip      = IpAddress(keys[1]);
     int             src_l4_port = stoi(keys[2]);
@@ -443,11 +473,13 @@ void NatMgr::updateDynamicTwiceNaptConnTrackTimeout(string key, int timeout)
     int             dst_l4_port = stoi(keys[4]);
     string          prototype = ((keys[0] == string("TCP")) ? "tcp" : "udp");
 
-    cmd += (" -U -s " + src_ip.to_string() + " -p " + prototype + " --orig-port-src " + to_string(src_l4_port) +
-            " -d " + dst_ip.to_string() + " --orig-port-dst " + std::to_string(dst_l4_port) +
-            " -t " + std::to_string(timeout) + REDIRECT_TO_DEV_NULL);
+    filter.protocol = getConntrackProtocol(prototype);
+    filter.src = src_ip.to_string();
+    filter.src_port = static_cast<uint16_t>(src_l4_port);
+    filter.dst = dst_ip.to_string();
+    filter.dst_port = static_cast<uint16_t>(dst_l4_port);
 
-    swss::exec(cmd, res);
+    m_conntrack.update(filter, timeout);
 
     SWSS_LOG_INFO("Updated active Twice NAPT conntrack entry with protocol %s, src-ip %s, src-port %d, dst-ip %s, dst-port %d, timeout %u",
                   prototype.c_str(), src_ip.to_string().c_str(), src_l4_port, dst_ip.to_string().c_str(), dst_l4_port, timeout);
@@ -605,46 +637,51 @@ void NatMgr::addConntrackStaticTwiceNaptEntry(const string &snatKey, const strin
 /* To Update a dummy conntrack entry for the Static Single NAT entry in the kernel */
 void NatMgr::updateConntrackStaticSingleNatEntry(const string &key)
 {
-    std::string res, cmds = std::string("") + CONNTRACK_CMD;
+    ConntrackFilter filter;
     int timeout = NAT_TIMEOUT_MAX;
 
+    filter.protocol = IPPROTO_UDP;
+
     if (m_staticNatEntry[key].nat_type == DNAT_NAT_TYPE)
     {
         SWSS_LOG_INFO("Update static NAT conntrack entry with src-ip %s, timeout %d",
                       m_staticNatEntry[key].local_ip.c_str(), timeout);
 
-        cmds += (" -U --src " + m_staticNatEntry[key].local_ip + " -p udp -t " + to_string(timeout) + REDIRECT_TO_DEV_NULL);
+        filter.src = m_staticNatEntry[key].local_ip;
     }
     else if (m_staticNatEntry[key].nat_type == SNAT_NAT_TYPE)
     {
         SWSS_LOG_INFO("Update static NAT conntrack entry with src-ip %s, timeout %d",
                       key.c_str(), timeout);
 
-        cmds += (" -U --src " + key + " -p udp -t " + to_string(timeout) + REDIRECT_TO_DEV_NULL);
+        filter.src = key;
     }
 
-    swss::exec(cmds, res);
+    m_conntrack.update(filter, timeout);
 }
 
 /* To Update a dummy conntrack entry for the Static Twice NAT entry in the kernel */
 void NatMgr::updateConntrackStaticTwiceNatEntry(const string &snatKey, const string &dnatKey)
 {
-    std::string res, cmds = std::string("") + CONNTRACK_CMD;
+    ConntrackFilter filter;
     int timeout = NAT_TIMEOUT_MAX;
 
     SWSS_LOG_INFO("Update static Twice NAT conntrack entry with src-ip %s, dst-ip %s, timeout %u",
                   snatKey.c_str(), dnatKey.c_str(), timeout);
-   
-    cmds += (" -U --src " + snatKey + " -p udp -t " + to_string(timeout) + " --dst " + dnatKey + REDIRECT_TO_DEV_NULL);
 
-    swss::exec(cmds, res);
+    filter.protocol = IPPROTO_UDP;
+    filter.src = snatKey;
+    filter.dst = dnatKey;
+
+    m_conntrack.update(filter, timeout);
 }
 
 /* To update a dummy conntrack entry for the Static NAPT entry in the kernel */
 void NatMgr::updateConntrackStaticSingleNaptEntry(const string &key)
 {
     int timeout = NAT_TIMEOUT_MAX;
-    std::string res, prototype, cmds = std::string("") + CONNTRACK_CMD;
+    ConntrackFilter filter;
+    std::string prototype;
     vector<string> keys = tokenize(key, config_db_key_delimiter);
 
     if (keys[1] == to_upper(IP_PROTOCOL_UDP))
@@ -656,31 +693,35 @@ void NatMgr::updateConntrackStaticSingleNaptEntry(const string &key)
         prototype = IP_PROTOCOL_TCP;
     }
 
+    filter.protocol = getConntrackProtocol(prototype);
+
     if (m_staticNaptEntry[key].nat_type == DNAT_NAT_TYPE)
     {
 
         SWSS_LOG_INFO("Update static NAPT conntrack entry with protocol %s, src-ip %s, src-port %s, timeout %d",
                       prototype.c_str(), m_staticNaptEntry[key].local_ip.c_str(), m_staticNaptEntry[key].local_port.c_str(), timeout);
  
-        cmds += (" -U --src " + m_staticNaptEntry[key].local_ip + " -p " + prototype + " --sport " + m_staticNaptEntry[key].local_port + " -t " 
-                 + to_string(timeout) + REDIRECT_TO_DEV_NULL);
+        filter.src = m_staticNaptEntry[key].local_ip;
+        filter.src_port = static_cast<uint16_t>(stoi(m_staticNaptEntry[key].local_port));
     }
     else if (m_staticNaptEntry[key].nat_type == SNAT_NAT_TYPE)
     {
         SWSS_LOG_INFO("Update static NAPT conntrack entry with protocol %s, src-ip %s, src-port %s, timeout %d",
                       prototype.c_str(), keys[0].c_str(), keys[2].c_str(), timeout);
 
-        cmds += (" -U --src " + keys[0] + " -p " + prototype + " --sport " + keys[2] + " -t " + to_string(timeout) + REDIRECT_TO_DEV_NULL);
+        filter.src = keys[0];
+        filter.src_port = static_cast<uint16_t>(stoi(keys[2]));
     }
 
-    swss::exec(cmds, res);
+    m_conntrack.update(filter, timeout);
 }
 
 /* To Update a dummy conntrack entry for the Static Twice NAPT entry in the kernel */
 void NatMgr::updateConntrackStaticTwiceNaptEntry(const string &snatKey, const string &dnatKey)
 {
     int timeout = NAT_TIMEOUT_MAX;
-    std::string res, prototype, cmds = std::string("") + CONNTRACK_CMD;
+    ConntrackFilter filter;
+    std::string prototype;
     vector<string> snatKeys = tokenize(snatKey, config_db_key_delimiter);
     vector<string> dnatKeys = tokenize(dnatKey, config_db_key_delimiter);
 
@@ -696,35 +737,38 @@ void NatMgr::updateConntrackStaticTwiceNaptEntry(const string &snatKey, const st
     SWSS_LOG_DEBUG("Update static Twice NAPT conntrack entry with protocol %s, src-ip %s, src-port %s, dst-ip %s, dst-port %s, timeout %u",
                    prototype.c_str(), snatKeys[0].c_str(), snatKeys[2].c_str(), dnatKeys[0].c_str(), dnatKeys[2].c_str(), timeout);
 
-    cmds += (" -U --src " + snatKeys[0] + " --dst " + dnatKeys[0] + " -p udp " + " --sport " + snatKeys[2] + " --dport " + dnatKeys[2]
-             + " -p udp -t " + to_string(timeout) + REDIRECT_TO_DEV_NULL);
+    filter.protocol = IPPROTO_UDP;
+    filter.src = snatKeys[0];
+    filter.dst = dnatKeys[0];
+    filter.src_port = static_cast<uint16_t>(stoi(snatKeys[2]));
+    filter.dst_port = static_cast<uint16_t>(stoi(dnatKeys[2]));
 
-    swss::exec(cmds, res);
+    m_conntrack.update(filter, timeout);
 }
 
 /* To Delete conntrack entry for Static Single NAT entry */
 void NatMgr::deleteConntrackStaticSingleNatEntry(const string &key)
 {
-    std::string res, cmds = std::string("") + CONNTRACK_CMD;
+    ConntrackFilter filter;
+
+    filter.protocol = IPPROTO_UDP;
 
     if (m_staticNatEntry[key].nat_type == DNAT_NAT_TYPE)
     {
         SWSS_LOG_INFO("Delete static NAT conntrack entry with src-ip %s", m_staticNatEntry[key].local_ip.c_str());
 
-        cmds += (" -D -s " + m_staticNatEntry[key].local_ip + " -p udp" + REDIRECT_TO_DEV_NULL);
+        filter.src = m_staticNatEntry[key].local_ip;
     }
     else if (m_staticNatEntry[key].nat_type == SNAT_NAT_TYPE)
     {
         SWSS_LOG_INFO("Delete static NAT conntrack entry with src-ip %s", key.c_str());
 
-        cmds += (" -D -s " + key + " -p udp" + REDIRECT_TO_DEV_NULL);
+        filter.src = key;
     }
 
-    int ret = swss::exec(cmds, res);
-
-    if (ret)
+    if (!m_conntrack.remove(filter))
     {
-        SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
+        SWSS_LOG_ERROR("Failed to delete the Static NAT conntrack entry");
     }
     else
     {
@@ -735,17 +779,16 @@ void NatMgr::deleteConntrackStaticSingleNatEntry(const string &key)
 /* To Delete conntrack entry for Static Twice NAT entry */
 void NatMgr::deleteConntrackStaticTwiceNatEntry(const string &snatKey, const string &dnatKey)
 {
-    std::string res, cmds = std::string("") + CONNTRACK_CMD;
+    ConntrackFilter filter;
 
     SWSS_LOG_INFO("Delete static Twice NAT conntrack entry with src-ip %s and dst-ip %s", snatKey.c_str(), dnatKey.c_str());
 
-    cmds += (" -D -s " + snatKey + " -d " + dnatKey + REDIRECT_TO_DEV_NULL);
+    filter.src = snatKey;
+    filter.dst = dnatKey;
 
-    int ret = swss::exec(cmds, res);
-
-    if (ret)
+    if (!m_conntrack.remove(filter))
     {
-        SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
+        SWSS_LOG_ERROR("Failed to delete the Static Twice NAT conntrack entry");
     }
     else
     {
@@ -756,7 +799,8 @@ void NatMgr::deleteConntrackStaticTwiceNatEntry(const string &snatKey, const str
 /* To Delete conntrack entry for Static Single NAPT entry */
 void NatMgr::deleteConntrackStaticSingleNaptEntry(const string &key)
 {
-    std::string res, prototype, cmds = std::string("") + CONNTRACK_CMD;
+    ConntrackFilter filter;
+    std::string prototype;
     vector<string> keys = tokenize(key, config_db_key_delimiter);
 
     if (keys[1] == to_upper(IP_PROTOCOL_UDP))
@@ -768,26 +812,28 @@ void NatMgr::deleteConntrackStaticSingleNaptEntry(const string &key)
         prototype = IP_PROTOCOL_TCP;
     }
 
+    filter.protocol = getConntrackProtocol(prototype);
+
     if (m_staticNaptEntry[key].nat_type == DNAT_NAT_TYPE)
     {
         SWSS_LOG_INFO("Delete static NAPT conntrack entry with protocol %s, src-ip %s, src-port %s",
                       prototype.c_str(), m_staticNaptEntry[key].local_ip.c_str(), m_staticNaptEntry[key].local_port.c_str());
 
-        cmds += (" -D -s " + m_staticNaptEntry[key].local_ip + " -p " + prototype + " --sport " + m_staticNaptEntry[key].local_port + REDIRECT_TO_DEV_NULL);
+        filter.src = m_staticNaptEntry[key].local_ip;
+        filter.src_port = static_cast<uint16_t>(stoi(m_staticNaptEntry[key].local_port));
     }
     else if (m_staticNaptEntry[key].nat_type == SNAT_NAT_TYPE)
     {
         SWSS_LOG_INFO("Delete static NAPT conntrack entry with protocol %s, src-ip %s, src-port %s",
                       prototype.c_str(), keys[0].c_str(), keys[2].c_str());
 
-        cmds += (" -D -s " + keys[0] + " -p " + prototype + " --sport " + keys[2] + REDIRECT_TO_DEV_NULL);
+        filter.src = keys[0];
+        filter.src_port = static_cast<uint16_t>(stoi(keys[2]));
     }
 
-    int ret = swss::exec(cmds, res);
-
-    if (ret)
+    if (!m_conntrack.remove(filter))
     {
-        SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
+        SWSS_LOG_ERROR("Failed to delete the Static NAPT conntrack entry");
     }
     else
     {
@@ -798,7 +844,8 @@ void NatMgr::deleteConntrackStaticSingleNaptEntry(const string &key)
 /* To Delete conntrack entry for Static Twice NAPT entry */
 void NatMgr::deleteConntrackStaticTwiceNaptEntry(const string &snatKey, const string &dnatKey)
 {
-    std::string res, prototype, cmds = std::string("") + CONNTRACK_CMD;
+    ConntrackFilter filter;
+    std::string prototype;
     vector<string> snatKeys = tokenize(snatKey, config_db_key_delimiter);
     vector<string> dnatKeys = tokenize(dnatKey, config_db_key_delimiter);
 
@@ -814,13 +861,15 @@ void NatMgr::deleteConntrackStaticTwiceNaptEntry(const string &snatKey, const st
     SWSS_LOG_INFO("Delete static Twice NAPT conntrack entry with protocol %s, src-ip %s, src-port %s, dst-ip %s, dst-port %s",
                   prototype.c_str(), snatKeys[0].c_str(), snatKeys[2].c_str(), dnatKeys[0].c_str(), dnatKeys[2].c_str());
 
-    cmds += (" -D -s " + snatKeys[0] + " -p " + prototype + " --orig-port-src " + snatKeys[2] + " -d " + dnatKeys[0] + " --orig-port-dst " + dnatKeys[2] + REDIRECT_TO_DEV_NULL);
-
-    int ret = swss::exec(cmds, res);
+    filter.protocol = getConntrackProtocol(prototype);
+    filter.src = snatKeys[0];
+    filter.src_port = static_cast<uint16_t>(stoi(snatKeys[2]));
+    filter.dst = dnatKeys[0];
+    filter.dst_port = static_cast<uint16_t>(stoi(dnatKeys[2]));
 
-    if (ret)
+    if (!m_conntrack.remove(filter))
     {
-        SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
+        SWSS_LOG_ERROR("Failed to delete the Static Twice NAPT conntrack entry");
     }
     else
     {
@@ -831,8 +880,6 @@ void NatMgr::deleteConntrackStaticTwiceNaptEntry(const string &snatKey, const st
 /* To Delete conntrack entries for matching Pool ip address */
 void NatMgr::deleteConntrackDynamicEntries(const string &ip_range)
 {
-    std::string res, cmds;
-
     uint32_t ipv4_addr_low, ipv4_addr_high, ip, setIp;
     char ipAddr[INET_ADDRSTRLEN];
 
@@ -858,26 +905,28 @@ void NatMgr::deleteConntrackDynamicEntries(const string &ip_range)
         ipv4_addr_low = ntohl(ipv4_addr_low);
     }
 
+    /* The conntrack table is read once for the whole pool */
+    m_conntrack.begin();
+
     for (ip = ipv4_addr_low; ip <= ipv4_addr_high; ip++)
     {
         setIp = htonl(ip);
         inet_ntop(AF_INET, &setIp, ipAddr, INET_ADDRSTRLEN);
-        std::string ipAddrString(ipAddr);
 
         SWSS_LOG_INFO("Delete dynamic conntrack entry with translated-src-ip %s", ipAddr);
 
-        cmds = (std::string("") + CONNTRACK_CMD + " -D -q " + ipAddrString + REDIRECT_TO_DEV_NULL);
-
-        int ret = swss::exec(cmds, res);
+        ConntrackFilter filter;
+        filter.reply_dst = ipAddr;
+        m_conntrack.remove(filter);
+    }
 
-        if (ret)
-        {
-            SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
-        }
-        else
-        {
-            SWSS_LOG_INFO("Deleted the dynamic conntrack entry");
-        }
+    if (!m_conntrack.end())
+    {
+        SWSS_LOG_ERROR("Failed to delete the dynamic conntrack entries of NAT pool %s", ip_range.c_str());
+    }
+    else
+    {
+        SWSS_LOG_INFO("Deleted the dynamic conntrack entries");
     }
 }
 
@@ -899,8 +948,6 @@ bool NatMgr::setMangleIptablesRules(const string &opCmd, const string &interface
      * iptables -t mangle -opCmd PREROUTING -i port -j MARK --set-mark nat_zone
      * iptables -t mangle -opCmd POSTROUTING -o port -j MARK --set-mark nat_zone
      */
-    std::string res;
-    int ret;
 
     if (nat_zone.empty())
     {
@@ -908,15 +955,13 @@ bool NatMgr::setMangleIptablesRules(const string &opCmd, const string &interface
         return false;
     }
 
-    const std::string cmds = std::string("")
-          + IPTABLES_CMD + " -t mangle " + "-" + opCmd + " PREROUTING -i " + interface + " -j MARK --set-mark " + nat_zone + " && "
-          + IPTABLES_CMD + " -t mangle " + "-" + opCmd + " POSTROUTING -o " + interface + " -j MARK --set-mark " + nat_zone ;
-
-    ret = swss::exec(cmds, res);
+    const vector<string> rules = {
+          "-" + opCmd + " PREROUTING -i " + interface + " -j MARK --set-mark " + nat_zone,
+          "-" + opCmd + " POSTROUTING -o " + interface + " -j MARK --set-mark " + nat_zone
+    };
 
-    if (ret)
+    if (!m_iptables.apply("mangle", rules))
     {
-        SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
         return false;
     }
 
@@ -929,19 +974,15 @@ bool NatMgr::setFullConeDnatIptablesRule(const string &opCmd)
     /* This rule in the PREROUTING chain should be the default rule at the end of the list
      * iptables -t nat -[A/D] PREROUTING -j DNAT --fullcone
      */
-    std::string res;
-    int ret;
 
     /* In case of fullcone, the --to-destination is ignored by the stack, giving an aribitrary value so that 
      * iptables doesn't fail for PREROUTING/DNAT rule */
-    const std::string cmds = std::string("")
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " PREROUTING " + " -j DNAT --to-destination 1.1.1.1 --fullcone";
+    const vector<string> rules = {
+          "-" + opCmd + " PREROUTING " + " -j DNAT --to-destination 1.1.1.1 --fullcone"
+    };
         
-    ret = swss::exec(cmds, res);
-
-    if (ret)
+    if (!m_iptables.apply("nat", rules))
     {
-        SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
         return false;
     }
     return true;
@@ -956,37 +997,31 @@ bool NatMgr::setStaticNatIptablesRules(const string &opCmd, const string &interf
      * iptables -t nat -opCmd PREROUTING -m mark --mark zone-value -j DNAT -d external_ip --to-destination internal_ip
      * iptables -t nat -opCmd POSTROUTING -m mark --mark zone-value -j SNAT -s internal_ip --to-source external_ip
      */
-    std::string res;
     std::string markStr = std::string("");
-    int ret;
 
     markStr = " -m mark --mark " + m_natZoneInterfaceInfo[interface];
 
     if (nat_type == DNAT_NAT_TYPE)
     {
-        const std::string cmds = std::string("")
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " PREROUTING " + markStr + " -j DNAT -d " + external_ip + " --to-destination " + internal_ip + " && "
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING " + markStr + " -j SNAT -s " + internal_ip + " --to-source " + external_ip ;
+        const vector<string> rules = {
+          "-" + opCmd + " PREROUTING " + markStr + " -j DNAT -d " + external_ip + " --to-destination " + internal_ip,
+          "-" + opCmd + " POSTROUTING " + markStr + " -j SNAT -s " + internal_ip + " --to-source " + external_ip
+        };
         
-        ret = swss::exec(cmds, res);
-
-        if (ret)
+        if (!m_iptables.apply("nat", rules))
         {
-            SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
             return false;
         }
     }
     else
     {
-        const std::string cmds = std::string("")
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " PREROUTING" + " -j DNAT -d " + internal_ip + " --to-destination " + external_ip + " && "
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING" + " -j SNAT -s " + external_ip + " --to-source " + internal_ip ;
-
-        ret = swss::exec(cmds, res);
+        const vector<string> rules = {
+          "-" + opCmd + " PREROUTING" + " -j DNAT -d " + internal_ip + " --to-destination " + external_ip,
+          "-" + opCmd + " POSTROUTING" + " -j SNAT -s " + external_ip + " --to-source " + internal_ip
+        };
 
-        if (ret)
+        if (!m_iptables.apply("nat", rules))
         {
-            SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
             return false;
         }
     }
@@ -1004,41 +1039,35 @@ bool NatMgr::setStaticNaptIptablesRules(const string &opCmd, const string &inter
      * iptables -t nat -opCmd PREROUTING -m mark --mark zone-value -p prototype -j DNAT -d external_ip --dport external_port --to-destination internal_ip:internal_port
      * iptables -t nat -opCmd POSTROUTING -m mark --mark zone-value -p prototype -j SNAT -s internal_ip --sport internal_port --to-source external_ip:external_port
      */
-    std::string res;
     std::string markStr = std::string("");
-    int ret;
 
     markStr = " -m mark --mark " + m_natZoneInterfaceInfo[interface];
 
     if (nat_type == DNAT_NAT_TYPE)
     {
-        const std::string cmds = std::string("")
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " PREROUTING " + markStr + " -p " + prototype + " -j DNAT -d " + external_ip + " --dport " + external_port + " --to-destination " 
-          + internal_ip + ":" + internal_port + " && "
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING " + markStr + " -p " + prototype + " -j SNAT -s " + internal_ip + " --sport " + internal_port + " --to-source " 
-          + external_ip + ":" + external_port;
+        const vector<string> rules = {
+          "-" + opCmd + " PREROUTING " + markStr + " -p " + prototype + " -j DNAT -d " + external_ip + " --dport " + external_port + " --to-destination " 
+          + internal_ip + ":" + internal_port,
+          "-" + opCmd + " POSTROUTING " + markStr + " -p " + prototype + " -j SNAT -s " + internal_ip + " --sport " + internal_port + " --to-source " 
+          + external_ip + ":" + external_port
+        };
 
-        ret = swss::exec(cmds, res);
-
-        if (ret)
+        if (!m_iptables.apply("nat", rules))
         {
-            SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
             return false;
         }
     }
     else
     {
-        const std::string cmds = std::string("")
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " PREROUTING" + " -p " + prototype + " -j DNAT -d " + internal_ip + " --dport " + internal_port + " --to-destination "
-          + external_ip + ":" + external_port + " && "
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING" + " -p " + prototype + " -j SNAT -s " + external_ip + " --sport " + external_port + " --to-source "
-          + internal_ip + ":" + internal_port;
-
-        ret = swss::exec(cmds, res);
+        const vector<string> rules = {
+          "-" + opCmd + " PREROUTING" + " -p " + prototype + " -j DNAT -d " + internal_ip + " --dport " + internal_port + " --to-destination "
+          + external_ip + ":" + external_port,
+          "-" + opCmd + " POSTROUTING" + " -p " + prototype + " -j SNAT -s " + external_ip + " --sport " + external_port + " --to-source "
+          + internal_ip + ":" + internal_port
+        };
 
-        if (ret)
+        if (!m_iptables.apply("nat", rules))
         {
-            SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
             return false;
         }
     }
@@ -1060,27 +1089,23 @@ bool NatMgr::setStaticTwiceNatIptablesRules(const string &opCmd, const string &i
      * iptables -t nat -opCmd POSTROUTING -m mark --mark zone-value -j SNAT -s translated_dst --to-source dst -d src 
      */
 
-    std::string res;
     std::string markStr = std::string("");
-    int ret;
 
     markStr = " -m mark --mark " + m_natZoneInterfaceInfo[interface];
 
-    const std::string cmds = std::string("")
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " PREROUTING -j DNAT -d " + translated_src_ip
-          + " --to-destination " + src_ip + " -s " + translated_dest_ip + " && "
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " PREROUTING " + markStr + " -j DNAT -d " + dest_ip
-          + " --to-destination " + translated_dest_ip + " -s " + src_ip + " && "
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -j SNAT -s " + src_ip
-          + " --to-source " + translated_src_ip + " -d " + translated_dest_ip + " && "
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING " + markStr + " -j SNAT -s " + translated_dest_ip
-          + " --to-source " + dest_ip + " -d " + src_ip;
+    const vector<string> rules = {
+          "-" + opCmd + " PREROUTING -j DNAT -d " + translated_src_ip
+          + " --to-destination " + src_ip + " -s " + translated_dest_ip,
+          "-" + opCmd + " PREROUTING " + markStr + " -j DNAT -d " + dest_ip
+          + " --to-destination " + translated_dest_ip + " -s " + src_ip,
+          "-" + opCmd + " POSTROUTING -j SNAT -s " + src_ip
+          + " --to-source " + translated_src_ip + " -d " + translated_dest_ip,
+          "-" + opCmd + " POSTROUTING " + markStr + " -j SNAT -s " + translated_dest_ip
+          + " --to-source " + dest_ip + " -d " + src_ip
+    };
 
-    ret = swss::exec(cmds, res);
-
-    if (ret)
+    if (!m_iptables.apply("nat", rules))
     {
-        SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
         return false;
     }
 
@@ -1106,27 +1131,23 @@ bool NatMgr::setStaticTwiceNaptIptablesRules(const string &opCmd, const string &
      * -d src --dport src_l4_port
      */
 
-    std::string res;
     std::string markStr = std::string("");
-    int ret;
 
     markStr = " -m mark --mark " + m_natZoneInterfaceInfo[interface];
 
-    const std::string cmds = std::string("")
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " PREROUTING -p " + prototype + " -j DNAT -d " + translated_src_ip + " --dport " + translated_src_port 
-          + " --to-destination " + src_ip + ":" + src_port + " -s " + translated_dest_ip + " --sport " + translated_dest_port + " && "
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " PREROUTING " + markStr + " -p " + prototype + " -j DNAT -d " + dest_ip + " --dport " + dest_port
-          + " --to-destination " + translated_dest_ip + ":" + translated_dest_port + " -s " + src_ip + " --sport " + src_port + " && "
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p " + prototype + " -j SNAT -s " + src_ip + " --sport " + src_port
-          + " --to-source " + translated_src_ip + ":" + translated_src_port + " -d " + translated_dest_ip + " --dport " + translated_dest_port + " && "
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING " + markStr + " -p " + prototype + " -j SNAT -s " + translated_dest_ip + " --sport " + translated_dest_port
-          + " --to-source " + dest_ip + ":" + dest_port + " -d " + src_ip + " --dport " +src_port;
-
-    ret = swss::exec(cmds, res);
+    const vector<string> rules = {
+          "-" + opCmd + " PREROUTING -p " + prototype + " -j DNAT -d " + translated_src_ip + " --dport " + translated_src_port 
+          + " --to-destination " + src_ip + ":" + src_port + " -s " + translated_dest_ip + " --sport " + translated_dest_port,
+          "-" + opCmd + " PREROUTING " + markStr + " -p " + prototype + " -j DNAT -d " + dest_ip + " --dport " + dest_port
+          + " --to-destination " + translated_dest_ip + ":" + translated_dest_port + " -s " + src_ip + " --sport " + src_port,
+          "-" + opCmd + " POSTROUTING -p " + prototype + " -j SNAT -s " + src_ip + " --sport " + src_port
+          + " --to-source " + translated_src_ip + ":" + translated_src_port + " -d " + translated_dest_ip + " --dport " + translated_dest_port,
+          "-" + opCmd + " POSTROUTING " + markStr + " -p " + prototype + " -j SNAT -s " + translated_dest_ip + " --sport " + translated_dest_port
+          + " --to-source " + dest_ip + ":" + dest_port + " -d " + src_ip + " --dport " +src_port
+    };
 
-    if (ret)
+    if (!m_iptables.apply("nat", rules))
     {
-        SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
         return false;
     }
 
@@ -1145,11 +1166,11 @@ bool NatMgr::setDynamicNatIptablesRulesWithoutAcl(const string &opCmd, const str
      * iptables -t nat -opCmd POSTROUTING -p udp -j SNAT -m mark --mark zone-value --to-source external_ip:external_port_range --fullcone
      * iptables -t nat -opCmd POSTROUTING -p icmp -j SNAT -m mark --mark zone-value --to-source external_ip:external_port_range --fullcone
      */
-    std::string res, cmd;
+    std::string cmd;
     std::string externalString = EMPTY_STRING;
     std::string fullcone = EMPTY_STRING;
     std::string prototype = EMPTY_STRING;
-    std::string cmds = std::string("");
+    vector<string> rules;
     std::string markStr = std::string("");
 
     markStr = " -m mark --mark " + m_natZoneInterfaceInfo[interface];
@@ -1168,13 +1189,14 @@ bool NatMgr::setDynamicNatIptablesRulesWithoutAcl(const string &opCmd, const str
     if (key.empty())
     {
         /* Rules for Single NAT */
-        cmds = std::string("")
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p tcp -j SNAT " + markStr + " --to-source " 
-          + externalString + fullcone + " && "
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p udp -j SNAT " + markStr + " --to-source " 
-          + externalString + fullcone + " && "
-          + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p icmp -j SNAT " + markStr + " --to-source " 
-          + externalString + fullcone;
+        rules = {
+          "-" + opCmd + " POSTROUTING -p tcp -j SNAT " + markStr + " --to-source " 
+          + externalString + fullcone,
+          "-" + opCmd + " POSTROUTING -p udp -j SNAT " + markStr + " --to-source " 
+          + externalString + fullcone,
+          "-" + opCmd + " POSTROUTING -p icmp -j SNAT " + markStr + " --to-source " 
+          + externalString + fullcone
+        };
     }
     else
     {
@@ -1200,29 +1222,29 @@ bool NatMgr::setDynamicNatIptablesRulesWithoutAcl(const string &opCmd, const str
             }
 
             /* Rules for Double NAT */
-            cmds = std::string("")
-              + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING " + prototype + " -j SNAT " + markStr + " --to-source "
-              + externalString + " -d " + keys[0] + " --dport " + keys[2] + fullcone + " && "
-              + IPTABLES_CMD + " -t nat " + "-" + cmd + " PREROUTING " + prototype + " -j DNAT -d " + m_staticNaptEntry[key].local_ip + " --dport "
-              + m_staticNaptEntry[key].local_port + " --to-destination " + keys[0] + ":" + keys[2] + " && "
-              + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING " + prototype + " -j SNAT -s " + keys[0] + " --sport "
-              + keys[2] + " --to-source " + m_staticNaptEntry[key].local_ip + ":" + m_staticNaptEntry[key].local_port;
+            rules = {
+              "-" + opCmd + " POSTROUTING " + prototype + " -j SNAT " + markStr + " --to-source "
+              + externalString + " -d " + keys[0] + " --dport " + keys[2] + fullcone,
+              "-" + cmd + " PREROUTING " + prototype + " -j DNAT -d " + m_staticNaptEntry[key].local_ip + " --dport "
+              + m_staticNaptEntry[key].local_port + " --to-destination " + keys[0] + ":" + keys[2],
+              "-" + opCmd + " POSTROUTING " + prototype + " -j SNAT -s " + keys[0] + " --sport "
+              + keys[2] + " --to-source " + m_staticNaptEntry[key].local_ip + ":" + m_staticNaptEntry[key].local_port
+            };
         }
         else
         {   
             /* Rules for Double NAT */ 
-            cmds = std::string("")
-              + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING " + prototype + " -j SNAT " + markStr + " --to-source "
-              + externalString + " -d " + key + fullcone + " && "
-              + IPTABLES_CMD + " -t nat " + "-" + cmd + " PREROUTING" + " -j DNAT -d " + m_staticNatEntry[key].local_ip + " --to-destination " + key + " && "
-              + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING" + " -j SNAT -s " + key + " --to-source " + m_staticNatEntry[key].local_ip ;
+            rules = {
+              "-" + opCmd + " POSTROUTING " + prototype + " -j SNAT " + markStr + " --to-source "
+              + externalString + " -d " + key + fullcone,
+              "-" + cmd + " PREROUTING" + " -j DNAT -d " + m_staticNatEntry[key].local_ip + " --to-destination " + key,
+              "-" + opCmd + " POSTROUTING" + " -j SNAT -s " + key + " --to-source " + m_staticNatEntry[key].local_ip
+            };
         }
     }
 
-    int ret = swss::exec(cmds, res);
-    if (ret)
+    if (!m_iptables.apply("nat", rules))
     {
-        SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
         return false;
     }
 
@@ -1247,12 +1269,12 @@ bool NatMgr::setDynamicNatIptablesRulesWithAcl(const string &opCmd, const string
      * iptables -t nat -opCmd POSTROUTING -p icmp srcIpAddressString -j SNAT -m mark --mark zone-value --to-source external_ip:external_port_range --fullcone
      */
 
-    std::string res, cmd;
+    std::string cmd;
     std::string srcIpAddressString = EMPTY_STRING, dstIpAddressString = EMPTY_STRING;
     std::string srcPortString = EMPTY_STRING, dstPortString = EMPTY_STRING;
     std::string externalString = EMPTY_STRING, fullcone = EMPTY_STRING;
     std::string prototype = EMPTY_STRING;
-    std::string cmds = std::string("");
+    vector<string> rules;
     vector<string> keys;
     std::string markStr = std::string("");
 
@@ -1336,36 +1358,39 @@ bool NatMgr::setDynamicNatIptablesRulesWithAcl(const string &opCmd, const string
             if (key.empty())
             {
                 /* Rules for Single NAT */
-                cmds = std::string("")
-                   + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p tcp" + srcIpAddressString + dstIpAddressString 
-                   + srcPortString + dstPortString + " -j RETURN" + " && "
-                   + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p udp" + srcIpAddressString + dstIpAddressString
-                   + srcPortString + dstPortString + " -j RETURN" + " && "
-                   + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p icmp" + srcIpAddressString + dstIpAddressString
-                   + " -j RETURN";
+                rules = {
+                   "-" + opCmd + " POSTROUTING -p tcp" + srcIpAddressString + dstIpAddressString 
+                   + srcPortString + dstPortString + " -j RETURN",
+                   "-" + opCmd + " POSTROUTING -p udp" + srcIpAddressString + dstIpAddressString
+                   + srcPortString + dstPortString + " -j RETURN",
+                   "-" + opCmd + " POSTROUTING -p icmp" + srcIpAddressString + dstIpAddressString
+                   + " -j RETURN"
+                };
             }
             else
             {
                 /* Rules for Double NAT */
                 if (keys.size() > 1)
                 {
-                    cmds = std::string("")
-                       + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p tcp" + srcIpAddressString + " -d " + keys[0]
-                       + srcPortString + " --dport " + keys[2] + " -j RETURN" + " && "
-                       + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p udp" + srcIpAddressString + " -d " + keys[0]
-                       + srcPortString + " --dport " + keys[2] + " -j RETURN" + " && "
-                       + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p icmp" + srcIpAddressString + " -d " + keys[0]
-                       + " -j RETURN";
+                    rules = {
+                       "-" + opCmd + " POSTROUTING -p tcp" + srcIpAddressString + " -d " + keys[0]
+                       + srcPortString + " --dport " + keys[2] + " -j RETURN",
+                       "-" + opCmd + " POSTROUTING -p udp" + srcIpAddressString + " -d " + keys[0]
+                       + srcPortString + " --dport " + keys[2] + " -j RETURN",
+                       "-" + opCmd + " POSTROUTING -p icmp" + srcIpAddressString + " -d " + keys[0]
+                       + " -j RETURN"
+                    };
                 }
                 else
                 {
-                    cmds = std::string("")
-                       + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p tcp" + srcIpAddressString + " -d " + keys[0]
-                       + srcPortString + " -j RETURN" + " && "
-                       + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p udp" + srcIpAddressString + " -d " + keys[0]
-                       + srcPortString + " -j RETURN" + " && "
-                       + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p icmp" + srcIpAddressString + " -d " + keys[0]
-                       + " -j RETURN";
+                    rules = {
+                       "-" + opCmd + " POSTROUTING -p tcp" + srcIpAddressString + " -d " + keys[0]
+                       + srcPortString + " -j RETURN",
+                       "-" + opCmd + " POSTROUTING -p udp" + srcIpAddressString + " -d " + keys[0]
+                       + srcPortString + " -j RETURN",
+                       "-" + opCmd + " POSTROUTING -p icmp" + srcIpAddressString + " -d " + keys[0]
+                       + " -j RETURN"
+                    };
                 }
 
             }
@@ -1376,25 +1401,28 @@ bool NatMgr::setDynamicNatIptablesRulesWithAcl(const string &opCmd, const string
             if (key.empty())
             {
                 /* Rule for Single NAT */
-                cmds = std::string("")
-                  + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p " + natAclRuleId.ip_protocol + srcIpAddressString
-                  + dstIpAddressString + srcPortString + dstPortString + " -j RETURN";
+                rules = {
+                  "-" + opCmd + " POSTROUTING -p " + natAclRuleId.ip_protocol + srcIpAddressString
+                  + dstIpAddressString + srcPortString + dstPortString + " -j RETURN"
+                };
             }
             else
             {
                 if (keys.size() > 1)
                 {
                     /* Rules for Double NAT */
-                    cmds = std::string("")
-                      + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p " + natAclRuleId.ip_protocol + srcIpAddressString
-                      + " -d " + keys[0] + srcPortString + " --dport " + keys[2] + " -j RETURN";
+                    rules = {
+                      "-" + opCmd + " POSTROUTING -p " + natAclRuleId.ip_protocol + srcIpAddressString
+                      + " -d " + keys[0] + srcPortString + " --dport " + keys[2] + " -j RETURN"
+                    };
                 }
                 else
                 {
                     /* Rules for Double NAT */
-                    cmds = std::string("")
-                      + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p " + natAclRuleId.ip_protocol + srcIpAddressString
-                      + " -d " + keys[0] + srcPortString + " -j RETURN";
+                    rules = {
+                      "-" + opCmd + " POSTROUTING -p " + natAclRuleId.ip_protocol + srcIpAddressString
+                      + " -d " + keys[0] + srcPortString + " -j RETURN"
+                    };
                 }
             }
         }
@@ -1407,19 +1435,21 @@ bool NatMgr::setDynamicNatIptablesRulesWithAcl(const string &opCmd, const string
             /* Rules for all ip protocols */
             if (natAclRuleId.ip_protocol == "None")
             {
-                cmds = std::string("")
-                   + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p tcp" + srcIpAddressString + dstIpAddressString + srcPortString + dstPortString 
-                   + " -j SNAT " + markStr + " --to-source " + externalString + fullcone + " && "
-                   + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p udp" + srcIpAddressString + dstIpAddressString + srcPortString + dstPortString
-                   + " -j SNAT " + markStr + " --to-source " + externalString + fullcone + " && "
-                   + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p icmp" + srcIpAddressString + dstIpAddressString + srcPortString + dstPortString 
-                   + " -j SNAT " + markStr + " --to-source " + externalString + fullcone;
+                rules = {
+                   "-" + opCmd + " POSTROUTING -p tcp" + srcIpAddressString + dstIpAddressString + srcPortString + dstPortString 
+                   + " -j SNAT " + markStr + " --to-source " + externalString + fullcone,
+                   "-" + opCmd + " POSTROUTING -p udp" + srcIpAddressString + dstIpAddressString + srcPortString + dstPortString
+                   + " -j SNAT " + markStr + " --to-source " + externalString + fullcone,
+                   "-" + opCmd + " POSTROUTING -p icmp" + srcIpAddressString + dstIpAddressString + srcPortString + dstPortString 
+                   + " -j SNAT " + markStr + " --to-source " + externalString + fullcone
+                };
             }
             else
             {
-                cmds = std::string("")
-                  + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING -p " + natAclRuleId.ip_protocol + srcIpAddressString
-                  + dstIpAddressString + srcPortString + dstPortString + " -j SNAT " + markStr + " --to-source " + externalString + fullcone;
+                rules = {
+                  "-" + opCmd + " POSTROUTING -p " + natAclRuleId.ip_protocol + srcIpAddressString
+                  + dstIpAddressString + srcPortString + dstPortString + " -j SNAT " + markStr + " --to-source " + externalString + fullcone
+                };
             }
         }
         else
@@ -1427,31 +1457,31 @@ bool NatMgr::setDynamicNatIptablesRulesWithAcl(const string &opCmd, const string
             if (keys.size() > 1)
             {
                 /* Rules for Double NAT */
-                cmds = std::string("")
-                  + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING " + prototype + " -j SNAT " + markStr + srcIpAddressString + srcPortString 
-                  + " --to-source " + externalString + " -d " + keys[0] + " --dport " + keys[2] + fullcone + " && "
-                  + IPTABLES_CMD + " -t nat " + "-" + cmd + " PREROUTING " + prototype + " -j DNAT -d " + m_staticNaptEntry[key].local_ip + " --dport "
-                  + m_staticNaptEntry[key].local_port + srcIpAddressString + srcPortString + " --to-destination " + keys[0] + ":" + keys[2] + " && "
-                  + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING " + prototype + " -j SNAT -s " + key[0] + " --sport "
-                  + keys[2] + " --to-source " + m_staticNaptEntry[key].local_ip + ":" + m_staticNaptEntry[key].local_port;
+                rules = {
+                  "-" + opCmd + " POSTROUTING " + prototype + " -j SNAT " + markStr + srcIpAddressString + srcPortString 
+                  + " --to-source " + externalString + " -d " + keys[0] + " --dport " + keys[2] + fullcone,
+                  "-" + cmd + " PREROUTING " + prototype + " -j DNAT -d " + m_staticNaptEntry[key].local_ip + " --dport "
+                  + m_staticNaptEntry[key].local_port + srcIpAddressString + srcPortString + " --to-destination " + keys[0] + ":" + keys[2],
+                  "-" + opCmd + " POSTROUTING " + prototype + " -j SNAT -s " + key[0] + " --sport "
+                  + keys[2] + " --to-source " + m_staticNaptEntry[key].local_ip + ":" + m_staticNaptEntry[key].local_port
+                };
             }
             else
             {
                 /* Rules for Double NAT */
-                cmds = std::string("")
-                  + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING " + prototype + " -j SNAT " + markStr + srcIpAddressString 
-                  + " --to-source " + externalString + " -d " + key + fullcone + " && "
-                  + IPTABLES_CMD + " -t nat " + "-" + cmd + " PREROUTING" + " -j DNAT -d " + m_staticNatEntry[key].local_ip + srcIpAddressString
-                  + " --to-destination " + key + " && "
-                  + IPTABLES_CMD + " -t nat " + "-" + opCmd + " POSTROUTING" + " -j SNAT -s " + key + " --to-source " + m_staticNatEntry[key].local_ip ;
+                rules = {
+                  "-" + opCmd + " POSTROUTING " + prototype + " -j SNAT " + markStr + srcIpAddressString 
+                  + " --to-source " + externalString + " -d " + key + fullcone,
+                  "-" + cmd + " PREROUTING" + " -j DNAT -d " + m_staticNatEntry[key].local_ip + srcIpAddressString
+                  + " --to-destination " + key,
+                  "-" + opCmd + " POSTROUTING" + " -j SNAT -s " + key + " --to-source " + m_staticNatEntry[key].local_ip
+                };
             }
         }
     }
 
-    int ret = swss::exec(cmds, res);
-    if (ret)
+    if (!m_iptables.apply("nat", rules))
     {
-        SWSS_LOG_ERROR("Command '%s' failed with rc %d", cmds.c_str(), ret);
         return false;
     }
 
@@ -5771,6 +5801,9 @@ void NatMgr::doNatRefreshTimerTask()
 {
     SWSS_LOG_ENTER();
 
+    /* Read the conntrack table once for all the entries */
+    m_conntrack.begin();
+
     /* Update conntrack static NAT entries */
     SWSS_LOG_INFO("Updating conntrack for Static NAT entries");
     setStaticNatConntrackEntries("UPDATE");
@@ -5778,6 +5811,11 @@ void NatMgr::doNatRefreshTimerTask()
     /* Update conntrack static NAPT entries */
     SWSS_LOG_INFO("Updating conntrack for Static NAPT entries");
     setStaticNaptConntrackEntries("UPDATE");
+
+    if (!m_conntrack.end())
+    {
+        SWSS_LOG_ERROR("Failed to update conntrack for Static NAT and NAPT entries");
+    }
 }
 
 /* To add all conntrack entries */
@@ -8150,6 +8188,9 @@ void NatMgr::doTask(Consumer &consumer)
 
     string table_name = consumer.getTableName();
 
+    /* Apply the iptables rules of all the entries of the task at once */
+    m_iptables.begin();
+
     if (table_name == CFG_STATIC_NAT_TABLE_NAME)
     {
         SWSS_LOG_INFO("Received update from CFG_STATIC_NAT_TABLE_NAME");
@@ -8196,6 +8237,8 @@ void NatMgr::doTask(Consumer &consumer)
         SWSS_LOG_ERROR("Unknown config table %s ", table_name.c_str());
         throw runtime_error("NatMgr doTask failure.");
     }
+
+    m_iptables.end();
 }
 
 /* To parse the timeout notifications */
@@ -8249,6 +8292,24 @@ void NatMgr::timeoutNotifications(string op, string data)
     }
 }
 
+/* To parse the pending timeout notifications, updating the conntrack entries together */
+void NatMgr::timeoutNotifications(const std::deque<KeyOpFieldsValuesTuple> &entries)
+{
+    SWSS_LOG_ENTER();
+
+    m_conntrack.begin();
+
+    for (const auto &entry : entries)
+    {
+        timeoutNotifications(kfvOp(entry), kfvKey(entry));
+    }
+
+    if (!m_conntrack.end())
+    {
+        SWSS_LOG_ERROR("Failed to update conntrack for %zu timeout notifications", entries.size());
+    }
+}
+
 /* To parse the flush notifications */
 void NatMgr::flushNotifications(string op, string data)
 {
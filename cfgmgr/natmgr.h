@@ -23,6 +23,8 @@
 #include "orch.h"
 #include "notificationproducer.h"
 #include "timer.h"
+#include "iptablesbatch.h"
+#include "conntrackbatch.h"
 #include <unistd.h>
 #include <set>
 #include <map>
@@ -245,8 +247,10 @@ public:
     /* Function to be called from signal handler on nat docker stop */
     void cleanupPoolIpTable();
     void cleanupMangleIpTables();
+    void cleanupIptables();
     bool isPortInitDone(DBConnector *app_db);
     void timeoutNotifications(std::string op, std::string data);
+    void timeoutNotifications(const std::deque<KeyOpFieldsValuesTuple> &entries);
     void flushNotifications(std::string op, std::string data);
     void removeStaticNatIptables(const std::string port = NONE_STRING);
     void removeStaticNaptIptables(const std::string port = NONE_STRING);
@@ -276,6 +280,10 @@ private:
     natDnatPool_map_t        m_natDnatPoolInfo;
     SelectableTimer          *m_natRefreshTimer;
 
+    /* Kernel NAT rules and conntrack entries */
+    IptablesBatch            m_iptables;
+    ConntrackBatch           m_conntrack;
+
     /* Declare doTask related functions */
     void doTask(Consumer &consumer);
     void doTask(SelectableTimer &timer);
@@ -88,11 +88,7 @@ void cleanup()
     
     if (natmgr)
     {
-        natmgr->removeStaticNatIptables();
-        natmgr->removeStaticNaptIptables();
-        natmgr->removeDynamicNatRules();
-
-        natmgr->cleanupMangleIpTables();
+        natmgr->cleanupIptables();
         natmgr->cleanupPoolIpTable();
     }
 }
@@ -167,12 +163,10 @@ int main(int argc, char **argv)
 
             if (sel == timeoutNotificationsConsumer)
             {
-               std::string op;
-               std::string data;
-               std::vector<swss::FieldValueTuple> values;
+               std::deque<KeyOpFieldsValuesTuple> entries;
 
-               timeoutNotificationsConsumer->pop(op, data, values);
-               natmgr->timeoutNotifications(op, data);
+               timeoutNotificationsConsumer->pops(entries);
+               natmgr->timeoutNotifications(entries);
                continue;
             }
 
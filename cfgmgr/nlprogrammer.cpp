@@ -0,0 +1,647 @@
+#include <errno.h>
+#include <string.h>
+#include <sys/socket.h>
+#include <netinet/in.h>
+#include <net/ethernet.h>
+#include <net/if.h>
+#include <linux/if_bridge.h>
+#include <linux/if_link.h>
+#include <linux/rtnetlink.h>
+#include <netlink/attr.h>
+#include <netlink/msg.h>
+
+#include <sstream>
+
+#include "logger.h"
+#include "nlprogrammer.h"
+
+using namespace std;
+using namespace swss;
+
+#define NL_SOCKET_BUFFER_SIZE   (1024 * 1024)
+#define NL_RECV_BUFFER_SIZE     (64 * 1024)
+
+/* Requests sent at once, below the socket send buffer size */
+#define NL_BATCH_MAX_SIZE       (16 * 1024)
+
+static struct nl_msg *allocMsg(int type, int flags, const void *hdr, size_t len, int &error)
+{
+    struct nl_msg *msg = nlmsg_alloc_simple(type, flags);
+    if (!msg)
+    {
+        error = -ENOMEM;
+        return nullptr;
+    }
+
+    if (nlmsg_append(msg, const_cast<void *>(hdr), len, NLMSG_ALIGNTO) < 0)
+    {
+        nlmsg_free(msg);
+        error = -ENOMEM;
+        return nullptr;
+    }
+
+    return msg;
+}
+
+static struct nl_msg *allocLinkMsg(int type, int flags, uint8_t family, int ifindex, int &error)
+{
+    struct ifinfomsg ifi;
+
+    memset(&ifi, 0, sizeof(ifi));
+    ifi.ifi_family = family;
+    ifi.ifi_index = ifindex;
+
+    return allocMsg(type, flags, &ifi, sizeof(ifi), error);
+}
+
+static void setLinkUp(struct nl_msg *msg, bool up)
+{
+    struct ifinfomsg *ifi = static_cast<struct ifinfomsg *>(nlmsg_data(nlmsg_hdr(msg)));
+
+    ifi->ifi_change |= IFF_UP;
+    if (up)
+    {
+        ifi->ifi_flags |= IFF_UP;
+    }
+}
+
+/* New link of the given kind, its kind specific data is added by fill */
+static struct nl_msg *allocNewLinkMsg(const string &name, const char *kind, bool up, int &error,
+                                      const function<void(struct nl_msg *)> &fill = nullptr)
+{
+    struct nl_msg *msg = allocLinkMsg(RTM_NEWLINK, NLM_F_CREATE | NLM_F_EXCL, AF_UNSPEC, 0, error);
+    if (!msg)
+    {
+        return nullptr;
+    }
+
+    setLinkUp(msg, up);
+    nla_put_string(msg, IFLA_IFNAME, name.c_str());
+
+    struct nlattr *linkinfo = nla_nest_start(msg, IFLA_LINKINFO);
+    nla_put_string(msg, IFLA_INFO_KIND, kind);
+    if (fill)
+    {
+        struct nlattr *data = nla_nest_start(msg, IFLA_INFO_DATA);
+        fill(msg);
+        nla_nest_end(msg, data);
+    }
+    nla_nest_end(msg, linkinfo);
+
+    return msg;
+}
+
+static struct nl_msg *allocBridgeVlanMsg(int type, int ifindex, uint16_t vlan_id, uint16_t flags, bool self, int &error)
+{
+    struct nl_msg *msg = allocLinkMsg(type, 0, AF_BRIDGE, ifindex, error);
+    if (!msg)
+    {
+        return nullptr;
+    }
+
+    struct bridge_vlan_info vinfo;
+    memset(&vinfo, 0, sizeof(vinfo));
+    vinfo.flags = flags;
+    vinfo.vid = vlan_id;
+
+    struct nlattr *afspec = nla_nest_start(msg, IFLA_AF_SPEC);
+    if (self)
+    {
+        nla_put_u16(msg, IFLA_BRIDGE_FLAGS, BRIDGE_FLAGS_SELF);
+    }
+    nla_put(msg, IFLA_BRIDGE_VLAN_INFO, sizeof(vinfo), &vinfo);
+    nla_nest_end(msg, afspec);
+
+    return msg;
+}
+
+static struct nl_msg *allocAddressMsg(int type, int flags, int ifindex, const IpPrefix &prefix, int &error)
+{
+    ip_addr_t ip = prefix.getIp().getIp();
+    struct ifaddrmsg ifa;
+
+    memset(&ifa, 0, sizeof(ifa));
+    ifa.ifa_family = ip.family;
+    ifa.ifa_prefixlen = static_cast<uint8_t>(prefix.getMaskLength());
+    ifa.ifa_index = static_cast<uint32_t>(ifindex);
+
+    struct nl_msg *msg = allocMsg(type, flags, &ifa, sizeof(ifa), error);
+    if (!msg)
+    {
+        return nullptr;
+    }
+
+    int len = prefix.isV4() ? static_cast<int>(sizeof(ip.ip_addr.ipv4_addr)) : static_cast<int>(sizeof(ip.ip_addr.ipv6_addr));
+    nla_put(msg, IFA_LOCAL, len, &ip.ip_addr);
+    nla_put(msg, IFA_ADDRESS, len, &ip.ip_addr);
+
+    return msg;
+}
+
+NlProgrammer::NlProgrammer() :
+    m_seq(0)
+{
+    SWSS_LOG_ENTER();
+
+    int err;
+
+    m_sock = nl_socket_alloc();
+    if (!m_sock)
+    {
+        throw runtime_error("Netlink socket alloc failed");
+    }
+
+    if ((err = nl_connect(m_sock, NETLINK_ROUTE)) < 0)
+    {
+        nl_socket_free(m_sock);
+        throw runtime_error(string("Netlink socket connect failed, error ") + nl_geterror(err));
+    }
+
+    nl_socket_set_buffer_size(m_sock, NL_SOCKET_BUFFER_SIZE, NL_SOCKET_BUFFER_SIZE);
+
+    /* Acks without the requests, with the error messages of the kernel */
+    int fd = nl_socket_get_fd(m_sock);
+    int one = 1;
+    setsockopt(fd, SOL_NETLINK, NETLINK_CAP_ACK, &one, sizeof(one));
+    setsockopt(fd, SOL_NETLINK, NETLINK_EXT_ACK, &one, sizeof(one));
+}
+
+NlProgrammer::~NlProgrammer()
+{
+    nl_socket_free(m_sock);
+}
+
+void NlProgrammer::queue(const string &desc, Builder build)
+{
+    m_ops.push_back({ desc, std::move(build) });
+}
+
+void NlProgrammer::addBridge(const string &name, bool up)
+{
+    queue("link add " + name + " type bridge", [=](int &error) {
+        return allocNewLinkMsg(name, "bridge", up, error);
+    });
+}
+
+void NlProgrammer::addVlan(const string &name, const string &parent, uint16_t vlan_id, const MacAddress &mac, bool up)
+{
+    queue("link add link " + parent + " name " + name + " type vlan id " + to_string(vlan_id), [=](int &error) -> struct nl_msg * {
+        int parent_index = getIfIndex(parent);
+        if (!parent_index)
+        {
+            error = -ENODEV;
+            return nullptr;
+        }
+
+        struct nl_msg *msg = allocNewLinkMsg(name, "vlan", up, error, [vlan_id](struct nl_msg *msg) {
+            nla_put_u16(msg, IFLA_VLAN_ID, vlan_id);
+        });
+        if (msg)
+        {
+            nla_put_u32(msg, IFLA_LINK, static_cast<uint32_t>(parent_index));
+            nla_put(msg, IFLA_ADDRESS, ETHER_ADDR_LEN, mac.getMac());
+        }
+        return msg;
+    });
+}
+
+void NlProgrammer::addVrf(const string &name, uint32_t table)
+{
+    queue("link add " + name + " type vrf table " + to_string(table), [=](int &error) {
+        return allocNewLinkMsg(name, "vrf", false, error, [table](struct nl_msg *msg) {
+            nla_put_u32(msg, IFLA_VRF_TABLE, table);
+        });
+    });
+}
+
+void NlProgrammer::delLink(const string &name)
+{
+    queue("link del " + name, [=](int &error) -> struct nl_msg * {
+        int ifindex = getIfIndex(name);
+        if (!ifindex)
+        {
+            error = -ENODEV;
+            return nullptr;
+        }
+
+        return allocLinkMsg(RTM_DELLINK, 0, AF_UNSPEC, ifindex, error);
+    });
+}
+
+void NlProgrammer::setLinkAdminState(const string &name, bool up)
+{
+    queue("link set " + name + (up ? " up" : " down"), [=](int &error) -> struct nl_msg * {
+        int ifindex = getIfIndex(name);
+        if (!ifindex)
+        {
+            error = -ENODEV;
+            return nullptr;
+        }
+
+        struct nl_msg *msg = allocLinkMsg(RTM_NEWLINK, 0, AF_UNSPEC, ifindex, error);
+        if (msg)
+        {
+            setLinkUp(msg, up);
+        }
+        return msg;
+    });
+}
+
+void NlProgrammer::setLinkMtu(const string &name, uint32_t mtu)
+{
+    queue("link set " + name + " mtu " + to_string(mtu), [=](int &error) -> struct nl_msg * {
+        int ifindex = getIfIndex(name);
+        if (!ifindex)
+        {
+            error = -ENODEV;
+            return nullptr;
+        }
+
+        struct nl_msg *msg = allocLinkMsg(RTM_NEWLINK, 0, AF_UNSPEC, ifindex, error);
+        if (msg)
+        {
+            nla_put_u32(msg, IFLA_MTU, mtu);
+        }
+        return msg;
+    });
+}
+
+void NlProgrammer::setLinkMac(const string &name, const MacAddress &mac)
+{
+    queue("link set " + name + " address " + mac.to_string(), [=](int &error) -> struct nl_msg * {
+        int ifindex = getIfIndex(name);
+        if (!ifindex)
+        {
+            error = -ENODEV;
+            return nullptr;
+        }
+
+        struct nl_msg *msg = allocLinkMsg(RTM_NEWLINK, 0, AF_UNSPEC, ifindex, error);
+        if (msg)
+        {
+            nla_put(msg, IFLA_ADDRESS, ETHER_ADDR_LEN, mac.getMac());
+        }
+        return msg;
+    });
+}
+
+void NlProgrammer::setLinkMaster(const string &name, const string &master)
+{
+    queue("link set " + name + (master.empty() ? " nomaster" : " master " + master), [=](int &error) -> struct nl_msg * {
+        int ifindex = getIfIndex(name);
+        int master_index = master.empty() ? 0 : getIfIndex(master);
+        if (!ifindex || (!master.empty() && !master_index))
+        {
+            error = -ENODEV;
+            return nullptr;
+        }
+
+        struct nl_msg *msg = allocLinkMsg(RTM_NEWLINK, 0, AF_UNSPEC, ifindex, error);
+        if (msg)
+        {
+            nla_put_u32(msg, IFLA_MASTER, static_cast<uint32_t>(master_index));
+        }
+        return msg;
+    });
+}
+
+void NlProgrammer::addBridgeVlan(const string &dev, uint16_t vlan_id, bool untagged, bool self)
+{
+    string desc = "bridge vlan add vid " + to_string(vlan_id) + " dev " + dev;
+    desc += untagged ? " pvid untagged" : "";
+    desc += self ? " self" : "";
+
+    queue(desc, [=](int &error) -> struct nl_msg * {
+        int ifindex = getIfIndex(dev);
+        if (!ifindex)
+        {
+            error = -ENODEV;
+            return nullptr;
+        }
+
+        uint16_t flags = untagged ? (BRIDGE_VLAN_INFO_PVID | BRIDGE_VLAN_INFO_UNTAGGED) : 0;
+        return allocBridgeVlanMsg(RTM_SETLINK, ifindex, vlan_id, flags, self, error);
+    });
+}
+
+void NlProgrammer::delBridgeVlan(const string &dev, uint16_t vlan_id, bool self)
+{
+    queue("bridge vlan del vid " + to_string(vlan_id) + " dev " + dev + (self ? " self" : ""), [=](int &error) -> struct nl_msg * {
+        int ifindex = getIfIndex(dev);
+        if (!ifindex)
+        {
+            error = -ENODEV;
+            return nullptr;
+        }
+
+        return allocBridgeVlanMsg(RTM_DELLINK, ifindex, vlan_id, 0, self, error);
+    });
+}
+
+void NlProgrammer::addAddress(const string &dev, const IpPrefix &prefix)
+{
+    queue("address add " + prefix.to_string() + " dev " + dev, [=](int &error) -> struct nl_msg * {
+        int ifindex = getIfIndex(dev);
+        if (!ifindex)
+        {
+            error = -ENODEV;
+            return nullptr;
+        }
+
+        return allocAddressMsg(RTM_NEWADDR, NLM_F_CREATE | NLM_F_EXCL, ifindex, prefix, error);
+    });
+}
+
+void NlProgrammer::delAddress(const string &dev, const IpPrefix &prefix)
+{
+    queue("address del " + prefix.to_string() + " dev " + dev, [=](int &error) -> struct nl_msg * {
+        int ifindex = getIfIndex(dev);
+        if (!ifindex)
+        {
+            error = -ENODEV;
+            return nullptr;
+        }
+
+        return allocAddressMsg(RTM_DELADDR, 0, ifindex, prefix, error);
+    });
+}
+
+int NlProgrammer::getIfIndex(const string &name)
+{
+    unsigned int ifindex = if_nametoindex(name.c_str());
+    if (!ifindex && !m_pending.empty())
+    {
+        /* The link may be created by a request not sent yet */
+        flush();
+        ifindex = if_nametoindex(name.c_str());
+    }
+
+    return static_cast<int>(ifindex);
+}
+
+void NlProgrammer::append(struct nl_msg *msg, size_t result)
+{
+    struct nlmsghdr *hdr = nlmsg_hdr(msg);
+
+    hdr->nlmsg_flags = static_cast<uint16_t>(hdr->nlmsg_flags | NLM_F_REQUEST | NLM_F_ACK);
+    hdr->nlmsg_seq = ++m_seq;
+    hdr->nlmsg_pid = 0;
+
+    const char *data = reinterpret_cast<const char *>(hdr);
+    m_batch.insert(m_batch.end(), data, data + hdr->nlmsg_len);
+    m_pending[hdr->nlmsg_seq] = result;
+
+    nlmsg_free(msg);
+}
+
+void NlProgrammer::flush()
+{
+    SWSS_LOG_ENTER();
+
+    if (m_batch.empty())
+    {
+        return;
+    }
+
+    struct sockaddr_nl kernel;
+    memset(&kernel, 0, sizeof(kernel));
+    kernel.nl_family = AF_NETLINK;
+
+    ssize_t sent = sendto(nl_socket_get_fd(m_sock), m_batch.data(), m_batch.size(), 0,
+                          reinterpret_cast<struct sockaddr *>(&kernel), sizeof(kernel));
+    int error = sent < 0 ? -errno : 0;
+    m_batch.clear();
+
+    if (!error)
+    {
+        bool received = receive([this](struct nlmsghdr *hdr) {
+            auto it = m_pending.find(hdr->nlmsg_seq);
+            if (hdr->nlmsg_type != NLMSG_ERROR || it == m_pending.end())
+            {
+                /* Acks of requests given up on after an earlier receive failure */
+                return true;
+            }
+
+            struct nlmsgerr *err = static_cast<struct nlmsgerr *>(nlmsg_data(hdr));
+            Result &result = m_results[it->second];
+            result.error = err->error;
+
+            if (hdr->nlmsg_flags & NLM_F_ACK_TLVS)
+            {
+                int offset = static_cast<int>(sizeof(*err));
+                if (!(hdr->nlmsg_flags & NLM_F_CAPPED))
+                {
+                    offset += static_cast<int>(NLMSG_ALIGN(err->msg.nlmsg_len) - sizeof(struct nlmsghdr));
+                }
+
+                struct nlattr *attr;
+                int remaining;
+                nla_for_each_attr(attr, reinterpret_cast<struct nlattr *>(reinterpret_cast<char *>(err) + offset),
+                                  nlmsg_datalen(hdr) - offset, remaining)
+                {
+                    if (nla_type(attr) == NLMSGERR_ATTR_MSG)
+                    {
+                        result.message = nla_get_string(attr);
+                    }
+                }
+            }
+
+            m_pending.erase(it);
+            return !m_pending.empty();
+        });
+
+        if (!received)
+        {
+            error = -EIO;
+        }
+    }
+
+    /* Outcome unknown, the requests may or may not have been applied */
+    for (const auto &it : m_pending)
+    {
+        m_results[it.second].error = error;
+    }
+    m_pending.clear();
+}
+
+bool NlProgrammer::receive(const function<bool(struct nlmsghdr *)> &handler)
+{
+    vector<char> buf(NL_RECV_BUFFER_SIZE);
+    int fd = nl_socket_get_fd(m_sock);
+
+    while (true)
+    {
+        ssize_t len = recv(fd, buf.data(), buf.size(), 0);
+        if (len < 0)
+        {
+            if (errno == EINTR)
+            {
+                continue;
+            }
+
+            SWSS_LOG_ERROR("Netlink receive failed, error '%s'", strerror(errno));
+            return false;
+        }
+
+        int remaining = static_cast<int>(len);
+        for (struct nlmsghdr *hdr = reinterpret_cast<struct nlmsghdr *>(buf.data());
+             nlmsg_ok(hdr, remaining); hdr = nlmsg_next(hdr, &remaining))
+        {
+            if (!handler(hdr))
+            {
+                return true;
+            }
+        }
+    }
+}
+
+bool NlProgrammer::commit()
+{
+    SWSS_LOG_ENTER();
+
+    m_results.clear();
+    m_results.reserve(m_ops.size());
+
+    vector<Operation> ops;
+    ops.swap(m_ops);
+
+    for (auto &op : ops)
+    {
+        size_t result = m_results.size();
+        m_results.push_back({ op.desc, 0, "" });
+
+        int error = 0;
+        struct nl_msg *msg = op.build(error);
+        if (!msg)
+        {
+            m_results[result].error = error;
+            continue;
+        }
+
+        append(msg, result);
+        if (m_batch.size() >= NL_BATCH_MAX_SIZE)
+        {
+            flush();
+        }
+    }
+    flush();
+
+    bool success = true;
+    for (const auto &result : m_results)
+    {
+        if (result.error)
+        {
+            SWSS_LOG_ERROR("Failed to %s: %s%s%s", result.op.c_str(), strerror(-result.error),
+                           result.message.empty() ? "" : ", ", result.message.c_str());
+            success = false;
+        }
+    }
+
+    return success;
+}
+
+string NlProgrammer::getErrors() const
+{
+    ostringstream errors;
+
+    for (const auto &result : m_results)
+    {
+        if (result.error)
+        {
+            if (errors.tellp() > 0)
+            {
+                errors << "; ";
+            }
+            errors << result.op << ": " << strerror(-result.error);
+            if (!result.message.empty())
+            {
+                errors << " (" << result.message << ")";
+            }
+        }
+    }
+
+    return errors.str();
+}
+
+bool NlProgrammer::getBridgeVlans(const string &dev, set<uint16_t> &vlan_ids)
+{
+    SWSS_LOG_ENTER();
+
+    int ifindex = static_cast<int>(if_nametoindex(dev.c_str()));
+    if (!ifindex)
+    {
+        SWSS_LOG_ERROR("Cannot find device %s", dev.c_str());
+        return false;
+    }
+
+    /* Bridge port VLANs are only dumped, for all the ports at once */
+    int error = 0;
+    struct nl_msg *msg = allocLinkMsg(RTM_GETLINK, NLM_F_REQUEST | NLM_F_DUMP, AF_BRIDGE, 0, error);
+    if (!msg)
+    {
+        return false;
+    }
+    nla_put_u32(msg, IFLA_EXT_MASK, RTEXT_FILTER_BRVLAN);
+
+    struct nlmsghdr *req = nlmsg_hdr(msg);
+    uint32_t seq = ++m_seq;
+    req->nlmsg_seq = seq;
+
+    struct sockaddr_nl kernel;
+    memset(&kernel, 0, sizeof(kernel));
+    kernel.nl_family = AF_NETLINK;
+
+    ssize_t sent = sendto(nl_socket_get_fd(m_sock), req, req->nlmsg_len, 0,
+                          reinterpret_cast<struct sockaddr *>(&kernel), sizeof(kernel));
+    nlmsg_free(msg);
+    if (sent < 0)
+    {
+        SWSS_LOG_ERROR("Netlink send failed, error '%s'", strerror(errno));
+        return false;
+    }
+
+    vlan_ids.clear();
+    bool success = true;
+    bool received = receive([&](struct nlmsghdr *hdr) {
+        if (hdr->nlmsg_seq != seq)
+        {
+            return true;
+        }
+
+        if (hdr->nlmsg_type == NLMSG_DONE)
+        {
+            return false;
+        }
+
+        if (hdr->nlmsg_type == NLMSG_ERROR)
+        {
+            struct nlmsgerr *err = static_cast<struct nlmsgerr *>(nlmsg_data(hdr));
+            SWSS_LOG_ERROR("Failed to get the bridge VLANs of %s: %s", dev.c_str(), strerror(-err->error));
+            success = false;
+            return false;
+        }
+
+        struct ifinfomsg *ifi = static_cast<struct ifinfomsg *>(nlmsg_data(hdr));
+        if (hdr->nlmsg_type != RTM_NEWLINK || ifi->ifi_index != ifindex)
+        {
+            return true;
+        }
+
+        struct nlattr *afspec = nlmsg_find_attr(hdr, sizeof(*ifi), IFLA_AF_SPEC);
+        if (afspec)
+        {
+            struct nlattr *attr;
+            int remaining;
+            nla_for_each_nested(attr, afspec, remaining)
+            {
+                if (nla_type(attr) == IFLA_BRIDGE_VLAN_INFO)
+                {
+                    vlan_ids.insert(static_cast<struct bridge_vlan_info *>(nla_data(attr))->vid);
+                }
+            }
+        }
+        return true;
+    });
+
+    return received && success;
+}
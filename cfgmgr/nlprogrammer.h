@@ -0,0 +1,108 @@
+#ifndef __NLPROGRAMMER__
+#define __NLPROGRAMMER__
+
+#include <netlink/netlink.h>
+
+#include <cstdint>
+#include <functional>
+#include <map>
+#include <set>
+#include <string>
+#include <vector>
+
+#include "ipprefix.h"
+#include "macaddress.h"
+
+namespace swss {
+
+/*
+ * Kernel link, VLAN, bridge, address and VRF programming over rtnetlink, in
+ * place of running ip and bridge commands.
+ *
+ * Operations are queued and sent by commit() in batches, many requests per
+ * send with one ack each, and the outcome of every operation is reported
+ * separately. Links are referred to by name, the names are resolved when the
+ * operations are sent so that an operation can use a link created earlier in
+ * the same commit.
+ */
+class NlProgrammer
+{
+public:
+    struct Result
+    {
+        std::string op;         // Description of the operation, e.g. "link add Vlan10"
+        int error;              // 0, or the negative errno returned by the kernel
+        std::string message;    // Extended ack message of the kernel, if any
+    };
+
+    NlProgrammer();
+    ~NlProgrammer();
+
+    // Disable copying
+    NlProgrammer(const NlProgrammer&) = delete;
+    NlProgrammer& operator=(const NlProgrammer&) = delete;
+
+    void addBridge(const std::string &name, bool up);
+    void addVlan(const std::string &name, const std::string &parent, uint16_t vlan_id, const MacAddress &mac, bool up);
+    void addVrf(const std::string &name, uint32_t table);
+    void delLink(const std::string &name);
+
+    void setLinkAdminState(const std::string &name, bool up);
+    void setLinkMtu(const std::string &name, uint32_t mtu);
+    void setLinkMac(const std::string &name, const MacAddress &mac);
+    /* Enslave the link to master, or release it from its master if master is empty */
+    void setLinkMaster(const std::string &name, const std::string &master);
+
+    /* VLANs of a bridge port, or of the bridge itself with self */
+    void addBridgeVlan(const std::string &dev, uint16_t vlan_id, bool untagged, bool self = false);
+    void delBridgeVlan(const std::string &dev, uint16_t vlan_id, bool self = false);
+
+    void addAddress(const std::string &dev, const IpPrefix &prefix);
+    void delAddress(const std::string &dev, const IpPrefix &prefix);
+
+    /*
+     * Send the queued operations and wait for the kernel to process them.
+     * All of them are attempted in order, whatever the outcome of the previous
+     * ones. Returns false if any failed.
+     */
+    bool commit();
+
+    /* Outcome of the operations of the last commit, in queuing order */
+    const std::vector<Result> &getResults() const { return m_results; }
+
+    /* The failed operations of the last commit, for logs and exceptions */
+    std::string getErrors() const;
+
+    /* VLANs configured on a bridge port, false if they cannot be read */
+    bool getBridgeVlans(const std::string &dev, std::set<uint16_t> &vlan_ids);
+
+private:
+    /* Builds the request of an operation, nullptr with error set if it cannot */
+    typedef std::function<struct nl_msg *(int &error)> Builder;
+
+    struct Operation
+    {
+        std::string desc;
+        Builder build;
+    };
+
+    void queue(const std::string &desc, Builder build);
+    int getIfIndex(const std::string &name);
+    void append(struct nl_msg *msg, size_t result);
+    void flush();
+    bool receive(const std::function<bool(struct nlmsghdr *)> &handler);
+
+    struct nl_sock *m_sock;
+    uint32_t m_seq;
+
+    std::vector<Operation> m_ops;
+    std::vector<Result> m_results;
+
+    /* Requests sent together, and the results waiting for their ack by sequence number */
+    std::vector<char> m_batch;
+    std::map<uint32_t, size_t> m_pending;
+};
+
+}
+
+#endif /* __NLPROGRAMMER__ */
@@ -13,6 +13,7 @@
 #define TEAMD_CMD            "/usr/bin/teamd"
 #define TEAMDCTL_CMD         "/usr/bin/teamdctl"
 #define IPTABLES_CMD         "/sbin/iptables"
+#define IPTABLES_RESTORE_CMD "/sbin/iptables-restore"
 #define CONNTRACK_CMD        "/usr/sbin/conntrack"
 
 #define EXEC_WITH_ERROR_THROW(cmd, res)   ({    \
@@ -1,4 +1,5 @@
 #include <string.h>
+#include <fstream>
 #include "logger.h"
 #include "producerstatetable.h"
 #include "macaddress.h"
@@ -115,29 +116,28 @@ VlanMgr::VlanMgr(DBConnector *cfgDb, DBConnector *appDb, DBConnector *stateDb, c
     EXEC_WITH_ERROR_THROW(no_ll_learn_cmd, res);
 }
 
+/* Send the queued kernel operations, throwing on failure like EXEC_WITH_ERROR_THROW */
+static void commitOrThrow(NlProgrammer &nl)
+{
+    if (!nl.commit())
+    {
+        throw runtime_error(nl.getErrors());
+    }
+}
+
 bool VlanMgr::addHostVlan(int vlan_id)
 {
     SWSS_LOG_ENTER();
 
-    // The command should be generated as:
-    // /bin/bash -c "/sbin/bridge vlan add vid {{vlan_id}} dev Bridge self &&
-    //               /sbin/ip link add link Bridge up name Vlan{{vlan_id}} address {{gMacAddress}} type vlan id {{vlan_id}}"
-    const std::string cmds = std::string("")
-      + BASH_CMD + " -c \""
-      + BRIDGE_CMD + " vlan add vid " + std::to_string(vlan_id) + " dev " + DOT1Q_BRIDGE_NAME + " self && "
-      + IP_CMD + " link add link " + DOT1Q_BRIDGE_NAME
-               + " up"
-               + " name " + VLAN_PREFIX + std::to_string(vlan_id)
-               + " address " + gMacAddress.to_string()
-               + " type vlan id " + std::to_string(vlan_id) + "\"";
-
-    std::string res;
-    EXEC_WITH_ERROR_THROW(cmds, res);
+    // Equivalent of:
+    // /sbin/bridge vlan add vid {{vlan_id}} dev Bridge self &&
+    // /sbin/ip link add link Bridge up name Vlan{{vlan_id}} address {{gMacAddress}} type vlan id {{vlan_id}}
+    m_nl.addBridgeVlan(DOT1Q_BRIDGE_NAME, static_cast<uint16_t>(vlan_id), false, true);
+    m_nl.addVlan(VLAN_PREFIX + std::to_string(vlan_id), DOT1Q_BRIDGE_NAME, static_cast<uint16_t>(vlan_id), gMacAddress, true);
+    commitOrThrow(m_nl);
 
-    res.clear();
-    const std::string echo_cmd = std::string("")
-      + ECHO_CMD + " 0 > /proc/sys/net/ipv4/conf/" + VLAN_PREFIX + std::to_string(vlan_id) + "/arp_evict_nocarrier";
-    swss::exec(echo_cmd, res);
+    std::ofstream arp_evict_nocarrier("/proc/sys/net/ipv4/conf/" VLAN_PREFIX + std::to_string(vlan_id) + "/arp_evict_nocarrier");
+    arp_evict_nocarrier << "0";
 
     return true;
 }
@@ -146,16 +146,12 @@ bool VlanMgr::removeHostVlan(int vlan_id)
 {
     SWSS_LOG_ENTER();
 
-    // The command should be generated as:
-    // /bin/bash -c "/sbin/ip link del Vlan{{vlan_id}} &&
-    //               /sbin/bridge vlan del vid {{vlan_id}} dev Bridge self"
-    const std::string cmds = std::string("")
-      + BASH_CMD + " -c \""
-      + IP_CMD + " link del " + VLAN_PREFIX + std::to_string(vlan_id) + " && "
-      + BRIDGE_CMD + " vlan del vid " + std::to_string(vlan_id) + " dev " + DOT1Q_BRIDGE_NAME + " self\"";
-
-    std::string res;
-    EXEC_WITH_ERROR_THROW(cmds, res);
+    // Equivalent of:
+    // /sbin/ip link del Vlan{{vlan_id}} &&
+    // /sbin/bridge vlan del vid {{vlan_id}} dev Bridge self
+    m_nl.delLink(VLAN_PREFIX + std::to_string(vlan_id));
+    m_nl.delBridgeVlan(DOT1Q_BRIDGE_NAME, static_cast<uint16_t>(vlan_id), true);
+    commitOrThrow(m_nl);
 
     return true;
 }
@@ -164,13 +160,15 @@ bool VlanMgr::setHostVlanAdminState(int vlan_id, const string &admin_status)
 {
     SWSS_LOG_ENTER();
 
-    // The command should be generated as:
-    // /sbin/ip link set Vlan{{vlan_id}} {{admin_status}}
-    ostringstream cmds;
-    cmds << IP_CMD " link set " VLAN_PREFIX + std::to_string(vlan_id) + " " << shellquote(admin_status);
+    if (admin_status != "up" && admin_status != "down")
+    {
+        throw runtime_error("Invalid admin status " + admin_status + " for " VLAN_PREFIX + std::to_string(vlan_id));
+    }
 
-    std::string res;
-    EXEC_WITH_ERROR_THROW(cmds.str(), res);
+    // Equivalent of:
+    // /sbin/ip link set Vlan{{vlan_id}} {{admin_status}}
+    m_nl.setLinkAdminState(VLAN_PREFIX + std::to_string(vlan_id), admin_status == "up");
+    commitOrThrow(m_nl);
 
     return true;
 }
@@ -179,53 +177,36 @@ bool VlanMgr::setHostVlanMtu(int vlan_id, uint32_t mtu)
 {
     SWSS_LOG_ENTER();
 
-    // The command should be generated as:
+    // Equivalent of:
     // /sbin/ip link set Vlan{{vlan_id}} mtu {{mtu}}
-    const std::string cmds = std::string("")
-      + IP_CMD + " link set " + VLAN_PREFIX + std::to_string(vlan_id) + " mtu " + std::to_string(mtu);
-
-    std::string res;
-    int ret = swss::exec(cmds, res);
-    if (ret == 0)
-    {
-        return true;
-    }
+    m_nl.setLinkMtu(VLAN_PREFIX + std::to_string(vlan_id), mtu);
 
     /* VLAN mtu should not be larger than member mtu */
-    return false;
+    return m_nl.commit();
 }
 
 bool VlanMgr::setHostVlanMac(int vlan_id, const string &mac)
 {
     SWSS_LOG_ENTER();
 
-    std::string res;
+    MacAddress macAddress(mac);
 
     /*
      * Bring down the bridge before changing MAC addresses of the bridge and the VLAN interface.
      * This is done so that the IPv6 link-local addresses of the bridge and the VLAN interface
      * are updated after MAC change.
+     *
+     * Equivalent of:
      * /sbin/ip link set Bridge down
-     */
-    string bridge_down(IP_CMD " link set " DOT1Q_BRIDGE_NAME " down");
-    EXEC_WITH_ERROR_THROW(bridge_down, res);
-
-    // The command should be generated as:
-    // /sbin/ip link set Vlan{{vlan_id}} address {{mac}} &&
-    // /sbin/ip link set Bridge address {{mac}}
-    ostringstream cmds;
-    cmds << IP_CMD " link set " VLAN_PREFIX + std::to_string(vlan_id) + " address " << shellquote(mac) << " && "
-            IP_CMD " link set " DOT1Q_BRIDGE_NAME " address " << shellquote(mac);
-    res.clear();
-    EXEC_WITH_ERROR_THROW(cmds.str(), res);
-
-    /*
-     * Start up the bridge again.
+     * /sbin/ip link set Vlan{{vlan_id}} address {{mac}} &&
+     * /sbin/ip link set Bridge address {{mac}}
      * /sbin/ip link set Bridge up
      */
-    string bridge_up(IP_CMD " link set " DOT1Q_BRIDGE_NAME " up");
-    res.clear();
-    EXEC_WITH_ERROR_THROW(bridge_up, res);
+    m_nl.setLinkAdminState(DOT1Q_BRIDGE_NAME, false);
+    m_nl.setLinkMac(VLAN_PREFIX + std::to_string(vlan_id), macAddress);
+    m_nl.setLinkMac(DOT1Q_BRIDGE_NAME, macAddress);
+    m_nl.setLinkAdminState(DOT1Q_BRIDGE_NAME, true);
+    commitOrThrow(m_nl);
 
     return true;
 }
@@ -234,39 +215,30 @@ bool VlanMgr::addHostVlanMember(int vlan_id, const string &port_alias, const str
 {
     SWSS_LOG_ENTER();
 
-    std::string tagging_cmd;
-    if (tagging_mode == "untagged" || tagging_mode == "priority_tagged")
-    {
-        tagging_cmd = "pvid untagged";
-    }
+    bool untagged = (tagging_mode == "untagged" || tagging_mode == "priority_tagged");
 
-    // The command should be generated as:
-    // /bin/bash -c "/sbin/ip link set {{port_alias}} master Bridge &&
-    //               /sbin/bridge vlan del vid 1 dev {{ port_alias }} &&
-    //               /sbin/bridge vlan add vid {{vlan_id}} dev {{port_alias}} {{tagging_mode}}"
-    ostringstream cmds, inner;
-    inner << IP_CMD " link set " << shellquote(port_alias) << " master " DOT1Q_BRIDGE_NAME " && "
-      BRIDGE_CMD " vlan del vid " DEFAULT_VLAN_ID " dev " << shellquote(port_alias) << " && "
-      BRIDGE_CMD " vlan add vid " + std::to_string(vlan_id) + " dev " << shellquote(port_alias) << " " + tagging_cmd;
-    cmds << BASH_CMD " -c " << shellquote(inner.str());
+    // Equivalent of:
+    // /sbin/ip link set {{port_alias}} master Bridge &&
+    // /sbin/bridge vlan del vid 1 dev {{ port_alias }} &&
+    // /sbin/bridge vlan add vid {{vlan_id}} dev {{port_alias}} {{tagging_mode}}
+    auto queueMember = [&]() {
+        m_nl.setLinkMaster(port_alias, DOT1Q_BRIDGE_NAME);
+        m_nl.delBridgeVlan(port_alias, static_cast<uint16_t>(std::stoi(DEFAULT_VLAN_ID)));
+        m_nl.addBridgeVlan(port_alias, static_cast<uint16_t>(vlan_id), untagged);
+    };
 
-    std::string res;
-    try
-    {
-        EXEC_WITH_ERROR_THROW(cmds.str(), res);
-    }
-    catch (const std::runtime_error& e)
+    queueMember();
+    if (!m_nl.commit())
     {
         // Race conidtion can happen with portchannel removal might happen
-	// but state db is not updated yet so we can do retry instead of sending exception
-	if (!port_alias.compare(0, strlen(LAG_PREFIX), LAG_PREFIX))
-	{
+        // but state db is not updated yet so we can do retry instead of sending exception
+        if (!port_alias.compare(0, strlen(LAG_PREFIX), LAG_PREFIX))
+        {
             return false;
-	}
-        else
-	{
-            EXEC_WITH_ERROR_THROW(cmds.str(), res);
-	}
+        }
+
+        queueMember();
+        commitOrThrow(m_nl);
     }
 
     return true;
@@ -276,34 +248,24 @@ bool VlanMgr::removeHostVlanMember(int vlan_id, const string &port_alias)
 {
     SWSS_LOG_ENTER();
 
-    // The command should be generated as:
-    // /bin/bash -c '/sbin/bridge vlan del vid {{vlan_id}} dev {{port_alias}} &&
-    //               ( vlanShow=$(/sbin/bridge vlan show dev {{port_alias}});
-    //               ret=$?;
-    //               if [ $ret -eq 0 ]; then
-    //               if (! echo "$vlanShow" | grep -q {{port_alias}})
-    //                 || (echo "$vlanShow" | grep -q None$)
-    //                 || (echo "$vlanShow" | grep -q {{port_alias}}$); then
-    //               /sbin/ip link set {{port_alias}} nomaster;
-    //               fi;
-    //               else exit $ret; fi )'
+    // Equivalent of:
+    // /sbin/bridge vlan del vid {{vlan_id}} dev {{port_alias}} &&
+    // /sbin/ip link set {{port_alias}} nomaster, if the port has no VLAN left
+    m_nl.delBridgeVlan(port_alias, static_cast<uint16_t>(vlan_id));
+    commitOrThrow(m_nl);
 
-    // When port is not member of any VLAN, it shall be detached from Dot1Q bridge!
-    ostringstream cmds, inner;
-    inner << BRIDGE_CMD " vlan del vid " + std::to_string(vlan_id) + " dev " << shellquote(port_alias) << " && ( "
-      "vlanShow=$(" BRIDGE_CMD " vlan show dev " << shellquote(port_alias) << "); "
-      "ret=$?; "
-      "if [ $ret -eq 0 ]; then "
-      "if (! echo \"$vlanShow\" | " GREP_CMD " -q " << shellquote(port_alias) << ") "
-      " || (echo \"$vlanShow\" | " GREP_CMD " -q None$) "
-      " || (echo \"$vlanShow\" | " GREP_CMD " -q " << shellquote(port_alias) << "$); then "
-      IP_CMD " link set " << shellquote(port_alias) << " nomaster; "
-      "fi; "
-      "else exit $ret; fi )";
-    cmds << BASH_CMD " -c " << shellquote(inner.str());
+    std::set<uint16_t> vlan_ids;
+    if (!m_nl.getBridgeVlans(port_alias, vlan_ids))
+    {
+        throw runtime_error("Failed to get the bridge VLANs of " + port_alias);
+    }
 
-    std::string res;
-    EXEC_WITH_ERROR_THROW(cmds.str(), res);
+    // When port is not member of any VLAN, it shall be detached from Dot1Q bridge!
+    if (vlan_ids.empty())
+    {
+        m_nl.setLinkMaster(port_alias, "");
+        m_nl.commit();
+    }
 
     return true;
 }
@@ -6,7 +6,8 @@ Description: bgp_eoiu_marker.py -- populating bgp eoiu marker flags in stateDB d
     It does not do anything in case neither system nor bgp warm restart is enabled.
 
     The script check bgp neighbor state via vtysh cli interface periodically (every 1 second).
-    It looks for explicit EOR and implicit EOR (keep alive after established) in the json output of show ip bgp neighbors A.B.C.D json
+    It looks for explicit EOR and implicit EOR (keep alive after established) in the json output of show bgp neighbors json,
+    which is queried once per check for all the neighbors.
 
     Once the script has collected all needed EORs, it set a EOIU flags in stateDB.
 
@@ -97,13 +98,29 @@ class BgpStateCheck():
         syslog.syslog('Cleaned ipv4 and ipv6 eoiu marker flags')
         return
 
-    def bgp_eor_received(self, neigh, is_ipv4):
+    # Get the status of all bgp neighbors with a single vtysh call, keyed by neighbor address
+    def get_bgp_neighbors_status(self):
+        try:
+            cmd = "vtysh -c 'show bgp neighbors json'"
+            output = commands.getoutput(cmd)
+            return json.loads(output)
+
+        except Exception:
+            syslog.syslog(syslog.LOG_ERR, "*ERROR* get_bgp_neighbors_status Exception: %s" % (traceback.format_exc()))
+            return {}
+
+    # neighbors_status is the output of get_bgp_neighbors_status(), if not provided
+    # the status of this neighbor alone is queried from vtysh
+    def bgp_eor_received(self, neigh, is_ipv4, neighbors_status=None):
         try:
             neighstr = "%s" % neigh
             eor_received = False
-            cmd = "vtysh -c 'show bgp neighbors %s json'" % neighstr
-            output = commands.getoutput(cmd)
-            neig_status = json.loads(output)
+            if neighbors_status is None:
+                cmd = "vtysh -c 'show bgp neighbors %s json'" % neighstr
+                output = commands.getoutput(cmd)
+                neig_status = json.loads(output)
+            else:
+                neig_status = neighbors_status
             if neighstr in neig_status:
                 if "gracefulRestartInfo" in neig_status[neighstr]:
                     if "endOfRibRecv" in neig_status[neighstr]["gracefulRestartInfo"]:
@@ -142,14 +159,18 @@ class BgpStateCheck():
     # Once all ipv6 neighbors have EOR received, bgp_ipv6_eoiu becomes True.
 
     # The neighbor EoR states were checked in a loop with an interval (CHECK_INTERVAL)
+    # The status of all the neighbors is fetched with one vtysh call per check, and
+    # the EoR state of every neighbor is evaluated from that single json document.
     # The function will timeout in case eoiu states never meet the condition
     # after some time (DEF_TIME_OUT).
     def wait_for_bgp_eoiu(self):
         wait_time = self.DEF_TIME_OUT
         while wait_time >= 0:
+            neighbors_status = self.get_bgp_neighbors_status()
+
             if not self.bgp_ipv4_eoiu:
                 for neigh, eor_status in self.ipv4_neigh_eor_status.items():
-                    if eor_status == "unknown" and self.bgp_eor_received(neigh, True):
+                    if eor_status == "unknown" and self.bgp_eor_received(neigh, True, neighbors_status):
                         self.ipv4_neigh_eor_status[neigh] = "rcvd"
                 if "unknown" not in self.ipv4_neigh_eor_status.values():
                     self.bgp_ipv4_eoiu = True
@@ -157,7 +178,7 @@ class BgpStateCheck():
 
             if not self.bgp_ipv6_eoiu:
                 for neigh, eor_status in self.ipv6_neigh_eor_status.items():
-                    if eor_status == "unknown" and self.bgp_eor_received(neigh, False):
+                    if eor_status == "unknown" and self.bgp_eor_received(neigh, False, neighbors_status):
                         self.ipv6_neigh_eor_status[neigh] = "rcvd"
                 if "unknown" not in self.ipv6_neigh_eor_status.values():
                     self.bgp_ipv6_eoiu = True
@@ -34,10 +34,13 @@ static int gFlushTimeout = FLUSH_TIMEOUT;
  * but fpmsyncd can invoke pipeline's flush even if it's not full yet.
  * 
  * By setting gSelectTimeout, fpmsyncd controls the flush interval.
+ * Route updates coalesced by RouteSync are written right before the flush,
+ * so that a route changing several times in between is written once.
  * 
+ * @param sync reference to the route sync holding the coalesced routes
  * @param pipeline reference to the pipeline to be flushed
  */
-void flushPipeline(RedisPipeline& pipeline);
+void flushPipeline(RouteSync& sync, RedisPipeline& pipeline);
 
 /*
  * Default warm-restart timer interval for routing-stack app. To be used only if
@@ -86,6 +89,7 @@ int main(int argc, char **argv)
 
     RedisPipeline pipeline(&db, ROUTE_SYNC_PPL_SIZE);
     RouteSync sync(&pipeline);
+    sync.setRouteCoalescingEnabled(true);
 
     DBConnector stateDb("STATE_DB", 0);
     Table bgpStateTable(&stateDb, STATE_BGP_TABLE_NAME);
@@ -134,6 +138,7 @@ int main(int argc, char **argv)
              * Pipeline should be flushed right away to deal with state pending
              * from previous try/catch iterations.
              */
+            sync.flushRoutes();
             pipeline.flush();
 
             cout << "Waiting for fpm-client connection..." << endl;
@@ -213,6 +218,7 @@ int main(int argc, char **argv)
 
                     // remove the one-shot timer.
                     s.removeSelectable(temps);
+                    sync.flushRoutes();
                     pipeline.flush();
                     SWSS_LOG_DEBUG("Pipeline flushed");
                 }
@@ -295,6 +301,8 @@ int main(int argc, char **argv)
                                  * orchagent, thus such updates might be missing. Since we are disabling suppression
                                  * we no longer care about real HW offload status and can mark all routes as offloaded
                                  * to avoid routes stuck in suppressed state after transition. */
+                                sync.flushRoutes();
+                                pipeline.flush();
                                 sync.markRoutesOffloaded(db);
 
                                 sync.setSuppressionEnabled(false);
@@ -319,7 +327,7 @@ int main(int argc, char **argv)
                 }
                 else if (!warmStartEnabled || sync.getWarmStartHelper().isReconciled())
                 {
-                    flushPipeline(pipeline);
+                    flushPipeline(sync, pipeline);
                 }
             }
         }
@@ -332,9 +340,9 @@ int main(int argc, char **argv)
     return 1;
 }
 
-void flushPipeline(RedisPipeline& pipeline) {
+void flushPipeline(RouteSync& sync, RedisPipeline& pipeline) {
 
-    size_t remaining = pipeline.size();
+    size_t remaining = pipeline.size() + sync.getPendingRouteCount();
 
     if (remaining == 0) {
         gSelectTimeout = INFINITE;
@@ -349,6 +357,7 @@ void flushPipeline(RedisPipeline& pipeline) {
     // 3. idle <= 0, due to system clock drift, should not happen since we already use steady_clock for timing
     if (remaining < SMALL_TRAFFIC || idle >= gFlushTimeout || idle <= 0) {
 
+        sync.flushRoutes();
         pipeline.flush();
 
         gSelectTimeout = INFINITE;
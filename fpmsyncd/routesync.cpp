@@ -27,6 +27,9 @@ using namespace swss;
 #define MGMT_VRF_PREFIX         "mgmt"
 
 #define NHG_DELIMITER ','
+
+/* Coalesced route updates are written out once there are this many pending */
+#define ROUTE_COALESCE_MAX_SIZE 50000
 #define MY_SID_KEY_DELIMITER ':'
 
 #ifndef ETH_ALEN
@@ -162,11 +165,25 @@ RouteSync::RouteSync(RedisPipeline *pipeline) :
     m_warmStartHelper(pipeline, m_routeTable.get(), APP_ROUTE_TABLE_NAME, "bgp", "bgp"),
     m_srv6MySidTable(pipeline, APP_SRV6_MY_SID_TABLE_NAME, true),
     m_srv6SidListTable(pipeline, APP_SRV6_SID_LIST_TABLE_NAME, true),
-    m_nl_sock(NULL), m_link_cache(NULL)
+    m_nl_sock(NULL)
 {
     m_nl_sock = nl_socket_alloc();
     nl_connect(m_nl_sock, NETLINK_ROUTE);
-    rtnl_link_alloc_cache(m_nl_sock, AF_UNSPEC, &m_link_cache);
+
+    /* Dump the links once, they are tracked from the link messages afterwards */
+    struct nl_cache *link_cache = NULL;
+    if (rtnl_link_alloc_cache(m_nl_sock, AF_UNSPEC, &link_cache) == 0)
+    {
+        nl_cache_foreach(link_cache, [](struct nl_object *obj, void *arg) {
+            auto *link = (struct rtnl_link *)obj;
+            auto *sync = static_cast<RouteSync *>(arg);
+            if (rtnl_link_get_name(link))
+            {
+                sync->addLink(rtnl_link_get_ifindex(link), rtnl_link_get_name(link));
+            }
+        }, this);
+        nl_cache_free(link_cache);
+    }
 }
 
 void RouteSync::setRouteWithWarmRestart(FieldValueTupleWrapperBase & fvw,
@@ -176,7 +193,11 @@ void RouteSync::setRouteWithWarmRestart(FieldValueTupleWrapperBase & fvw,
 
     if (!warmRestartInProgress)
     {
-        table.set(fvw.KeyOpFieldsValuesTupleVector());
+        auto kfvs = fvw.KeyOpFieldsValuesTupleVector();
+        if (!coalesceRoute(table, fvw.key, std::move(kfvs)))
+        {
+            table.set(kfvs);
+        }
     }
     else
     {
@@ -199,12 +220,84 @@ void RouteSync::delWithWarmRestart(FieldValueTupleWrapperBase && fvw,
                                    ProducerStateTable & table) {
     bool warmRestartInProgress = m_warmStartHelper.inProgress();
     if (!warmRestartInProgress) {
-        table.del(fvw.key);
+        if (!coalesceRoute(table, fvw.key, {})) {
+            table.del(fvw.key);
+        }
     } else {
         m_warmStartHelper.insertRefreshMap(fvw.KeyOpFieldsValuesTupleVectorForDel());
     }
 }
 
+void RouteSync::setRoute(ProducerStateTable &table, const string &key, const vector<FieldValueTuple> &fvs)
+{
+    if (!coalesceRoute(table, key, { KeyOpFieldsValuesTuple{key, SET_COMMAND, fvs} }))
+    {
+        table.set(key, fvs);
+    }
+}
+
+void RouteSync::setRouteCoalescingEnabled(bool enabled)
+{
+    if (!enabled)
+    {
+        flushRoutes();
+    }
+    m_isRouteCoalescingEnabled = enabled;
+}
+
+bool RouteSync::coalesceRoute(ProducerStateTable &table, const string &key, vector<KeyOpFieldsValuesTuple> &&kfvs)
+{
+    if (!m_isRouteCoalescingEnabled
+        || (&table != m_routeTable.get() && &table != m_label_routeTable.get()))
+    {
+        return false;
+    }
+
+    auto it = m_pendingRouteIndex.find(make_pair(&table, key));
+    if (it != m_pendingRouteIndex.end())
+    {
+        /* The last update of the route wins, it replaces the whole previous one */
+        SWSS_LOG_DEBUG("Coalesce route update %s", key.c_str());
+        m_pendingRoutes[it->second].kfvs = std::move(kfvs);
+        return true;
+    }
+
+    m_pendingRouteIndex.emplace(make_pair(&table, key), m_pendingRoutes.size());
+    m_pendingRoutes.push_back({ &table, key, std::move(kfvs) });
+
+    if (m_pendingRoutes.size() >= ROUTE_COALESCE_MAX_SIZE)
+    {
+        flushRoutes();
+    }
+
+    return true;
+}
+
+void RouteSync::flushRoutes()
+{
+    if (m_pendingRoutes.empty())
+    {
+        return;
+    }
+
+    SWSS_LOG_DEBUG("Write %zu coalesced route updates", m_pendingRoutes.size());
+
+    for (auto &route : m_pendingRoutes)
+    {
+        if (route.kfvs.empty())
+        {
+            route.table->del(route.key);
+        }
+        else
+        {
+            route.table->set(route.kfvs);
+        }
+    }
+
+    m_pendingRoutes.clear();
+    m_pendingRouteIndex.clear();
+}
+
 char *RouteSync::prefixMac2Str(char *mac, char *buf, int size)
 {
     char *ptr = buf;
@@ -1864,7 +1957,7 @@ void RouteSync::onSrv6VpnRouteMsg(struct nlmsghdr *h, int len)
                 FieldValueTuple wg("weight", weights.c_str());
                 fvVector.push_back(wg);
             }
-            m_routeTable->set(routeTableKey, fvVector);
+            setRoute(*m_routeTable, routeTableKey, fvVector);
 
             SWSS_LOG_DEBUG("NextHop group id %d is a single nexthop address. Filling the route table %s with nexthop and ifname", nhg_id, destipprefix);
         }
@@ -1892,7 +1985,7 @@ void RouteSync::onSrv6VpnRouteMsg(struct nlmsghdr *h, int len)
             fvVectorVpnRoute.push_back(vpn_sid);
             fvVectorVpnRoute.push_back(seg_srcs_route);
             fvVectorVpnRoute.push_back(intf);
-            m_routeTable->set(routeTableKey, fvVectorVpnRoute);
+            setRoute(*m_routeTable, routeTableKey, fvVectorVpnRoute);
         }
     }
 
@@ -2054,7 +2147,7 @@ void RouteSync::onMsg(int nlmsg_type, struct nl_object *obj)
 {
     if (nlmsg_type == RTM_NEWLINK || nlmsg_type == RTM_DELLINK)
     {
-        nl_cache_refill(m_nl_sock, m_link_cache);
+        onLinkMsg(nlmsg_type, (struct rtnl_link *)obj);
         return;
     }
 
@@ -2859,30 +2952,106 @@ bool RouteSync::getIfName(int if_index, char *if_name, size_t name_len)
 
     memset(if_name, 0, name_len);
 
-    /* Cannot get interface name. Possibly the interface gets re-created. */
-    if (!rtnl_link_i2name(m_link_cache, if_index, if_name, name_len))
+    auto it = m_ifNames.find(if_index);
+
+    /* Cannot get interface name. Possibly the link message is not received yet. */
+    if (it == m_ifNames.end())
     {
-        /* Trying to refill cache */
-        nl_cache_refill(m_nl_sock, m_link_cache);
-        if (!rtnl_link_i2name(m_link_cache, if_index, if_name, name_len))
+        /* Trying to get this link only */
+        if (!fetchLink(if_index, NULL))
         {
             return false;
         }
+        it = m_ifNames.find(if_index);
     }
 
+    strncpy(if_name, it->second.c_str(), name_len - 1);
+
     return true;
 }
 
-rtnl_link* RouteSync::getLinkByName(const char *name)
+int RouteSync::getIfIndex(const char *name)
 {
-    auto link = rtnl_link_get_by_name(m_link_cache, name);
-    if (link == nullptr)
+    auto it = m_ifIndexes.find(name);
+    if (it == m_ifIndexes.end())
     {
-        /* Trying to refill cache */
-        nl_cache_refill(m_nl_sock ,m_link_cache);
-        link = rtnl_link_get_by_name(m_link_cache, name);
+        /* Trying to get this link only */
+        if (!fetchLink(0, name))
+        {
+            return 0;
+        }
+        it = m_ifIndexes.find(name);
     }
-    return link;
+    return it->second;
+}
+
+void RouteSync::onLinkMsg(int nlmsg_type, struct rtnl_link *link)
+{
+    int if_index = rtnl_link_get_ifindex(link);
+    const char *name = rtnl_link_get_name(link);
+
+    if (nlmsg_type == RTM_DELLINK)
+    {
+        SWSS_LOG_DEBUG("Link removed: %d", if_index);
+        removeLink(if_index);
+    }
+    else if (name)
+    {
+        SWSS_LOG_DEBUG("Link updated: %d %s", if_index, name);
+        addLink(if_index, name);
+    }
+}
+
+void RouteSync::addLink(int if_index, const string &name)
+{
+    auto it = m_ifNames.find(if_index);
+    if (it != m_ifNames.end())
+    {
+        if (it->second == name)
+        {
+            return;
+        }
+        /* Renamed link */
+        m_ifIndexes.erase(it->second);
+    }
+
+    m_ifNames[if_index] = name;
+    m_ifIndexes[name] = if_index;
+}
+
+void RouteSync::removeLink(int if_index)
+{
+    auto it = m_ifNames.find(if_index);
+    if (it == m_ifNames.end())
+    {
+        return;
+    }
+
+    auto name = m_ifIndexes.find(it->second);
+    if (name != m_ifIndexes.end() && name->second == if_index)
+    {
+        m_ifIndexes.erase(name);
+    }
+    m_ifNames.erase(it);
+}
+
+bool RouteSync::fetchLink(int if_index, const char *name)
+{
+    struct rtnl_link *link = NULL;
+
+    if (rtnl_link_get_kernel(m_nl_sock, if_index, name, &link) < 0 || !link)
+    {
+        return false;
+    }
+
+    bool found = rtnl_link_get_name(link) != NULL;
+    if (found)
+    {
+        addLink(rtnl_link_get_ifindex(link), rtnl_link_get_name(link));
+    }
+    rtnl_link_put(link);
+
+    return found;
 }
 
 /*
@@ -3245,15 +3414,14 @@ void RouteSync::onRouteResponse(const std::string& key, const std::vector<FieldV
     unsigned int vrfIfIndex = 0;
     if (!vrfName.empty())
     {
-        auto* link = getLinkByName(vrfName.c_str());
-        if (!link)
+        vrfIfIndex = getIfIndex(vrfName.c_str());
+        if (!vrfIfIndex)
         {
             SWSS_LOG_DEBUG("Failed to find VRF when constructing response message for prefix %s(%s). "
                 "This message is probably outdated", prefix.to_string().c_str(),
                 vrfName.c_str());
             return;
         }
-        vrfIfIndex = rtnl_link_get_ifindex(link);
     }
 
     rtnl_route_set_table(routeObject.get(), vrfIfIndex);
@@ -3367,6 +3535,8 @@ void RouteSync::deleteNextHopGroup(uint32_t nh_id)
     {
         string key = getNextHopGroupKeyAsString(nh_id);
         SWSS_LOG_DEBUG("NextHopGroup table del: key [%s]", key.c_str());
+        // Routes moved off the group are written before the group goes away
+        flushRoutes();
         m_nexthop_groupTable.del(key);
     }
     m_nh_groups.erase(git);
@@ -3386,6 +3556,7 @@ void RouteSync::deletePicContextGroup(uint32_t nh_id)
     if(nhg.installed)
     {
         string key = getNextHopGroupKeyAsString(nh_id);
+        flushRoutes();
         m_pic_context_groupTable.del(key.c_str());
         SWSS_LOG_DEBUG("NextHopGroup table del: key [%s]", key.c_str());
     }
@@ -233,6 +233,25 @@ public:
         return m_isSuppressionEnabled;
     }
 
+    /*
+     * Keep only the last update of each route (VRF and prefix) and each label
+     * route until flushRoutes(), instead of writing every update right away.
+     */
+    void setRouteCoalescingEnabled(bool enabled);
+
+    bool isRouteCoalescingEnabled() const
+    {
+        return m_isRouteCoalescingEnabled;
+    }
+
+    /* Write the coalesced route updates to their tables */
+    void flushRoutes();
+
+    size_t getPendingRouteCount() const
+    {
+        return m_pendingRoutes.size();
+    }
+
     /* Helper method to set route table with warm restart support */
     void setRouteWithWarmRestart(
         FieldValueTupleWrapperBase & fvw,
@@ -286,8 +305,10 @@ private:
     ProducerStateTable m_srv6MySidTable; 
     /* srv6 sid list table */
     ProducerStateTable m_srv6SidListTable; 
-    struct nl_cache    *m_link_cache;
     struct nl_sock     *m_nl_sock;
+    /* ifindex <-> name of the kernel links, kept up to date from link messages */
+    unordered_map<int, string> m_ifNames;
+    unordered_map<string, int> m_ifIndexes;
     /* nexthop group table */
     ProducerStateTable  m_nexthop_groupTable;
     ProducerStateTable  m_pic_context_groupTable;
@@ -296,6 +317,22 @@ private:
     map<string, uint32_t> m_srv6_sidlist_refcnt;
 
     bool                m_isSuppressionEnabled{false};
+    bool                m_isRouteCoalescingEnabled{false};
+
+    struct PendingRoute
+    {
+        ProducerStateTable *table;
+        string key;
+        /* Tuples to set, empty for a DEL */
+        vector<KeyOpFieldsValuesTuple> kfvs;
+    };
+    /* Coalesced route updates in arrival order, indexed by table and key */
+    vector<PendingRoute> m_pendingRoutes;
+    map<pair<ProducerStateTable *, string>, size_t> m_pendingRouteIndex;
+
+    /* Returns false if the update must be written right away */
+    bool coalesceRoute(ProducerStateTable &table, const string &key, vector<KeyOpFieldsValuesTuple> &&kfvs);
+    void setRoute(ProducerStateTable &table, const string &key, const vector<FieldValueTuple> &fvs);
     FpmInterface*       m_fpmInterface {nullptr};
 
     /* Handle regular route (include VRF route) */
@@ -342,8 +379,15 @@ private:
     /* Get interface name based on interface index */
     virtual bool getIfName(int if_index, char *if_name, size_t name_len);
 
-    /* Get interface if_index based on interface name */
-    rtnl_link* getLinkByName(const char *name);
+    /* Get interface if_index based on interface name, 0 if not found */
+    int getIfIndex(const char *name);
+
+    /* Handle link message, update the ifindex <-> name maps */
+    void onLinkMsg(int nlmsg_type, struct rtnl_link *link);
+    void addLink(int if_index, const string &name);
+    void removeLink(int if_index);
+    /* Query a single link from the kernel, by index or by name */
+    bool fetchLink(int if_index, const char *name);
 
     void getEvpnNextHopSep(string& nexthops, string& vni_list,  
                        string& mac_list, string& intf_list);
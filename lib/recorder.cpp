@@ -1,18 +1,35 @@
+#define ZLIB_CONST
+
 #include "recorder.h"
 #include "timestamp.h"
 #include "logger.h"
 #include <cstring>
 #include <inttypes.h>
 #include <unistd.h>
+#include <zlib.h>
 
 using namespace swss;
 
+#define BINARY_RECORD_MAGIC   "SWSSREC"
+#define BINARY_RECORD_VERSION 1
+
+#define BINARY_RECORD_HEADER  0
+#define BINARY_RECORD_LINE    1
+#define BINARY_RECORD_TUPLE   2
+
+/* Idle writer thread wakeup, bounds the latency of a missed signal */
+#define BINARY_WRITER_IDLE_MSECS 100
+#define BINARY_WRITER_BATCH_SIZE (64 * 1024)
+
 const std::string Recorder::DEFAULT_DIR = ".";
 const std::string Recorder::REC_START = "|recording started";
 const std::string Recorder::SWSS_FNAME = "swss.rec";
 const std::string Recorder::SAIREDIS_FNAME = "sairedis.rec";
 const std::string Recorder::RESPPUB_FNAME = "responsepublisher.rec";
 const std::string Recorder::RETRY_FNAME = "retry.rec";
+const std::string Recorder::BINARY_SUFFIX = ".bin";
+
+const size_t BinRecWriter::DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024;
 
 Recorder& Recorder::Instance()
 {
@@ -20,6 +37,588 @@ Recorder& Recorder::Instance()
     return m_recorder;
 }
 
+static void appendVarint(std::string& buf, uint64_t value)
+{
+    while (value >= 0x80)
+    {
+        buf.push_back(static_cast<char>((value & 0x7f) | 0x80));
+        value >>= 7;
+    }
+    buf.push_back(static_cast<char>(value));
+}
+
+static void appendString(std::string& buf, const std::string& str)
+{
+    appendVarint(buf, str.size());
+    buf.append(str);
+}
+
+static uint64_t toUsecs(const struct timeval& tv)
+{
+    return static_cast<uint64_t>(tv.tv_sec) * 1000000 + static_cast<uint64_t>(tv.tv_usec);
+}
+
+/* Wrap the payload of a record with its length */
+static std::string encodeRecord(uint8_t type, uint64_t usecs, const std::string& body)
+{
+    std::string payload;
+    payload.push_back(static_cast<char>(type));
+    appendVarint(payload, usecs);
+    payload.append(body);
+
+    std::string record;
+    appendVarint(record, payload.size());
+    record.append(payload);
+    return record;
+}
+
+static std::string encodeLine(uint8_t type, const std::string& line)
+{
+    struct timeval tv;
+    gettimeofday(&tv, nullptr);
+    return encodeRecord(type, toUsecs(tv), line);
+}
+
+static std::string encodeHeader()
+{
+    std::string body = BINARY_RECORD_MAGIC;
+    appendVarint(body, BINARY_RECORD_VERSION);
+    return encodeLine(BINARY_RECORD_HEADER, body);
+}
+
+namespace {
+
+/*
+ * gzip stream of a recording, owned by the writer thread. Every flush ends a
+ * gzip member, so a recording cut short, e.g. on a crash, only loses its last
+ * member and sessions appended to it later remain readable.
+ */
+class GzipRecFile
+{
+public:
+    GzipRecFile()
+    {
+        memset(&m_stream, 0, sizeof(m_stream));
+    }
+
+    ~GzipRecFile()
+    {
+        close();
+    }
+
+    bool open(FILE *file)
+    {
+        // Fastest level, recordings mostly repeat the same keys and fields
+        if (deflateInit2(&m_stream, Z_BEST_SPEED, Z_DEFLATED, 15 + 16, 8, Z_DEFAULT_STRATEGY) != Z_OK)
+        {
+            fclose(file);
+            return false;
+        }
+
+        m_file = file;
+        return true;
+    }
+
+    bool isOpen() const { return m_file != nullptr; }
+
+    bool write(const std::string& data)
+    {
+        m_pending = true;
+        return deflateTo(data, Z_NO_FLUSH);
+    }
+
+    bool flush()
+    {
+        if (!m_pending)
+        {
+            return true;
+        }
+
+        m_pending = false;
+        if (!deflateTo(std::string(), Z_FINISH))
+        {
+            return false;
+        }
+
+        deflateReset(&m_stream);
+        return fflush(m_file) == 0;
+    }
+
+    void close()
+    {
+        if (!m_file)
+        {
+            return;
+        }
+
+        flush();
+        deflateEnd(&m_stream);
+        fclose(m_file);
+        m_file = nullptr;
+        memset(&m_stream, 0, sizeof(m_stream));
+    }
+
+private:
+    bool deflateTo(const std::string& data, int flush)
+    {
+        if (!m_file)
+        {
+            return false;
+        }
+
+        m_stream.next_in = reinterpret_cast<const Bytef *>(data.data());
+        m_stream.avail_in = static_cast<uInt>(data.size());
+
+        do
+        {
+            m_stream.next_out = m_out;
+            m_stream.avail_out = sizeof(m_out);
+            deflate(&m_stream, flush);
+
+            size_t have = sizeof(m_out) - m_stream.avail_out;
+            if (have && fwrite(m_out, 1, have, m_file) != have)
+            {
+                return false;
+            }
+        } while (m_stream.avail_out == 0);
+
+        return true;
+    }
+
+    FILE *m_file = nullptr;
+    bool m_pending = false;
+    z_stream m_stream;
+    Bytef m_out[BINARY_WRITER_BATCH_SIZE];
+};
+
+}
+
+BinRecWriter::BinRecWriter(size_t memoryBudget) :
+    m_memoryBudget(memoryBudget)
+{
+    m_tail = new Node();
+    m_head.store(m_tail);
+}
+
+BinRecWriter::~BinRecWriter()
+{
+    close();
+
+    std::string data;
+    while (pop(data))
+    {
+    }
+    delete m_tail;
+}
+
+bool BinRecWriter::open(const std::string& path)
+{
+    m_path = path;
+    FILE *file = fopen(path.c_str(), "ab");
+    if (!file)
+    {
+        return false;
+    }
+
+    m_stop = false;
+    m_worker = std::thread(&BinRecWriter::run, this, file);
+    return true;
+}
+
+void BinRecWriter::close()
+{
+    if (!m_worker.joinable())
+    {
+        return;
+    }
+
+    {
+        std::lock_guard<std::mutex> lock(m_mutex);
+        m_stop = true;
+    }
+    m_signal.notify_one();
+    m_worker.join();
+
+    auto stats = getStats();
+    SWSS_LOG_NOTICE("Binary recorder %s closed: written_total=%" PRIu64 " dropped_total=%" PRIu64,
+                    m_path.c_str(), stats.written_total, stats.dropped_total);
+}
+
+void BinRecWriter::reopen()
+{
+    m_reopen = true;
+}
+
+bool BinRecWriter::recordTuple(const struct timeval& tv, const std::string& prefix, const KeyOpFieldsValuesTuple& tuple)
+{
+    std::string body;
+    appendString(body, prefix);
+    appendString(body, kfvKey(tuple));
+    appendString(body, kfvOp(tuple));
+
+    const auto& fvs = kfvFieldsValues(tuple);
+    appendVarint(body, fvs.size());
+    for (const auto& fv : fvs)
+    {
+        appendString(body, fvField(fv));
+        appendString(body, fvValue(fv));
+    }
+
+    return push(encodeRecord(BINARY_RECORD_TUPLE, toUsecs(tv), body));
+}
+
+BinaryRecorderStats BinRecWriter::getStats() const
+{
+    return {
+        m_queuedBytes.load(std::memory_order_relaxed),
+        m_writtenTotal.load(std::memory_order_relaxed),
+        m_droppedTotal.load(std::memory_order_relaxed),
+    };
+}
+
+bool BinRecWriter::push(std::string&& data)
+{
+    uint64_t size = data.size() + sizeof(Node);
+    if (m_queuedBytes.fetch_add(size, std::memory_order_relaxed) + size > m_memoryBudget)
+    {
+        m_queuedBytes.fetch_sub(size, std::memory_order_relaxed);
+        m_droppedTotal.fetch_add(1, std::memory_order_relaxed);
+        return false;
+    }
+
+    Node *node = new Node();
+    node->data = std::move(data);
+
+    Node *prev = m_head.exchange(node);
+    prev->next.store(node, std::memory_order_release);
+
+    // Only wake up the writer thread when it waits for records
+    if (m_idle.load())
+    {
+        std::lock_guard<std::mutex> lock(m_mutex);
+        m_signal.notify_one();
+    }
+
+    return true;
+}
+
+bool BinRecWriter::pop(std::string& data)
+{
+    Node *next = m_tail->next.load(std::memory_order_acquire);
+    if (!next)
+    {
+        return false;
+    }
+
+    // The popped node becomes the new stub of the queue
+    data = std::move(next->data);
+    delete m_tail;
+    m_tail = next;
+
+    m_queuedBytes.fetch_sub(data.size() + sizeof(Node), std::memory_order_relaxed);
+    return true;
+}
+
+bool BinRecWriter::empty() const
+{
+    return m_tail->next.load(std::memory_order_acquire) == nullptr;
+}
+
+void BinRecWriter::run(FILE *recFile)
+{
+    GzipRecFile file;
+    if (file.open(recFile))
+    {
+        file.write(encodeHeader());
+        file.flush();
+    }
+
+    uint64_t droppedNoted = 0;
+    std::string batch;
+    while (true)
+    {
+        std::string data;
+        uint64_t count = 0;
+        while (pop(data))
+        {
+            batch.append(data);
+            count++;
+
+            if (batch.size() >= BINARY_WRITER_BATCH_SIZE)
+            {
+                file.write(batch);
+                batch.clear();
+            }
+        }
+
+        uint64_t dropped = m_droppedTotal.load(std::memory_order_relaxed);
+        if (dropped != droppedNoted)
+        {
+            batch.append(encodeLine(BINARY_RECORD_LINE,
+                "recorder dropped " + std::to_string(dropped - droppedNoted) + " records"));
+            droppedNoted = dropped;
+        }
+
+        if (!batch.empty())
+        {
+            file.write(batch);
+            batch.clear();
+        }
+
+        if (file.isOpen())
+        {
+            if (!file.flush())
+            {
+                SWSS_LOG_ERROR("Binary recorder: Failed to write %s: %s", m_path.c_str(), strerror(errno));
+            }
+            m_writtenTotal.fetch_add(count, std::memory_order_relaxed);
+        }
+
+        if (m_reopen.exchange(false))
+        {
+            /*
+             * On log rotate we will use the same file name, we are assuming
+             * that logrotate daemon move filename to filename.1 and we will
+             * start a new recording session in a new file here.
+             */
+            file.close();
+            FILE *newFile = fopen(m_path.c_str(), "ab");
+            if (!newFile || !file.open(newFile))
+            {
+                SWSS_LOG_ERROR("Binary recorder: Failed to open file %s: %s", m_path.c_str(), strerror(errno));
+            }
+            else
+            {
+                file.write(encodeHeader());
+                file.flush();
+                SWSS_LOG_INFO("Binary recorder: LogRotate request handled");
+            }
+        }
+
+        std::unique_lock<std::mutex> lock(m_mutex);
+        if (m_stop && empty())
+        {
+            break;
+        }
+
+        m_idle = true;
+        m_signal.wait_for(lock, std::chrono::milliseconds(BINARY_WRITER_IDLE_MSECS), [this]() {
+            return m_stop || m_reopen || !empty();
+        });
+        m_idle = false;
+    }
+}
+
+namespace {
+
+/* Decode the records of a binary recording, read through zlib */
+class BinRecReader
+{
+public:
+    BinRecReader(gzFile file) : m_file(file)
+    {
+    }
+
+    /* Returns false at the end of the recording */
+    bool next(std::string& payload, bool& truncated)
+    {
+        uint64_t len;
+        truncated = false;
+
+        int c = gzgetc(m_file);
+        if (c < 0)
+        {
+            return false;
+        }
+        gzungetc(c, m_file);
+
+        if (!readVarint(len) || len > UINT32_MAX)
+        {
+            truncated = true;
+            return false;
+        }
+
+        payload.resize(len);
+        if (len && gzread(m_file, &payload[0], static_cast<unsigned>(len)) != static_cast<int>(len))
+        {
+            truncated = true;
+            return false;
+        }
+
+        return true;
+    }
+
+private:
+    bool readVarint(uint64_t& value)
+    {
+        value = 0;
+        for (int shift = 0; shift < 64; shift += 7)
+        {
+            int c = gzgetc(m_file);
+            if (c < 0)
+            {
+                return false;
+            }
+
+            value |= static_cast<uint64_t>(c & 0x7f) << shift;
+            if (!(c & 0x80))
+            {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    gzFile m_file;
+};
+
+bool decodeVarint(const std::string& buf, size_t& pos, uint64_t& value)
+{
+    value = 0;
+    for (int shift = 0; shift < 64 && pos < buf.size(); shift += 7)
+    {
+        auto c = static_cast<uint8_t>(buf[pos++]);
+        value |= static_cast<uint64_t>(c & 0x7f) << shift;
+        if (!(c & 0x80))
+        {
+            return true;
+        }
+    }
+    return false;
+}
+
+bool decodeString(const std::string& buf, size_t& pos, std::string& str)
+{
+    uint64_t len;
+    if (!decodeVarint(buf, pos, len) || buf.size() - pos < len)
+    {
+        return false;
+    }
+
+    str.assign(buf, pos, len);
+    pos += len;
+    return true;
+}
+
+std::string formatUsecs(uint64_t usecs)
+{
+    char buffer[64];
+    struct tm tm_info;
+    time_t secs = static_cast<time_t>(usecs / 1000000);
+    localtime_r(&secs, &tm_info);
+
+    size_t size = strftime(buffer, 32, "%Y-%m-%d.%T.", &tm_info);
+    snprintf(&buffer[size], 32, "%06" PRIu64, usecs % 1000000);
+
+    return std::string(buffer);
+}
+
+/* Text line of a record payload, as written by RecWriter */
+bool decodeRecord(const std::string& payload, std::string& line)
+{
+    size_t pos = 1;
+    uint64_t usecs;
+    if (payload.empty() || !decodeVarint(payload, pos, usecs))
+    {
+        return false;
+    }
+
+    line = formatUsecs(usecs);
+    switch (payload[0])
+    {
+        case BINARY_RECORD_HEADER:
+        {
+            std::string magic = BINARY_RECORD_MAGIC;
+            uint64_t version;
+            if (payload.compare(pos, magic.size(), magic) != 0)
+            {
+                return false;
+            }
+
+            pos += magic.size();
+            if (!decodeVarint(payload, pos, version) || version != BINARY_RECORD_VERSION)
+            {
+                return false;
+            }
+            line += Recorder::REC_START;
+            return pos == payload.size();
+        }
+
+        case BINARY_RECORD_LINE:
+            line += "|" + payload.substr(pos);
+            return true;
+
+        case BINARY_RECORD_TUPLE:
+        {
+            std::string prefix, key, op, field, value;
+            uint64_t count;
+            if (!decodeString(payload, pos, prefix) || !decodeString(payload, pos, key)
+                || !decodeString(payload, pos, op) || !decodeVarint(payload, pos, count))
+            {
+                return false;
+            }
+
+            line += "|" + prefix + key + "|" + op;
+            for (uint64_t i = 0; i < count; i++)
+            {
+                if (!decodeString(payload, pos, field) || !decodeString(payload, pos, value))
+                {
+                    return false;
+                }
+                line += "|" + field + ":" + value;
+            }
+            return pos == payload.size();
+        }
+
+        default:
+            return false;
+    }
+}
+
+}
+
+bool swss::convertBinaryRecording(const std::string& path, std::ostream& out)
+{
+    gzFile file = gzopen(path.c_str(), "rb");
+    if (!file)
+    {
+        SWSS_LOG_ERROR("Failed to open binary recording %s: %s", path.c_str(), strerror(errno));
+        return false;
+    }
+
+    BinRecReader reader(file);
+    std::string payload, line;
+    bool truncated;
+    bool first = true;
+    bool valid = true;
+
+    while (reader.next(payload, truncated))
+    {
+        // Every recording starts with a header, a text recording would not
+        if ((first && (payload.empty() || payload[0] != BINARY_RECORD_HEADER))
+            || !decodeRecord(payload, line))
+        {
+            SWSS_LOG_ERROR("Invalid binary recording %s", path.c_str());
+            valid = false;
+            break;
+        }
+
+        first = false;
+        out << line << "\n";
+    }
+
+    if (truncated)
+    {
+        // Expected for the last records of a recording still being written
+        SWSS_LOG_WARN("Truncated binary recording %s", path.c_str());
+        valid = false;
+    }
+
+    gzclose(file);
+    return valid && out.good();
+}
+
+
 AsyncSwssRecorderDebugStats swss::getAsyncSwssRecorderDebugStats()
 {
     return Recorder::Instance().swss.getAsyncDebugStats();
@@ -57,6 +656,63 @@ SwSSRec::~SwSSRec()
     stopAsyncWorker();
 }
 
+void SwSSRec::startRec(bool exit_if_failure)
+{
+    if (!m_binaryEnabled)
+    {
+        RecWriter::startRec(exit_if_failure);
+        return;
+    }
+
+    if (!isRecord())
+    {
+        return;
+    }
+
+    auto fname = getLoc() + "/" + getFile() + Recorder::BINARY_SUFFIX;
+    m_binary.reset(new BinRecWriter());
+    if (!m_binary->open(fname))
+    {
+        SWSS_LOG_ERROR("%s Recorder: Failed to open recording file %s: error %s", getName().c_str(), fname.c_str(), strerror(errno));
+        m_binary.reset();
+        if (exit_if_failure)
+        {
+            exit(EXIT_FAILURE);
+        }
+        setRecord(false);
+        return;
+    }
+    SWSS_LOG_NOTICE("%s Recorder: Binary recording started at %s", getName().c_str(), fname.c_str());
+}
+
+BinaryRecorderStats SwSSRec::getBinaryStats() const
+{
+    if (!m_binary)
+    {
+        return {};
+    }
+
+    return m_binary->getStats();
+}
+
+void SwSSRec::recordBinary(const std::string& prefix, const KeyOpFieldsValuesTuple& tuple)
+{
+    if (!isRecord())
+    {
+        return;
+    }
+
+    if (isRotate())
+    {
+        setRotate(false);
+        m_binary->reopen();
+    }
+
+    struct timeval received_time;
+    gettimeofday(&received_time, nullptr);
+    m_binary->recordTuple(received_time, prefix, tuple);
+}
+
 void SwSSRec::setAsync(bool enabled)
 {
     bool previous = m_asyncEnabled.exchange(enabled, std::memory_order_relaxed);
@@ -78,6 +734,12 @@ bool SwSSRec::isAsyncEnabled() const
 
 void SwSSRec::recordTupleAsync(const std::string& prefix, const KeyOpFieldsValuesTuple& tuple)
 {
+    if (m_binary)
+    {
+        recordBinary(prefix, tuple);
+        return;
+    }
+
     if (!m_asyncEnabled.load(std::memory_order_relaxed))
     {
         AsyncSwssRecordEntry entry = {{}, prefix, tuple};
@@ -119,6 +781,15 @@ void SwSSRec::recordTupleAsync(const std::string& prefix, const KeyOpFieldsValue
 
 void SwSSRec::recordTuplesAsync(const std::string& prefix, const std::deque<KeyOpFieldsValuesTuple>& entries)
 {
+    if (m_binary)
+    {
+        for (const auto& entry : entries)
+        {
+            recordBinary(prefix, entry);
+        }
+        return;
+    }
+
     if (!m_asyncEnabled.load(std::memory_order_relaxed))
     {
         for (const auto& entry : entries)
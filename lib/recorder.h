@@ -11,6 +11,7 @@
 #include <condition_variable>
 #include <atomic>
 #include <cstdint>
+#include <cstdio>
 #include <sys/time.h>
 
 #include "table.h"
@@ -46,7 +47,7 @@ class RecWriter : public RecBase {
 public:
     RecWriter() = default;
     virtual ~RecWriter();
-    void startRec(bool exit_if_failure);
+    virtual void startRec(bool exit_if_failure);
     void record(const std::string& val);
     void record(const std::string& timestamp, const std::string& val);
 
@@ -63,6 +64,88 @@ public:
     RetryRec();
 };
 
+struct BinaryRecorderStats
+{
+    uint64_t queued_bytes;
+    uint64_t written_total;
+    uint64_t dropped_total;
+};
+
+/*
+ * Compressed binary recording, converted back to the text format by
+ * convertBinaryRecording() or swssrecdump.
+ *
+ * Records are encoded by the recording thread and pushed to a lock-free
+ * queue, a background thread compresses them into a gzip stream flushed
+ * whenever the queue is empty. Queued records are bounded by a memory budget,
+ * records past it are dropped and their count is recorded once the writer
+ * caught up.
+ *
+ * Stream layout, integers as LEB128 varints:
+ *   record:  varint length, u8 type, varint timestamp in usecs, body
+ *   header:  magic string, varint version, starts every recording session
+ *   line:    text line
+ *   tuple:   string prefix, string key, string op, varint field count,
+ *            fields as string field, string value
+ *   string:  varint length, bytes
+ */
+class BinRecWriter {
+public:
+    static const size_t DEFAULT_MEMORY_BUDGET;
+
+    BinRecWriter(size_t memoryBudget = DEFAULT_MEMORY_BUDGET);
+    ~BinRecWriter();
+
+    // Disable copying
+    BinRecWriter(const BinRecWriter&) = delete;
+    BinRecWriter& operator=(const BinRecWriter&) = delete;
+
+    /* Open the recording for append and start the writer thread */
+    bool open(const std::string& path);
+    /* Write the queued records and stop the writer thread */
+    void close();
+    /* Have the writer thread reopen the recording, e.g. on log rotate */
+    void reopen();
+
+    /* Returns false if the record was dropped */
+    bool recordTuple(const struct timeval& tv, const std::string& prefix, const KeyOpFieldsValuesTuple& tuple);
+
+    BinaryRecorderStats getStats() const;
+
+private:
+    struct Node
+    {
+        std::atomic<Node *> next{nullptr};
+        std::string data;
+    };
+
+    bool push(std::string&& data);
+    bool pop(std::string& data);
+    bool empty() const;
+    void run(FILE *file);
+
+    size_t m_memoryBudget;
+    std::string m_path;
+
+    /* Multi producer single consumer queue, m_head pushed, m_tail popped */
+    std::atomic<Node *> m_head;
+    Node *m_tail;
+
+    std::atomic<uint64_t> m_queuedBytes{0};
+    std::atomic<uint64_t> m_writtenTotal{0};
+    std::atomic<uint64_t> m_droppedTotal{0};
+
+    std::atomic<bool> m_idle{false};
+    std::atomic<bool> m_reopen{false};
+    std::atomic<bool> m_stop{false};
+    std::mutex m_mutex;
+    std::condition_variable m_signal;
+    std::thread m_worker;
+};
+
+/* Write a binary recording to out in the text format, false if invalid or truncated */
+bool convertBinaryRecording(const std::string& path, std::ostream& out);
+
 struct AsyncSwssRecorderDebugStats
 {
     uint64_t pending_count;
@@ -76,8 +159,14 @@ public:
     SwSSRec();
     ~SwSSRec() override;
 
+    void startRec(bool exit_if_failure) override;
+
     void setAsync(bool enabled);
     bool isAsyncEnabled() const;
+    /* Record to the compressed binary format instead, must be set before startRec() */
+    void setBinary(bool enabled) { m_binaryEnabled = enabled; }
+    bool isBinary() const { return m_binaryEnabled; }
+    BinaryRecorderStats getBinaryStats() const;
     void recordTupleAsync(const std::string& prefix, const KeyOpFieldsValuesTuple& tuple);
     void recordTuplesAsync(const std::string& prefix, const std::deque<KeyOpFieldsValuesTuple>& entries);
     AsyncSwssRecorderDebugStats getAsyncDebugStats() const;
@@ -98,6 +187,7 @@ private:
     std::string formatTimestamp(const struct timeval& tv) const;
     std::string serialize(const AsyncSwssRecordEntry& entry) const;
     void drain();
+    void recordBinary(const std::string& prefix, const KeyOpFieldsValuesTuple& tuple);
 
     static size_t appendLiteral(char *buffer, size_t pos, const char *text, size_t capacity);
     static size_t appendUnsigned(char *buffer, size_t pos, uint64_t value, size_t capacity);
@@ -114,6 +204,9 @@ private:
     std::condition_variable m_signal;
     std::deque<AsyncSwssRecordEntry> m_queue;
     std::thread m_worker;
+
+    bool m_binaryEnabled = false;
+    std::unique_ptr<BinRecWriter> m_binary;
 };
 
 /* Record Handler for Response Publisher Class */
@@ -137,6 +230,7 @@ public:
     static const std::string SAIREDIS_FNAME;
     static const std::string RESPPUB_FNAME;
     static const std::string RETRY_FNAME;
+    static const std::string BINARY_SUFFIX;
 
     Recorder() = default;
     /* Individual Handlers */
@@ -15,17 +15,19 @@ Description: restore_neighbors.py -- restoring neighbor table into kernel during
 import sys
 import netifaces
 import time
-from pyroute2 import IPRoute, NetlinkError
+import os
+import queue
+import select
+import socket
+import struct
+import threading
+from pyroute2 import NetlinkError
 from pyroute2.netlink.rtnl import ndmsg
 from socket import AF_INET,AF_INET6
+import ctypes
 import logging
-logging.getLogger("scapy.runtime").setLevel(logging.ERROR)
-
-# Avoid long startup delays when route tables are large.
-from scapy.config import conf
-conf.route_autoload = False
-conf.route6_autoload = False
-from scapy.all import in6_getnsma, inet_pton, inet_ntop, in6_getnsmac, get_if_hwaddr, Ether, ARP, IPv6, ICMPv6ND_NS, ICMPv6NDOptSrcLLAddr
+from concurrent.futures import ThreadPoolExecutor
+import redis
 from swsscommon import swsscommon
 import errno
 import syslog
@@ -36,20 +38,17 @@ logger.addHandler(logging.NullHandler())
 
 SYSLOG_IDENTIFIER = 'restore_neighbor'
 
+# open syslog once for the lifetime of the process instead of per message
+syslog.openlog(SYSLOG_IDENTIFIER)
+
 def log_info(msg):
-    syslog.openlog(SYSLOG_IDENTIFIER)
     syslog.syslog(syslog.LOG_INFO, msg)
-    syslog.closelog()
 
 def log_warning(msg):
-    syslog.openlog(SYSLOG_IDENTIFIER)
     syslog.syslog(syslog.LOG_WARNING, msg)
-    syslog.closelog()
 
 def log_error(msg):
-    syslog.openlog(SYSLOG_IDENTIFIER)
     syslog.syslog(syslog.LOG_ERR, msg)
-    syslog.closelog()
 
 # timeout the restore process in 110 seconds if not finished
 # This is mostly to wait for interfaces to be created and up after system warm-reboot
@@ -58,9 +57,39 @@ def log_error(msg):
 # default timeout to 110 seconds.
 DEF_TIME_OUT = 110
 
-# every 5 seconds to check interfaces states
+# every 5 seconds to check interfaces states, interfaces are also checked as soon
+# as a netlink or STATE_DB event reports a change on them, this periodic check is
+# only a fallback in case an event is missed
 CHECK_INTERVAL = 5
 
+# how often the event monitor threads check whether they have to stop, in seconds
+MONITOR_POLL_INTERVAL = 0.1
+
+# number of RTM_NEWNEIGH requests packed into a single netlink send
+NEIGH_BATCH_SIZE = 128
+
+# maximum number of RTM_NEWNEIGH requests sent but not yet acknowledged,
+# this bounds the ACKs queued on the netlink socket receive buffer
+NEIGH_MAX_INFLIGHT = 1024
+
+# seconds to wait for the kernel to acknowledge outstanding requests
+NEIGH_ACK_TIME_OUT = 10
+
+# number of NEIGH_TABLE keys requested per SCAN call, and so per pipelined HGETALL batch
+NEIGH_SCAN_BATCH_SIZE = 1000
+
+# maximum number of interfaces restored concurrently
+RESTORE_WORKERS = 8
+
+# how often the restore progress counters are written to STATE_DB, in seconds
+PROGRESS_UPDATE_INTERVAL = 1
+
+# rate at which arp/ns probes are sent, in packets per second, across all interfaces
+PROBE_RATE_PPS = 10000
+
+# number of arp/ns probes handed to the kernel in a single sendmmsg call
+PROBE_BURST_SIZE = 64
+
 ip_family = {"IPv4": AF_INET, "IPv6": AF_INET6}
 
 # return the first ipv4/ipv6 address assigned on intf
@@ -85,30 +114,196 @@ def is_intf_oper_state_up(intf):
         return True
     return False
 
-def check_state_db(intf, db):
-    table_name = ''
-    if 'Vlan' in intf:
-        table_name = 'VLAN_MEMBER_TABLE|{}|*'.format(intf)
-    elif 'PortChannel' in intf:
-        table_name = 'LAG_MEMBER_TABLE|{}|*'.format(intf)
-    else:
+def check_state_db(intf, monitor):
+    if 'Vlan' not in intf and 'PortChannel' not in intf:
         return True
-    key = db.keys(db.STATE_DB, table_name)
-    if key is None:
+    if not monitor.has_members(intf):
         log_info ("members for {} are not yet created".format(intf))
         return False
-    if is_intf_up.counter == 0:
-        time.sleep(3*CHECK_INTERVAL)
-        is_intf_up.counter = 1
     log_info ("intf {} is up".format(intf))
     return True
 
-def is_intf_up(intf, db):
+def is_intf_up(intf, monitor):
     if not is_intf_oper_state_up(intf):
          return False
-    return check_state_db(intf, db)
+    return check_state_db(intf, monitor)
+
+# Watch for changes that can make an interface ready for restoring neighbors:
+# link and address changes from netlink, and VLAN/LAG members from STATE_DB
+# keyspace notifications. The names of the interfaces that changed are queued
+# so each one can be checked the moment it changes instead of on a sweep.
+class IntfReadinessMonitor(object):
+    NLMSG_HDR = struct.Struct('=IHHII')
+    # ifi_family, pad, ifi_type, ifi_index / ifa_family, ifa_prefixlen, ifa_flags, ifa_scope, ifa_index
+    IFINFOMSG = struct.Struct('=BxHi')
+    IFADDRMSG = struct.Struct('=BBBBi')
+
+    RTM_NEWLINK = 16
+    RTM_NEWADDR = 20
+    RTMGRP_LINK = 0x1
+    RTMGRP_IPV4_IFADDR = 0x10
+    RTMGRP_IPV6_IFADDR = 0x100
+
+    MEMBER_TABLES = ['VLAN_MEMBER_TABLE', 'LAG_MEMBER_TABLE']
+
+    def __init__(self):
+        self.events = queue.Queue()
+        self.stopped = threading.Event()
+        self.lock = threading.Lock()
+        # VLAN/PortChannel name -> set of members in STATE_DB
+        self.members = {}
+
+        self.nl_sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+        self.nl_sock.bind((0, self.RTMGRP_LINK | self.RTMGRP_IPV4_IFADDR | self.RTMGRP_IPV6_IFADDR))
+
+        self.threads = [threading.Thread(target=self._watch_netlink),
+                        threading.Thread(target=self._watch_state_db)]
+        for thread in self.threads:
+            thread.daemon = True
+            thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        for thread in self.threads:
+            thread.join()
+        self.nl_sock.close()
+
+    def has_members(self, intf):
+        with self.lock:
+            return bool(self.members.get(intf))
+
+    # wait up to timeout seconds for changes, return the set of interfaces which
+    # changed or None if nothing changed in time
+    def wait(self, timeout):
+        try:
+            intfs = {self.events.get(timeout=max(timeout, 0))}
+        except queue.Empty:
+            return None
+        while True:
+            try:
+                intfs.add(self.events.get_nowait())
+            except queue.Empty:
+                return intfs
+
+    def _watch_netlink(self):
+        try:
+            while not self.stopped.is_set():
+                if not select.select([self.nl_sock], [], [], MONITOR_POLL_INTERVAL)[0]:
+                    continue
+                try:
+                    data = self.nl_sock.recv(65536, socket.MSG_DONTWAIT)
+                except BlockingIOError:
+                    continue
+                except OSError as e:
+                    # events were dropped on overflow, the periodic check covers them
+                    if e.errno != errno.ENOBUFS:
+                        raise
+                    continue
+                for intf_idx in self._parse_netlink(data):
+                    try:
+                        self.events.put(socket.if_indextoname(intf_idx))
+                    except OSError:
+                        # interface is already gone
+                        pass
+        except Exception as e:
+            log_error('Netlink event monitor failed: {}'.format(str(e)))
+
+    def _parse_netlink(self, data):
+        offset = 0
+        while offset + self.NLMSG_HDR.size <= len(data):
+            msg_len, msg_type, _, _, _ = self.NLMSG_HDR.unpack_from(data, offset)
+            if msg_len < self.NLMSG_HDR.size:
+                break
+            if msg_type == self.RTM_NEWLINK:
+                yield self.IFINFOMSG.unpack_from(data, offset + self.NLMSG_HDR.size)[2]
+            elif msg_type == self.RTM_NEWADDR:
+                yield self.IFADDRMSG.unpack_from(data, offset + self.NLMSG_HDR.size)[4]
+            offset += (msg_len + 3) & ~3
+
+    def _watch_state_db(self):
+        try:
+            db = swsscommon.DBConnector('STATE_DB', 0)
+            sel = swsscommon.Select()
+            subscribers = {}
+            for table_name in self.MEMBER_TABLES:
+                subscriber = swsscommon.SubscriberStateTable(db, table_name)
+                sel.addSelectable(subscriber)
+                subscribers[subscriber.getFd()] = subscriber
+
+            while not self.stopped.is_set():
+                state, selectable = sel.select(int(MONITOR_POLL_INTERVAL * 1000))
+                if state != swsscommon.Select.OBJECT:
+                    continue
+                # Key format: "Vlan1000|Ethernet0", "PortChannel01|Ethernet4"
+                key, op, _ = subscribers[selectable.getFd()].pop()
+                if '|' not in key:
+                    continue
+                intf, member = key.split('|', 1)
+                with self.lock:
+                    if op == 'SET':
+                        self.members.setdefault(intf, set()).add(member)
+                    else:
+                        self.members.get(intf, set()).discard(member)
+                self.events.put(intf)
+        except Exception as e:
+            log_error('STATE_DB event monitor failed: {}'.format(str(e)))
+
+# Read the neigh table from AppDB in batches. The keys are walked with SCAN so
+# the shared redis is never blocked by a KEYS over the whole table, and the
+# entries of each batch are fetched with a single pipelined HGETALL round trip.
+# Each batch is yielded as soon as it is read as a list of
+# (intf, family, ip, mac) tuples.
+def read_neigh_table(batch_size=NEIGH_SCAN_BATCH_SIZE):
+    db = redis.Redis(host='127.0.0.1',
+                     port=swsscommon.SonicDBConfig.getDbPort('APPL_DB'),
+                     db=swsscommon.SonicDBConfig.getDbId('APPL_DB'),
+                     decode_responses=True)
 
-# read the neigh table from AppDB to memory, format as below
+    # Key format: "NEIGH_TABLE:intf-name:ipv4/ipv6", examples below:
+    # "NEIGH_TABLE:Ethernet122:100.1.1.200"
+    # "NEIGH_TABLE:Ethernet122:fe80::2e0:ecff:fe3b:d6ac"
+    # Value format:
+    # 1) "neigh"
+    # 2) "00:22:33:44:55:cc"
+    # 3) "family"
+    # 4) "IPv4" or "IPv6"
+    seen_keys = set()
+    cursor = None
+    try:
+        while cursor != 0:
+            cursor, keys = db.scan(cursor or 0, match='NEIGH_TABLE:*', count=batch_size)
+            # SCAN may return a key more than once
+            keys = [key for key in keys if key not in seen_keys]
+            if not keys:
+                continue
+            seen_keys.update(keys)
+
+            pipe = db.pipeline(transaction=False)
+            for key in keys:
+                pipe.hgetall(key)
+
+            neighs = []
+            for key, value in zip(keys, pipe.execute()):
+                key_split = key.split(':', 2)
+                intf_name = key_split[1]
+                if intf_name == 'lo':
+                    continue
+                dst_ip = key_split[2]
+                if 'neigh' in value and 'family' in value:
+                    dmac = value['neigh']
+                    family = value['family']
+                else:
+                    raise RuntimeError('Neigh table format is incorrect')
+
+                if family not in ip_family:
+                    raise RuntimeError('Neigh table format is incorrect')
+
+                neighs.append((intf_name, family, dst_ip, dmac))
+            yield neighs
+    finally:
+        db.close()
+
+# add neighbors read from the neigh table to the map, format as below
 # build map as below, this can efficiently access intf and family groups later
 #       { intf1 -> { { family1 -> [[ip1, mac1], [ip2, mac2] ...] }
 #                    { family2 -> [[ipM, macM], [ipN, macN] ...] } },
@@ -127,95 +322,308 @@ def is_intf_up(intf, db):
 # These alternative solutions would have worse performance because:
 #  1, need iterate the whole list if only one family is up.
 #  2, need check interface state twice due to the split map
-
-def read_neigh_table_to_maps():
-    db = swsscommon.SonicV2Connector(host='127.0.0.1')
-    db.connect(db.APPL_DB, False)
-
-    intf_neigh_map = {}
-    # Key format: "NEIGH_TABLE:intf-name:ipv4/ipv6", examples below:
-    # "NEIGH_TABLE:Ethernet122:100.1.1.200"
-    # "NEIGH_TABLE:Ethernet122:fe80::2e0:ecff:fe3b:d6ac"
-    # Value format:
-    # 1) "neigh"
-    # 2) "00:22:33:44:55:cc"
-    # 3) "family"
-    # 4) "IPv4" or "IPv6"
-    keys = db.keys(db.APPL_DB, 'NEIGH_TABLE:*')
-    keys = [] if keys is None else keys
-    for key in keys:
-        key_split = key.split(':', 2)
-        intf_name = key_split[1]
-        if intf_name == 'lo':
-            continue
-        dst_ip = key_split[2]
-        value = db.get_all(db.APPL_DB, key)
-        if 'neigh' in value and 'family' in value:
-            dmac = value['neigh']
-            family = value['family']
-        else:
-            raise RuntimeError('Neigh table format is incorrect')
-
-        if family not in ip_family:
-            raise RuntimeError('Neigh table format is incorrect')
-
-        # build map like this:
-        #       { intf1 -> { { family1 -> [[ip1, mac1], [ip2, mac2] ...] }
-        #                    { family2 -> [[ipM, macM], [ipN, macN] ...] } },
-        #         intfX -> {...}
-        #       }
+#
+# Return the set of interfaces which got new neighbors.
+def add_neighs_to_map(intf_neigh_map, neighs):
+    intfs = set()
+    for intf_name, family, dst_ip, dmac in neighs:
         ip_mac_pair = []
         ip_mac_pair.append(dst_ip)
         ip_mac_pair.append(dmac)
 
         intf_neigh_map.setdefault(intf_name, {}).setdefault(family, []).append(ip_mac_pair)
-    db.close(db.APPL_DB)
-    return intf_neigh_map
+        intfs.add(intf_name)
+    return intfs
 
+# read the whole neigh table from AppDB to memory
+def read_neigh_table_to_maps():
+    intf_neigh_map = {}
+    for neighs in read_neigh_table():
+        add_neighs_to_map(intf_neigh_map, neighs)
+    return intf_neigh_map
 
-# Use netlink to set neigh table into kernel, not overwrite the existing ones
-def set_neigh_in_kernel(ipclass, family, intf_idx, dst_ip, dmac):
-    log_info('Add neighbor entries: family: {}, intf_idx: {}, ip: {}, mac: {}'.format(
-    family, intf_idx, dst_ip, dmac))
-
-    if family not in ip_family:
-        return
 
-    family_af_inet = ip_family[family]
-    # Add neighbor to kernel with "stale" state, we will send arp/ns packet later
-    # so if the neighbor is active, it will become "reachable", otherwise, it will
-    # stay at "stale" state and get aged out by kernel.
-    try :
-        ipclass.neigh('add',
-            family=family_af_inet,
-            dst=dst_ip,
-            lladdr=dmac,
-            ifindex=intf_idx,
-            state=ndmsg.states['stale'])
-
-    # If neigh exists, log it but no exception raise, other exceptions, raise
-    except NetlinkError as e:
-        if e.code == errno.EEXIST:
-            log_warning('Neigh exists in kernel with family: {}, intf_idx: {}, ip: {}, mac: {}'.format(
-            family, intf_idx, dst_ip, dmac))
+# Use netlink to set neigh table into kernel, not overwrite the existing ones.
+# Many RTM_NEWNEIGH requests are packed into each netlink send and the ACKs are
+# read back without blocking while further batches are sent, so the restore
+# never waits for the kernel to answer requests one by one.
+class NeighBatchWriter(object):
+    NLMSG_HDR = struct.Struct('=IHHII')
+    NDMSG = struct.Struct('=BBHiHBB')
+    RTATTR_HDR = struct.Struct('=HH')
+    NLMSG_ERROR_CODE = struct.Struct('=i')
+
+    NLMSG_ERROR = 2
+    RTM_NEWNEIGH = 28
+    NDA_DST = 1
+    NDA_LLADDR = 2
+    # NLM_F_REQUEST | NLM_F_ACK | NLM_F_EXCL | NLM_F_CREATE
+    NEWNEIGH_FLAGS = 0x1 | 0x4 | 0x200 | 0x400
+
+    SOL_NETLINK = 270
+    NETLINK_CAP_ACK = 10
+    RCVBUF_SIZE = 1024 * 1024
+
+    def __init__(self, batch_size=NEIGH_BATCH_SIZE, max_inflight=NEIGH_MAX_INFLIGHT):
+        self.batch_size = max(batch_size, 1)
+        self.max_inflight = max(max_inflight, self.batch_size)
+        self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.RCVBUF_SIZE)
+        try:
+            # don't echo the request back in each ACK
+            self.sock.setsockopt(self.SOL_NETLINK, self.NETLINK_CAP_ACK, 1)
+        except OSError:
+            pass
+        self.sock.bind((0, 0))
+        self.seq = 0
+        self.batch = bytearray()
+        self.batch_count = 0
+        # seq -> (intf, family, dst_ip, dmac) for requests not acknowledged yet
+        self.inflight = {}
+        # intf -> family -> {'added': count, 'exists': count}
+        self.stats = {}
+
+    def close(self):
+        self.sock.close()
+
+    def add(self, intf, intf_idx, family, dst_ip, dmac):
+        if family not in ip_family:
+            return
+
+        family_af_inet = ip_family[family]
+        self.seq += 1
+
+        # Add neighbor to kernel with "stale" state, we will send arp/ns packet later
+        # so if the neighbor is active, it will become "reachable", otherwise, it will
+        # stay at "stale" state and get aged out by kernel.
+        body = self.NDMSG.pack(family_af_inet, 0, 0, intf_idx, ndmsg.states['stale'], 0, 0)
+        body += self._rtattr(self.NDA_DST, socket.inet_pton(family_af_inet, dst_ip))
+        body += self._rtattr(self.NDA_LLADDR, bytes.fromhex(dmac.replace(':', '')))
+
+        self.batch += self.NLMSG_HDR.pack(self.NLMSG_HDR.size + len(body), self.RTM_NEWNEIGH,
+                                          self.NEWNEIGH_FLAGS, self.seq, 0)
+        self.batch += body
+        self.batch_count += 1
+        self.inflight[self.seq] = (intf, family, dst_ip, dmac)
+
+        if self.batch_count >= self.batch_size:
+            self._send_batch()
+
+    # send the pending batch and wait until every request has been acknowledged
+    def flush(self):
+        self._send_batch()
+        while self.inflight:
+            self._read_acks(block=True)
+
+    def log_summary(self, intf):
+        for family, counts in self.stats.pop(intf, {}).items():
+            log_info('Restored {} neighbors on {}: added: {}, already existing: {}'.format(
+            family, intf, counts['added'], counts['exists']))
+
+    def _send_batch(self):
+        if self.batch_count:
+            self.sock.send(self.batch)
+            self.batch = bytearray()
+            self.batch_count = 0
+
+        self._read_acks(block=False)
+        while len(self.inflight) > self.max_inflight:
+            self._read_acks(block=True)
+
+    # read all the ACKs available on the socket, waiting for at least one if block is set
+    def _read_acks(self, block):
+        while True:
+            if block and not select.select([self.sock], [], [], NEIGH_ACK_TIME_OUT)[0]:
+                raise RuntimeError('Timed out waiting for {} neighbor ACKs from kernel'.format(len(self.inflight)))
+            try:
+                data = self.sock.recv(65536, socket.MSG_DONTWAIT)
+            except BlockingIOError:
+                return
+
+            self._handle_acks(data)
+            block = False
+
+    def _handle_acks(self, data):
+        offset = 0
+        while offset + self.NLMSG_HDR.size <= len(data):
+            msg_len, msg_type, _, seq, _ = self.NLMSG_HDR.unpack_from(data, offset)
+            if msg_len < self.NLMSG_HDR.size:
+                break
+
+            if msg_type == self.NLMSG_ERROR and seq in self.inflight:
+                code = -self.NLMSG_ERROR_CODE.unpack_from(data, offset + self.NLMSG_HDR.size)[0]
+                intf, family, dst_ip, dmac = self.inflight.pop(seq)
+                counts = self.stats.setdefault(intf, {}).setdefault(family, {'added': 0, 'exists': 0})
+
+                # If neigh exists, count it but no exception raise, other errors, raise
+                if code == 0:
+                    counts['added'] += 1
+                elif code == errno.EEXIST:
+                    counts['exists'] += 1
+                else:
+                    raise NetlinkError(code, 'Failed to add neighbor with family: {}, intf: {}, ip: {}, mac: {}'.format(
+                    family, intf, dst_ip, dmac))
+
+            offset += (msg_len + 3) & ~3
+
+    def _rtattr(self, attr_type, value):
+        attr = self.RTATTR_HDR.pack(self.RTATTR_HDR.size + len(value), attr_type) + value
+        return attr + b'\0' * (-len(attr) % 4)
+
+# Pace the arp/ns probes so that restoring a large neighbor table doesn't flood
+# the CPU queue. Callers ask for permission to send a burst of packets and are
+# delayed until the burst fits in the configured rate. The rate is shared by
+# all the restore workers.
+class RateLimiter(object):
+    def __init__(self, rate_pps=PROBE_RATE_PPS):
+        self.interval = 1.0 / rate_pps if rate_pps > 0 else 0
+        self.next_send_time = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, count):
+        with self.lock:
+            now = time.monotonic()
+            send_time = max(self.next_send_time, now)
+            self.next_send_time = send_time + count * self.interval
+        if send_time > now:
+            time.sleep(send_time - now)
+
+
+class Iovec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p),
+                ('iov_len', ctypes.c_size_t)]
+
+
+class Msghdr(ctypes.Structure):
+    _fields_ = [('msg_name', ctypes.c_void_p),
+                ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.c_void_p),
+                ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p),
+                ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+
+class Mmsghdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', Msghdr),
+                ('msg_len', ctypes.c_uint)]
+
+
+libc = ctypes.CDLL(None, use_errno=True)
+sendmmsg = getattr(libc, 'sendmmsg', None)
+
+
+# Send arp/ns probes on one interface. The frames are built from byte templates
+# precomputed per interface and source address, and written to a raw packet
+# socket in bursts with sendmmsg (one frame per send if it's not available).
+class ProbeSender(object):
+    ETH_P_IP = 0x0800
+    ETH_P_ARP = 0x0806
+    ETH_P_IPV6 = 0x86dd
+    ARP_REQUEST = 1
+    ICMPV6_ND_NS = 135
+    ICMPV6_ND_OPT_SRC_LLADDR = 1
+    IPPROTO_ICMPV6 = 58
+    ND_HOP_LIMIT = 255
+    NS_LEN = 32
+
+    def __init__(self, intf, smac, rate_limiter, burst_size=PROBE_BURST_SIZE):
+        self.sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW)
+        self.sock.bind((intf, 0))
+        self.smac = bytes.fromhex(smac.replace(':', ''))
+        self.rate_limiter = rate_limiter
+        self.burst_size = max(burst_size, 1)
+        self.frames = []
+        self.templates = {}
+
+    def close(self):
+        self.flush()
+        self.sock.close()
+
+    # queue an arp/ns probe for dst_ip, the queued probes are sent in bursts
+    def send(self, family, src_ip, dst_ip):
+        if family == 'IPv4':
+            self.frames.append(self._arp_template(src_ip) + socket.inet_aton(dst_ip))
+        elif family == 'IPv6':
+            self.frames.append(self._build_ns(src_ip, socket.inet_pton(AF_INET6, dst_ip)))
+
+        if len(self.frames) >= self.burst_size:
+            self.flush()
+
+    def flush(self):
+        if not self.frames:
+            return
+
+        self.rate_limiter.acquire(len(self.frames))
+        if sendmmsg is not None:
+            self._sendmmsg(self.frames)
         else:
-            raise
-
-# build ARP or NS packets depending on family
-def build_arp_ns_pkt(family, smac, src_ip, dst_ip):
-    if family == 'IPv4':
-        eth = Ether(src=smac, dst='ff:ff:ff:ff:ff:ff')
-        pkt = eth/ARP(op='who-has', pdst=dst_ip, psrc=src_ip, hwsrc=smac)
-    elif family == 'IPv6':
-        nsma = in6_getnsma(inet_pton(AF_INET6, dst_ip))
-        mcast_dst_ip = inet_ntop(AF_INET6, nsma)
-        dmac = in6_getnsmac(nsma)
-        eth = Ether(src=smac,dst=dmac)
-        ipv6 = IPv6(src=src_ip, dst=mcast_dst_ip)
-        ns = ICMPv6ND_NS(tgt=dst_ip)
-        ns_opt = ICMPv6NDOptSrcLLAddr(lladdr=smac)
-        pkt = eth/ipv6/ns/ns_opt
-    return pkt
+            for frame in self.frames:
+                self.sock.send(frame)
+        self.frames = []
+
+    def _sendmmsg(self, frames):
+        buf = bytearray(b''.join(frames))
+        base = ctypes.addressof((ctypes.c_char * len(buf)).from_buffer(buf))
+        iovs = (Iovec * len(frames))()
+        msgs = (Mmsghdr * len(frames))()
+
+        offset = 0
+        for i, frame in enumerate(frames):
+            iovs[i].iov_base = base + offset
+            iovs[i].iov_len = len(frame)
+            msgs[i].msg_hdr.msg_iov = ctypes.addressof(iovs[i])
+            msgs[i].msg_hdr.msg_iovlen = 1
+            offset += len(frame)
+
+        sent = 0
+        while sent < len(frames):
+            ret = sendmmsg(self.sock.fileno(), ctypes.byref(msgs, sent * ctypes.sizeof(Mmsghdr)),
+                           len(frames) - sent, 0)
+            if ret < 0:
+                err = ctypes.get_errno()
+                if err == errno.EINTR:
+                    continue
+                raise OSError(err, 'sendmmsg failed: {}'.format(os.strerror(err)))
+            sent += ret
+
+    # broadcast ARP who-has request, everything but the target ip is fixed per source ip
+    def _arp_template(self, src_ip):
+        key = (AF_INET, src_ip)
+        if key not in self.templates:
+            self.templates[key] = (b'\xff' * 6 + self.smac + struct.pack('!H', self.ETH_P_ARP) +
+                                   struct.pack('!HHBBH', 1, self.ETH_P_IP, 6, 4, self.ARP_REQUEST) +
+                                   self.smac + socket.inet_aton(src_ip) + b'\0' * 6)
+        return self.templates[key]
+
+    # neighbor solicitation to the solicited-node multicast address of the target
+    def _build_ns(self, src_ip, target):
+        key = (AF_INET6, src_ip)
+        if key not in self.templates:
+            src = socket.inet_pton(AF_INET6, src_ip)
+            ns_opt = struct.pack('!BB', self.ICMPV6_ND_OPT_SRC_LLADDR, 1) + self.smac
+            # checksum of the parts of the pseudo header and NS that don't depend on the target
+            partial = self._csum_add(0, src + struct.pack('!IxxxB', self.NS_LEN, self.IPPROTO_ICMPV6) +
+                                     struct.pack('!BB', self.ICMPV6_ND_NS, 0) + ns_opt)
+            self.templates[key] = (src, ns_opt, partial)
+        src, ns_opt, partial = self.templates[key]
+
+        nsma = b'\xff\x02' + b'\0' * 9 + b'\x01\xff' + target[13:]
+        csum = self._csum_add(partial, nsma + target)
+        csum = ~csum & 0xffff
+
+        return (b'\x33\x33\xff' + target[13:] + self.smac + struct.pack('!H', self.ETH_P_IPV6) +
+                struct.pack('!IHBB', 0x60000000, self.NS_LEN, self.IPPROTO_ICMPV6, self.ND_HOP_LIMIT) +
+                src + nsma +
+                struct.pack('!BBHI', self.ICMPV6_ND_NS, 0, csum, 0) + target + ns_opt)
+
+    # one's complement sum of 16-bit words, data must have an even length
+    @staticmethod
+    def _csum_add(csum, data):
+        csum += sum(struct.unpack('!{}H'.format(len(data) // 2), data))
+        while csum >> 16:
+            csum = (csum & 0xffff) + (csum >> 16)
+        return csum
 
 # Set the statedb "NEIGH_RESTORE_TABLE|Flags", so neighsyncd can start reconciliation
 def set_statedb_neigh_restore_done():
@@ -225,59 +633,155 @@ def set_statedb_neigh_restore_done():
     db.close(db.STATE_DB)
     return
 
+# Write the restore progress counters to STATE_DB "NEIGH_RESTORE_TABLE|Progress",
+# so operators can watch a long restore.
+class RestoreProgress(object):
+    def __init__(self):
+        self.db = swsscommon.SonicV2Connector(host='127.0.0.1')
+        self.db.connect(self.db.STATE_DB, False)
+        self.neighbors_read = 0
+        self.neighbors_restored = 0
+        self.restored_intfs = set()
+        self.last_update_time = None
+
+    def close(self):
+        self.db.close(self.db.STATE_DB)
+
+    def update(self, state, intf_neigh_map, in_progress, force=False):
+        now = time.monotonic()
+        if not force and self.last_update_time is not None and \
+                now - self.last_update_time < PROGRESS_UPDATE_INTERVAL:
+            return
+        self.last_update_time = now
+
+        self.db.hmset(self.db.STATE_DB, 'NEIGH_RESTORE_TABLE|Progress', {
+            'state': state,
+            'neighbors_read': str(self.neighbors_read),
+            'neighbors_restored': str(self.neighbors_restored),
+            'interfaces_pending': str(len(intf_neigh_map)),
+            'interfaces_in_progress': str(len(in_progress)),
+            'interfaces_restored': str(len(self.restored_intfs - set(intf_neigh_map))),
+        })
+
+# Restore the neighbors of one interface. The restoring process is done by
+# setting the neighbors in kernel from saved entries first, then sending arp/nd
+# packets to update the neighbors. Only the families with an IP configured on
+# the interface are restored; they are removed from family_neigh_map.
+# This runs in a restore worker thread, so it only uses its own sockets and the
+# shared rate limiter. Return the number of restored neighbors.
+def restore_intf_neighbors(intf, family_neigh_map, rate_limiter):
+    restored = 0
+    src_mac = netifaces.ifaddresses(intf)[netifaces.AF_LINK][0]['addr']
+    intf_idx = socket.if_nametoindex(intf)
+    neigh_writer = NeighBatchWriter()
+    # create socket per intf to send packets
+    sender = ProbeSender(intf, src_mac, rate_limiter)
+    try:
+        # Only two families: 'IPv4' and 'IPv6'
+        for family in ip_family.keys():
+            # if ip address assigned and if we have neighs in this family, restore them
+            src_ip = first_ip_on_intf(intf, family)
+            if src_ip and (family in family_neigh_map):
+                neigh_list = family_neigh_map[family]
+                # use netlink to set neighbor entries
+                for dst_ip, dmac in neigh_list:
+                    neigh_writer.add(intf, intf_idx, family, dst_ip, dmac)
+                # neighbors must be in kernel before the arp/ns replies come back
+                neigh_writer.flush()
+
+                # sending arp/ns packet to update kernel neigh info
+                for dst_ip, dmac in neigh_list:
+                    sender.send(family, src_ip, dst_ip)
+                restored += len(neigh_list)
+                # delete this family on the intf
+                del family_neigh_map[family]
+        neigh_writer.log_summary(intf)
+    finally:
+        # send the remaining packets and close the sockets
+        sender.close()
+        neigh_writer.close()
+    return restored
+
 # This function is to restore the kernel neighbors based on the saved neighbor map
-# It iterates through the map, and work on interface by interface basis.
-# If the interface is operational up and has IP configured per IP family,
-# it will restore the neighbors per family.
-# The restoring process is done by setting the neighbors in kernel from saved entries
-# first, then sending arp/nd packets to update the neighbors.
+# It works on interface by interface basis: once an interface is operational up
+# its neighbors are handed to a pool of workers which restores up to max_workers
+# interfaces concurrently, per family which has IP configured. The families which
+# couldn't be restored yet are put back in the map when the worker is done.
 # Once all the entries are restored, this function is returned.
-# The interfaces' states were checked in a loop with an interval (CHECK_INTERVAL)
+# Interfaces are checked first when started, then whenever a netlink or STATE_DB
+# event reports a change on them or their restore finishes, and all of them every
+# CHECK_INTERVAL in case an event was missed.
+# If neigh_batches is given, the neighbors are added to the map batch by batch
+# while restoring, so interfaces read first are restored before the whole
+# table has been read.
 # The function will timeout in case interfaces' states never meet the condition
 # after some time (DEF_TIME_OUT).
-def restore_update_kernel_neighbors(intf_neigh_map, timeout=DEF_TIME_OUT):
-    # create object for netlink calls to kernel
-    ipclass = IPRoute()
+def restore_update_kernel_neighbors(intf_neigh_map, timeout=DEF_TIME_OUT, neigh_batches=None,
+                                    max_workers=RESTORE_WORKERS):
+    rate_limiter = RateLimiter()
     start_time = time.monotonic()
-    is_intf_up.counter = 0
-    db = swsscommon.SonicV2Connector(host='127.0.0.1')
-    db.connect(db.STATE_DB, False)
-    while (time.monotonic() - start_time) < timeout:
-        for intf, family_neigh_map in list(intf_neigh_map.items()):
-            # only try to restore to kernel when link is up
-            if is_intf_up(intf, db):
-                src_mac = get_if_hwaddr(intf)
-                intf_idx = ipclass.link_lookup(ifname=intf)[0]
-                # create socket per intf to send packets
-                s = conf.L2socket(iface=intf)
-
-                # Only two families: 'IPv4' and 'IPv6'
-                for family in ip_family.keys():
-                    # if ip address assigned and if we have neighs in this family, restore them
-                    src_ip = first_ip_on_intf(intf, family)
-                    if src_ip and (family in family_neigh_map):
-                        neigh_list = family_neigh_map[family]
-                        for dst_ip, dmac in neigh_list:
-                            # use netlink to set neighbor entries
-                            set_neigh_in_kernel(ipclass, family, intf_idx, dst_ip, dmac)
-
-                            log_info('Sending Neigh with family: {}, intf_idx: {}, ip: {}, mac: {}'.format(
-                            family, intf_idx, dst_ip, dmac))
-                            # sending arp/ns packet to update kernel neigh info
-                            s.send(build_arp_ns_pkt(family, src_mac, src_ip, dst_ip))
-                        # delete this family on the intf
-                        del intf_neigh_map[intf][family]
-                # close the pkt socket
-                s.close()
-
-                # if all families are deleted, remove the key
-                if len(intf_neigh_map[intf]) == 0:
-                    del intf_neigh_map[intf]
-        # map is empty, all neigh entries are restored
-        if not intf_neigh_map:
-            break
-        time.sleep(CHECK_INTERVAL)
-    db.close(db.STATE_DB)
+    monitor = IntfReadinessMonitor()
+    progress = RestoreProgress()
+    progress.neighbors_read = sum(len(neigh_list) for family_neigh_map in intf_neigh_map.values()
+                                  for neigh_list in family_neigh_map.values())
+    workers = ThreadPoolExecutor(max_workers=max(max_workers, 1))
+    # intf -> (worker future, family map handed to the worker)
+    in_progress = {}
+    state = 'failed'
+
+    # merge the neighbors a finished worker couldn't restore back into the map
+    def collect(intf):
+        future, family_neigh_map = in_progress.pop(intf)
+        progress.neighbors_restored += future.result()
+        for family, neigh_list in family_neigh_map.items():
+            intf_neigh_map.setdefault(intf, {}).setdefault(family, []).extend(neigh_list)
+        progress.restored_intfs.add(intf)
+
+    try:
+        intfs_to_check = set(intf_neigh_map)
+        while True:
+            for intf in [intf for intf, (future, _) in in_progress.items() if future.done()]:
+                collect(intf)
+            for intf in intfs_to_check:
+                # only try to restore to kernel when link is up and no worker is restoring it
+                if intf in intf_neigh_map and intf not in in_progress and is_intf_up(intf, monitor):
+                    family_neigh_map = intf_neigh_map.pop(intf)
+                    future = workers.submit(restore_intf_neighbors, intf, family_neigh_map, rate_limiter)
+                    in_progress[intf] = (future, family_neigh_map)
+                    # check the interface again once the worker is done
+                    future.add_done_callback(lambda _, intf=intf: monitor.events.put(intf))
+            progress.update('restoring', intf_neigh_map, in_progress)
+
+            remaining = timeout - (time.monotonic() - start_time)
+            if neigh_batches is not None and remaining > 0:
+                neighs = next(neigh_batches, None)
+                if neighs is not None:
+                    progress.neighbors_read += len(neighs)
+                    # check the interfaces with new neighbors and the ones with pending events
+                    intfs_to_check = add_neighs_to_map(intf_neigh_map, neighs) | (monitor.wait(0) or set())
+                    continue
+                # whole table is read
+                neigh_batches = None
+            # map is empty and no worker is running, all neigh entries are restored
+            if not intf_neigh_map and not in_progress:
+                state = 'done'
+                break
+            if remaining <= 0:
+                state = 'timeout'
+                break
+            intfs_to_check = monitor.wait(min(remaining, CHECK_INTERVAL))
+            if intfs_to_check is None:
+                intfs_to_check = set(intf_neigh_map)
+
+        # let the workers which are still running finish their interfaces
+        for intf in list(in_progress):
+            in_progress[intf][0].result()
+            collect(intf)
+    finally:
+        workers.shutdown(wait=True)
+        monitor.stop()
+        progress.update(state, intf_neigh_map, {}, force=True)
+        progress.close()
 
 
 def main():
@@ -298,15 +802,9 @@ def main():
         set_statedb_neigh_restore_done()
         log_info ("restore_neighbors service is done as system warm reboot not enabled")
         return
-    # read the neigh table from appDB to internal map
-    try:
-        intf_neigh_map = read_neigh_table_to_maps()
-    except RuntimeError as e:
-        logger.exception(str(e))
-        sys.exit(1)
-
+    # stream the neigh table from appDB to internal map while restoring
     try:
-        restore_update_kernel_neighbors(intf_neigh_map)
+        restore_update_kernel_neighbors({}, neigh_batches=read_neigh_table())
     except Exception as e:
         logger.exception(str(e))
         sys.exit(1)
@@ -0,0 +1,127 @@
+#ifndef SWSS_CONSUMERSTATS_H
+#define SWSS_CONSUMERSTATS_H
+
+#include <algorithm>
+#include <array>
+#include <atomic>
+#include <cstdint>
+#include <string>
+#include <vector>
+
+#include "table.h"
+
+/*
+ * Log2 histogram: bucket 0 counts zeros, bucket i counts values in [2^(i-1), 2^i).
+ *
+ * Every histogram has a single writer, the thread running the corresponding
+ * consumer step, so updates are plain relaxed load/store pairs instead of atomic
+ * read-modify-write. Readers on other threads (the exporter) may see a sample
+ * partially applied, which is fine for statistics.
+ */
+class StatHistogram
+{
+public:
+    static const size_t BUCKETS = 33;
+
+    StatHistogram()
+    {
+        for (auto &b : m_buckets)
+        {
+            b.store(0, std::memory_order_relaxed);
+        }
+    }
+
+    void add(uint64_t value)
+    {
+        size_t bucket = value == 0 ? 0 : 64 - __builtin_clzll(value);
+        if (bucket >= BUCKETS)
+        {
+            bucket = BUCKETS - 1;
+        }
+
+        inc(m_buckets[bucket], 1);
+        inc(m_count, 1);
+        inc(m_sum, value);
+        if (value > m_max.load(std::memory_order_relaxed))
+        {
+            m_max.store(value, std::memory_order_relaxed);
+        }
+    }
+
+    uint64_t count() const { return m_count.load(std::memory_order_relaxed); }
+    uint64_t sum() const { return m_sum.load(std::memory_order_relaxed); }
+    uint64_t max() const { return m_max.load(std::memory_order_relaxed); }
+
+    uint64_t avg() const
+    {
+        auto c = count();
+        return c ? sum() / c : 0;
+    }
+
+    /* Upper bound of the bucket holding the given percentile, capped by the max */
+    uint64_t percentile(unsigned int pct) const
+    {
+        uint64_t total = count();
+        if (total == 0)
+        {
+            return 0;
+        }
+
+        uint64_t target = (total * pct + 99) / 100;
+        uint64_t seen = 0;
+        for (size_t i = 0; i < BUCKETS; i++)
+        {
+            seen += m_buckets[i].load(std::memory_order_relaxed);
+            if (seen >= target)
+            {
+                uint64_t upper = (1ULL << i) - 1;
+                return std::min(upper, max());
+            }
+        }
+        return max();
+    }
+
+private:
+    static void inc(std::atomic<uint64_t> &counter, uint64_t value)
+    {
+        counter.store(counter.load(std::memory_order_relaxed) + value, std::memory_order_relaxed);
+    }
+
+    std::array<std::atomic<uint64_t>, BUCKETS> m_buckets;
+    std::atomic<uint64_t> m_count{0};
+    std::atomic<uint64_t> m_sum{0};
+    std::atomic<uint64_t> m_max{0};
+};
+
+/* Hot path statistics of one consumer, see ConsumerBase::m_stats */
+struct ConsumerStats
+{
+    StatHistogram popBatchSize;     // entries returned by each pops()
+    StatHistogram pendingTasks;     // m_toSync size when doTask starts
+    StatHistogram doTaskUsecs;      // time spent in Orch::doTask(Consumer&)
+    StatHistogram retriedTasks;     // tasks moved back from the retry cache per pass
+    StatHistogram retryCacheSize;   // retry cache size sampled on each pass
+
+    std::vector<swss::FieldValueTuple> toFieldValues() const
+    {
+        return {
+            { "pop_count",            std::to_string(popBatchSize.count()) },
+            { "pop_entries",          std::to_string(popBatchSize.sum()) },
+            { "pop_batch_avg",        std::to_string(popBatchSize.avg()) },
+            { "pop_batch_max",        std::to_string(popBatchSize.max()) },
+            { "pending_tasks_p50",    std::to_string(pendingTasks.percentile(50)) },
+            { "pending_tasks_p99",    std::to_string(pendingTasks.percentile(99)) },
+            { "pending_tasks_max",    std::to_string(pendingTasks.max()) },
+            { "dotask_count",         std::to_string(doTaskUsecs.count()) },
+            { "dotask_usecs_total",   std::to_string(doTaskUsecs.sum()) },
+            { "dotask_usecs_p50",     std::to_string(doTaskUsecs.percentile(50)) },
+            { "dotask_usecs_p99",     std::to_string(doTaskUsecs.percentile(99)) },
+            { "dotask_usecs_max",     std::to_string(doTaskUsecs.max()) },
+            { "retried_tasks",        std::to_string(retriedTasks.sum()) },
+            { "retry_cache_size_p99", std::to_string(retryCacheSize.percentile(99)) },
+            { "retry_cache_size_max", std::to_string(retryCacheSize.max()) },
+        };
+    }
+};
+
+#endif /* SWSS_CONSUMERSTATS_H */
@@ -395,10 +395,25 @@ const map<string, CrmResourceType> crmUsedCntsTableMap =
     { "crm_stats_twamp_entry_used", CrmResourceType::CRM_TWAMP_ENTRY },
 };
 
+class CrmPollExecutor : public Executor
+{
+public:
+    CrmPollExecutor(SelectableEvent *event, CrmOrch *orch)
+        : Executor(event, orch, "CRM_COUNTERS_POLL_DONE")
+    {
+    }
+
+    void execute()
+    {
+        static_cast<CrmOrch *>(m_orch)->doPollResult();
+    }
+};
+
 CrmOrch::CrmOrch(DBConnector *db, string tableName):
     Orch(db, tableName),
     m_countersDb(new DBConnector("COUNTERS_DB", 0)),
-    m_countersCrmTable(new Table(m_countersDb.get(), COUNTERS_CRM_TABLE)),
+    m_countersPipeline(new RedisPipeline(m_countersDb.get())),
+    m_countersCrmTable(new Table(m_countersPipeline.get(), COUNTERS_CRM_TABLE, true)),
     m_timer(new SelectableTimer(timespec { .tv_sec = CRM_POLLING_INTERVAL_DEFAULT, .tv_nsec = 0 }))
 {
     SWSS_LOG_ENTER();
@@ -411,14 +426,33 @@ CrmOrch::CrmOrch(DBConnector *db, string tableName):
     }
 
     // The CRM stats needs to be populated again
-    m_countersCrmTable->del(CRM_COUNTERS_TABLE_KEY);
+    delCrmCounters(CRM_COUNTERS_TABLE_KEY);
 
     // Note: ExecutableTimer will hold m_timer pointer and release the object later
     auto executor = new ExecutableTimer(m_timer, this, "CRM_COUNTERS_POLL");
     Orch::addExecutor(executor);
+
+    m_pollDone = new SelectableEvent();
+    Orch::addExecutor(new CrmPollExecutor(m_pollDone, this));
+    m_pollThread = thread(&CrmOrch::pollResAvailableCounters, this);
+
     m_timer->start();
 }
 
+CrmOrch::~CrmOrch()
+{
+    {
+        lock_guard<mutex> lock(m_pollMutex);
+        m_pollStop = true;
+    }
+    m_pollCv.notify_one();
+
+    if (m_pollThread.joinable())
+    {
+        m_pollThread.join();
+    }
+}
+
 CrmOrch::CrmResourceEntry::CrmResourceEntry(string name, CrmThresholdType thresholdType, uint32_t lowThreshold, uint32_t highThreshold):
     name(name),
     thresholdType(thresholdType),
@@ -477,6 +511,8 @@ void CrmOrch::handleSetCommand(const string& key, const vector<FieldValueTuple>&
 {
     SWSS_LOG_ENTER();
 
+    std::lock_guard<std::recursive_mutex> lock(m_resourcesMutex);
+
     for (auto i : data)
     {
         const auto &field = fvField(i);
@@ -543,6 +579,8 @@ void CrmOrch::incCrmResUsedCounter(CrmResourceType resource)
 {
     SWSS_LOG_ENTER();
 
+    std::lock_guard<std::recursive_mutex> lock(m_resourcesMutex);
+
     try
     {
         m_resourcesMap.at(resource).countersMap[CRM_COUNTERS_TABLE_KEY].usedCounter++;
@@ -558,6 +596,8 @@ void CrmOrch::decCrmResUsedCounter(CrmResourceType resource)
 {
     SWSS_LOG_ENTER();
 
+    std::lock_guard<std::recursive_mutex> lock(m_resourcesMutex);
+
     try
     {
         m_resourcesMap.at(resource).countersMap[CRM_COUNTERS_TABLE_KEY].usedCounter--;
@@ -573,6 +613,8 @@ void CrmOrch::incCrmAclUsedCounter(CrmResourceType resource, sai_acl_stage_t sta
 {
     SWSS_LOG_ENTER();
 
+    std::lock_guard<std::recursive_mutex> lock(m_resourcesMutex);
+
     try
     {
         m_resourcesMap.at(resource).countersMap[getCrmAclKey(stage, point)].usedCounter++;
@@ -588,6 +630,8 @@ void CrmOrch::decCrmAclUsedCounter(CrmResourceType resource, sai_acl_stage_t sta
 {
     SWSS_LOG_ENTER();
 
+    std::lock_guard<std::recursive_mutex> lock(m_resourcesMutex);
+
     try
     {
         m_resourcesMap.at(resource).countersMap[getCrmAclKey(stage, point)].usedCounter--;
@@ -613,7 +657,7 @@ void CrmOrch::decCrmAclUsedCounter(CrmResourceType resource, sai_acl_stage_t sta
             }
 
             // remove ACL_TABLE_STATS in crm database
-            m_countersCrmTable->del(getCrmAclTableKey(oid));
+            delCrmCounters(getCrmAclTableKey(oid));
         }
     }
     catch (...)
@@ -627,6 +671,8 @@ void CrmOrch::incCrmAclTableUsedCounter(CrmResourceType resource, sai_object_id_
 {
     SWSS_LOG_ENTER();
 
+    std::lock_guard<std::recursive_mutex> lock(m_resourcesMutex);
+
     try
     {
         m_resourcesMap.at(resource).countersMap[getCrmAclTableKey(tableId)].usedCounter++;
@@ -643,6 +689,8 @@ void CrmOrch::decCrmAclTableUsedCounter(CrmResourceType resource, sai_object_id_
 {
     SWSS_LOG_ENTER();
 
+    std::lock_guard<std::recursive_mutex> lock(m_resourcesMutex);
+
     try
     {
         m_resourcesMap.at(resource).countersMap[getCrmAclTableKey(tableId)].usedCounter--;
@@ -658,6 +706,8 @@ void CrmOrch::incCrmExtTableUsedCounter(CrmResourceType resource, std::string ta
 {
     SWSS_LOG_ENTER();
 
+    std::lock_guard<std::recursive_mutex> lock(m_resourcesMutex);
+
     try
     {
         m_resourcesMap.at(resource).countersMap[getCrmP4rtTableKey(table_name)].usedCounter++;
@@ -673,6 +723,8 @@ void CrmOrch::decCrmExtTableUsedCounter(CrmResourceType resource, std::string ta
 {
     SWSS_LOG_ENTER();
 
+    std::lock_guard<std::recursive_mutex> lock(m_resourcesMutex);
+
     try
     {
         m_resourcesMap.at(resource).countersMap[getCrmP4rtTableKey(table_name)].usedCounter--;
@@ -688,6 +740,8 @@ void CrmOrch::incCrmDashAclUsedCounter(CrmResourceType resource, sai_object_id_t
 {
     SWSS_LOG_ENTER();
 
+    std::lock_guard<std::recursive_mutex> lock(m_resourcesMutex);
+
     try
     {
         if (resource == CrmResourceType::CRM_DASH_IPV4_ACL_GROUP)
@@ -721,19 +775,21 @@ void CrmOrch::decCrmDashAclUsedCounter(CrmResourceType resource, sai_object_id_t
 {
     SWSS_LOG_ENTER();
 
+    std::lock_guard<std::recursive_mutex> lock(m_resourcesMutex);
+
     try
     {
         if (resource == CrmResourceType::CRM_DASH_IPV4_ACL_GROUP)
         {
             decCrmResUsedCounter(resource);
             m_resourcesMap.at(CrmResourceType::CRM_DASH_IPV4_ACL_RULE).countersMap.erase(getCrmDashAclGroupKey(tableId));
-            m_countersCrmTable->del(getCrmDashAclGroupKey(tableId));
+            delCrmCounters(getCrmDashAclGroupKey(tableId));
         }
         else if (resource == CrmResourceType::CRM_DASH_IPV6_ACL_GROUP)
         {
             decCrmResUsedCounter(resource);
             m_resourcesMap.at(CrmResourceType::CRM_DASH_IPV6_ACL_RULE).countersMap.erase(getCrmDashAclGroupKey(tableId));
-            m_countersCrmTable->del(getCrmDashAclGroupKey(tableId));
+            delCrmCounters(getCrmDashAclGroupKey(tableId));
         }
         else 
         {
@@ -752,11 +808,112 @@ void CrmOrch::doTask(SelectableTimer &timer)
 {
     SWSS_LOG_ENTER();
 
-    getResAvailableCounters();
+    unique_ptr<CrmResourceMap> request(new CrmResourceMap());
+    {
+        std::lock_guard<std::recursive_mutex> lock(m_resourcesMutex);
+
+        for (const auto &res : m_resourcesMap)
+        {
+            // ignore unsupported resources
+            if (res.second.resStatus == CrmResourceStatus::CRM_RES_SUPPORTED)
+            {
+                request->emplace(res.first, res.second);
+            }
+        }
+    }
+
+    // A poll still running on a slow SAI only picks up the latest snapshot
+    lock_guard<mutex> lock(m_pollMutex);
+    m_pollRequest = std::move(request);
+    m_pollCv.notify_one();
+}
+
+void CrmOrch::pollResAvailableCounters()
+{
+    SWSS_LOG_ENTER();
+
+    while (true)
+    {
+        unique_ptr<CrmResourceMap> resources;
+        {
+            unique_lock<mutex> lock(m_pollMutex);
+            m_pollCv.wait(lock, [this]() { return m_pollStop || m_pollRequest; });
+            if (m_pollStop)
+            {
+                return;
+            }
+            resources = std::move(m_pollRequest);
+        }
+
+        getResAvailableCounters(*resources);
+
+        {
+            lock_guard<mutex> lock(m_pollMutex);
+            m_pollResult = std::move(resources);
+        }
+        m_pollDone->notify();
+    }
+}
+
+void CrmOrch::doPollResult()
+{
+    SWSS_LOG_ENTER();
+
+    unique_ptr<CrmResourceMap> resources;
+    {
+        lock_guard<mutex> lock(m_pollMutex);
+        resources = std::move(m_pollResult);
+    }
+
+    if (!resources)
+    {
+        return;
+    }
+
+    std::lock_guard<std::recursive_mutex> lock(m_resourcesMutex);
+
+    mergeResAvailableCounters(*resources);
     updateCrmCountersTable();
     checkCrmThresholds();
 }
 
+void CrmOrch::mergeResAvailableCounters(const CrmResourceMap &resources)
+{
+    SWSS_LOG_ENTER();
+
+    for (const auto &polled : resources)
+    {
+        auto it = m_resourcesMap.find(polled.first);
+        if (it == m_resourcesMap.end())
+        {
+            continue;
+        }
+
+        auto &res = it->second;
+        if (polled.second.resStatus == CrmResourceStatus::CRM_RES_NOT_SUPPORTED)
+        {
+            res.resStatus = CrmResourceStatus::CRM_RES_NOT_SUPPORTED;
+            continue;
+        }
+
+        for (const auto &cnt : polled.second.countersMap)
+        {
+            auto c = res.countersMap.find(cnt.first);
+            if (c == res.countersMap.end())
+            {
+                // Per table counters (ACL, EXT, DASH ACL group) removed while polling
+                if (cnt.second.id != SAI_NULL_OBJECT_ID || polled.first == CrmResourceType::CRM_EXT_TABLE)
+                {
+                    continue;
+                }
+                c = res.countersMap.emplace(cnt.first, CrmResourceCounter()).first;
+            }
+
+            c->second.availableCounter = cnt.second.availableCounter;
+        }
+    }
+}
+
 bool CrmOrch::getResAvailability(CrmResourceType type, CrmResourceEntry &res)
 {
     sai_attribute_t attr;
@@ -875,11 +1032,11 @@ bool CrmOrch::getDashAclGroupResAvailability(CrmResourceType type, CrmResourceEn
     return true;
 }
 
-void CrmOrch::getResAvailableCounters()
+void CrmOrch::getResAvailableCounters(CrmResourceMap &resources)
 {
     SWSS_LOG_ENTER();
 
-    for (auto &res : m_resourcesMap)
+    for (auto &res : resources)
     {
         // ignore unsupported resources
         if (res.second.resStatus != CrmResourceStatus::CRM_RES_SUPPORTED)
@@ -1064,6 +1221,8 @@ void CrmOrch::updateCrmCountersTable()
 {
     SWSS_LOG_ENTER();
 
+    CrmCountersUpdate update;
+
     // Update CRM used counters in COUNTERS_DB
     for (const auto &i : crmUsedCntsTableMap)
     {
@@ -1077,9 +1236,7 @@ void CrmOrch::updateCrmCountersTable()
 
             for (const auto &cnt : res.countersMap)
             {
-                FieldValueTuple attr(i.first, to_string(cnt.second.usedCounter));
-                vector<FieldValueTuple> attrs = { attr };
-                m_countersCrmTable->set(cnt.first, attrs);
+                addCrmCounterUpdate(update, cnt.first, i.first, cnt.second.usedCounter);
             }
         }
         catch(const out_of_range &e)
@@ -1101,9 +1258,7 @@ void CrmOrch::updateCrmCountersTable()
 
             for (const auto &cnt : res.countersMap)
             {
-                FieldValueTuple attr(i.first, to_string(cnt.second.availableCounter));
-                vector<FieldValueTuple> attrs = { attr };
-                m_countersCrmTable->set(cnt.first, attrs);
+                addCrmCounterUpdate(update, cnt.first, i.first, cnt.second.availableCounter);
             }
         }
         catch(const out_of_range &e)
@@ -1111,6 +1266,33 @@ void CrmOrch::updateCrmCountersTable()
             // expected when a resource is unavailable
         }
     }
+
+    // One write per changed key, all sent with a single pipeline flush
+    for (const auto &u : update)
+    {
+        m_countersCrmTable->set(u.first, u.second);
+    }
+    m_countersCrmTable->flush();
+}
+
+void CrmOrch::addCrmCounterUpdate(CrmCountersUpdate &update, const string &key, const string &field, uint32_t value)
+{
+    string str = to_string(value);
+    auto &cached = m_countersCache[key][field];
+    if (cached == str)
+    {
+        return;
+    }
+
+    cached = str;
+    update[key].emplace_back(field, std::move(str));
+}
+
+void CrmOrch::delCrmCounters(const string &key)
+{
+    m_countersCache.erase(key);
+    m_countersCrmTable->del(key);
+    m_countersCrmTable->flush();
 }
 
 void CrmOrch::checkCrmThresholds()
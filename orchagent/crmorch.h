@@ -2,8 +2,12 @@
 
 #include <thread>
 #include <chrono>
+#include <condition_variable>
 #include <map>
+#include <memory>
+#include <mutex>
 #include "orch.h"
+#include "selectableevent.h"
 #include "port.h"
 #include "events.h"
 
@@ -74,6 +78,7 @@ class CrmOrch : public Orch
 {
 public:
     CrmOrch(swss::DBConnector *db, std::string tableName);
+    ~CrmOrch();
     void incCrmResUsedCounter(CrmResourceType resource);
     void decCrmResUsedCounter(CrmResourceType resource);
     // Increment "used" counter for the ACL table/group CRM resources
@@ -94,7 +99,11 @@ public:
     void decCrmDashAclUsedCounter(CrmResourceType resource, sai_object_id_t groupId);
 
 private:
+    friend class CrmPollExecutor;
+
     std::shared_ptr<swss::DBConnector> m_countersDb = nullptr;
+    // Counters are buffered in the pipeline and flushed once per update
+    std::shared_ptr<swss::RedisPipeline> m_countersPipeline = nullptr;
     std::shared_ptr<swss::Table> m_countersCrmTable = nullptr;
     swss::SelectableTimer *m_timer = nullptr;
 
@@ -123,15 +132,42 @@ private:
 
     std::chrono::seconds m_pollingInterval;
 
-    std::map<CrmResourceType, CrmResourceEntry> m_resourcesMap;
+    typedef std::map<CrmResourceType, CrmResourceEntry> CrmResourceMap;
+    typedef std::map<std::string, std::vector<swss::FieldValueTuple>> CrmCountersUpdate;
+
+    CrmResourceMap m_resourcesMap;
+    // Used counters are updated by orchs running on OrchScheduler workers
+    std::recursive_mutex m_resourcesMutex;
+
+    // Last values written to COUNTERS_DB by key and field, only changes are pushed
+    std::map<std::string, std::map<std::string, std::string>> m_countersCache;
+
+    /*
+     * The availability counters are queried from SAI on m_pollThread, so a slow
+     * poll never blocks the select loop. The timer hands a snapshot of the
+     * resources to the thread, which fills it in and signals m_pollDone. The
+     * result is then merged back on the thread running the orch.
+     */
+    std::thread m_pollThread;
+    std::mutex m_pollMutex;
+    std::condition_variable m_pollCv;
+    std::unique_ptr<CrmResourceMap> m_pollRequest;
+    std::unique_ptr<CrmResourceMap> m_pollResult;
+    bool m_pollStop = false;
+    swss::SelectableEvent *m_pollDone = nullptr;
 
     void doTask(Consumer &consumer);
     void handleSetCommand(const std::string& key, const std::vector<swss::FieldValueTuple>& data);
     void doTask(swss::SelectableTimer &timer);
     bool getResAvailability(CrmResourceType type, CrmResourceEntry &res);
     bool getDashAclGroupResAvailability(CrmResourceType type, CrmResourceEntry &res);
-    void getResAvailableCounters();
+    void getResAvailableCounters(CrmResourceMap &resources);
+    void pollResAvailableCounters();
+    void doPollResult();
+    void mergeResAvailableCounters(const CrmResourceMap &resources);
     void updateCrmCountersTable();
+    void addCrmCounterUpdate(CrmCountersUpdate &update, const std::string &key, const std::string &field, uint32_t value);
+    void delCrmCounters(const std::string &key);
     void checkCrmThresholds();
     std::string getCrmAclKey(sai_acl_stage_t stage, sai_acl_bind_point_type_t bindPoint);
     std::string getCrmAclTableKey(sai_object_id_t id);
@@ -65,6 +65,76 @@ bool FdbOrch::bake()
 }
 
 
+static void removeFromIndex(fdb_entries_index_t& index, sai_object_id_t oid, const FdbEntry& entry)
+{
+    auto it = index.find(oid);
+    if (it == index.end())
+    {
+        return;
+    }
+
+    it->second.erase(entry);
+    if (it->second.empty())
+    {
+        index.erase(it);
+    }
+}
+
+/*
+Inserts or updates an entry of the internal cache and its indexes
+*/
+void FdbOrch::setFdbEntry(const FdbEntry& entry, const FdbData& fdbData)
+{
+    auto it = m_entries.find(entry);
+    if (it == m_entries.end())
+    {
+        it = m_entries.emplace(entry, fdbData).first;
+        m_entriesByBvId[entry.bv_id].insert(it->first);
+    }
+    else
+    {
+        // MAC move, the cache keeps the key of the entry
+        if (it->second.bridge_port_id != fdbData.bridge_port_id)
+        {
+            removeFromIndex(m_entriesByBridgePort, it->second.bridge_port_id, it->first);
+        }
+        it->second = fdbData;
+    }
+
+    m_entriesByBridgePort[fdbData.bridge_port_id].insert(it->first);
+}
+
+/*
+Removes an entry from the internal cache and its indexes
+*/
+size_t FdbOrch::eraseFdbEntry(const FdbEntry& entry)
+{
+    auto it = m_entries.find(entry);
+    if (it == m_entries.end())
+    {
+        return 0;
+    }
+
+    removeFromIndex(m_entriesByBridgePort, it->second.bridge_port_id, it->first);
+    removeFromIndex(m_entriesByBvId, it->first.bv_id, it->first);
+    m_entries.erase(it);
+    return 1;
+}
+
+void FdbOrch::setFlushPending(const fdb_entries_index_t& index, sai_object_id_t oid)
+{
+    auto it = index.find(oid);
+    if (it == index.end())
+    {
+        return;
+    }
+
+    for (const auto& entry : it->second)
+    {
+        m_entries.at(entry).is_flush_pending = true;
+    }
+}
+
 bool FdbOrch::storeFdbEntryState(const FdbUpdate& update)
 {
     const FdbEntry& entry = update.entry;
@@ -115,7 +185,7 @@ bool FdbOrch::storeFdbEntryState(const FdbUpdate& update)
         fdbdata.esi = "";
         fdbdata.vni = 0;
 
-        m_entries[entry] = fdbdata;
+        setFdbEntry(entry, fdbdata);
         SWSS_LOG_INFO("FdbOrch notification: mac %s was inserted in port %s into bv_id 0x%" PRIx64,
                         entry.mac.to_string().c_str(), portName.c_str(), entry.bv_id);
         SWSS_LOG_INFO("m_entries size=%zu mac=%s port=0x%" PRIx64,
@@ -148,7 +218,7 @@ bool FdbOrch::storeFdbEntryState(const FdbUpdate& update)
             oldFdbData = it->second;
         }
 
-        size_t erased = m_entries.erase(entry);
+        size_t erased = eraseFdbEntry(entry);
         SWSS_LOG_DEBUG("FdbOrch notification: mac %s was removed from bv_id 0x%" PRIx64, entry.mac.to_string().c_str(), entry.bv_id);
 
         if (erased == 0)
@@ -224,52 +294,64 @@ void FdbOrch::handleSyncdFlushNotif(const sai_object_id_t& bv_id,
                 clearFdbEntry(curr->first);
             }
         }
+        return;
     }
-    else if (bv_id == SAI_NULL_OBJECT_ID)
+
+    /*
+     * FLUSH based on PORT, BV_ID or both only visits the entries of the
+     * bridge port or BV_ID index, or the entry itself for a single MAC in a
+     * BV_ID. They are collected first as clearing entries updates the indexes.
+     */
+    vector<FdbEntry> entries;
+    if (bv_id != SAI_NULL_OBJECT_ID && mac != flush_mac)
     {
-        /* FLUSH based on PORT */
-        for (auto itr = m_entries.begin(); itr != m_entries.end();)
-        {
-            auto curr = itr++;
-            if (curr->second.bridge_port_id == bridge_port_id)
-            {
-                if (curr->second.sai_fdb_type == sai_fdb_type &&
-                    (curr->first.mac == mac || mac == flush_mac) && curr->second.is_flush_pending)
-                {
-                    clearFdbEntry(curr->first);
-                }
-            }
-        }
+        FdbEntry entry;
+        entry.mac = mac;
+        entry.bv_id = bv_id;
+        entries.push_back(entry);
     }
-    else if (bridge_port_id == SAI_NULL_OBJECT_ID)
+    else
     {
-        /* FLUSH based on BV_ID */
-        for (auto itr = m_entries.begin(); itr != m_entries.end();)
+        auto byPort = m_entriesByBridgePort.find(bridge_port_id);
+        auto byBvId = m_entriesByBvId.find(bv_id);
+        if (bridge_port_id != SAI_NULL_OBJECT_ID && byPort == m_entriesByBridgePort.end())
         {
-            auto curr = itr++;
-            if (curr->first.bv_id == bv_id)
-            {
-                if (curr->second.sai_fdb_type == sai_fdb_type &&
-                    (curr->first.mac == mac || mac == flush_mac) && curr->second.is_flush_pending)
-                {
-                    clearFdbEntry(curr->first);
-                }
-            }
+            return;
         }
+        if (bv_id != SAI_NULL_OBJECT_ID && byBvId == m_entriesByBvId.end())
+        {
+            return;
+        }
+
+        // FLUSH based on port and VLAN visits the smaller index
+        const set<FdbEntry> *indexed;
+        if (bv_id == SAI_NULL_OBJECT_ID ||
+            (bridge_port_id != SAI_NULL_OBJECT_ID && byPort->second.size() < byBvId->second.size()))
+        {
+            indexed = &byPort->second;
+        }
+        else
+        {
+            indexed = &byBvId->second;
+        }
+        entries.assign(indexed->begin(), indexed->end());
     }
-    else
+
+    for (const auto& entry : entries)
     {
-        /* FLUSH based on port and VLAN */
-        for (auto itr = m_entries.begin(); itr != m_entries.end();)
+        auto curr = m_entries.find(entry);
+        if (curr == m_entries.end())
         {
-            auto curr = itr++;
-            if (curr->first.bv_id == bv_id && curr->second.bridge_port_id == bridge_port_id)
+            continue;
+        }
+
+        if ((bridge_port_id == SAI_NULL_OBJECT_ID || curr->second.bridge_port_id == bridge_port_id) &&
+            (bv_id == SAI_NULL_OBJECT_ID || curr->first.bv_id == bv_id))
+        {
+            if (curr->second.sai_fdb_type == sai_fdb_type &&
+                (curr->first.mac == mac || mac == flush_mac) && curr->second.is_flush_pending)
             {
-                if (curr->second.sai_fdb_type == sai_fdb_type &&
-                    (curr->first.mac == mac || mac == flush_mac) && curr->second.is_flush_pending)
-                {
-                    clearFdbEntry(curr->first);
-                }
+                clearFdbEntry(curr->first);
             }
         }
     }
@@ -1132,16 +1214,13 @@ void FdbOrch::flushFDBEntries(sai_object_id_t bridge_port_oid,
     }
 
     if (SAI_STATUS_SUCCESS == rv) {
-        for (map<FdbEntry, FdbData>::iterator it = m_entries.begin();
-                it != m_entries.end(); it++)
+        if (bridge_port_oid != SAI_NULL_OBJECT_ID)
         {
-            if ((bridge_port_oid != SAI_NULL_OBJECT_ID &&
-                    it->second.bridge_port_id == bridge_port_oid) ||
-                    (vlan_oid != SAI_NULL_OBJECT_ID &&
-                    it->first.bv_id == vlan_oid))
-            {
-                it->second.is_flush_pending = true;
-            }
+            setFlushPending(m_entriesByBridgePort, bridge_port_oid);
+        }
+        if (vlan_oid != SAI_NULL_OBJECT_ID)
+        {
+            setFlushPending(m_entriesByBvId, vlan_oid);
         }
     }
 }
@@ -1180,17 +1259,20 @@ void FdbOrch::notifyObserversFDBFlush(Port &port, sai_object_id_t& bvid)
     FdbFlushUpdate flushUpdate;
     flushUpdate.port = port;
 
-    for (auto itr = m_entries.begin(); itr != m_entries.end(); ++itr)
+    auto indexed = m_entriesByBvId.find(bvid);
+    if (indexed != m_entriesByBvId.end())
     {
-        if ((itr->first.port_name == port.m_alias) &&
-            (itr->first.bv_id == bvid))
+        for (const auto& key : indexed->second)
         {
-            SWSS_LOG_INFO("Adding MAC learnt on [ port:%s , bvid:0x%" PRIx64 "]\
-                           to ARP flush", port.m_alias.c_str(), bvid);
-            FdbEntry entry;
-            entry.mac = itr->first.mac;
-            entry.bv_id = itr->first.bv_id;
-            flushUpdate.entries.push_back(entry);
+            if (key.port_name == port.m_alias)
+            {
+                SWSS_LOG_INFO("Adding MAC learnt on [ port:%s , bvid:0x%" PRIx64 "]\
+                               to ARP flush", port.m_alias.c_str(), bvid);
+                FdbEntry entry;
+                entry.mac = key.mac;
+                entry.bv_id = key.bv_id;
+                flushUpdate.entries.push_back(entry);
+            }
         }
     }
 
@@ -1562,7 +1644,7 @@ bool FdbOrch::addFdbEntry(const FdbEntry& entry, const string& port_name,
         storeFdbData.type = "dynamic";
     }
 
-    m_entries[entry] = storeFdbData;
+    setFdbEntry(entry, storeFdbData);
 
     string key = "Vlan" + to_string(vlan.m_vlan_info.vlan_id) + ":" + entry.mac.to_string();
 
@@ -1717,7 +1799,7 @@ bool FdbOrch::removeFdbEntry(const FdbEntry& entry, FdbOrigin origin)
     m_portsOrch->setPort(port.m_alias, port);
     vlan.m_fdb_count--;
     m_portsOrch->setPort(vlan.m_alias, vlan);
-    (void)m_entries.erase(entry);
+    (void)eraseFdbEntry(entry);
 
     // Remove in StateDb
     if ((fdbData.origin != FDB_ORIGIN_VXLAN_ADVERTIZED) && (fdbData.origin != FDB_ORIGIN_MCLAG_ADVERTIZED))
@@ -80,6 +80,7 @@ struct SavedFdbEntry
 };
 
 typedef unordered_map<string, vector<SavedFdbEntry>> fdb_entries_by_port_t;
+typedef map<sai_object_id_t, set<FdbEntry>> fdb_entries_index_t;
 
 class FdbOrch: public Orch, public Subject, public Observer
 {
@@ -109,6 +110,9 @@ public:
 private:
     PortsOrch *m_portsOrch;
     map<FdbEntry, FdbData> m_entries;
+    /* Keys of m_entries by bridge port and by BV_ID, only updated by setFdbEntry and eraseFdbEntry */
+    fdb_entries_index_t m_entriesByBridgePort;
+    fdb_entries_index_t m_entriesByBvId;
     fdb_entries_by_port_t saved_fdb_entries;
     vector<Table*> m_appTables;
     Table m_fdbStateTable;
@@ -123,6 +127,10 @@ private:
     void updateVlanMember(const VlanMemberUpdate&);
     void updatePortOperState(const PortOperStateUpdate&);
 
+    void setFdbEntry(const FdbEntry&, const FdbData&);
+    size_t eraseFdbEntry(const FdbEntry&);
+    void setFlushPending(const fdb_entries_index_t&, sai_object_id_t);
+
     bool addFdbEntry(const FdbEntry&, const string&, FdbData fdbData);
     void deleteFdbEntryFromSavedFDB(const MacAddress &mac, const unsigned short &vlanId, FdbOrigin origin, const string portName="");
 
@@ -52,6 +52,7 @@ MacAddress gMacAddress;
 MacAddress gVxlanMacAddress;
 bool gOrchUnhealthy = false;
 extern volatile sig_atomic_t gOrchShutdownRequested;
+extern volatile sig_atomic_t gConsumerStatsDumpRequested;
 string gSaiErrorString;
 
 extern size_t gMaxBulkSize;
@@ -59,8 +60,12 @@ extern size_t gMaxBulkSize;
 #define DEFAULT_BATCH_SIZE  128
 extern int gBatchSize;
 
+#define DEFAULT_TASK_TIME_SLICE 50
+extern int gTaskTimeSlice;
+
 bool gRingMode = false;
 bool gSyncMode = false;
+bool gPfcWdNativeDetection = false;
 sai_redis_communication_mode_t gRedisCommunicationMode = SAI_REDIS_COMMUNICATION_MODE_REDIS_ASYNC;
 string gAsicInstance;
 
@@ -92,7 +97,7 @@ bool isChassisDbInUse()
 
 void usage()
 {
-    cout << "usage: orchagent [-h] [-r record_type] [-A] [-d record_location] [-f swss_rec_filename] [-j sairedis_rec_filename] [-b batch_size] [-m MAC] [-i INST_ID] [-s] [-z mode] [-k bulk_size] [-q zmq_server_address] [-c mode] [-t create_switch_timeout] [-v VRF] [-I heart_beat_interval] [-R] [-M]" << endl;
+    cout << "usage: orchagent [-h] [-r record_type] [-A] [-B] [-d record_location] [-f swss_rec_filename] [-j sairedis_rec_filename] [-b batch_size] [-L time_slice] [-m MAC] [-i INST_ID] [-s] [-z mode] [-k bulk_size] [-q zmq_server_address] [-c mode] [-t create_switch_timeout] [-v VRF] [-I heart_beat_interval] [-R] [-W checkpoint_file] [-M]" << endl;
     cout << "    -h: display this message" << endl;
     cout << "    -r record_type: record orchagent logs with type (default 3)" << endl;
     cout << "                    Bit 0: sairedis.rec, Bit 1: swss.rec, Bit 2: responsepublisher.rec. For example:" << endl;
@@ -103,9 +108,11 @@ void usage()
     cout << "                    7: enable sairedis.rec, swss.rec and responsepublisher.rec" << endl;
     cout << "    -d record_location: set record logs folder location (default .)" << endl;
     cout << "    -b batch_size: set consumer table pop operation batch size (default 128)" << endl;
+    cout << "    -L time_slice: milliseconds a pending tasks pass may spend before deferring non urgent tables, 0 to disable (default 50)" << endl;
     cout << "    -m MAC: set switch MAC address" << endl;
     cout << "    -i INST_ID: set the ASIC instance_id in multi-asic platform" << endl;
     cout << "    -A: enable async swss.rec recording path" << endl;
+    cout << "    -B: record swss.rec in the compressed binary format to swss_rec_filename.bin, see swssrecdump" << endl;
     cout << "    -s enable synchronous mode (deprecated, use -z)" << endl;
     cout << "    -z redis communication mode (redis_async|redis_sync|zmq_sync), default: redis_async" << endl;
     cout << "    -f swss_rec_filename: swss record log filename(default 'swss.rec')" << endl;
@@ -117,6 +124,9 @@ void usage()
     cout << "    -v vrf: VRF name (default empty)" << endl;
     cout << "    -I heart_beat_interval: Heart beat interval in millisecond (default 10)" << endl;
     cout << "    -R enable the ring thread feature" << endl;
+    cout << "    -P detect PFC watchdog storms in orchagent instead of with the Lua plugins, on supported platforms" << endl;
+    cout << "    -T workers: run independent orchs on up to <workers> threads (default 0, disabled)" << endl;
+    cout << "    -W checkpoint_file: checkpoint the consumer tables to <checkpoint_file> when frozen for warm restart, and refill from it on warm start (default disabled)" << endl;
     cout << "    -M enable SAI MACSec POST" << endl;
     cout << "    -D Delay in seconds before flex counter processing begins after orchagent startup (default 0)" << endl;
 }
@@ -132,6 +142,14 @@ void sighup_handler(int signo)
     Recorder::Instance().respub.setRotate(true);
 }
 
+void consumer_stats_signal_handler(int signo)
+{
+    /*
+     * The dump itself is done by the main loop.
+     */
+    gConsumerStatsDumpRequested = signo;
+}
+
 void fatal_signal_handler(int signo)
 {
     /*
@@ -454,10 +472,17 @@ int main(int argc, char **argv)
     register_graceful_shutdown_signal_handler(SIGTERM);
     register_graceful_shutdown_signal_handler(SIGINT);
 
+    if (signal(SIGUSR1, consumer_stats_signal_handler) == SIG_ERR)
+    {
+        SWSS_LOG_ERROR("failed to setup SIGUSR1 action");
+        exit(1);
+    }
+
     int opt;
     sai_status_t status;
 
     gBatchSize = DEFAULT_BATCH_SIZE;
+    gTaskTimeSlice = DEFAULT_TASK_TIME_SLICE;
     string record_location = Recorder::DEFAULT_DIR;
     string swss_rec_filename = Recorder::SWSS_FNAME;
     string sairedis_rec_filename = Recorder::SAIREDIS_FNAME;
@@ -471,13 +496,25 @@ int main(int argc, char **argv)
     // Disable SAI MACSec POST by default. Use option -M to enable it.
     bool macsec_post_enabled = false;
 
-    while ((opt = getopt(argc, argv, "b:m:r:Af:j:d:i:hsz:k:q:c:t:v:I:RD:M")) != -1)
+    // All orchs run on the main thread by default. Use option -T to enable the scheduler.
+    int orch_workers = 0;
+    string warm_checkpoint;
+
+    while ((opt = getopt(argc, argv, "b:L:m:r:ABf:j:d:i:hsz:k:q:c:t:v:I:RPT:W:D:M")) != -1)
     {
         switch (opt)
         {
         case 'b':
             gBatchSize = atoi(optarg);
             break;
+        case 'L':
+            gTaskTimeSlice = atoi(optarg);
+            if (gTaskTimeSlice < 0)
+            {
+                SWSS_LOG_ERROR("Invalid input for task time slice: %d. Time slicing disabled.", gTaskTimeSlice);
+                gTaskTimeSlice = 0;
+            }
+            break;
         case 'i':
             {
                 // Limit asic instance string max length
@@ -508,6 +545,10 @@ int main(int argc, char **argv)
             Recorder::Instance().swss.setAsync(true);
             SWSS_LOG_NOTICE("Async swss recorder enabled");
             break;
+        case 'B':
+            Recorder::Instance().swss.setBinary(true);
+            SWSS_LOG_NOTICE("Binary swss recorder enabled");
+            break;
         case 'd':
             record_location = optarg;
             if (access(record_location.c_str(), W_OK))
@@ -593,6 +634,26 @@ int main(int argc, char **argv)
         case 'R':
             gRingMode = true;
             break;
+        case 'P':
+            gPfcWdNativeDetection = true;
+            break;
+        case 'T':
+            if (optarg)
+            {
+                orch_workers = atoi(optarg);
+                if (orch_workers < 0)
+                {
+                    SWSS_LOG_ERROR("Invalid input for orch workers: %d. Scheduler disabled.", orch_workers);
+                    orch_workers = 0;
+                }
+            }
+            break;
+        case 'W':
+            if (optarg)
+            {
+                warm_checkpoint = optarg;
+            }
+            break;
          case 'M':
             macsec_post_enabled = true;
             break;
@@ -1016,6 +1077,14 @@ int main(int argc, char **argv)
         orchDaemon->enableRingBuffer();
     }
 
+    if (orch_workers > 0)
+    {
+        /* Must be created before OrchDaemon initializing Orchs as well */
+        orchDaemon->enableScheduler(orch_workers);
+    }
+
+    orchDaemon->setWarmCheckpointPath(warm_checkpoint);
+
     if (!orchDaemon->init())
     {
         SWSS_LOG_ERROR("Failed to initialize orchestration daemon");
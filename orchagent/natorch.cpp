@@ -37,6 +37,7 @@ extern sai_object_id_t     gVirtualRouterId;
 extern sai_nat_api_t      *sai_nat_api;
 extern sai_hostif_api_t   *sai_hostif_api;
 extern bool               gIsNatSupported;
+extern size_t             gMaxBulkSize;
 #ifdef DEBUG_FRAMEWORK
 extern DebugDumpOrch      *gDebugDumpOrch;
 #endif
@@ -3115,53 +3116,289 @@ void NatOrch::doTask(SelectableTimer &timer)
     }
 }
 
+static sai_nat_entry_t getNatEntryKey(const IpAddress &ipAddr, bool dnat)
+{
+    sai_nat_entry_t nat_entry = {};
+
+    nat_entry.vr_id       = gVirtualRouterId;
+    nat_entry.switch_id   = gSwitchId;
+
+    if (dnat)
+    {
+        nat_entry.nat_type = SAI_NAT_TYPE_DESTINATION_NAT;
+        nat_entry.data.key.dst_ip = ipAddr.getV4Addr();
+        nat_entry.data.mask.dst_ip = 0xffffffff;
+    }
+    else
+    {
+        nat_entry.nat_type = SAI_NAT_TYPE_SOURCE_NAT;
+        nat_entry.data.key.src_ip = ipAddr.getV4Addr();
+        nat_entry.data.mask.src_ip = 0xffffffff;
+    }
+
+    return nat_entry;
+}
+
+static sai_nat_entry_t getNaptEntryKey(const NaptEntryKey &naptKey, bool dnat)
+{
+    sai_nat_entry_t nat_entry = {};
+
+    nat_entry.vr_id       = gVirtualRouterId;
+    nat_entry.switch_id   = gSwitchId;
+
+    if (dnat)
+    {
+        nat_entry.nat_type = SAI_NAT_TYPE_DESTINATION_NAT;
+        nat_entry.data.key.dst_ip       = naptKey.ip_address.getV4Addr();
+        nat_entry.data.key.l4_dst_port  = (uint16_t)(naptKey.l4_port);
+        nat_entry.data.mask.dst_ip      = 0xffffffff;
+        nat_entry.data.mask.l4_dst_port = 0xffff;
+    }
+    else
+    {
+        nat_entry.nat_type = SAI_NAT_TYPE_SOURCE_NAT;
+        nat_entry.data.key.src_ip       = naptKey.ip_address.getV4Addr();
+        nat_entry.data.key.l4_src_port  = (uint16_t)(naptKey.l4_port);
+        nat_entry.data.mask.src_ip      = 0xffffffff;
+        nat_entry.data.mask.l4_src_port = 0xffff;
+    }
+
+    nat_entry.data.key.proto  = (uint8_t)((naptKey.prototype == "TCP") ? IPPROTO_TCP : IPPROTO_UDP);
+    nat_entry.data.mask.proto = 0xff;
+
+    return nat_entry;
+}
+
+static sai_nat_entry_t getTwiceNatEntryKey(const TwiceNatEntryKey &key)
+{
+    sai_nat_entry_t dbl_nat_entry = {};
+
+    dbl_nat_entry.vr_id = gVirtualRouterId;
+    dbl_nat_entry.switch_id = gSwitchId;
+    dbl_nat_entry.nat_type = SAI_NAT_TYPE_DOUBLE_NAT;
+    dbl_nat_entry.data.key.src_ip = key.src_ip.getV4Addr();
+    dbl_nat_entry.data.mask.src_ip = 0xffffffff;
+    dbl_nat_entry.data.key.dst_ip = key.dst_ip.getV4Addr();
+    dbl_nat_entry.data.mask.dst_ip = 0xffffffff;
+
+    return dbl_nat_entry;
+}
+
+static sai_nat_entry_t getTwiceNaptEntryKey(const TwiceNaptEntryKey &key)
+{
+    sai_nat_entry_t dbl_nat_entry = {};
+
+    dbl_nat_entry.vr_id = gVirtualRouterId;
+    dbl_nat_entry.switch_id = gSwitchId;
+    dbl_nat_entry.nat_type = SAI_NAT_TYPE_DOUBLE_NAT;
+    dbl_nat_entry.data.key.src_ip = key.src_ip.getV4Addr();
+    dbl_nat_entry.data.mask.src_ip = 0xffffffff;
+    dbl_nat_entry.data.key.l4_src_port = (uint16_t)(key.src_l4_port);
+    dbl_nat_entry.data.mask.l4_src_port = 0xffff;
+    dbl_nat_entry.data.key.dst_ip = key.dst_ip.getV4Addr();
+    dbl_nat_entry.data.mask.dst_ip = 0xffffffff;
+    dbl_nat_entry.data.key.l4_dst_port = (uint16_t)(key.dst_l4_port);
+    dbl_nat_entry.data.mask.l4_dst_port = 0xffff;
+    dbl_nat_entry.data.key.proto = (uint8_t)((key.prototype == "TCP") ? IPPROTO_TCP : IPPROTO_UDP);
+    dbl_nat_entry.data.mask.proto = 0xff;
+
+    return dbl_nat_entry;
+}
+
+/* Byte and packet counts of a NAT entry read by a bulk get, zero if it failed */
+static void getCountersFromAttrs(sai_status_t status, const sai_attribute_t *attrs,
+                                 uint64_t &nat_translations_pkts, uint64_t &nat_translations_bytes)
+{
+    nat_translations_pkts = nat_translations_bytes = 0;
+
+    if (status == SAI_STATUS_SUCCESS)
+    {
+        nat_translations_bytes = attrs[0].value.u64;
+        nat_translations_pkts  = attrs[1].value.u64;
+    }
+}
+
+void NatOrch::bulkGetNatEntries(NatBulkGet &bulk, const vector<sai_attribute_t> &attrs)
+{
+    SWSS_LOG_ENTER();
+
+    size_t                   count = bulk.entries.size();
+    size_t                   chunk = gMaxBulkSize ? gMaxBulkSize : count;
+    uint32_t                 attr_count = (uint32_t)attrs.size();
+    vector<sai_attribute_t>  values;
+    vector<sai_status_t>     statuses(count, SAI_STATUS_FAILURE);
+
+    values.reserve(count * attr_count);
+    for (size_t i = 0; i < count; i++)
+    {
+        values.insert(values.end(), attrs.begin(), attrs.end());
+    }
+
+    for (size_t start = 0; start < count; start += chunk)
+    {
+        uint32_t object_count = (uint32_t)min(chunk, count - start);
+
+        if (m_natBulkGetSupported and sai_nat_api->get_nat_entries_attribute)
+        {
+            vector<uint32_t>          attr_counts(object_count, attr_count);
+            vector<sai_attribute_t *> attr_lists(object_count);
+
+            for (uint32_t i = 0; i < object_count; i++)
+            {
+                attr_lists[i] = &values[(start + i) * attr_count];
+            }
+
+            /* Per entry statuses are valid whatever the status of the whole chunk,
+             * unless the bulk get is not available at all */
+            sai_status_t status = sai_nat_api->get_nat_entries_attribute(object_count, &bulk.entries[start],
+                                                                         attr_counts.data(), attr_lists.data(),
+                                                                         SAI_BULK_OP_ERROR_MODE_IGNORE_ERROR,
+                                                                         &statuses[start]);
+            if ((status != SAI_STATUS_NOT_IMPLEMENTED) and (status != SAI_STATUS_NOT_SUPPORTED))
+            {
+                continue;
+            }
+
+            SWSS_LOG_NOTICE("Bulk get of NAT entries is not supported, querying the entries one by one");
+            m_natBulkGetSupported = false;
+        }
+
+        for (size_t i = start; i < start + object_count; i++)
+        {
+            statuses[i] = sai_nat_api->get_nat_entry_attribute(&bulk.entries[i], attr_count, &values[i * attr_count]);
+        }
+    }
+
+    for (size_t i = 0; i < count; i++)
+    {
+        bulk.handlers[i](statuses[i], &values[i * attr_count]);
+    }
+}
+
 void NatOrch::queryCounters(void)
 {
     SWSS_LOG_ENTER();
 
     uint32_t         queried_entries = 0;
     struct timespec  time_now, time_end, time_spent;
+    NatBulkGet       bulk;
 
     if (clock_gettime (CLOCK_MONOTONIC, &time_now) < 0)
     {
         return;
     }
 
-    NatEntry::iterator natIter = m_natEntries.begin();
-    while (natIter != m_natEntries.end())
+    /* The counters of all the entries added to the hardware are read
+     * together with bulk gets, then updated in the database. */
+    for (auto natIter = m_natEntries.begin(); natIter != m_natEntries.end(); natIter++)
     {
-        getNatCounters(natIter);
+        if (natIter->second.addedToHw == false)
+        {
+            continue;
+        }
 
-        queried_entries++;
-        natIter++;
+        bulk.add(getNatEntryKey(natIter->first, natIter->second.nat_type == "dnat"),
+                 [this, natIter](sai_status_t status, const sai_attribute_t *attrs)
+        {
+            uint64_t nat_translations_pkts, nat_translations_bytes;
+
+            getCountersFromAttrs(status, attrs, nat_translations_pkts, nat_translations_bytes);
+            if (status != SAI_STATUS_SUCCESS)
+            {
+                SWSS_LOG_ERROR("Failed to get Counters for %s entry [ip %s], rv:%d", natIter->second.nat_type.c_str(),
+                               natIter->first.to_string().c_str(), status);
+            }
+
+            /* Update the Counter values in the database */
+            updateNatCounters(natIter->first, nat_translations_pkts, nat_translations_bytes);
+        });
     }
 
-    NaptEntry::iterator naptIter = m_naptEntries.begin();
-    while (naptIter != m_naptEntries.end())
+    for (auto naptIter = m_naptEntries.begin(); naptIter != m_naptEntries.end(); naptIter++)
     {
-        getNaptCounters(naptIter);
+        if (naptIter->second.addedToHw == false)
+        {
+            continue;
+        }
 
-        queried_entries++;
-        naptIter++;
+        bulk.add(getNaptEntryKey(naptIter->first, naptIter->second.nat_type == "dnat"),
+                 [this, naptIter](sai_status_t status, const sai_attribute_t *attrs)
+        {
+            const NaptEntryKey &naptKey = naptIter->first;
+            uint64_t           nat_translations_pkts, nat_translations_bytes;
+
+            getCountersFromAttrs(status, attrs, nat_translations_pkts, nat_translations_bytes);
+            if (status != SAI_STATUS_SUCCESS)
+            {
+                SWSS_LOG_ERROR("Failed to get Counters for %s NAPT entry for [proto %s, ip %s, port %d], rv:%d",
+                               naptIter->second.nat_type.c_str(), naptKey.prototype.c_str(),
+                               naptKey.ip_address.to_string().c_str(), naptKey.l4_port, status);
+            }
+
+            /* Update the Counter values in the database */
+            updateNaptCounters(naptKey.prototype, naptKey.ip_address, naptKey.l4_port,
+                               nat_translations_pkts, nat_translations_bytes);
+        });
     }
-    TwiceNatEntry::iterator tnatIter = m_twiceNatEntries.begin();
-    while (tnatIter != m_twiceNatEntries.end())
+
+    for (auto tnatIter = m_twiceNatEntries.begin(); tnatIter != m_twiceNatEntries.end(); tnatIter++)
     {
-        getTwiceNatCounters(tnatIter);
+        if (tnatIter->second.addedToHw == false)
+        {
+            continue;
+        }
+
+        bulk.add(getTwiceNatEntryKey(tnatIter->first),
+                 [this, tnatIter](sai_status_t status, const sai_attribute_t *attrs)
+        {
+            const TwiceNatEntryKey &key = tnatIter->first;
+            uint64_t               nat_translations_pkts, nat_translations_bytes;
 
-        queried_entries++;
-        tnatIter++;
+            getCountersFromAttrs(status, attrs, nat_translations_pkts, nat_translations_bytes);
+            if (status != SAI_STATUS_SUCCESS)
+            {
+                SWSS_LOG_ERROR("Failed to get Counters for Twice NAT entry [src-ip %s, dst-ip %s], rv:%d",
+                               key.src_ip.to_string().c_str(), key.dst_ip.to_string().c_str(), status);
+            }
+
+            /* Update the Counter values in the database */
+            updateTwiceNatCounters(key, nat_translations_pkts, nat_translations_bytes);
+        });
     }
 
-    TwiceNaptEntry::iterator tnaptIter = m_twiceNaptEntries.begin();
-    while (tnaptIter != m_twiceNaptEntries.end())
+    for (auto tnaptIter = m_twiceNaptEntries.begin(); tnaptIter != m_twiceNaptEntries.end(); tnaptIter++)
     {
-        getTwiceNaptCounters(tnaptIter);
+        if (tnaptIter->second.addedToHw == false)
+        {
+            continue;
+        }
+
+        bulk.add(getTwiceNaptEntryKey(tnaptIter->first),
+                 [this, tnaptIter](sai_status_t status, const sai_attribute_t *attrs)
+        {
+            const TwiceNaptEntryKey &key = tnaptIter->first;
+            uint64_t                nat_translations_pkts, nat_translations_bytes;
+
+            getCountersFromAttrs(status, attrs, nat_translations_pkts, nat_translations_bytes);
+            if (status != SAI_STATUS_SUCCESS)
+            {
+                SWSS_LOG_DEBUG("Failed to get Counters for Twice NAPT entry for [proto %s, src ip %s, src port %d, dst ip %s, dst port %d], rv:%d",
+                               key.prototype.c_str(), key.src_ip.to_string().c_str(), key.src_l4_port,
+                               key.dst_ip.to_string().c_str(), key.dst_l4_port, status);
+            }
 
-        queried_entries++;
-        tnaptIter++;
+            /* Update the Counter values in the database */
+            updateTwiceNaptCounters(key, nat_translations_pkts, nat_translations_bytes);
+        });
     }
 
+    vector<sai_attribute_t> attrs(NAT_BULK_GET_ATTR_COUNT);
+    attrs[0].id = SAI_NAT_ENTRY_ATTR_BYTE_COUNT;
+    attrs[1].id = SAI_NAT_ENTRY_ATTR_PACKET_COUNT;
+
+    queried_entries = (uint32_t)bulk.entries.size();
+    bulkGetNatEntries(bulk, attrs);
+
     if (clock_gettime (CLOCK_MONOTONIC, &time_end) < 0)
     {
         return;
@@ -3307,126 +3544,300 @@ void NatOrch::queryHitBits(void)
 
     uint32_t         queried_entries = 0;
     struct timespec  time_now, time_end, time_spent;
+    NatBulkGet       snatBulk, dnatBulk;
 
     if (clock_gettime (CLOCK_MONOTONIC, &time_now) < 0)
     {
         return;
     }
 
-    /* Remove the NAT entries that are aged out.
-     * Query the NAT entries for their activity in the hardware
-     * and update the active timeout. */
-    NatEntry::iterator natIter = m_natEntries.begin();
-    while (natIter != m_natEntries.end())
+    time_t now = time_now.tv_sec;
+
+    /* Query the NAT entries for their activity in the hardware with bulk gets.
+     * SNAT hit bits are read first, then the hit bits in the reverse direction
+     * for the entries whose SNAT hit bit is not set. An entry seen active,
+     * or static, gets its active time reset. */
+    for (auto natIter = m_natEntries.begin(); natIter != m_natEntries.end(); natIter++)
     {
-        if (checkIfNatEntryIsActive(natIter, time_now.tv_sec))
+        NatEntryValue &entry = natIter->second;
+
+        /* Hitbits are queried for both directions when SNAT entry is checked */
+        if ((entry.nat_type == "dnat") or (entry.addedToHw == false))
         {
-            /* Since the entry is active in the hardware, reset the active time */
-            natIter->second.activeTime = time_now.tv_sec;
+            continue;
         }
-        else
+
+        if (entry.entry_type == "static")
         {
-            if ((natIter->second.nat_type == "snat") and (natIter->second.addedToHw == true) and
-                (natIter->second.entry_type != "static"))
+            /* Static NAT entries are always treated active */
+            entry.activeTime = now;
+            continue;
+        }
+
+        snatBulk.add(getNatEntryKey(natIter->first, false),
+                     [this, natIter, now, &dnatBulk](sai_status_t status, const sai_attribute_t *attrs)
+        {
+            NatEntryValue &entry = natIter->second;
+
+            if (status != SAI_STATUS_SUCCESS)
+            {
+                return;
+            }
+
+            SWSS_LOG_DEBUG("SNAT HIT BIT for src-ip %s = %d", natIter->first.to_string().c_str(), attrs[0].value.booldata);
+            if (attrs[0].value.booldata)
+            {
+                entry.activeTime = now;
+                entry.ageOutTime = now + timeout;
+                return;
+            }
+
+            auto dnatIter = m_natEntries.find(entry.translated_ip);
+            if ((dnatIter == m_natEntries.end()) or ((dnatIter->second).addedToHw == false))
+            {
+                return;
+            }
+
+            /* If SNAT HitBit is not set, check for the HitBit in the reverse direction */
+            dnatBulk.add(getNatEntryKey(entry.translated_ip, true),
+                         [this, natIter, now](sai_status_t status, const sai_attribute_t *attrs)
             {
-                if (time_now.tv_sec - natIter->second.activeTime >= timeout)
+                NatEntryValue &entry = natIter->second;
+
+                if (status != SAI_STATUS_SUCCESS)
                 {
-                    std::vector<FieldValueTuple> fvVector;
-                    std::string key = natIter->first.to_string();
-                    setTimeoutNotifier->send("AGEOUT-SINGLE-NAT", key, fvVector);
+                    return;
                 }
-            } 
-        }
-        queried_entries++;
-        natIter++;
+
+                SWSS_LOG_DEBUG("DNAT HIT BIT for dst-ip %s = %d", entry.translated_ip.to_string().c_str(), attrs[0].value.booldata);
+                if (attrs[0].value.booldata)
+                {
+                    entry.activeTime = now;
+                    entry.ageOutTime = now + timeout;
+                }
+            });
+        });
     }
 
-    /* Remove the NAPT entries that are aged out.
-     * Query the NAPT entries for their activity in the hardware
-     * and update the active timeout. */
-    NaptEntry::iterator naptIter = m_naptEntries.begin();
-    while (naptIter != m_naptEntries.end())
+    for (auto naptIter = m_naptEntries.begin(); naptIter != m_naptEntries.end(); naptIter++)
     {
-        if (checkIfNaptEntryIsActive(naptIter, time_now.tv_sec))
+        NaptEntryValue &entry = naptIter->second;
+
+        /* Hitbits are queried for both directions when SNAPT entry is checked */
+        if ((entry.nat_type == "dnat") or (entry.addedToHw == false))
+        {
+            continue;
+        }
+
+        if (entry.entry_type == "static")
         {
-            /* Since the entry is active in the hardware, reset the active time */
-            naptIter->second.activeTime = time_now.tv_sec;
+            /* Static NAPT entries are always treated active */
+            entry.activeTime = now;
+            continue;
         }
-        else
+
+        snatBulk.add(getNaptEntryKey(naptIter->first, false),
+                     [this, naptIter, now, &dnatBulk](sai_status_t status, const sai_attribute_t *attrs)
         {
-            if ((naptIter->second.nat_type == "snat") and (naptIter->second.addedToHw == true) and
-                (naptIter->second.entry_type != "static"))
+            const NaptEntryKey &naptKey = naptIter->first;
+            NaptEntryValue     &entry   = naptIter->second;
+            int                timeout = naptKey.prototype == string("TCP") ? tcp_timeout : udp_timeout;
+
+            if (status != SAI_STATUS_SUCCESS)
+            {
+                return;
+            }
+
+            SWSS_LOG_DEBUG("SNAPT HIT BIT for proto %s, src-ip %s, src-port %d = %d", naptKey.prototype.c_str(),
+                           naptKey.ip_address.to_string().c_str(), naptKey.l4_port, attrs[0].value.booldata);
+            if (attrs[0].value.booldata)
+            {
+                entry.activeTime = now;
+                entry.ageOutTime = now + timeout;
+                return;
+            }
+
+            NaptEntryKey dnaptKey;
+            dnaptKey.ip_address = entry.translated_ip;
+            dnaptKey.l4_port    = entry.translated_l4_port;
+            dnaptKey.prototype  = naptKey.prototype;
+
+            auto dnaptIter = m_naptEntries.find(dnaptKey);
+            if ((dnaptIter == m_naptEntries.end()) or ((dnaptIter->second).addedToHw == false))
+            {
+                return;
+            }
+
+            /* If SNAPT HitBit is not set, check for the HitBit in the reverse direction */
+            dnatBulk.add(getNaptEntryKey(dnaptKey, true),
+                         [naptIter, now, timeout](sai_status_t status, const sai_attribute_t *attrs)
             {
-                int timeout = naptIter->first.prototype == string("TCP") ? tcp_timeout : udp_timeout;
-                if (time_now.tv_sec - naptIter->second.activeTime >= timeout)
+                NaptEntryValue &entry = naptIter->second;
+
+                if (status != SAI_STATUS_SUCCESS)
                 {
-                    std::vector<FieldValueTuple> fvVector;
-                    std::string key = (naptIter->first.prototype + ":" + naptIter->first.ip_address.to_string() + ":" + to_string(naptIter->first.l4_port));
-                    setTimeoutNotifier->send("AGEOUT-SINGLE-NAPT", key, fvVector);
+                    return;
+                }
+
+                SWSS_LOG_DEBUG("DNAPT HIT BIT for proto %s, dst-ip %s, dst-port %d = %d", naptIter->first.prototype.c_str(),
+                               entry.translated_ip.to_string().c_str(), entry.translated_l4_port, attrs[0].value.booldata);
+                if (attrs[0].value.booldata)
+                {
+                    entry.activeTime = now;
+                    entry.ageOutTime = now + timeout;
                 }
+            });
+        });
+    }
+
+    for (auto twiceNatIter = m_twiceNatEntries.begin(); twiceNatIter != m_twiceNatEntries.end(); twiceNatIter++)
+    {
+        TwiceNatEntryValue &entry = twiceNatIter->second;
+
+        if (entry.entry_type == "static")
+        {
+            /* Static Twice NAT entries are always treated active */
+            entry.activeTime = now;
+            continue;
+        }
+
+        if (entry.addedToHw == false)
+        {
+            continue;
+        }
+
+        snatBulk.add(getTwiceNatEntryKey(twiceNatIter->first),
+                     [this, twiceNatIter, now](sai_status_t status, const sai_attribute_t *attrs)
+        {
+            const TwiceNatEntryKey &key   = twiceNatIter->first;
+            TwiceNatEntryValue     &entry = twiceNatIter->second;
+
+            if (status != SAI_STATUS_SUCCESS)
+            {
+                return;
+            }
+
+            SWSS_LOG_DEBUG("Twice NAT HIT BIT for src-ip %s, dst-ip %s = %d",
+                           key.src_ip.to_string().c_str(), key.dst_ip.to_string().c_str(), attrs[0].value.booldata);
+            if (attrs[0].value.booldata)
+            {
+                entry.activeTime = now;
+                entry.ageOutTime = now + timeout;
             }
+        });
+    }
+
+    for (auto twiceNaptIter = m_twiceNaptEntries.begin(); twiceNaptIter != m_twiceNaptEntries.end(); twiceNaptIter++)
+    {
+        TwiceNaptEntryValue &entry = twiceNaptIter->second;
+
+        if (entry.addedToHw == false)
+        {
+            continue;
         }
-        queried_entries++;
-        naptIter++;
+
+        if (entry.entry_type == "static")
+        {
+            /* Static Twice NAPT entries are always treated active */
+            entry.activeTime = now;
+            continue;
+        }
+
+        snatBulk.add(getTwiceNaptEntryKey(twiceNaptIter->first),
+                     [this, twiceNaptIter, now](sai_status_t status, const sai_attribute_t *attrs)
+        {
+            const TwiceNaptEntryKey &key   = twiceNaptIter->first;
+            TwiceNaptEntryValue     &entry = twiceNaptIter->second;
+
+            if (status != SAI_STATUS_SUCCESS)
+            {
+                return;
+            }
+
+            SWSS_LOG_DEBUG("Twice NAPT HIT BIT for [proto %s, src ip %s, src port %d, dst ip %s, dst port %d] = %d",
+                           key.prototype.c_str(), key.src_ip.to_string().c_str(), key.src_l4_port, key.dst_ip.to_string().c_str(),
+                           key.dst_l4_port, attrs[0].value.booldata);
+            if (attrs[0].value.booldata)
+            {
+                entry.activeTime = now;
+                entry.ageOutTime = now + ((key.prototype == string("TCP")) ? tcp_timeout : udp_timeout);
+            }
+        });
     }
 
-    /* Remove the Twice NAT entries that are aged out.
-     * Query the Twice NAT entries for their activity in the hardware
-     * and update the active timeout. */
-    TwiceNatEntry::iterator twiceNatIter = m_twiceNatEntries.begin();
-    while (twiceNatIter != m_twiceNatEntries.end())
+    vector<sai_attribute_t> attrs(NAT_BULK_GET_ATTR_COUNT);
+    attrs[0].id             = SAI_NAT_ENTRY_ATTR_HIT_BIT;  /* Get the Hit bit */
+    attrs[0].value.booldata = 0;
+    attrs[1].id             = SAI_NAT_ENTRY_ATTR_HIT_BIT_COR; /* clear the hit bit after returning the value */
+    attrs[1].value.booldata = 1;
+
+    queried_entries = (uint32_t)snatBulk.entries.size();
+    bulkGetNatEntries(snatBulk, attrs);
+
+    /* Reverse direction queries are added by the SNAT results */
+    queried_entries += (uint32_t)dnatBulk.entries.size();
+    bulkGetNatEntries(dnatBulk, attrs);
+
+    /* Remove the entries that are aged out, the active ones had their active time reset above */
+    for (auto natIter = m_natEntries.begin(); natIter != m_natEntries.end(); natIter++)
     {
-        if (checkIfTwiceNatEntryIsActive(twiceNatIter, time_now.tv_sec))
+        if ((natIter->second.nat_type == "snat") and (natIter->second.addedToHw == true) and
+            (natIter->second.entry_type != "static"))
         {
-            /* Since the entry is active in the hardware, reset the active time */
-            twiceNatIter->second.activeTime = time_now.tv_sec;
+            if (now - natIter->second.activeTime >= timeout)
+            {
+                std::vector<FieldValueTuple> fvVector;
+                std::string key = natIter->first.to_string();
+                setTimeoutNotifier->send("AGEOUT-SINGLE-NAT", key, fvVector);
+            }
         }
-        else
+    }
+
+    for (auto naptIter = m_naptEntries.begin(); naptIter != m_naptEntries.end(); naptIter++)
+    {
+        if ((naptIter->second.nat_type == "snat") and (naptIter->second.addedToHw == true) and
+            (naptIter->second.entry_type != "static"))
         {
-            if ((twiceNatIter->second.addedToHw == true) and
-                (twiceNatIter->second.entry_type != "static"))
+            int timeout = naptIter->first.prototype == string("TCP") ? tcp_timeout : udp_timeout;
+            if (now - naptIter->second.activeTime >= timeout)
             {
-                if (time_now.tv_sec - twiceNatIter->second.activeTime >= timeout)
-                {
-                    std::vector<FieldValueTuple> fvVector;
-                    std::string key = (twiceNatIter->first.src_ip.to_string() + ":" + twiceNatIter->first.dst_ip.to_string());
-                    setTimeoutNotifier->send("AGEOUT-TWICE-NAT", key, fvVector);
-                }
+                std::vector<FieldValueTuple> fvVector;
+                std::string key = (naptIter->first.prototype + ":" + naptIter->first.ip_address.to_string() + ":" + to_string(naptIter->first.l4_port));
+                setTimeoutNotifier->send("AGEOUT-SINGLE-NAPT", key, fvVector);
             }
         }
-        queried_entries++;
-        twiceNatIter++;
     }
 
-    /* Remove the Twice NAPT entries that are aged out.
-     * Query the Twice NAPT entries for their activity in the hardware
-     * and update the active timeout. */
-    TwiceNaptEntry::iterator twiceNaptIter = m_twiceNaptEntries.begin();
-    while (twiceNaptIter != m_twiceNaptEntries.end())
+    for (auto twiceNatIter = m_twiceNatEntries.begin(); twiceNatIter != m_twiceNatEntries.end(); twiceNatIter++)
     {
-        if (checkIfTwiceNaptEntryIsActive(twiceNaptIter, time_now.tv_sec))
+        if ((twiceNatIter->second.addedToHw == true) and
+            (twiceNatIter->second.entry_type != "static"))
         {
-            /* Since the entry is active in the hardware, reset the active time */
-            twiceNaptIter->second.activeTime = time_now.tv_sec;
+            if (now - twiceNatIter->second.activeTime >= timeout)
+            {
+                std::vector<FieldValueTuple> fvVector;
+                std::string key = (twiceNatIter->first.src_ip.to_string() + ":" + twiceNatIter->first.dst_ip.to_string());
+                setTimeoutNotifier->send("AGEOUT-TWICE-NAT", key, fvVector);
+            }
         }
-        else
+    }
+
+    for (auto twiceNaptIter = m_twiceNaptEntries.begin(); twiceNaptIter != m_twiceNaptEntries.end(); twiceNaptIter++)
+    {
+        if ((twiceNaptIter->second.addedToHw == true) and
+            (twiceNaptIter->second.entry_type != "static"))
         {
-            if ((twiceNaptIter->second.addedToHw == true) and
-                (twiceNaptIter->second.entry_type != "static"))
+            int timeout = twiceNaptIter->first.prototype == string("TCP") ? tcp_timeout : udp_timeout;
+            if (now - twiceNaptIter->second.activeTime >= timeout)
             {
-                int timeout = twiceNaptIter->first.prototype == string("TCP") ? tcp_timeout : udp_timeout;
-                if (time_now.tv_sec - twiceNaptIter->second.activeTime >= timeout)
-                {
-                    std::vector<FieldValueTuple> fvVector;
-                    std::string key = (twiceNaptIter->first.prototype + ":" + twiceNaptIter->first.src_ip.to_string() + ":" + to_string(twiceNaptIter->first.src_l4_port) + 
-                                       ":" + twiceNaptIter->first.dst_ip.to_string() + ":" + to_string(twiceNaptIter->first.dst_l4_port));
-                    setTimeoutNotifier->send("AGEOUT-TWICE-NAPT", key, fvVector);
-                }
+                std::vector<FieldValueTuple> fvVector;
+                std::string key = (twiceNaptIter->first.prototype + ":" + twiceNaptIter->first.src_ip.to_string() + ":" + to_string(twiceNaptIter->first.src_l4_port) + 
+                                   ":" + twiceNaptIter->first.dst_ip.to_string() + ":" + to_string(twiceNaptIter->first.dst_l4_port));
+                setTimeoutNotifier->send("AGEOUT-TWICE-NAPT", key, fvVector);
             }
         }
-        queried_entries++;
-        twiceNaptIter++;
     }
+
     if (clock_gettime (CLOCK_MONOTONIC, &time_end) < 0)
     {
         return;
@@ -3504,127 +3915,6 @@ void NatOrch::updateAllConntrackEntries(void)
     }
 }
 
-bool NatOrch::getNatCounters(const NatEntry::iterator &iter)
-{
-    const IpAddress   &ipAddr = iter->first;
-    NatEntryValue     &entry  = iter->second;
-    uint32_t          attr_count;
-    sai_attribute_t   nat_entry_attr[4] = {};
-    sai_nat_entry_t   nat_entry = {};
-    sai_status_t      status;
-    uint64_t          nat_translations_pkts = 0, nat_translations_bytes = 0;
-
-    if (entry.addedToHw == false)
-    {
-        SWSS_LOG_DEBUG("Skip get Counters for %s NAT entry [ip %s], as not yet added to HW", entry.nat_type.c_str(), ipAddr.to_string().c_str());
-        return 0;
-    }
-
-    nat_entry_attr[0].id   = SAI_NAT_ENTRY_ATTR_BYTE_COUNT;
-    nat_entry_attr[1].id   = SAI_NAT_ENTRY_ATTR_PACKET_COUNT;
-
-    attr_count = 2;
-
-
-    nat_entry.vr_id       = gVirtualRouterId;
-    nat_entry.switch_id   = gSwitchId;
-
-    if (entry.nat_type == "dnat")
-    {
-        nat_entry.nat_type = SAI_NAT_TYPE_DESTINATION_NAT;
-        nat_entry.data.key.dst_ip = ipAddr.getV4Addr();   
-        nat_entry.data.mask.dst_ip = 0xffffffff;
-    }
-    else
-    {
-        nat_entry.nat_type = SAI_NAT_TYPE_SOURCE_NAT;
-        nat_entry.data.key.src_ip = ipAddr.getV4Addr();
-        nat_entry.data.mask.src_ip = 0xffffffff;
-    }
-
-    status = sai_nat_api->get_nat_entry_attribute(&nat_entry, attr_count, nat_entry_attr);
-    if (entry.nat_type == "snat")
-    {
-        if (status != SAI_STATUS_SUCCESS)
-        {
-            SWSS_LOG_ERROR("Failed to get Counters for SNAT entry [src-ip %s], bytes = %" PRIu64 ", pkts = %" PRIu64 "", ipAddr.to_string().c_str(),
-                           nat_entry_attr[0].value.u64, nat_entry_attr[1].value.u64);
-        }
-        else
-        {
-            nat_translations_bytes = nat_entry_attr[0].value.u64;
-            nat_translations_pkts  = nat_entry_attr[1].value.u64;
-        }
-    }
-    else if (entry.nat_type == "dnat")
-    {
-        if (status != SAI_STATUS_SUCCESS)
-        {
-            SWSS_LOG_ERROR("Failed to get Counters for DNAT entry [dst-ip %s], bytes = %" PRIu64 ", pkts = %" PRIu64 "", ipAddr.to_string().c_str(),
-                           nat_entry_attr[0].value.u64, nat_entry_attr[1].value.u64);
-        }
-        else
-        {
-            nat_translations_bytes = nat_entry_attr[0].value.u64;
-            nat_translations_pkts  = nat_entry_attr[1].value.u64;
-        }
-    }
-
-    /* Update the Counter values in the database */
-    updateNatCounters(ipAddr, nat_translations_pkts, nat_translations_bytes);
-
-    return 0;
-}
-
-bool NatOrch::getTwiceNatCounters(const TwiceNatEntry::iterator &iter)
-{
-    const TwiceNatEntryKey   &key = iter->first;
-    TwiceNatEntryValue       &entry  = iter->second;
-    uint32_t          attr_count;
-    sai_attribute_t   nat_entry_attr[4] = {};
-    sai_nat_entry_t   dbl_nat_entry = {};
-    sai_status_t      status;
-    uint64_t          nat_translations_pkts = 0, nat_translations_bytes = 0;
-
-    if (entry.addedToHw == false)
-    {
-        SWSS_LOG_DEBUG("Skip get Counters for Twice NAT entry [src ip %s, dst ip %s], as not yet added to HW",
-                        key.src_ip.to_string().c_str(), key.dst_ip.to_string().c_str());
-        return 0;
-    }
-
-    nat_entry_attr[0].id   = SAI_NAT_ENTRY_ATTR_BYTE_COUNT;
-    nat_entry_attr[1].id   = SAI_NAT_ENTRY_ATTR_PACKET_COUNT;
-
-    attr_count = 2;
-
-    dbl_nat_entry.vr_id = gVirtualRouterId;
-    dbl_nat_entry.switch_id = gSwitchId;
-    dbl_nat_entry.nat_type = SAI_NAT_TYPE_DOUBLE_NAT;
-    dbl_nat_entry.data.key.src_ip = key.src_ip.getV4Addr();
-    dbl_nat_entry.data.mask.src_ip = 0xffffffff;
-    dbl_nat_entry.data.key.dst_ip = key.dst_ip.getV4Addr();
-    dbl_nat_entry.data.mask.dst_ip = 0xffffffff;
-
-    status = sai_nat_api->get_nat_entry_attribute(&dbl_nat_entry, attr_count, nat_entry_attr);
-    if (status != SAI_STATUS_SUCCESS)
-    {
-        SWSS_LOG_ERROR("Failed to get Counters for Twice NAT entry [src-ip %s, dst-ip %s], bytes = %" PRIu64 ", pkts = %" PRIu64 "",
-                        key.src_ip.to_string().c_str(), key.dst_ip.to_string().c_str(),
-                        nat_entry_attr[0].value.u64, nat_entry_attr[1].value.u64);
-    }
-    else
-    {
-        nat_translations_bytes = nat_entry_attr[0].value.u64;
-        nat_translations_pkts  = nat_entry_attr[1].value.u64;
-    }
-
-    /* Update the Counter values in the database */
-    updateTwiceNatCounters(key, nat_translations_pkts, nat_translations_bytes);
-
-    return 0;
-}
-
 bool NatOrch::setNatCounters(const NatEntry::iterator &iter)
 {
     const IpAddress   &ipAddr = iter->first;
@@ -3660,186 +3950,46 @@ bool NatOrch::setNatCounters(const NatEntry::iterator &iter)
         nat_entry.data.mask.src_ip = 0xffffffff;
     }
 
-    status = sai_nat_api->set_nat_entry_attribute(&nat_entry, &nat_entry_attr_packet);
-    
-    if (entry.nat_type == "snat")
-    {
-        if (status != SAI_STATUS_SUCCESS)
-        {
-            SWSS_LOG_ERROR("Failed to clear packet counter for SNAT entry [src-ip %s]", ipAddr.to_string().c_str());
-            handleSaiSetStatus(SAI_API_NAT, status);
-        }
-    }
-    else if (entry.nat_type == "dnat")
-    {
-        if (status != SAI_STATUS_SUCCESS)
-        {
-            SWSS_LOG_ERROR("Failed to clear packet counter for DNAT entry [dst-ip %s]", ipAddr.to_string().c_str());
-            handleSaiSetStatus(SAI_API_NAT, status);
-        }
-    }
-
-    status = sai_nat_api->set_nat_entry_attribute(&nat_entry, &nat_entry_attr_byte);
-
-    if (entry.nat_type == "snat")
-    {
-        if (status != SAI_STATUS_SUCCESS)
-        {
-            SWSS_LOG_ERROR("Failed to clear byte counter for SNAT entry [src-ip %s]", ipAddr.to_string().c_str());
-            handleSaiSetStatus(SAI_API_NAT, status);
-        }
-    }
-    else if (entry.nat_type == "dnat")
-    {
-        if (status != SAI_STATUS_SUCCESS)
-        {
-            SWSS_LOG_ERROR("Failed to clear byte counter for DNAT entry [dst-ip %s]", ipAddr.to_string().c_str());
-            handleSaiSetStatus(SAI_API_NAT, status);
-        }
-    }
-    /* Update the Counter values in the database */
-    updateNatCounters(ipAddr, nat_translations_pkts, nat_translations_bytes);
-
-    return 0;
-}
-
-bool NatOrch::getNaptCounters(const NaptEntry::iterator &iter)
-{
-    const NaptEntryKey &naptKey    = iter->first;
-    NaptEntryValue     &entry      = iter->second;
-    uint8_t            protoType   = ((naptKey.prototype == "TCP") ? IPPROTO_TCP : IPPROTO_UDP);
-    uint32_t           attr_count;
-    sai_attribute_t    nat_entry_attr[4] = {};
-    sai_nat_entry_t    nat_entry = {};
-    sai_status_t       status;
-    uint64_t           nat_translations_pkts = 0, nat_translations_bytes = 0;
-
-    if (entry.addedToHw == false)
-    {
-        SWSS_LOG_DEBUG("Skip get Counters for %s NAPT entry for [proto %s, ip %s, port %d], as not yet added to HW",
-                       entry.nat_type.c_str(), naptKey.prototype.c_str(), naptKey.ip_address.to_string().c_str(), naptKey.l4_port);
-        return 0;
-    }
-
-    nat_entry_attr[0].id   = SAI_NAT_ENTRY_ATTR_BYTE_COUNT;
-    nat_entry_attr[1].id   = SAI_NAT_ENTRY_ATTR_PACKET_COUNT;
-
-    attr_count = 2;
-
-    nat_entry.vr_id       = gVirtualRouterId;
-    nat_entry.switch_id   = gSwitchId;
-
-    if (entry.nat_type == "dnat")
-    {
-        nat_entry.nat_type = SAI_NAT_TYPE_DESTINATION_NAT;
-        nat_entry.data.key.dst_ip      = naptKey.ip_address.getV4Addr();
-        nat_entry.data.key.l4_dst_port = (uint16_t)(naptKey.l4_port);
-        nat_entry.data.mask.dst_ip      = 0xffffffff;
-        nat_entry.data.mask.l4_dst_port = 0xffff;
-    }
-    else if (entry.nat_type == "snat")
-    {
-        nat_entry.nat_type = SAI_NAT_TYPE_SOURCE_NAT;
-        nat_entry.data.key.src_ip      = naptKey.ip_address.getV4Addr();
-        nat_entry.data.key.l4_src_port = (uint16_t)(naptKey.l4_port);
-        nat_entry.data.mask.src_ip      = 0xffffffff;
-        nat_entry.data.mask.l4_src_port = 0xffff;
-    }
-
-    nat_entry.data.key.proto        = protoType;
-    nat_entry.data.mask.proto       = 0xff;
-
-    status = sai_nat_api->get_nat_entry_attribute(&nat_entry, attr_count, nat_entry_attr);
-
+    status = sai_nat_api->set_nat_entry_attribute(&nat_entry, &nat_entry_attr_packet);
+    
     if (entry.nat_type == "snat")
-    { 
+    {
         if (status != SAI_STATUS_SUCCESS)
         {
-            SWSS_LOG_ERROR("Failed to get Counters for SNAPT entry for [proto %s, src-ip %s, src-port %d], bytes = %" PRIu64 ", pkts = %" PRIu64 "",
-                           naptKey.prototype.c_str(), naptKey.ip_address.to_string().c_str(), naptKey.l4_port,
-                           nat_entry_attr[0].value.u64, nat_entry_attr[1].value.u64);
-        }
-        else
-        {
-            nat_translations_bytes = nat_entry_attr[0].value.u64;
-            nat_translations_pkts  = nat_entry_attr[1].value.u64;
+            SWSS_LOG_ERROR("Failed to clear packet counter for SNAT entry [src-ip %s]", ipAddr.to_string().c_str());
+            handleSaiSetStatus(SAI_API_NAT, status);
         }
     }
     else if (entry.nat_type == "dnat")
     {
         if (status != SAI_STATUS_SUCCESS)
         {
-            SWSS_LOG_ERROR("Failed to get Counters for DNAPT entry for [proto %s, dst-ip %s, dst-port %d], bytes = %" PRIu64 ", pkts = %" PRIu64 "",
-                           naptKey.prototype.c_str(), naptKey.ip_address.to_string().c_str(), naptKey.l4_port,
-                           nat_entry_attr[0].value.u64, nat_entry_attr[1].value.u64);
-        }
-        else
-        {
-            nat_translations_bytes = nat_entry_attr[0].value.u64;
-            nat_translations_pkts  = nat_entry_attr[1].value.u64;
+            SWSS_LOG_ERROR("Failed to clear packet counter for DNAT entry [dst-ip %s]", ipAddr.to_string().c_str());
+            handleSaiSetStatus(SAI_API_NAT, status);
         }
     }
 
-    /* Update the Counter values in the database */
-    updateNaptCounters(naptKey.prototype, naptKey.ip_address, naptKey.l4_port,
-                       nat_translations_pkts, nat_translations_bytes);
-    return 0;
-}
-
-bool NatOrch::getTwiceNaptCounters(const TwiceNaptEntry::iterator &iter)
-{
-    const TwiceNaptEntryKey &key    = iter->first;
-    TwiceNaptEntryValue     &entry      = iter->second;
-    uint8_t            protoType   = ((key.prototype == "TCP") ? IPPROTO_TCP : IPPROTO_UDP);
-    uint32_t           attr_count;
-    sai_attribute_t    nat_entry_attr[4] = {};
-    sai_nat_entry_t    dbl_nat_entry = {};
-    sai_status_t       status;
-    uint64_t           nat_translations_pkts = 0, nat_translations_bytes = 0;
-
-    if (entry.addedToHw == false)
-    {
-        SWSS_LOG_DEBUG("Skip get Counters for Twice NAPT entry for [proto %s, src ip %s, src port %d, dst ip %s, dst port %d], as not yet added to HW",
-                       key.prototype.c_str(), key.src_ip.to_string().c_str(), key.src_l4_port, key.dst_ip.to_string().c_str(),
-                       key.dst_l4_port);
-        return 0;
-    }
-
-    nat_entry_attr[0].id   = SAI_NAT_ENTRY_ATTR_BYTE_COUNT;
-    nat_entry_attr[1].id   = SAI_NAT_ENTRY_ATTR_PACKET_COUNT;
-
-    attr_count = 2;
-
-    dbl_nat_entry.vr_id = gVirtualRouterId;
-    dbl_nat_entry.switch_id = gSwitchId;
-    dbl_nat_entry.nat_type = SAI_NAT_TYPE_DOUBLE_NAT;
-    dbl_nat_entry.data.key.src_ip = key.src_ip.getV4Addr();
-    dbl_nat_entry.data.mask.src_ip = 0xffffffff;
-    dbl_nat_entry.data.key.l4_src_port = (uint16_t)(key.src_l4_port);
-    dbl_nat_entry.data.mask.l4_src_port = 0xffff;
-    dbl_nat_entry.data.key.dst_ip = key.dst_ip.getV4Addr();
-    dbl_nat_entry.data.mask.dst_ip = 0xffffffff;
-    dbl_nat_entry.data.key.l4_dst_port = (uint16_t)(key.dst_l4_port);
-    dbl_nat_entry.data.mask.l4_dst_port = 0xffff;
-    dbl_nat_entry.data.key.proto = protoType;
-    dbl_nat_entry.data.mask.proto = 0xff;
-
-    status = sai_nat_api->get_nat_entry_attribute(&dbl_nat_entry, attr_count, nat_entry_attr);
+    status = sai_nat_api->set_nat_entry_attribute(&nat_entry, &nat_entry_attr_byte);
 
-    if (status != SAI_STATUS_SUCCESS)
+    if (entry.nat_type == "snat")
     {
-        SWSS_LOG_DEBUG("Failed to get Counters for Twice NAPT entry for [proto %s, src ip %s, src port %d, dst ip %s, dst port %d], as not yet added to HW",
-                       key.prototype.c_str(), key.src_ip.to_string().c_str(), key.src_l4_port, key.dst_ip.to_string().c_str(),
-                       key.dst_l4_port);
+        if (status != SAI_STATUS_SUCCESS)
+        {
+            SWSS_LOG_ERROR("Failed to clear byte counter for SNAT entry [src-ip %s]", ipAddr.to_string().c_str());
+            handleSaiSetStatus(SAI_API_NAT, status);
+        }
     }
-    else
+    else if (entry.nat_type == "dnat")
     {
-        nat_translations_bytes = nat_entry_attr[0].value.u64;
-        nat_translations_pkts  = nat_entry_attr[1].value.u64;
+        if (status != SAI_STATUS_SUCCESS)
+        {
+            SWSS_LOG_ERROR("Failed to clear byte counter for DNAT entry [dst-ip %s]", ipAddr.to_string().c_str());
+            handleSaiSetStatus(SAI_API_NAT, status);
+        }
     }
-
     /* Update the Counter values in the database */
-    updateTwiceNaptCounters(key, nat_translations_pkts, nat_translations_bytes);
+    updateNatCounters(ipAddr, nat_translations_pkts, nat_translations_bytes);
+
     return 0;
 }
 
@@ -4134,319 +4284,6 @@ void NatOrch::updateTwiceNaptCounters(const TwiceNaptEntryKey &key,
     m_countersTwiceNaptTable.set(naptKey, values);
 }
 
-bool NatOrch::checkIfNatEntryIsActive(const NatEntry::iterator &iter, time_t now)
-{
-    const IpAddress   &ipAddr = iter->first;
-    NatEntryValue     &entry  = iter->second;
-    uint32_t          attr_count;
-    IpAddress         srcIp;
-    sai_attribute_t   nat_entry_attr[4] = {};
-    sai_nat_entry_t   snat_entry = {};
-    sai_nat_entry_t   dnat_entry;
-    sai_status_t      status;
-
-    if (entry.nat_type == "dnat")
-    {
-        /* Hitbits are queried for both directions when SNAT entry is checked */
-        return 0;
-    }
-
-    if (entry.addedToHw == false)
-    {
-        SWSS_LOG_DEBUG("Skip get hitbits for %s NAT entry [ip %s], as not yet added to HW", entry.nat_type.c_str(), ipAddr.to_string().c_str());
-        return 0;
-    }
-
-    if (entry.entry_type == "static")
-    {
-        /* Static NAT entries are always treated active */ 
-        return 1;
-    }
-
-    nat_entry_attr[0].id             = SAI_NAT_ENTRY_ATTR_HIT_BIT;  /* Get the Hit bit */
-    nat_entry_attr[0].value.booldata = 0;
-    nat_entry_attr[1].id             = SAI_NAT_ENTRY_ATTR_HIT_BIT_COR; /* clear the hit bit after returning the value */
-    nat_entry_attr[1].value.booldata = 1;
-
-    attr_count = 2;
-
-    snat_entry.vr_id                 = gVirtualRouterId;
-    snat_entry.switch_id             = gSwitchId;
-    snat_entry.nat_type              = SAI_NAT_TYPE_SOURCE_NAT;
-    srcIp     = ipAddr;
-    snat_entry.data.key.src_ip   = srcIp.getV4Addr();
-    snat_entry.data.mask.src_ip  = 0xffffffff;
-
-    status = sai_nat_api->get_nat_entry_attribute(&snat_entry, attr_count, nat_entry_attr);
-    if (status == SAI_STATUS_SUCCESS)
-    {
-        SWSS_LOG_DEBUG("SNAT HIT BIT for src-ip %s = %d", srcIp.to_string().c_str(),
-                      nat_entry_attr[0].value.booldata);
-
-        if (nat_entry_attr[0].value.booldata)
-        {
-            entry.ageOutTime = now + timeout;
-            return 1;
-        }
-        else
-        {
-            auto dnatIter = m_natEntries.find(entry.translated_ip);
-            if (dnatIter == m_natEntries.end())
-            {
-                return 0;
-            }
-            if ((dnatIter->second).addedToHw == false)
-            {
-                return 0;
-            }
-
-            /* If SNAT HitBit is not set, check for the HitBit in the reverse direction */
-            memset(&dnat_entry, 0, sizeof(dnat_entry));
-
-            dnat_entry.vr_id             = gVirtualRouterId;
-            dnat_entry.switch_id         = gSwitchId;
-            dnat_entry.nat_type          = SAI_NAT_TYPE_DESTINATION_NAT;
-            dnat_entry.data.key.dst_ip   = entry.translated_ip.getV4Addr();
-            dnat_entry.data.mask.dst_ip  = 0xffffffff;
-
-            status = sai_nat_api->get_nat_entry_attribute(&dnat_entry, attr_count, nat_entry_attr);
-            if (status == SAI_STATUS_SUCCESS)
-            {
-                SWSS_LOG_DEBUG("DNAT HIT BIT for dst-ip %s = %d", entry.translated_ip.to_string().c_str(),
-                                nat_entry_attr[0].value.booldata);
-                if (nat_entry_attr[0].value.booldata)
-                {
-                    entry.ageOutTime = now + timeout;
-                    return 1;
-                }
-            }
-        }
-    }
-    return 0;
-}
-
-bool NatOrch::checkIfNaptEntryIsActive(const NaptEntry::iterator &iter, time_t now)
-{
-    const NaptEntryKey &naptKey    = iter->first;
-    NaptEntryValue     &entry      = iter->second;
-    int                protoType   = ((naptKey.prototype == "TCP") ? IPPROTO_TCP : IPPROTO_UDP);
-    uint32_t           attr_count;
-    IpAddress          srcIp;
-    uint16_t           srcPort;
-    sai_attribute_t    nat_entry_attr[4] = {};
-    sai_nat_entry_t    snat_entry = {};
-    sai_nat_entry_t    dnat_entry;
-    sai_status_t       status;
-
-    if (entry.nat_type == "dnat")
-    {
-        /* Hitbits are queried for both directions when SNAT entry is checked */
-        return 0;
-    }
-
-    if (entry.addedToHw == false)
-    {
-        SWSS_LOG_DEBUG("Skip get hitbits for %s NAPT entry for [proto %s, ip %s, port %d], as not yet added to HW",
-                       entry.nat_type.c_str(), naptKey.prototype.c_str(), naptKey.ip_address.to_string().c_str(), naptKey.l4_port);
-        return 0;
-    }
-
-    if (entry.entry_type == "static")
-    {
-        /* Static NAPT entries are always treated active */
-        return 1;
-    }
-
-    nat_entry_attr[0].id             = SAI_NAT_ENTRY_ATTR_HIT_BIT;  /* Get the Hit bit */
-    nat_entry_attr[0].value.booldata = 0;
-    nat_entry_attr[1].id             = SAI_NAT_ENTRY_ATTR_HIT_BIT_COR; /* clear the hit bit after returning the value */
-    nat_entry_attr[1].value.booldata = 1;
-
-    attr_count = 2;
-
-    snat_entry.vr_id                 = gVirtualRouterId;
-    snat_entry.switch_id             = gSwitchId;
-    snat_entry.nat_type              = SAI_NAT_TYPE_SOURCE_NAT;
-
-    srcIp     = naptKey.ip_address;
-    srcPort   = (uint16_t)(naptKey.l4_port);
-    snat_entry.data.key.src_ip       = srcIp.getV4Addr();
-    snat_entry.data.key.l4_src_port  = srcPort;
-
-    snat_entry.data.mask.src_ip      = 0xffffffff;
-    snat_entry.data.mask.l4_src_port = 0xffff;
-    snat_entry.data.key.proto        = (uint8_t)protoType;
-    snat_entry.data.mask.proto       = 0xff;
-
-    status = sai_nat_api->get_nat_entry_attribute(&snat_entry, attr_count, nat_entry_attr);
-    if (status == SAI_STATUS_SUCCESS)
-    {
-        SWSS_LOG_DEBUG("SNAPT HIT BIT for proto %s, src-ip %s, src-port %d = %d", naptKey.prototype.c_str(),
-                      srcIp.to_string().c_str(), srcPort, nat_entry_attr[0].value.booldata);
-        if (nat_entry_attr[0].value.booldata)
-        {
-            entry.ageOutTime = now + ((protoType == IPPROTO_TCP) ? tcp_timeout : udp_timeout);
-            return 1;
-        }
-        else
-        {
-            NaptEntryKey dnaptKey;
-            dnaptKey.ip_address = entry.translated_ip;
-            dnaptKey.l4_port    = entry.translated_l4_port;
-            dnaptKey.prototype  = naptKey.prototype;
-
-            auto dnaptIter = m_naptEntries.find(dnaptKey);
-            if (dnaptIter == m_naptEntries.end())
-            {
-                return 0;
-            }
-            if ((dnaptIter->second).addedToHw == false)
-            {
-                return 0;
-            }
-
-
-            /* If SNAPT HitBit is not set, check for the HitBit in the reverse direction */
-            memset(&dnat_entry, 0, sizeof(dnat_entry));
-
-            dnat_entry.vr_id                 = gVirtualRouterId;
-            dnat_entry.switch_id             = gSwitchId;
-            dnat_entry.nat_type              = SAI_NAT_TYPE_DESTINATION_NAT;
-
-            dnat_entry.data.key.dst_ip       = entry.translated_ip.getV4Addr();
-            dnat_entry.data.key.l4_dst_port  = (uint16_t)(entry.translated_l4_port);
-
-            dnat_entry.data.mask.dst_ip      = 0xffffffff;
-            dnat_entry.data.mask.l4_dst_port = 0xffff;
-            dnat_entry.data.key.proto        = (uint8_t)protoType;
-            dnat_entry.data.mask.proto       = 0xff;
-
-            status = sai_nat_api->get_nat_entry_attribute(&dnat_entry, attr_count, nat_entry_attr);
-            if (status == SAI_STATUS_SUCCESS)
-            {
-                SWSS_LOG_DEBUG("DNAPT HIT BIT for proto %s, dst-ip %s, dst-port %d = %d", naptKey.prototype.c_str(),
-                              entry.translated_ip.to_string().c_str(), entry.translated_l4_port, nat_entry_attr[0].value.booldata);
-                if (nat_entry_attr[0].value.booldata)
-                {
-                    entry.ageOutTime = now + ((protoType == IPPROTO_TCP) ? tcp_timeout : udp_timeout);
-                    return 1;
-                }
-            }
-        }
-    }
-    return 0;
-}
-
-bool NatOrch::checkIfTwiceNatEntryIsActive(const TwiceNatEntry::iterator &iter, time_t now)
-{
-    const TwiceNatEntryKey &key    = iter->first;
-    TwiceNatEntryValue     &entry  = iter->second;
-    uint32_t           attr_count;
-    sai_attribute_t    nat_entry_attr[4] = {};
-    sai_nat_entry_t    dbl_nat_entry = {};
-    sai_status_t       status;
-
-    if (entry.entry_type == "static")
-    {
-        /* Static NAPT entries are always treated active */
-        return 1;
-    }
-
-    if (entry.addedToHw == false)
-    {
-        SWSS_LOG_DEBUG("Skip get hitbits for Twice NAPT entry for [src ip %s, dst-ip %s], as not yet added to HW",
-                       key.src_ip.to_string().c_str(), key.dst_ip.to_string().c_str());
-        return 0;
-    }
-
-    nat_entry_attr[0].id             = SAI_NAT_ENTRY_ATTR_HIT_BIT;  /* Get the Hit bit */
-    nat_entry_attr[0].value.booldata = 0;
-    nat_entry_attr[1].id             = SAI_NAT_ENTRY_ATTR_HIT_BIT_COR; /* clear the hit bit after returning the value */
-    nat_entry_attr[1].value.booldata = 1;
-
-    attr_count = 2;
-
-    dbl_nat_entry.vr_id = gVirtualRouterId;
-    dbl_nat_entry.switch_id = gSwitchId;
-    dbl_nat_entry.nat_type = SAI_NAT_TYPE_DOUBLE_NAT;
-    dbl_nat_entry.data.key.src_ip = key.src_ip.getV4Addr();
-    dbl_nat_entry.data.mask.src_ip = 0xffffffff;
-    dbl_nat_entry.data.key.dst_ip = key.dst_ip.getV4Addr();
-    dbl_nat_entry.data.mask.dst_ip = 0xffffffff;
-
-    status = sai_nat_api->get_nat_entry_attribute(&dbl_nat_entry, attr_count, nat_entry_attr);
-    if (status == SAI_STATUS_SUCCESS)
-    {
-        SWSS_LOG_DEBUG("Twice NAT HIT BIT for src-ip %s, dst-ip %s = %d",
-                       key.src_ip.to_string().c_str(), key.dst_ip.to_string().c_str(), nat_entry_attr[0].value.booldata);
-        if (nat_entry_attr[0].value.booldata)
-        {
-            entry.ageOutTime = now + timeout;
-            return 1;
-        }
-    }
-    return 0;
-}
-
-bool NatOrch::checkIfTwiceNaptEntryIsActive(const TwiceNaptEntry::iterator &iter, time_t now)
-{
-    const TwiceNaptEntryKey &key   = iter->first;
-    TwiceNaptEntryValue     &entry = iter->second;
-    uint8_t            protoType   = ((key.prototype == "TCP") ? IPPROTO_TCP : IPPROTO_UDP);
-    uint32_t           attr_count;
-    sai_attribute_t    nat_entry_attr[4] = {};
-    sai_nat_entry_t    dbl_nat_entry = {};
-    sai_status_t       status;
-
-    if (entry.addedToHw == false)
-    {
-        SWSS_LOG_DEBUG("Skip get hitbits for Twice NAPT entry for [proto %s, src ip %s, src port %d, dst ip %s, dst port %d], as not yet added to HW",
-                        key.prototype.c_str(), key.src_ip.to_string().c_str(), key.src_l4_port, key.dst_ip.to_string().c_str(), key.dst_l4_port);
-        return 0;
-    }
-
-    if (entry.entry_type == "static")
-    {
-        /* Static NAPT entries are always treated active */
-        return 1;
-    }
-
-    nat_entry_attr[0].id             = SAI_NAT_ENTRY_ATTR_HIT_BIT;  /* Get the Hit bit */
-    nat_entry_attr[0].value.booldata = 0;
-    nat_entry_attr[1].id             = SAI_NAT_ENTRY_ATTR_HIT_BIT_COR; /* clear the hit bit after returning the value */
-    nat_entry_attr[1].value.booldata = 1;
-
-    attr_count = 2;
-
-    dbl_nat_entry.vr_id = gVirtualRouterId;
-    dbl_nat_entry.switch_id = gSwitchId;
-    dbl_nat_entry.nat_type = SAI_NAT_TYPE_DOUBLE_NAT;
-    dbl_nat_entry.data.key.src_ip = key.src_ip.getV4Addr();
-    dbl_nat_entry.data.mask.src_ip = 0xffffffff;
-    dbl_nat_entry.data.key.l4_src_port = (uint16_t)(key.src_l4_port);
-    dbl_nat_entry.data.mask.l4_src_port = 0xffff;
-    dbl_nat_entry.data.key.dst_ip = key.dst_ip.getV4Addr();
-    dbl_nat_entry.data.mask.dst_ip = 0xffffffff;
-    dbl_nat_entry.data.key.l4_dst_port = (uint16_t)(key.dst_l4_port);
-    dbl_nat_entry.data.mask.l4_dst_port = 0xffff;
-    dbl_nat_entry.data.key.proto = protoType;
-    dbl_nat_entry.data.mask.proto = 0xff;
-
-    status = sai_nat_api->get_nat_entry_attribute(&dbl_nat_entry, attr_count, nat_entry_attr);
-    if (status == SAI_STATUS_SUCCESS)
-    {
-        SWSS_LOG_DEBUG("Twice NAPT HIT BIT for [proto %s, src ip %s, src port %d, dst ip %s, dst port %d] = %d",
-                        key.prototype.c_str(), key.src_ip.to_string().c_str(), key.src_l4_port, key.dst_ip.to_string().c_str(), key.dst_l4_port,
-                        nat_entry_attr[0].value.booldata);
-        if (nat_entry_attr[0].value.booldata)
-        {
-            entry.ageOutTime = now + ((protoType == IPPROTO_TCP) ? tcp_timeout : udp_timeout);
-            return 1;
-        }
-    }
-    return 0;
-}
-
 void NatOrch::doTask(NotificationConsumer& consumer)
 {
     SWSS_LOG_ENTER();
@@ -17,6 +17,8 @@
 #ifndef SWSS_NATORCH_H
 #define SWSS_NATORCH_H
 
+#include <functional>
+
 #include "orch.h"
 #include "observer.h"
 #include "portsorch.h"
@@ -37,6 +39,7 @@
 #define NAT_HITBIT_N_CNTRS_QUERY_PERIOD   5        // 5 secs
 #define NAT_CONNTRACK_TIMEOUT_PERIOD      86400    // 1 day
 #define NAT_HITBIT_QUERY_MULTIPLE         6        // Hit bits are queried every 30 secs
+#define NAT_BULK_GET_ATTR_COUNT           2        // Hit bit or counter attributes read per entry
 
 struct NatEntryValue
 {
@@ -176,6 +179,23 @@ struct DnatEntries
 
 typedef std::map<IpAddress, DnatEntries> DnatNhResolvCache;
 
+/* NAT entries whose attributes are read together, in chunks of SAI bulk gets.
+ * The handler of each entry is called with its status and attributes once read.
+ */
+struct NatBulkGet
+{
+    typedef std::function<void(sai_status_t, const sai_attribute_t *)> Handler;
+
+    std::vector<sai_nat_entry_t> entries;
+    std::vector<Handler>         handlers;
+
+    void add(const sai_nat_entry_t &entry, Handler handler)
+    {
+        entries.push_back(entry);
+        handlers.push_back(std::move(handler));
+    }
+};
+
 class NatOrch: public Orch, public Subject, public Observer
 {
 public:
@@ -225,6 +245,9 @@ private:
      * or indirect NextHop (via route) to reach the DNAT IP is changed. */
     DnatNhResolvCache       m_nhResolvCache;
 
+    /* Cleared when the SAI does not implement the bulk get of NAT entries */
+    bool                    m_natBulkGetSupported = true;
+
     int              timeout;
     int              tcp_timeout;
     int              udp_timeout;
@@ -289,11 +312,6 @@ private:
     bool addHwDnatPoolEntry(const IpAddress &dstIp);
     bool removeHwDnatPoolEntry(const IpAddress &dstIp);
 
-    bool checkIfNatEntryIsActive(const NatEntry::iterator &iter, time_t now);
-    bool checkIfNaptEntryIsActive(const NaptEntry::iterator &iter, time_t now);
-    bool checkIfTwiceNatEntryIsActive(const TwiceNatEntry::iterator &iter, time_t now);
-    bool checkIfTwiceNaptEntryIsActive(const TwiceNaptEntry::iterator &iter, time_t now);
-
     void enableNatFeature(void);
     void disableNatFeature(void);
     void addAllNatEntries(void);
@@ -304,10 +322,7 @@ private:
     void queryCounters(void);
     void queryHitBits(void);
     bool isNatEnabled(void);
-    bool getNatCounters(const NatEntry::iterator &iter);
-    bool getTwiceNatCounters(const TwiceNatEntry::iterator &iter);
-    bool getNaptCounters(const NaptEntry::iterator &iter);
-    bool getTwiceNaptCounters(const TwiceNaptEntry::iterator &iter);
+    void bulkGetNatEntries(NatBulkGet &bulk, const vector<sai_attribute_t> &attrs);
     bool setNatCounters(const NatEntry::iterator &iter);
     bool setTwiceNatCounters(const TwiceNatEntry::iterator &iter);
     bool setNaptCounters(const NaptEntry::iterator &iter);
@@ -1,3 +1,5 @@
+#include <algorithm>
+#include <chrono>
 #include <stdexcept>
 #include <thread>
 #include "timestamp.h"
@@ -15,9 +17,16 @@
 using namespace swss;
 
 int gBatchSize = 0;
+/* Time in milliseconds a doTask pass may spend before deferring non urgent tables, 0 to disable */
+int gTaskTimeSlice = 0;
+
+/* Above this many field comparisons a SET merge indexes the updated fields */
+#define SYNC_MERGE_LINEAR_LIMIT 256
 
 std::shared_ptr<RingBuffer> Orch::gRingBuffer = nullptr;
 std::shared_ptr<RingBuffer> Executor::gRingBuffer = nullptr;
+thread_local bool Executor::gOnWorkerThread = false;
+const WarmStartSnapshot *ConsumerBase::gWarmStartSnapshot = nullptr;
 
 RingBuffer::RingBuffer(int size): buffer(size)
 {
@@ -170,7 +179,7 @@ bool ConsumerBase::addToRetry(const Task &task, const Constraint &cst) {
     auto retryCache = getOrch() ? getOrch()->getRetryCache(getName()) : nullptr;
     if (retryCache)
     {
-        Recorder::Instance().retry.record(dumpTuple(task).append(CACHE));
+        recordRetry(task, CACHE);
         retryCache->insert(task, cst);
         return true;
     }
@@ -181,7 +190,7 @@ bool Orch::addToRetry(const std::string &executorName, const Task &task, const C
     auto retryCache = getRetryCache(executorName);
     if (retryCache)
     {
-        Recorder::Instance().retry.record(getConsumerBase(executorName)->dumpTuple(task).append(CACHE));
+        getConsumerBase(executorName)->recordRetry(task, CACHE);
         retryCache->insert(task, cst);
         return true;
     }
@@ -207,6 +216,7 @@ size_t Orch::retryToSync(const std::string &executorName, size_t quota)
     std::unordered_set<Constraint>& constraints = retryCache->getResolvedConstraints();
 
     size_t count = 0;
+    auto consumer = getConsumerBase(executorName);
 
     while (!constraints.empty() && count < quota)
     {
@@ -216,8 +226,17 @@ size_t Orch::retryToSync(const std::string &executorName, size_t quota)
 
         count += tasks->size();
 
-        getConsumerBase(executorName)->addToSync(tasks, true);
+        consumer->addToSync(tasks, true);
+
+    }
 
+    if (consumer)
+    {
+        if (count)
+        {
+            consumer->m_stats.retriedTasks.add(count);
+        }
+        consumer->m_stats.retryCacheSize.add(retryCache->getRetryMap().size());
     }
     return count;
 }
@@ -241,10 +260,51 @@ size_t ConsumerBase::addToSync(std::shared_ptr<std::deque<swss::KeyOpFieldsValue
 
 void ConsumerBase::addToSync(const KeyOpFieldsValuesTuple &entry, bool onRetry)
 {
-    addToSyncInternal(entry, onRetry, true);
+    addToSyncInternal(KeyOpFieldsValuesTuple(entry), onRetry, true);
 }
 
-void ConsumerBase::addToSyncInternal(const KeyOpFieldsValuesTuple &entry, bool onRetry, bool recordTask)
+/*
+ * Upsert the fields of a SET into the pending SET of the same key, in place.
+ * An updated field moves to the end, fields are applied in the order they
+ * were received.
+ */
+static void mergeFieldValues(vector<FieldValueTuple> &existing, vector<FieldValueTuple> &&updates)
+{
+    if (existing.size() * updates.size() <= SYNC_MERGE_LINEAR_LIMIT)
+    {
+        for (auto &fv : updates)
+        {
+            const auto &field = fvField(fv);
+            existing.erase(std::remove_if(existing.begin(), existing.end(),
+                                          [&field](const FieldValueTuple &e) { return fvField(e) == field; }),
+                           existing.end());
+            existing.push_back(std::move(fv));
+        }
+        return;
+    }
+
+    /* Large tuples, index the updated fields by the position of their last occurrence */
+    unordered_map<string, size_t> last;
+    for (size_t i = 0; i < updates.size(); i++)
+    {
+        last[fvField(updates[i])] = i;
+    }
+
+    existing.erase(std::remove_if(existing.begin(), existing.end(),
+                                  [&last](const FieldValueTuple &e) { return last.count(fvField(e)) != 0; }),
+                   existing.end());
+    existing.reserve(existing.size() + last.size());
+
+    for (size_t i = 0; i < updates.size(); i++)
+    {
+        if (last[fvField(updates[i])] == i)
+        {
+            existing.push_back(std::move(updates[i]));
+        }
+    }
+}
+
+void ConsumerBase::addToSyncInternal(KeyOpFieldsValuesTuple &&entry, bool onRetry, bool recordTask)
 {
     SWSS_LOG_ENTER();
 
@@ -259,7 +319,7 @@ void ConsumerBase::addToSyncInternal(const KeyOpFieldsValuesTuple &entry, bool o
         }
         else
         {
-            Recorder::Instance().retry.record(dumpTuple(entry).append(DECACHE));
+            recordRetry(entry, DECACHE);
         }
     }
 
@@ -290,7 +350,7 @@ void ConsumerBase::addToSyncInternal(const KeyOpFieldsValuesTuple &entry, bool o
                 if (kfvOp(it->second.second) == SET_COMMAND)
                 {
                     auto old_task = retryCache->evict(key);
-                    Recorder::Instance().retry.record(dumpTuple(*old_task).append(DECACHE));
+                    recordRetry(*old_task, DECACHE);
                 }
             }
             else if (op == SET_COMMAND)
@@ -300,7 +360,7 @@ void ConsumerBase::addToSyncInternal(const KeyOpFieldsValuesTuple &entry, bool o
                     // move the old SET back to m_toSync for later merge
                     auto old_task = retryCache->evict(key);
                     m_toSync.emplace(key, *old_task);
-                    Recorder::Instance().retry.record(dumpTuple(*old_task).append(DECACHE));
+                    recordRetry(*old_task, DECACHE);
                 }
             }
             break;
@@ -312,14 +372,14 @@ void ConsumerBase::addToSyncInternal(const KeyOpFieldsValuesTuple &entry, bool o
             {
                 // remove the SET task from the cache, reuse the DEL task
                 auto old_task = retryCache->evict(key);
-                Recorder::Instance().retry.record(dumpTuple(*old_task).append(DECACHE));
+                recordRetry(*old_task, DECACHE);
                 return;
             }
             else if (op == SET_COMMAND)
             {
                 // Keep the DEL task, move the old SET back to m_toSync for later merge
                 auto old_task = retryCache->evict(key);
-                Recorder::Instance().retry.record(dumpTuple(*old_task).append(DECACHE));
+                recordRetry(*old_task, DECACHE);
                 m_toSync.emplace(key, *old_task);
             }
             break;
@@ -333,76 +393,63 @@ void ConsumerBase::addToSyncInternal(const KeyOpFieldsValuesTuple &entry, bool o
     * m_toSync is a multimap which will allow one key with multiple values,
     * Also, the order of the key-value pairs whose keys compare equivalent
     * is the order of insertion and does not change. (since C++11)
+    * We maintain maximum two values per key: a DEL or a SET, or a DEL then a SET.
+    * The key is looked up once, and entries are moved or merged in place.
     */
+    auto range = m_toSync.equal_range(key);
 
     /* If a new task comes we directly put it into getConsumerTable().m_toSync map */
-    if (m_toSync.find(key) == m_toSync.end())
+    if (range.first == range.second)
     {
-        m_toSync.emplace(key, entry);
+        m_toSync.emplace_hint(range.second, std::move(key), std::move(entry));
     }
 
-    /* if a DEL task comes, we overwrite the old key */
+    /* if a DEL task comes, it overwrites everything pending for the key */
     else if (op == DEL_COMMAND)
     {
-        m_toSync.erase(key);
-        m_toSync.emplace(key, entry);
+        range.first->second = std::move(entry);
+        m_toSync.erase(std::next(range.first), range.second);
     }
     else
     {
         /*
         * Now we are trying to add the key-value with SET.
-        * We maintain maximum two values per key.
-        * In case there is one key-value, it should be DEL or SET
-        * In case there are two key-value pairs, it should be DEL then SET
-        * The code logic is following:
-        * We iterate the values with the key, we skip the value with DEL and then
-        * check if that was the only one (I,E, the iter pointer now points to end or next key),
-        * in such case, we insert the key-value with SET.
-        * If there was a SET already (I,E, the pointer still points to the same key), we combine the kfv.
+        * In case there is no SET pending (only a DEL), we insert the SET after it.
+        * If there was a SET already, we combine the fields into it.
         */
-        auto ret = m_toSync.equal_range(key);
-        auto iter = ret.first;
-        for (; iter != ret.second; ++iter)
-        {
-            auto old_op = kfvOp(iter->second);
-            if (old_op == SET_COMMAND)
-                break;
-        }
-        if (iter == ret.second)
+        auto iter = std::find_if(range.first, range.second,
+                                 [](const SyncMap::value_type &v) { return kfvOp(v.second) == SET_COMMAND; });
+        if (iter == range.second)
         {
-            m_toSync.emplace(key, entry);
+            m_toSync.emplace_hint(range.second, std::move(key), std::move(entry));
         }
         else
         {
-            KeyOpFieldsValuesTuple existing_data = iter->second;
+            mergeFieldValues(kfvFieldsValues(iter->second), std::move(kfvFieldsValues(entry)));
+            kfvOp(iter->second) = std::move(op);
+        }
+    }
 
-            auto new_values = kfvFieldsValues(entry);
-            auto existing_values = kfvFieldsValues(existing_data);
+}
 
+size_t ConsumerBase::addToSync(const std::deque<KeyOpFieldsValuesTuple> &entries, bool onRetry)
+{
+    SWSS_LOG_ENTER();
 
-            for (auto it : new_values)
-            {
-                string field = fvField(it);
-                string value = fvValue(it);
+    if (!onRetry)
+    {
+        recordTuples(entries);
+    }
 
-                auto iu = existing_values.begin();
-                while (iu != existing_values.end())
-                {
-                    string ofield = fvField(*iu);
-                    if (field == ofield)
-                        iu = existing_values.erase(iu);
-                    else
-                        iu++;
-                }
-                existing_values.push_back(FieldValueTuple(field, value));
-            }
-            iter->second = KeyOpFieldsValuesTuple(key, op, existing_values);
-        }
+    for (auto& entry: entries)
+    {
+        addToSyncInternal(KeyOpFieldsValuesTuple(entry), onRetry, onRetry);
     }
 
+    return entries.size();
 }
 
-size_t ConsumerBase::addToSync(const std::deque<KeyOpFieldsValuesTuple> &entries, bool onRetry)
+size_t ConsumerBase::addToSync(std::deque<KeyOpFieldsValuesTuple> &&entries, bool onRetry)
 {
     SWSS_LOG_ENTER();
 
@@ -413,7 +460,7 @@ size_t ConsumerBase::addToSync(const std::deque<KeyOpFieldsValuesTuple> &entries
 
     for (auto& entry: entries)
     {
-        addToSyncInternal(entry, onRetry, onRetry);
+        addToSyncInternal(std::move(entry), onRetry, onRetry);
     }
 
     return entries.size();
@@ -442,6 +489,60 @@ size_t ConsumerBase::refillToSync(Table* table)
     return addToSync(entries);
 }
 
+size_t ConsumerBase::refillToSync(Table* table, TableSnapshot &snapshot)
+{
+    std::deque<KeyOpFieldsValuesTuple> entries;
+    vector<string> keys;
+    table->getKeys(keys);
+
+    // Keys gone from the table were deleted after the snapshot, the deletion is not pending anymore
+    size_t read = 0;
+    for (const auto &key: keys)
+    {
+        KeyOpFieldsValuesTuple kco;
+
+        kfvKey(kco) = key;
+        kfvOp(kco) = SET_COMMAND;
+
+        auto it = snapshot.find(key);
+        if (it != snapshot.end())
+        {
+            kfvFieldsValues(kco) = std::move(it->second);
+        }
+        else if (table->get(key, kfvFieldsValues(kco)))
+        {
+            read++;
+        }
+        else
+        {
+            continue;
+        }
+        entries.push_back(std::move(kco));
+    }
+
+    SWSS_LOG_NOTICE("Refill %s from warm start snapshot, %zu of %zu entries read from the table",
+                    getName().c_str(), read, entries.size());
+
+    return addToSync(std::move(entries));
+}
+
+string ConsumerBase::getSnapshotName() const
+{
+    /*
+     * Only consumer tables are saved: any change made while orchagent is down
+     * is still pending for them and popped after the refill. Zmq tables are not,
+     * their updates are not queued while the consumer is away. Subscriber
+     * tables pop their whole content on start anyway.
+     */
+    auto consumerTable = dynamic_cast<ConsumerTableBase *>(getSelectable());
+    if (consumerTable == NULL || dynamic_cast<SubscriberStateTable *>(getSelectable()) != NULL)
+    {
+        return "";
+    }
+
+    return to_string(consumerTable->getDbConnector()->getDbId()) + delimiter + getTableName();
+}
+
 size_t ConsumerBase::refillToSync()
 {
     auto subTable = dynamic_cast<SubscriberStateTable *>(getSelectable());
@@ -465,6 +566,12 @@ size_t ConsumerBase::refillToSync()
         // consumerTable is either ConsumerStateTable or ConsumerTable
         auto db = consumerTable->getDbConnector();
         auto table = Table(db, tableName);
+
+        TableSnapshot snapshot;
+        if (gWarmStartSnapshot && gWarmStartSnapshot->getTable(getSnapshotName(), snapshot))
+        {
+            return refillToSync(&table, snapshot);
+        }
         return refillToSync(&table);
     }
     auto zmqTable = dynamic_cast<ZmqConsumerStateTable *>(getSelectable());
@@ -479,11 +586,21 @@ size_t ConsumerBase::refillToSync()
 
 string ConsumerBase::dumpTuple(const KeyOpFieldsValuesTuple &tuple)
 {
-    string s = getTableName() + getConsumerTable()->getTableNameSeparator() + kfvKey(tuple)
-               + "|" + kfvOp(tuple);
-    for (auto i = kfvFieldsValues(tuple).begin(); i != kfvFieldsValues(tuple).end(); i++)
+    const auto &fvs = kfvFieldsValues(tuple);
+
+    string s = getTableName() + getConsumerTable()->getTableNameSeparator();
+
+    size_t len = s.size() + kfvKey(tuple).size() + 1 + kfvOp(tuple).size();
+    for (const auto &fv : fvs)
+    {
+        len += fvField(fv).size() + fvValue(fv).size() + 2;
+    }
+    s.reserve(len);
+
+    s.append(kfvKey(tuple)).append("|").append(kfvOp(tuple));
+    for (const auto &fv : fvs)
     {
-        s += "|" + fvField(*i) + ":" + fvValue(*i);
+        s.append("|").append(fvField(fv)).append(":").append(fvValue(fv));
     }
 
     return s;
@@ -493,9 +610,13 @@ void ConsumerBase::recordTuple(const KeyOpFieldsValuesTuple &tuple)
 {
     auto& swssRecorder = Recorder::Instance().swss;
 
-    if (!swssRecorder.isAsyncEnabled())
+    if (!swssRecorder.isAsyncEnabled() && !swssRecorder.isBinary())
     {
-        swssRecorder.record(dumpTuple(tuple));
+        // Don't serialize the tuple if nothing is going to be written
+        if (swssRecorder.isRecord())
+        {
+            swssRecorder.record(dumpTuple(tuple));
+        }
         return;
     }
 
@@ -508,11 +629,14 @@ void ConsumerBase::recordTuples(const std::deque<KeyOpFieldsValuesTuple> &entrie
 {
     auto& swssRecorder = Recorder::Instance().swss;
 
-    if (!swssRecorder.isAsyncEnabled())
+    if (!swssRecorder.isAsyncEnabled() && !swssRecorder.isBinary())
     {
-        for (const auto& entry : entries)
+        if (swssRecorder.isRecord())
         {
-            swssRecorder.record(dumpTuple(entry));
+            for (const auto& entry : entries)
+            {
+                swssRecorder.record(dumpTuple(entry));
+            }
         }
         return;
     }
@@ -522,6 +646,16 @@ void ConsumerBase::recordTuples(const std::deque<KeyOpFieldsValuesTuple> &entrie
         entries);
 }
 
+void ConsumerBase::recordRetry(const KeyOpFieldsValuesTuple &tuple, const string &marker)
+{
+    auto& retryRecorder = Recorder::Instance().retry;
+
+    if (retryRecorder.isRecord())
+    {
+        retryRecorder.record(dumpTuple(tuple).append(marker));
+    }
+}
+
 void ConsumerBase::dumpPendingTasks(vector<string> &ts)
 {
     for (auto &tm : m_toSync)
@@ -554,12 +688,14 @@ void Consumer::execute()
 
     auto entries = std::make_shared<std::deque<KeyOpFieldsValuesTuple>>();
     getConsumerTable()->pops(*entries);
+    m_stats.popBatchSize.add(entries->size());
 
     processAnyTask(
         // bundle tasks into a lambda function which takes no argument and returns void
         // this lambda captures variables by value from the surrounding scope
+        // the popped entries are only used here, move them into m_toSync
         [=](){
-            addToSync(entries);
+            addToSync(std::move(*entries));
             drain();
         }
     );
@@ -567,8 +703,9 @@ void Consumer::execute()
 
 void Executor::processAnyTask(AnyTask&& task)
 {
-    // if either gRingBuffer isn't initialized or the ring thread isn't created
-    if (!gRingBuffer || !gRingBuffer->thread_created) 
+    // if either gRingBuffer isn't initialized or the ring thread isn't created,
+    // or the task comes from an executor already running on a scheduler worker
+    if (!gRingBuffer || !gRingBuffer->thread_created || gOnWorkerThread)
     {
         // execute the input task immediately
         task();
@@ -605,6 +742,9 @@ void Consumer::drain()
 {
     if (!m_toSync.empty())
     {
+        m_stats.pendingTasks.add(m_toSync.size());
+
+        auto start = std::chrono::steady_clock::now();
         try
         {
             ((Orch *)m_orch)->doTask((Consumer&)*this);
@@ -629,6 +769,9 @@ void Consumer::drain()
             SWSS_LOG_ERROR("Exception caught: type=unknown, table=%s",
                            getName().c_str());
         }
+
+        auto elapsed = std::chrono::steady_clock::now() - start;
+        m_stats.doTaskUsecs.add(std::chrono::duration_cast<std::chrono::microseconds>(elapsed).count());
     }
 }
 
@@ -914,34 +1057,53 @@ void Orch::doTask()
 
     size_t count = 0;
 
-    for (auto &it : m_consumerMap)
+    // higher priority tables get their retries and their turn first
+    m_taskSlicer.run(gTaskTimeSlice, [&](Executor *executor)
     {
+        const auto &name = executor->getName();
         try
         {
-            count += retryToSync(it.first, threshold - count);
-            it.second->drain();
+            count += retryToSync(name, threshold - count);
+            executor->drain();
         }
         catch (const std::invalid_argument& e)
         {
             SWSS_LOG_ERROR("Exception caught: type=invalid_argument, table=%s, orch=%s, error=%s",
-                           it.first.c_str(), typeid(*this).name(), e.what());
+                           name.c_str(), typeid(*this).name(), e.what());
         }
         catch (const std::logic_error& e)
         {
             SWSS_LOG_ERROR("Exception caught: type=logic_error, table=%s, orch=%s, error=%s",
-                           it.first.c_str(), typeid(*this).name(), e.what());
+                           name.c_str(), typeid(*this).name(), e.what());
         }
         catch (const std::exception& e)
         {
             SWSS_LOG_ERROR("Exception caught: type=exception, table=%s, orch=%s, error=%s",
-                           it.first.c_str(), typeid(*this).name(), e.what());
+                           name.c_str(), typeid(*this).name(), e.what());
         }
         catch (...)
         {
             SWSS_LOG_ERROR("Exception caught: type=unknown, table=%s, orch=%s",
-                           it.first.c_str(), typeid(*this).name());
+                           name.c_str(), typeid(*this).name());
+        }
+    });
+}
+
+int Orch::getPriority() const
+{
+    int pri = default_orch_pri;
+    bool found = false;
+
+    for (const auto &it : m_consumerMap)
+    {
+        if (it.second && (!found || it.second->getPri() > pri))
+        {
+            pri = it.second->getPri();
+            found = true;
         }
     }
+
+    return pri;
 }
 
 void Orch::dumpPendingTasks(vector<string> &ts)
@@ -959,6 +1121,20 @@ void Orch::dumpPendingTasks(vector<string> &ts)
     }
 }
 
+void Orch::getConsumerStats(std::map<std::string, std::vector<FieldValueTuple>> &stats)
+{
+    for (auto &it : m_consumerMap)
+    {
+        auto consumer = dynamic_cast<ConsumerBase *>(it.second.get());
+        if (consumer == NULL)
+        {
+            continue;
+        }
+
+        stats[consumer->getStatsKey()] = consumer->m_stats.toFieldValues();
+    }
+}
+
 void Orch::flushResponses()
 {
     m_publisher.flush();
@@ -1207,6 +1383,8 @@ void Orch::addExecutor(Executor* executor)
         SWSS_LOG_THROW("Duplicated executorName in m_consumerMap: %s", executor->getName().c_str());
     }
 
+    m_taskSlicer.add(executor, executor->getPri());
+
     if (gRingBuffer && executor->getName() == APP_ROUTE_TABLE_NAME) {
         gRingBuffer->addExecutor(executor);
     }
@@ -27,6 +27,8 @@ extern "C" {
 #include "recorder.h"
 #include "schema.h"
 #include "retrycache.h"
+#include "consumerstats.h"
+#include "taskslicer.h"
 
 const char delimiter           = ':';
 const char list_item_delimiter = ',';
@@ -57,6 +59,8 @@ const char state_db_key_delimiter  = '|';
 #define SLEEP_MSECONDS 500
 
 const int default_orch_pri = 0;
+/* Tables at or above this priority (ports, interfaces, neighbors) are never deferred */
+const int urgent_orch_pri = 30;
 
 typedef enum
 {
@@ -107,7 +111,8 @@ class Executor : public swss::Selectable
 {
 public:
     Executor(swss::Selectable *selectable, Orch *orch, const std::string &name)
-        : m_selectable(selectable)
+        : swss::Selectable(selectable ? selectable->getPri() : 0)
+        , m_selectable(selectable)
         , m_orch(orch)
         , m_name(name)
     {
@@ -137,6 +142,8 @@ public:
 
     Orch *getOrch() const { return m_orch; }
     static std::shared_ptr<RingBuffer> gRingBuffer;
+    // Set on OrchScheduler worker threads, tasks there are always executed in place
+    static thread_local bool gOnWorkerThread;
     void processAnyTask(AnyTask&& func);
 
 protected:
@@ -152,6 +159,18 @@ protected:
 
 typedef std::map<std::string, std::shared_ptr<Executor>> ConsumerMap;
 
+typedef std::unordered_map<std::string, std::vector<swss::FieldValueTuple>> TableSnapshot;
+
+/* Table contents saved before a warm restart, see WarmCheckpoint */
+class WarmStartSnapshot
+{
+public:
+    virtual ~WarmStartSnapshot() = default;
+
+    /* Fill the saved entries of the table, false if the table was not saved */
+    virtual bool getTable(const std::string &name, TableSnapshot &entries) const = 0;
+};
+
 class ConsumerBase : public Executor {
 public:
     ConsumerBase(swss::Selectable *selectable, Orch *orch, const std::string &name)
@@ -166,6 +185,12 @@ public:
         return getConsumerTable()->getTableName();
     }
 
+    /* Key of this consumer in the exported statistics */
+    virtual std::string getStatsKey() const
+    {
+        return getName();
+    }
+
     std::string dumpTuple(const swss::KeyOpFieldsValuesTuple &tuple);
     void dumpPendingTasks(std::vector<std::string> &ts);
 
@@ -173,14 +198,21 @@ public:
     // TODO: hide?
     SyncMap m_toSync;
 
+    /* Hot path statistics, exported periodically by OrchDaemon */
+    ConsumerStats m_stats;
+
     /* record the tuple */
     void recordTuple(const swss::KeyOpFieldsValuesTuple &tuple);
     void recordTuples(const std::deque<swss::KeyOpFieldsValuesTuple> &entries);
+    /* record a retry cache change, the tuple is only serialized when recording is on */
+    void recordRetry(const swss::KeyOpFieldsValuesTuple &tuple, const std::string &marker);
 
     void addToSync(const swss::KeyOpFieldsValuesTuple &entry, bool onRetry=false);
 
     // Returns: the number of entries added to m_toSync
     size_t addToSync(const std::deque<swss::KeyOpFieldsValuesTuple> &entries, bool onRetry=false);
+    // Same as above, the entries are moved into m_toSync instead of being copied
+    size_t addToSync(std::deque<swss::KeyOpFieldsValuesTuple> &&entries, bool onRetry=false);
     size_t addToSync(std::shared_ptr<std::deque<swss::KeyOpFieldsValuesTuple>> entries, bool onRetry=false); 
 
     /**
@@ -192,9 +224,17 @@ public:
 
     size_t refillToSync();
     size_t refillToSync(swss::Table* table);
+    // Same as above, the entries found in the snapshot are not read from the table
+    size_t refillToSync(swss::Table* table, TableSnapshot &snapshot);
+
+    /* Name of the table in a warm start snapshot, empty if it can't be saved */
+    std::string getSnapshotName() const;
+
+    /* Used by refillToSync() while set, only during warm start */
+    static const WarmStartSnapshot *gWarmStartSnapshot;
 
 private:
-    void addToSyncInternal(const swss::KeyOpFieldsValuesTuple &entry, bool onRetry, bool recordTask);
+    void addToSyncInternal(swss::KeyOpFieldsValuesTuple &&entry, bool onRetry, bool recordTask);
 };
 
 class RingBuffer
@@ -260,6 +300,11 @@ public:
         return getDbConnector()->getDbName();
     }
 
+    std::string getStatsKey() const override
+    {
+        return getDbName() + delimiter + getName();
+    }
+
     void execute() override;
     void drain() override;
 };
@@ -302,9 +347,16 @@ public:
     // otherwise fallback to cold start
     virtual bool bake();
 
-    /* Iterate all consumers in m_consumerMap and run doTask(Consumer) */
+    /*
+     * Iterate all consumers in m_consumerMap by priority and run doTask(Consumer).
+     * Consumers below urgent_orch_pri may be deferred to the next call once
+     * gTaskTimeSlice is used up.
+     */
     virtual void doTask();
 
+    /* Highest priority of the executors of this orch */
+    int getPriority() const;
+
     /* Run doTask against a specific executor */
     virtual void doTask(Consumer &consumer) { };
     virtual void doTask(swss::NotificationConsumer &consumer) { }
@@ -321,7 +373,10 @@ public:
     virtual void onWarmBootEnd() { }
 
     void dumpPendingTasks(std::vector<std::string> &ts);
-    
+
+    /* Collect the statistics of all consumers, keyed by ConsumerBase::getStatsKey() */
+    void getConsumerStats(std::map<std::string, std::vector<swss::FieldValueTuple>> &stats);
+
     void createRetryCache(const std::string &executorName);
     RetryCache* getRetryCache(const std::string &executorName);
     ConsumerBase* getConsumerBase(const std::string &executorName);
@@ -382,6 +437,8 @@ protected:
     ResponsePublisher m_publisher{"APPL_STATE_DB"};
 private:
     void addConsumer(swss::DBConnector *db, std::string tableName, int pri = default_orch_pri);
+
+    TaskSlicer<Executor *> m_taskSlicer{urgent_orch_pri};
 };
 
 #include "request_parser.h"
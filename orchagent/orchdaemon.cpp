@@ -4,12 +4,15 @@
 #include <limits.h>
 #include <errno.h>
 #include <signal.h>
+#include <stdio.h>
+#include <fstream>
 #include "orchdaemon.h"
 #include "logger.h"
 #include <sairedis.h>
 #include "warm_restart.h"
 #include <iostream>
 #include "orch_zmq_config.h"
+#include "warmcheckpoint.h"
 
 #define SAI_SWITCH_ATTR_CUSTOM_RANGE_BASE SAI_SWITCH_ATTR_CUSTOM_RANGE_START
 #include "sairedis.h"
@@ -21,6 +24,9 @@ using namespace swss;
 
 /* select() function timeout retry time */
 #define SELECT_TIMEOUT 1000
+#define CONSUMER_STATS_INTERVAL 10000
+#define COUNTERS_ORCH_CONSUMER_STATS_TABLE "ORCH_CONSUMER_STATS"
+#define CONSUMER_STATS_FNAME "orchagent_consumer_stats.txt"
 #define PFC_WD_POLL_MSECS 100
 
 #define APP_FABRIC_MONITOR_PORT_TABLE_NAME      "FABRIC_PORT_TABLE"
@@ -31,8 +37,11 @@ extern sai_object_id_t             gSwitchId;
 extern string                      gMySwitchType;
 extern string                      gMySwitchSubType;
 extern bool                        gOrchUnhealthy;
+extern bool                        gPfcWdNativeDetection;
 extern string                      gSaiErrorString;
+extern int                         gTaskTimeSlice;
 volatile sig_atomic_t              gOrchShutdownRequested = 0;
+volatile sig_atomic_t              gConsumerStatsDumpRequested = 0;
 
 extern void syncd_apply_view();
 /*
@@ -91,6 +100,7 @@ OrchDaemon::OrchDaemon(DBConnector *applDb, DBConnector *configDb, DBConnector *
     SWSS_LOG_ENTER();
     m_select = new Select();
     m_lastHeartBeat = std::chrono::high_resolution_clock::now();
+    m_lastStatsExport = m_lastHeartBeat;
 }
 
 OrchDaemon::~OrchDaemon()
@@ -110,6 +120,11 @@ OrchDaemon::~OrchDaemon()
      * exposes the latent null dereference. Guard the ring buffer accesses
      * so teardown is safe whether ring mode is enabled or not.
      */
+    if (m_scheduler)
+    {
+        m_scheduler->stop();
+    }
+
     if (ring_thread.joinable()) {
         if (gRingBuffer) {
             // notify the ring_thread to exit
@@ -183,6 +198,101 @@ void OrchDaemon::disableRingBuffer() {
     Orch::gRingBuffer = nullptr;
 }
 
+void OrchDaemon::enableScheduler(size_t workers)
+{
+    m_scheduler = std::make_shared<OrchScheduler>(workers);
+    SWSS_LOG_NOTICE("OrchScheduler created with up to %zu workers", workers);
+}
+
+/*
+ * Scheduled orchs run on their own thread and must not share a redis
+ * connection with the main thread.
+ */
+DBConnector *OrchDaemon::getShardDb(DBConnector *db)
+{
+    if (!m_scheduler)
+    {
+        return db;
+    }
+
+    m_shardDbs.emplace_back(db->newConnector(0));
+    return m_shardDbs.back().get();
+}
+
+/*
+ * Declare which orchs leave the main loop and what they depend on.
+ * A dependency covers direct calls in both directions as well as observer
+ * updates, so that an orch is never running concurrently with one it touches.
+ */
+void OrchDaemon::scheduleOrchs(Orch *pfcwd_orch, Orch *dtel_orch)
+{
+    SWSS_LOG_ENTER();
+
+    /* CRM used counters are protected by CrmOrch itself */
+    m_scheduler->schedule(gCrmOrch, "CrmOrch");
+
+    m_scheduler->schedule(gFdbOrch, "FdbOrch");
+    m_scheduler->addDependency(gFdbOrch, gPortsOrch);
+    m_scheduler->addDependency(gFdbOrch, gMlagOrch);
+    m_scheduler->addDependency(gFdbOrch, gNeighOrch);
+    m_scheduler->addDependency(gFdbOrch, gMirrorOrch);
+    m_scheduler->addDependency(gFdbOrch, gMuxOrch);
+    m_scheduler->addDependency(gFdbOrch, gStpOrch);
+
+    m_scheduler->schedule(gAclOrch, "AclOrch");
+    m_scheduler->addDependency(gAclOrch, gPortsOrch);
+    m_scheduler->addDependency(gAclOrch, gSwitchOrch);
+    m_scheduler->addDependency(gAclOrch, gMirrorOrch);
+    m_scheduler->addDependency(gAclOrch, gNeighOrch);
+    m_scheduler->addDependency(gAclOrch, gRouteOrch);
+    m_scheduler->addDependency(gAclOrch, gMuxOrch);
+    m_scheduler->addDependency(gAclOrch, gP4Orch);
+    m_scheduler->addDependency(gAclOrch, dtel_orch);
+
+    if (pfcwd_orch)
+    {
+        /* PFC WD ACL handlers program through AclOrch */
+        m_scheduler->schedule(pfcwd_orch, "PfcWdOrch");
+        m_scheduler->addDependency(pfcwd_orch, gAclOrch);
+        m_scheduler->addDependency(pfcwd_orch, gPortsOrch);
+        m_scheduler->addDependency(pfcwd_orch, gSwitchOrch);
+    }
+
+    /* Ordering between the main thread orchs on the path to the shards above */
+    m_scheduler->addDependency(gRouteOrch, gNeighOrch);
+    m_scheduler->addDependency(gNeighOrch, gIntfsOrch);
+    m_scheduler->addDependency(gIntfsOrch, gPortsOrch);
+}
+
+void OrchDaemon::runOrchTask(Orch *o)
+{
+    if (!m_scheduler)
+    {
+        o->doTask();
+    }
+    else if (!m_scheduler->isScheduled(o))
+    {
+        m_scheduler->runExclusive(o, [o](){ o->doTask(); });
+    }
+}
+
+void OrchDaemon::runOrchTasks()
+{
+    m_orchSlicer.run(gTaskTimeSlice, [this](Orch *o){ runOrchTask(o); });
+}
+
+void OrchDaemon::executeTask(Executor *c)
+{
+    if (!m_scheduler)
+    {
+        c->execute();
+    }
+    else
+    {
+        m_scheduler->runExclusive(c->getOrch(), [c](){ c->execute(); });
+    }
+}
+
 bool OrchDaemon::init()
 {
     SWSS_LOG_ENTER();
@@ -191,7 +301,7 @@ bool OrchDaemon::init()
 
     g_events_handle = events_init_publisher("sonic-events-swss");
 
-    gCrmOrch = new CrmOrch(m_configDb, CFG_CRM_TABLE_NAME);
+    gCrmOrch = new CrmOrch(getShardDb(m_configDb), CFG_CRM_TABLE_NAME);
 
     TableConnector stateDbSwitchTable(m_stateDb, STATE_SWITCH_CAPABILITY_TABLE_NAME);
     TableConnector app_switch_table(m_applDb, APP_SWITCH_TABLE_NAME);
@@ -230,9 +340,10 @@ bool OrchDaemon::init()
     };
 
     gPortsOrch = new PortsOrch(m_applDb, m_stateDb, ports_tables, m_chassisAppDb);
-    TableConnector stateDbFdb(m_stateDb, STATE_FDB_TABLE_NAME);
-    TableConnector stateMclagDbFdb(m_stateDb, STATE_MCLAG_REMOTE_FDB_TABLE_NAME);
-    gFdbOrch = new FdbOrch(m_applDb, app_fdb_tables, stateDbFdb, stateMclagDbFdb, gPortsOrch);
+    DBConnector *fdbStateDb = getShardDb(m_stateDb);
+    TableConnector stateDbFdb(fdbStateDb, STATE_FDB_TABLE_NAME);
+    TableConnector stateMclagDbFdb(fdbStateDb, STATE_MCLAG_REMOTE_FDB_TABLE_NAME);
+    gFdbOrch = new FdbOrch(getShardDb(m_applDb), app_fdb_tables, stateDbFdb, stateMclagDbFdb, gPortsOrch);
 
     TableConnector stateDbBfdSessionTable(m_stateDb, STATE_BFD_SESSION_TABLE_NAME);
 
@@ -405,12 +516,14 @@ bool OrchDaemon::init()
     TableConnector confDbMirrorSession(m_configDb, CFG_MIRROR_SESSION_TABLE_NAME);
     gMirrorOrch = new MirrorOrch(stateDbMirrorSession, confDbMirrorSession, gPortsOrch, gRouteOrch, gNeighOrch, gFdbOrch, gPolicerOrch, gSwitchOrch);
 
-    TableConnector confDbAclTable(m_configDb, CFG_ACL_TABLE_TABLE_NAME);
-    TableConnector confDbAclTableType(m_configDb, CFG_ACL_TABLE_TYPE_TABLE_NAME);
-    TableConnector confDbAclRuleTable(m_configDb, CFG_ACL_RULE_TABLE_NAME);
-    TableConnector appDbAclTable(m_applDb, APP_ACL_TABLE_TABLE_NAME);
-    TableConnector appDbAclTableType(m_applDb, APP_ACL_TABLE_TYPE_TABLE_NAME);
-    TableConnector appDbAclRuleTable(m_applDb, APP_ACL_RULE_TABLE_NAME);
+    DBConnector *aclConfigDb = getShardDb(m_configDb);
+    DBConnector *aclApplDb = getShardDb(m_applDb);
+    TableConnector confDbAclTable(aclConfigDb, CFG_ACL_TABLE_TABLE_NAME);
+    TableConnector confDbAclTableType(aclConfigDb, CFG_ACL_TABLE_TYPE_TABLE_NAME);
+    TableConnector confDbAclRuleTable(aclConfigDb, CFG_ACL_RULE_TABLE_NAME);
+    TableConnector appDbAclTable(aclApplDb, APP_ACL_TABLE_TABLE_NAME);
+    TableConnector appDbAclTableType(aclApplDb, APP_ACL_TABLE_TYPE_TABLE_NAME);
+    TableConnector appDbAclRuleTable(aclApplDb, APP_ACL_RULE_TABLE_NAME);
 
     vector<TableConnector> acl_table_connectors = {
         confDbAclTableType,
@@ -530,7 +643,7 @@ bool OrchDaemon::init()
         m_orchList.push_back(dtel_orch);
     }
 
-    gAclOrch = new AclOrch(acl_table_connectors, m_stateDb,
+    gAclOrch = new AclOrch(acl_table_connectors, getShardDb(m_stateDb),
         gSwitchOrch, gPortsOrch, gMirrorOrch, gNeighOrch, gRouteOrch, dtel_orch);
 
     vector<string> mlag_tables = {
@@ -632,6 +745,9 @@ bool OrchDaemon::init()
         CFG_PFC_WD_TABLE_NAME
     };
 
+    DBConnector *pfcwdConfigDb = getShardDb(m_configDb);
+    size_t pfcwd_index = m_orchList.size();
+
     if ((platform == MLNX_PLATFORM_SUBSTRING)  || (platform == VS_PLATFORM_SUBSTRING))
     {
 
@@ -664,7 +780,7 @@ bool OrchDaemon::init()
         static const vector<sai_queue_attr_t> queueAttrIds;
 
         m_orchList.push_back(new PfcWdSwOrch<PfcWdZeroBufferHandler, PfcWdLossyHandler>(
-                    m_configDb,
+                    pfcwdConfigDb,
                     pfc_wd_tables,
                     portStatIds,
                     queueStatIds,
@@ -712,7 +828,7 @@ bool OrchDaemon::init()
 	    (platform == NPS_PLATFORM_SUBSTRING))
         {
             m_orchList.push_back(new PfcWdSwOrch<PfcWdZeroBufferHandler, PfcWdLossyHandler>(
-                        m_configDb,
+                        pfcwdConfigDb,
                         pfc_wd_tables,
                         portStatIds,
                         queueStatIds,
@@ -722,7 +838,7 @@ bool OrchDaemon::init()
         else if (platform == BFN_PLATFORM_SUBSTRING)
         {
             m_orchList.push_back(new PfcWdSwOrch<PfcWdAclHandler, PfcWdLossyHandler>(
-                        m_configDb,
+                        pfcwdConfigDb,
                         pfc_wd_tables,
                         portStatIds,
                         queueStatIds,
@@ -784,22 +900,24 @@ bool OrchDaemon::init()
         if(pfcDlrInit)
         {
             m_orchList.push_back(new PfcWdSwOrch<PfcWdDlrHandler, PfcWdDlrHandler>(
-                        m_configDb,
+                        pfcwdConfigDb,
                         pfc_wd_tables,
                         portStatIds,
                         queueStatIds,
                         queueAttrIds,
-                        PFC_WD_POLL_MSECS));
+                        PFC_WD_POLL_MSECS,
+                        gPfcWdNativeDetection));
         }
         else
         {
             m_orchList.push_back(new PfcWdSwOrch<PfcWdAclHandler, PfcWdLossyHandler>(
-                        m_configDb,
+                        pfcwdConfigDb,
                         pfc_wd_tables,
                         portStatIds,
                         queueStatIds,
                         queueAttrIds,
-                        PFC_WD_POLL_MSECS));
+                        PFC_WD_POLL_MSECS,
+                        gPfcWdNativeDetection));
         }
     } else if (platform == CISCO_8000_PLATFORM_SUBSTRING)
     {
@@ -834,7 +952,7 @@ bool OrchDaemon::init()
         };
 
         m_orchList.push_back(new PfcWdSwOrch<PfcWdSaiDlrInitHandler, PfcWdActionHandler>(
-                    m_configDb,
+                    pfcwdConfigDb,
                     pfc_wd_tables,
                     portStatIds,
                     queueStatIds,
@@ -842,6 +960,8 @@ bool OrchDaemon::init()
                     PFC_WD_POLL_MSECS));
     }
 
+    Orch *pfcwd_orch = m_orchList.size() > pfcwd_index ? m_orchList.back() : nullptr;
+
     m_orchList.push_back(&CounterCheckOrch::getInstance(m_configDb));
 
     vector<string> p4rt_tables = {APP_P4RT_TABLE_NAME};
@@ -869,6 +989,11 @@ bool OrchDaemon::init()
         SWSS_LOG_NOTICE("High Frequency Telemetry is not supported on this platform");
     }
 
+    if (m_scheduler)
+    {
+        scheduleOrchs(pfcwd_orch, dtel_orch);
+    }
+
     if (WarmStart::isWarmStart())
     {
         bool suc = warmRestoreAndSyncUp();
@@ -877,6 +1002,11 @@ bool OrchDaemon::init()
             return false;
         }
     }
+    else if (!m_warmCheckpointPath.empty())
+    {
+        // A checkpoint is only valid for the warm start following it
+        unlink(m_warmCheckpointPath.c_str());
+    }
 
     return true;
 }
@@ -911,11 +1041,103 @@ void OrchDaemon::flush()
     {
         for (auto* orch: m_orchList)
         {
+            // Scheduled orchs flush their responses on their own worker
+            if (m_scheduler && m_scheduler->isStarted() && m_scheduler->isScheduled(orch))
+            {
+                continue;
+            }
             orch->flushResponses();
         }
     }
 }
 
+void OrchDaemon::exportConsumerStats()
+{
+    std::map<std::string, std::vector<FieldValueTuple>> stats;
+    for (Orch *o : m_orchList)
+    {
+        o->getConsumerStats(stats);
+    }
+
+    exportConsumerStats(stats);
+}
+
+void OrchDaemon::exportConsumerStats(const std::map<std::string, std::vector<FieldValueTuple>> &stats)
+{
+    SWSS_LOG_ENTER();
+
+    if (!m_consumerStatsTable)
+    {
+        m_countersDb = make_shared<DBConnector>("COUNTERS_DB", 0);
+        m_consumerStatsTable = make_unique<Table>(m_countersDb.get(), COUNTERS_ORCH_CONSUMER_STATS_TABLE);
+    }
+
+    for (const auto &it : stats)
+    {
+        m_consumerStatsTable->set(it.first, it.second);
+    }
+}
+
+void OrchDaemon::dumpConsumerStats()
+{
+    SWSS_LOG_ENTER();
+
+    std::map<std::string, std::vector<FieldValueTuple>> stats;
+    for (Orch *o : m_orchList)
+    {
+        o->getConsumerStats(stats);
+    }
+
+    exportConsumerStats(stats);
+
+    static const std::vector<std::string> columns = {
+        "pop_count", "pop_batch_avg", "pop_batch_max", "pending_tasks_p99", "pending_tasks_max",
+        "dotask_count", "dotask_usecs_p50", "dotask_usecs_p99", "dotask_usecs_max",
+        "retried_tasks", "retry_cache_size_max"
+    };
+
+    std::string path = Recorder::Instance().swss.getLoc() + "/" + CONSUMER_STATS_FNAME;
+    std::string tmp = path + ".tmp";
+    std::ofstream ofs(tmp, std::ofstream::out | std::ofstream::trunc);
+    if (!ofs.is_open())
+    {
+        SWSS_LOG_ERROR("Failed to open consumer statistics file %s", tmp.c_str());
+        return;
+    }
+
+    char line[64];
+    snprintf(line, sizeof(line), "%-40s", "consumer");
+    ofs << line;
+    for (const auto &column : columns)
+    {
+        ofs << " " << column;
+    }
+    ofs << std::endl;
+
+    for (const auto &it : stats)
+    {
+        snprintf(line, sizeof(line), "%-40s", it.first.c_str());
+        ofs << line;
+
+        std::map<std::string, std::string> values(it.second.begin(), it.second.end());
+        for (const auto &column : columns)
+        {
+            snprintf(line, sizeof(line), " %*s", static_cast<int>(column.size()), values[column].c_str());
+            ofs << line;
+        }
+        ofs << std::endl;
+    }
+    ofs.close();
+
+    if (rename(tmp.c_str(), path.c_str()) != 0)
+    {
+        SWSS_LOG_ERROR("Failed to write consumer statistics file %s: %s", path.c_str(), strerror(errno));
+        return;
+    }
+
+    SWSS_LOG_NOTICE("Dumped statistics of %zu consumers to %s", stats.size(), path.c_str());
+}
+
 /* Release the file handle so the log can be rotated */
 void OrchDaemon::logRotate() {
     SWSS_LOG_ENTER();
@@ -940,7 +1162,17 @@ void OrchDaemon::start(long heartBeatInterval)
 
     for (Orch *o : m_orchList)
     {
+        if (m_scheduler && m_scheduler->isScheduled(o))
+        {
+            continue;
+        }
         m_select->addSelectables(o->getSelectables());
+        m_orchSlicer.add(o, o->getPriority());
+    }
+
+    if (m_scheduler)
+    {
+        m_scheduler->start();
     }
 
     auto tstart = std::chrono::high_resolution_clock::now();
@@ -964,6 +1196,12 @@ void OrchDaemon::start(long heartBeatInterval)
             break;
         }
 
+        if (gConsumerStatsDumpRequested != 0)
+        {
+            gConsumerStatsDumpRequested = 0;
+            dumpConsumerStats();
+        }
+
         /*
          * Log an error message periodically if a previous SAI API call failed with
          * an unrecoverable error.
@@ -985,6 +1223,13 @@ void OrchDaemon::start(long heartBeatInterval)
             flush();
         }
 
+        auto statsDiff = std::chrono::duration_cast<std::chrono::milliseconds>(tend - m_lastStatsExport);
+        if (statsDiff.count() >= CONSUMER_STATS_INTERVAL)
+        {
+            m_lastStatsExport = tend;
+            exportConsumerStats();
+        }
+
         if (ret == Select::ERROR)
         {
             if (errno == EINTR && gOrchShutdownRequested != 0)
@@ -1013,8 +1258,7 @@ void OrchDaemon::start(long heartBeatInterval)
                 }
                 else
                 {
-                    for (Orch *o : m_orchList)
-                        o->doTask();
+                    runOrchTasks();
                 }
             }
 
@@ -1030,15 +1274,14 @@ void OrchDaemon::start(long heartBeatInterval)
         }
 
         auto *c = (Executor *)s;
-        c->execute();
+        executeTask(c);
 
         /* After each iteration, periodically check all m_toSync map to
          * execute all the remaining tasks that need to be retried. */
 
         if (!gRingBuffer || (gRingBuffer->IsEmpty() && gRingBuffer->IsIdle()))
         {
-            for (Orch *o : m_orchList)
-                o->doTask();
+            runOrchTasks();
         }
         /*
          * Asked to check warm restart readiness.
@@ -1064,6 +1307,12 @@ void OrchDaemon::start(long heartBeatInterval)
                 // Should sleep here or continue handling timers and etc.??
                 if (!gSwitchOrch->checkRestartNoFreeze())
                 {
+                    // Stop the workers, scheduled orchs must not process new data either
+                    if (m_scheduler)
+                    {
+                        m_scheduler->stop();
+                    }
+
                     // Disable FDB aging
                     gSwitchOrch->setAgingFDB(0);
 
@@ -1080,6 +1329,11 @@ void OrchDaemon::start(long heartBeatInterval)
                     // Flush sairedis's redis pipeline
                     flush();
 
+                    if (!m_warmCheckpointPath.empty())
+                    {
+                        WarmCheckpoint::save(m_warmCheckpointPath, m_orchList);
+                    }
+
                     SWSS_LOG_WARN("Orchagent is frozen for warm restart!");
                     freezeAndHeartBeat(UINT_MAX, heartBeatInterval);
                 }
@@ -1098,11 +1352,27 @@ bool OrchDaemon::warmRestoreAndSyncUp()
 
     WarmStart::setWarmStartState("orchagent", WarmStart::INITIALIZED);
 
+    /*
+     * The checkpoint stays mapped while the orchs bake. It is removed right
+     * away, the tables change as soon as orchagent runs again.
+     */
+    WarmCheckpoint checkpoint;
+    if (!m_warmCheckpointPath.empty())
+    {
+        if (checkpoint.load(m_warmCheckpointPath))
+        {
+            ConsumerBase::gWarmStartSnapshot = &checkpoint;
+        }
+        unlink(m_warmCheckpointPath.c_str());
+    }
+
     for (Orch *o : m_orchList)
     {
         o->bake();
     }
 
+    ConsumerBase::gWarmStartSnapshot = nullptr;
+
     // let's cache the neighbor updates in mux orch and
     // process them after everything being settled.
     gMuxOrch->enableCachingNeighborUpdate();
@@ -1176,10 +1446,20 @@ bool OrchDaemon::warmRestoreAndSyncUp()
  */
 void OrchDaemon::getTaskToSync(vector<string> &ts)
 {
+    if (m_scheduler)
+    {
+        m_scheduler->pause();
+    }
+
     for (Orch *o : m_orchList)
     {
         o->dumpPendingTasks(ts);
     }
+
+    if (m_scheduler)
+    {
+        m_scheduler->resume();
+    }
 }
 
 
@@ -6,6 +6,7 @@
 #include "consumertable.h"
 #include "zmqserver.h"
 #include "select.h"
+#include "orchscheduler.h"
 
 #include "portsorch.h"
 #include "fabricportsorch.h"
@@ -91,8 +92,18 @@ public:
     {
         m_fabricQueueStatEnabled = enabled;
     }
+    /* Checkpoint the consumer tables when frozen for warm restart, see WarmCheckpoint */
+    void setWarmCheckpointPath(const std::string &path)
+    {
+        m_warmCheckpointPath = path;
+    }
     void logRotate();
 
+    /* Write the consumer statistics to COUNTERS_DB */
+    void exportConsumerStats();
+    /* Export and also write a text table, see CONSUMER_STATS_FNAME */
+    void dumpConsumerStats();
+
     // Two required API to support ring buffer feature
     /**
      * This method is used by a ring buffer consumer [Orchdaemon] to initialzie its ring,
@@ -110,6 +121,17 @@ public:
 
     std::thread ring_thread;
 
+    /**
+     * Run independent orchs on up to 'workers' threads, see OrchScheduler.
+     * Must be called before init() so that the scheduled orchs get their own
+     * DB connections.
+     */
+    void enableScheduler(size_t workers);
+    std::shared_ptr<OrchScheduler> getScheduler() const
+    {
+        return m_scheduler;
+    }
+
 protected:
     DBConnector *m_applDb;
     DBConnector *m_configDb;
@@ -124,10 +146,29 @@ protected:
     bool m_fabricEnabled = false;
     bool m_fabricPortStatEnabled = true;
     bool m_fabricQueueStatEnabled = true;
+    std::string m_warmCheckpointPath;
 
     std::vector<Orch *> m_orchList;
     Select *m_select;
     std::chrono::time_point<std::chrono::high_resolution_clock> m_lastHeartBeat;
+    std::chrono::time_point<std::chrono::high_resolution_clock> m_lastStatsExport;
+
+    std::shared_ptr<DBConnector> m_countersDb = nullptr;
+    std::unique_ptr<Table> m_consumerStatsTable = nullptr;
+
+    void exportConsumerStats(const std::map<std::string, std::vector<FieldValueTuple>> &stats);
+
+    std::shared_ptr<OrchScheduler> m_scheduler = nullptr;
+    std::vector<std::unique_ptr<DBConnector>> m_shardDbs;
+
+    DBConnector *getShardDb(DBConnector *db);
+    void scheduleOrchs(Orch *pfcwd_orch, Orch *dtel_orch);
+    void runOrchTask(Orch *o);
+    void executeTask(Executor *c);
+
+    /* Pending tasks pass over the main thread orchs, by priority, see TaskSlicer */
+    TaskSlicer<Orch *> m_orchSlicer{urgent_orch_pri};
+    void runOrchTasks();
 
     void flush();
 
@@ -0,0 +1,332 @@
+#include <algorithm>
+#include <chrono>
+#include <deque>
+#include <set>
+#include <stdexcept>
+#include <string.h>
+
+#include "orchscheduler.h"
+#include "logger.h"
+
+using namespace std;
+using namespace swss;
+
+OrchScheduler::OrchScheduler(size_t workers) : m_maxWorkers(workers)
+{
+    if (workers == 0)
+    {
+        throw std::invalid_argument("Number of workers must be greater than 0");
+    }
+}
+
+OrchScheduler::~OrchScheduler()
+{
+    stop();
+}
+
+void OrchScheduler::schedule(Orch *orch, const string &name)
+{
+    SWSS_LOG_ENTER();
+
+    if (m_started)
+    {
+        SWSS_LOG_THROW("Cannot schedule %s, scheduler already started", name.c_str());
+    }
+
+    if (!orch || isScheduled(orch))
+    {
+        return;
+    }
+
+    m_scheduled.push_back(orch);
+    m_names[orch] = name;
+}
+
+void OrchScheduler::addDependency(Orch *orch, Orch *dependency)
+{
+    SWSS_LOG_ENTER();
+
+    if (m_started)
+    {
+        SWSS_LOG_THROW("Cannot add dependency, scheduler already started");
+    }
+
+    if (!orch || !dependency || orch == dependency)
+    {
+        return;
+    }
+
+    m_dependencies.emplace_back(orch, dependency);
+}
+
+bool OrchScheduler::isScheduled(const Orch *orch) const
+{
+    return m_names.find(orch) != m_names.end();
+}
+
+int OrchScheduler::getWorker(const Orch *orch) const
+{
+    auto it = m_orchWorker.find(orch);
+    if (it == m_orchWorker.end())
+    {
+        return -1;
+    }
+    return static_cast<int>(it->second);
+}
+
+string OrchScheduler::getWorkerName(size_t worker) const
+{
+    string name;
+    for (const auto &n : m_workers.at(worker)->names)
+    {
+        name += (name.empty() ? "" : "+") + n;
+    }
+    return name;
+}
+
+vector<size_t> OrchScheduler::getExclusiveWorkers(const Orch *orch) const
+{
+    vector<size_t> workers;
+    auto it = m_exclusive.find(orch);
+    if (it != m_exclusive.end())
+    {
+        for (auto *worker : it->second)
+        {
+            workers.push_back(worker->index);
+        }
+    }
+    return workers;
+}
+
+Orch *OrchScheduler::findRoot(map<Orch *, Orch *> &parents, Orch *orch)
+{
+    while (parents[orch] != orch)
+    {
+        parents[orch] = parents[parents[orch]];
+        orch = parents[orch];
+    }
+    return orch;
+}
+
+void OrchScheduler::start()
+{
+    SWSS_LOG_ENTER();
+
+    if (m_started)
+    {
+        return;
+    }
+
+    /* Scheduled orchs depending on each other share a shard */
+    map<Orch *, Orch *> parents;
+    for (auto *orch : m_scheduled)
+    {
+        parents[orch] = orch;
+    }
+
+    map<Orch *, vector<Orch *>> adjacency;
+    for (const auto &dep : m_dependencies)
+    {
+        adjacency[dep.first].push_back(dep.second);
+        adjacency[dep.second].push_back(dep.first);
+
+        if (isScheduled(dep.first) && isScheduled(dep.second))
+        {
+            parents[findRoot(parents, dep.first)] = findRoot(parents, dep.second);
+        }
+    }
+
+    map<Orch *, size_t> shards;
+    for (auto *orch : m_scheduled)
+    {
+        shards.emplace(findRoot(parents, orch), shards.size());
+    }
+
+    size_t count = min(m_maxWorkers, shards.size());
+    for (size_t i = 0; i < count; i++)
+    {
+        m_workers.emplace_back(new Worker());
+        m_workers.back()->index = i;
+    }
+
+    for (auto *orch : m_scheduled)
+    {
+        size_t index = shards[findRoot(parents, orch)] % count;
+        m_workers[index]->orchs.push_back(orch);
+        m_workers[index]->names.push_back(m_names[orch]);
+        m_orchWorker[orch] = index;
+    }
+
+    /*
+     * A main thread orch has to be serialized with every shard it can reach
+     * through other main thread orchs, as the state in between is shared.
+     */
+    for (const auto &it : adjacency)
+    {
+        Orch *orch = it.first;
+        if (isScheduled(orch))
+        {
+            continue;
+        }
+
+        set<Orch *> visited = { orch };
+        set<size_t> workers;
+        deque<Orch *> pending = { orch };
+
+        while (!pending.empty())
+        {
+            Orch *current = pending.front();
+            pending.pop_front();
+
+            for (auto *next : adjacency[current])
+            {
+                if (isScheduled(next))
+                {
+                    workers.insert(m_orchWorker[next]);
+                }
+                else if (visited.insert(next).second)
+                {
+                    pending.push_back(next);
+                }
+            }
+        }
+
+        /* Ascending order, the main thread is the only one taking several locks */
+        for (auto index : workers)
+        {
+            m_exclusive[orch].push_back(m_workers[index].get());
+        }
+    }
+
+    for (auto &worker : m_workers)
+    {
+        SWSS_LOG_NOTICE("OrchScheduler worker %zu runs %s",
+                        worker->index, getWorkerName(worker->index).c_str());
+        worker->thread = thread(&OrchScheduler::run, this, worker.get());
+    }
+
+    m_started = true;
+}
+
+void OrchScheduler::stop()
+{
+    SWSS_LOG_ENTER();
+
+    if (!m_started || m_stopped)
+    {
+        return;
+    }
+
+    m_stopped = true;
+    resume();
+
+    for (auto &worker : m_workers)
+    {
+        worker->stopEvent.notify();
+    }
+
+    for (auto &worker : m_workers)
+    {
+        if (worker->thread.joinable())
+        {
+            worker->thread.join();
+        }
+    }
+
+    SWSS_LOG_NOTICE("OrchScheduler stopped %zu workers", m_workers.size());
+}
+
+void OrchScheduler::runExclusive(const Orch *orch, const function<void()> &func)
+{
+    auto it = m_exclusive.find(orch);
+    if (!m_started || m_stopped || it == m_exclusive.end())
+    {
+        func();
+        return;
+    }
+
+    vector<unique_lock<mutex>> locks;
+    locks.reserve(it->second.size());
+    for (auto *worker : it->second)
+    {
+        locks.emplace_back(worker->mtx);
+    }
+
+    func();
+}
+
+void OrchScheduler::pause()
+{
+    SWSS_LOG_ENTER();
+
+    if (!m_started || m_stopped || !m_pauseLocks.empty())
+    {
+        return;
+    }
+
+    for (auto &worker : m_workers)
+    {
+        m_pauseLocks.emplace_back(worker->mtx);
+    }
+}
+
+void OrchScheduler::resume()
+{
+    m_pauseLocks.clear();
+}
+
+void OrchScheduler::run(Worker *worker)
+{
+    SWSS_LOG_ENTER();
+
+    Executor::gOnWorkerThread = true;
+
+    for (auto *orch : worker->orchs)
+    {
+        worker->select.addSelectables(orch->getSelectables());
+    }
+    worker->select.addSelectable(&worker->stopEvent);
+
+    auto lastFlush = chrono::steady_clock::now();
+
+    while (!m_stopped)
+    {
+        Selectable *s;
+        int ret = worker->select.select(&s, SHARD_SELECT_TIMEOUT);
+
+        lock_guard<mutex> lock(worker->mtx);
+
+        if (m_stopped)
+        {
+            break;
+        }
+
+        if (ret == Select::ERROR)
+        {
+            SWSS_LOG_NOTICE("Worker %zu error: %s!", worker->index, strerror(errno));
+            continue;
+        }
+
+        if (ret == Select::OBJECT && s != &worker->stopEvent)
+        {
+            static_cast<Executor *>(s)->execute();
+        }
+
+        /* Retry pending tasks, the same way the main loop does after each event */
+        for (auto *orch : worker->orchs)
+        {
+            orch->doTask();
+        }
+
+        auto now = chrono::steady_clock::now();
+        if (ret == Select::TIMEOUT
+            || now - lastFlush >= chrono::milliseconds(SHARD_SELECT_TIMEOUT))
+        {
+            for (auto *orch : worker->orchs)
+            {
+                orch->flushResponses();
+            }
+            lastFlush = now;
+        }
+    }
+}
@@ -0,0 +1,98 @@
+#ifndef SWSS_ORCHSCHEDULER_H
+#define SWSS_ORCHSCHEDULER_H
+
+#include <atomic>
+#include <functional>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <thread>
+#include <vector>
+
+#include "select.h"
+#include "selectableevent.h"
+#include "orch.h"
+
+#define SHARD_SELECT_TIMEOUT 1000
+
+/*
+ * OrchScheduler moves independent orchs off the main select loop.
+ *
+ * Orchs are opted in with schedule(). Dependencies between orchs, i.e. one orch
+ * reading or changing the state of another one (including observer updates),
+ * are declared with addDependency(). Scheduled orchs connected by a dependency
+ * are put in the same shard, and shards are spread over at most 'workers'
+ * threads. Every worker runs its own Select over the executors of its orchs, so
+ * pops, timers, notifications, retries and response flushes of a scheduled orch
+ * all happen on that thread, in the order they arrive.
+ *
+ * Orchs that stay on the main thread must run through runExclusive(). It holds
+ * the lock of every shard reachable from the orch through declared dependencies,
+ * so the main thread never touches the state of a shard while its worker runs.
+ * Orchs without such a path run concurrently with all the workers.
+ */
+class OrchScheduler
+{
+public:
+    OrchScheduler(size_t workers);
+    ~OrchScheduler();
+
+    // Disable copying
+    OrchScheduler(const OrchScheduler&) = delete;
+    OrchScheduler& operator=(const OrchScheduler&) = delete;
+
+    void schedule(Orch *orch, const std::string &name);
+    void addDependency(Orch *orch, Orch *dependency);
+
+    /* Build the shards and spawn the workers. The orch set is frozen afterwards. */
+    void start();
+    void stop();
+
+    bool isStarted() const { return m_started; }
+    bool isScheduled(const Orch *orch) const;
+
+    /* Worker the orch runs on, -1 if the orch runs on the main thread */
+    int getWorker(const Orch *orch) const;
+    size_t getWorkerCount() const { return m_workers.size(); }
+    std::string getWorkerName(size_t worker) const;
+
+    /* Workers whose lock is taken when the main thread runs the orch */
+    std::vector<size_t> getExclusiveWorkers(const Orch *orch) const;
+
+    void runExclusive(const Orch *orch, const std::function<void()> &func);
+
+    /* Hold all workers after their current iteration, e.g. to dump pending tasks */
+    void pause();
+    void resume();
+
+private:
+    struct Worker
+    {
+        size_t index;
+        std::vector<Orch *> orchs;
+        std::vector<std::string> names;
+        std::mutex mtx;
+        swss::SelectableEvent stopEvent;
+        swss::Select select;
+        std::thread thread;
+    };
+
+    void run(Worker *worker);
+    Orch *findRoot(std::map<Orch *, Orch *> &parents, Orch *orch);
+
+    size_t m_maxWorkers;
+    bool m_started = false;
+    std::atomic<bool> m_stopped{false};
+
+    std::vector<Orch *> m_scheduled;
+    std::map<const Orch *, std::string> m_names;
+    std::vector<std::pair<Orch *, Orch *>> m_dependencies;
+
+    std::vector<std::unique_ptr<Worker>> m_workers;
+    std::map<const Orch *, size_t> m_orchWorker;
+    std::map<const Orch *, std::vector<Worker *>> m_exclusive;
+    std::vector<std::unique_lock<std::mutex>> m_pauseLocks;
+};
+
+#endif /* SWSS_ORCHSCHEDULER_H */
@@ -0,0 +1,243 @@
+#include <algorithm>
+#include "pfcwddetector.h"
+#include "logger.h"
+
+using namespace std;
+
+void PfcWdDetector::addQueue(sai_object_id_t queueId, uint32_t detectionTime, uint32_t restorationTime,
+        bool alert, bool history)
+{
+    SWSS_LOG_ENTER();
+
+    auto it = find(m_queues.begin(), m_queues.end(), queueId);
+    size_t i = static_cast<size_t>(it - m_queues.begin());
+
+    if (it == m_queues.end())
+    {
+        m_queues.push_back(queueId);
+        m_detectionTime.push_back(0);
+        m_restorationTime.push_back(0);
+        m_timeLeft.push_back(0);
+        m_alert.push_back(false);
+        m_history.push_back(false);
+        m_stormed.push_back(false);
+        m_held.push_back(false);
+        m_last.emplace_back();
+    }
+
+    m_detectionTime[i] = detectionTime;
+    m_restorationTime[i] = restorationTime;
+    m_alert[i] = alert;
+    m_history[i] = history;
+    m_timeLeft[i] = (m_stormed[i] && !alert) ? restorationTime : detectionTime;
+}
+
+void PfcWdDetector::removeQueue(sai_object_id_t queueId)
+{
+    SWSS_LOG_ENTER();
+
+    auto it = find(m_queues.begin(), m_queues.end(), queueId);
+    if (it == m_queues.end())
+    {
+        return;
+    }
+
+    // The order of the queues does not matter, move the last one in place of the removed one
+    size_t i = static_cast<size_t>(it - m_queues.begin());
+    size_t last = m_queues.size() - 1;
+
+    m_queues[i] = m_queues[last];
+    m_detectionTime[i] = m_detectionTime[last];
+    m_restorationTime[i] = m_restorationTime[last];
+    m_timeLeft[i] = m_timeLeft[last];
+    m_alert[i] = m_alert[last];
+    m_history[i] = m_history[last];
+    m_stormed[i] = m_stormed[last];
+    m_held[i] = m_held[last];
+    m_last[i] = m_last[last];
+
+    m_queues.pop_back();
+    m_detectionTime.pop_back();
+    m_restorationTime.pop_back();
+    m_timeLeft.pop_back();
+    m_alert.pop_back();
+    m_history.pop_back();
+    m_stormed.pop_back();
+    m_held.pop_back();
+    m_last.pop_back();
+}
+
+void PfcWdDetector::reset()
+{
+    SWSS_LOG_ENTER();
+
+    for (size_t i = 0; i < m_queues.size(); i++)
+    {
+        m_last[i].valid = false;
+        m_held[i] = false;
+        m_timeLeft[i] = (m_stormed[i] && !m_alert[i]) ? m_restorationTime[i] : m_detectionTime[i];
+    }
+    m_lastPoll = 0;
+}
+
+void PfcWdDetector::setPollInterval(uint32_t pollInterval)
+{
+    m_pollInterval = pollInterval;
+}
+
+void PfcWdDetector::update(const vector<PfcWdQueueCounters> &counters,
+        const vector<bool> &stormed,
+        uint64_t now,
+        vector<Transition> &transitions,
+        vector<PauseEstimate> &estimates)
+{
+    SWSS_LOG_ENTER();
+
+    if (counters.size() != m_queues.size() || stormed.size() != m_queues.size())
+    {
+        SWSS_LOG_ERROR("Got counters of %zu and state of %zu queues for %zu PFC watchdog queues",
+                counters.size(), stormed.size(), m_queues.size());
+        return;
+    }
+
+    // Time since the last poll for the pause time estimates, in microseconds
+    uint64_t sincePoll = uint64_t(m_pollInterval) * 1000;
+    if (m_lastPoll != 0)
+    {
+        sincePoll = now > m_lastPoll ? now - m_lastPoll : 0;
+    }
+
+    for (size_t i = 0; i < m_queues.size(); i++)
+    {
+        const auto &c = counters[i];
+
+        // Counters not polled yet, the queue was just added
+        if (!c.valid)
+        {
+            continue;
+        }
+
+        if (stormed[i] != m_stormed[i])
+        {
+            m_stormed[i] = stormed[i];
+            m_held[i] = false;
+            m_timeLeft[i] = (m_stormed[i] && !m_alert[i]) ? m_restorationTime[i] : m_detectionTime[i];
+        }
+
+        // The first poll only records the counters
+        if (m_last[i].valid)
+        {
+            evaluate(i, c, transitions);
+            estimate(i, c, sincePoll, estimates);
+        }
+
+        m_last[i] = c;
+    }
+
+    m_lastPoll = now;
+}
+
+void PfcWdDetector::evaluate(size_t i, const PfcWdQueueCounters &c, vector<Transition> &transitions)
+{
+    const auto &last = m_last[i];
+    int64_t pollInterval = m_pollInterval;
+
+    if (m_stormed[i] && !m_alert[i])
+    {
+        // Restoration, as in pfc_restore.lua
+        if (m_restorationTime[i] == 0)
+        {
+            return;
+        }
+
+        if (c.pfcRxPackets == last.pfcRxPackets && !c.debugStorm)
+        {
+            if (m_timeLeft[i] <= pollInterval)
+            {
+                transitions.push_back({ m_queues[i], Event::RESTORE });
+                m_timeLeft[i] = m_restorationTime[i];
+            }
+            else
+            {
+                m_timeLeft[i] -= pollInterval;
+            }
+        }
+        else
+        {
+            m_timeLeft[i] = m_restorationTime[i];
+        }
+
+        return;
+    }
+
+    // The counters are polled by syncd and read here at the same interval,
+    // so a poll may find them unchanged only because syncd has not polled
+    // them again yet. Keep the time left on a first unchanged poll rather
+    // than restarting the detection.
+    bool unchanged = c.packets == last.packets
+        && c.pfcRxPackets == last.pfcRxPackets
+        && c.pfcOn2OffRxPackets == last.pfcOn2OffRxPackets
+        && c.paused == last.paused;
+
+    if (unchanged && !c.debugStorm && !m_held[i])
+    {
+        m_held[i] = true;
+        return;
+    }
+    m_held[i] = false;
+
+    // Detection, as in pfc_detect_broadcom.lua
+    bool storm = (c.pfcRxPackets > last.pfcRxPackets
+            && c.pfcOn2OffRxPackets == last.pfcOn2OffRxPackets
+            && last.paused && c.paused)
+        || c.debugStorm;
+
+    if (storm)
+    {
+        if (m_timeLeft[i] <= pollInterval)
+        {
+            // Alert queues are still watched in storm, only report their new storms
+            if (!m_stormed[i])
+            {
+                transitions.push_back({ m_queues[i], Event::STORM });
+            }
+            m_timeLeft[i] = m_detectionTime[i];
+        }
+        else
+        {
+            m_timeLeft[i] -= pollInterval;
+        }
+    }
+    else
+    {
+        if (m_stormed[i])
+        {
+            transitions.push_back({ m_queues[i], Event::RESTORE });
+        }
+        m_timeLeft[i] = m_detectionTime[i];
+    }
+}
+
+void PfcWdDetector::estimate(size_t i, const PfcWdQueueCounters &c,
+        uint64_t sincePoll, vector<PauseEstimate> &estimates)
+{
+    const auto &last = m_last[i];
+
+    // Estimated along with the detection only, as in pfc_detect_broadcom.lua
+    if (!m_history[i] || (m_stormed[i] && !m_alert[i]))
+    {
+        return;
+    }
+
+    if (c.pfcRxPackets > last.pfcRxPackets)
+    {
+        // Paused for the entire poll interval when there was PFC activity,
+        // a new pause period if the queue was not paused before
+        estimates.push_back({ m_queues[i], !last.paused, m_lastPoll, sincePoll });
+    }
+    else if (last.paused && c.paused)
+    {
+        // Paused for the entire poll interval without activity
+        estimates.push_back({ m_queues[i], false, m_lastPoll, sincePoll });
+    }
+}
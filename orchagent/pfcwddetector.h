@@ -0,0 +1,100 @@
+#ifndef PFC_WATCHDOG_DETECTOR_H
+#define PFC_WATCHDOG_DETECTOR_H
+
+#include <vector>
+#include <cstddef>
+#include <cstdint>
+
+extern "C" {
+#include "sai.h"
+}
+
+// Counters of a watched queue and of the PFC priority of its port, as polled
+// by the PFC_WD flex counter group
+struct PfcWdQueueCounters
+{
+    bool valid = false;             // All the counters below have been polled
+    uint64_t packets = 0;           // SAI_QUEUE_STAT_PACKETS
+    uint64_t pfcRxPackets = 0;      // SAI_PORT_STAT_PFC_<index>_RX_PKTS
+    uint64_t pfcOn2OffRxPackets = 0;// SAI_PORT_STAT_PFC_<index>_ON2OFF_RX_PKTS
+    bool paused = false;            // SAI_QUEUE_ATTR_PAUSE_STATUS
+    bool debugStorm = false;        // DEBUG_STORM enabled on the queue
+};
+
+// PFC storm detection and restoration of the watched queues, evaluated in
+// orchagent in place of the pfc_detect and pfc_restore plugins.
+//
+// It implements the conditions of pfc_detect_broadcom.lua and pfc_restore.lua,
+// with the last counters and the time left of each queue kept in memory
+// instead of the *_last and *_TIME_LEFT fields of COUNTERS_DB. The queues are
+// stored in arrays and evaluated in one pass per poll, and only the changes
+// of storm state are reported.
+class PfcWdDetector
+{
+public:
+    enum class Event
+    {
+        STORM,
+        RESTORE,
+    };
+
+    struct Transition
+    {
+        sai_object_id_t queueId;
+        Event event;
+    };
+
+    // Estimated pause time of a queue with PFC stat history enabled
+    struct PauseEstimate
+    {
+        sai_object_id_t queueId;
+        bool restart;               // A new pause period started at the last poll
+        uint64_t lastPoll;          // Time of the last poll, in microseconds
+        uint64_t pauseTime;         // Time paused since the last poll, in microseconds
+    };
+
+    // Detection and restoration times in milliseconds, no restoration when 0
+    void addQueue(sai_object_id_t queueId, uint32_t detectionTime, uint32_t restorationTime,
+            bool alert, bool history);
+    void removeQueue(sai_object_id_t queueId);
+
+    // Forget the last counters, the next poll only records them
+    void reset();
+
+    void setPollInterval(uint32_t pollInterval);
+
+    // Queues to read the counters of, in the order update() takes them
+    const std::vector<sai_object_id_t>& getQueues() const
+    {
+        return m_queues;
+    }
+
+    // Evaluate all the queues on their new counters. stormed tells whether
+    // the storm action is currently applied on each queue. now is the time
+    // of the poll in microseconds.
+    void update(const std::vector<PfcWdQueueCounters> &counters,
+            const std::vector<bool> &stormed,
+            uint64_t now,
+            std::vector<Transition> &transitions,
+            std::vector<PauseEstimate> &estimates);
+
+private:
+    void evaluate(size_t i, const PfcWdQueueCounters &c, std::vector<Transition> &transitions);
+    void estimate(size_t i, const PfcWdQueueCounters &c,
+            uint64_t sincePoll, std::vector<PauseEstimate> &estimates);
+
+    uint32_t m_pollInterval = 0;
+    uint64_t m_lastPoll = 0;
+
+    std::vector<sai_object_id_t> m_queues;
+    std::vector<uint32_t> m_detectionTime;
+    std::vector<uint32_t> m_restorationTime;
+    std::vector<int64_t> m_timeLeft;
+    std::vector<bool> m_alert;
+    std::vector<bool> m_history;
+    std::vector<bool> m_stormed;
+    std::vector<bool> m_held;
+    std::vector<PfcWdQueueCounters> m_last;
+};
+
+#endif
@@ -1,5 +1,6 @@
 #include <limits.h>
 #include <inttypes.h>
+#include <chrono>
 #include <unordered_map>
 #include "pfcwdorch.h"
 #include "sai_serialize.h"
@@ -354,6 +355,16 @@ task_process_status PfcWdSwOrch<DropHandler, ForwardHandler>::createEntry(const
             if (field == POLL_INTERVAL_FIELD)
             {
                 this->m_pfcwdFlexCounterManager->updateGroupPollingInterval(stoi(value));
+
+                if (m_nativeDetection)
+                {
+                    m_pollInterval = stoi(value);
+                    m_detector.setPollInterval(static_cast<uint32_t>(m_pollInterval));
+
+                    auto interv = timespec { .tv_sec = m_pollInterval / 1000, .tv_nsec = (m_pollInterval % 1000) * 1000000 };
+                    m_detectionTimer->setInterval(interv);
+                    m_detectionTimer->reset();
+                }
             }
             else if (field == BIG_RED_SWITCH_FIELD)
             {
@@ -397,6 +408,9 @@ void PfcWdSwOrch<DropHandler, ForwardHandler>::disableBigRedSwitchMode()
     SWSS_LOG_ENTER();
 
     m_bigRedSwitchFlag = false;
+    // The counters were not evaluated while in BIG_RED_SWITCH mode
+    m_detector.reset();
+
     // Disable pfcwdaction handler on each queue if exists.
     for (auto &entry : m_brsEntryMap)
     {
@@ -596,6 +610,12 @@ bool PfcWdSwOrch<DropHandler, ForwardHandler>::registerInWdDb(const Port& port,
         // Create internal entry
         m_entryMap.emplace(queueId, PfcWdQueueEntry(action, port.m_port_id, i, port.m_alias));
 
+        if (m_nativeDetection)
+        {
+            m_detector.addQueue(queueId, detectionTime, restorationTime,
+                    action == PfcWdAction::PFC_WD_ACTION_ALERT, pfcStatHistory == "enable");
+        }
+
         // Initialize PFC WD related counters
         PfcWdActionHandler::initWdCounters(
                 this->getCountersTable(),
@@ -663,6 +683,7 @@ void PfcWdSwOrch<DropHandler, ForwardHandler>::unregisterFromWdDb(const Port& po
         }
 
         m_entryMap.erase(queueId);
+        m_detector.removeQueue(queueId);
 
         // Clean up
         string countersKey = this->getCountersTable()->getTableName() + this->getCountersTable()->getTableNameSeparator() + sai_serialize_object_id(queueId);
@@ -678,14 +699,16 @@ PfcWdSwOrch<DropHandler, ForwardHandler>::PfcWdSwOrch(
         const vector<sai_port_stat_t> &portStatIds,
         const vector<sai_queue_stat_t> &queueStatIds,
         const vector<sai_queue_attr_t> &queueAttrIds,
-        int pollInterval):
+        int pollInterval,
+        bool nativeDetection):
     PfcWdOrch<DropHandler, ForwardHandler>(db, tableNames),
     c_portStatIds(portStatIds),
     c_queueStatIds(queueStatIds),
     c_queueAttrIds(queueAttrIds),
     m_pollInterval(pollInterval),
     m_applDb(make_shared<DBConnector>("APPL_DB", 0)),
-    m_applTable(make_shared<Table>(m_applDb.get(), APP_PFC_WD_TABLE_NAME "_INSTORM"))
+    m_applTable(make_shared<Table>(m_applDb.get(), APP_PFC_WD_TABLE_NAME "_INSTORM")),
+    m_nativeDetection(nativeDetection)
 {
     SWSS_LOG_ENTER();
 
@@ -700,22 +723,31 @@ PfcWdSwOrch<DropHandler, ForwardHandler>::PfcWdSwOrch(
         restorePluginName = "pfc_restore.lua";
     }
 
-    try
+    if (m_nativeDetection)
     {
-        string detectLuaScript = swss::loadLuaScript(detectPluginName);
-        detectSha = swss::loadRedisScript(
-                this->getCountersDb().get(),
-                detectLuaScript);
-
-        string restoreLuaScript = swss::loadLuaScript(restorePluginName);
-        restoreSha = swss::loadRedisScript(
-                this->getCountersDb().get(),
-                restoreLuaScript);
-        plugins = detectSha + "," + restoreSha;
+        // No plugins, the counters polled by the flex counter group are evaluated by detectStorms()
+        SWSS_LOG_NOTICE("PFC watchdog storms are detected by orchagent instead of %s and %s",
+                detectPluginName.c_str(), restorePluginName.c_str());
     }
-    catch (...)
+    else
     {
-        SWSS_LOG_WARN("Lua scripts and polling interval for PFC watchdog were not set successfully");
+        try
+        {
+            string detectLuaScript = swss::loadLuaScript(detectPluginName);
+            detectSha = swss::loadRedisScript(
+                    this->getCountersDb().get(),
+                    detectLuaScript);
+
+            string restoreLuaScript = swss::loadLuaScript(restorePluginName);
+            restoreSha = swss::loadRedisScript(
+                    this->getCountersDb().get(),
+                    restoreLuaScript);
+            plugins = detectSha + "," + restoreSha;
+        }
+        catch (...)
+        {
+            SWSS_LOG_WARN("Lua scripts and polling interval for PFC watchdog were not set successfully");
+        }
     }
 
     this->m_pfcwdFlexCounterManager = make_shared<FlexCounterTaggedCachedManager<sai_object_type_t>>(
@@ -733,6 +765,26 @@ PfcWdSwOrch<DropHandler, ForwardHandler>::PfcWdSwOrch(
     Orch::addExecutor(executor);
     timer->start();
 
+    if (m_nativeDetection)
+    {
+        m_detector.setPollInterval(static_cast<uint32_t>(m_pollInterval));
+        m_countersPipeline = make_shared<RedisPipeline>(this->getCountersDb().get());
+
+        for (const auto &stat : counterIdsToStr(c_portStatIds, &sai_serialize_port_stat))
+        {
+            if (stat.find("_RX_PAUSE_DURATION_US") != string::npos)
+            {
+                m_pauseDurationPolled = true;
+            }
+        }
+
+        auto detectionInterv = timespec { .tv_sec = m_pollInterval / 1000, .tv_nsec = (m_pollInterval % 1000) * 1000000 };
+        m_detectionTimer = new SelectableTimer(detectionInterv);
+        auto detectionExecutor = new ExecutableTimer(m_detectionTimer, this, "PFC_WD_DETECTION_POLL");
+        Orch::addExecutor(detectionExecutor);
+        m_detectionTimer->start();
+    }
+
     auto ssTable = new swss::SubscriberStateTable(
             m_applDb.get(), APP_PFC_WD_TABLE_NAME, TableConsumable::DEFAULT_POP_BATCH_SIZE, default_orch_pri);
     auto ssConsumer = new Consumer(ssTable, this, APP_PFC_WD_TABLE_NAME);
@@ -921,6 +973,12 @@ void PfcWdSwOrch<DropHandler, ForwardHandler>::doTask(SelectableTimer &timer)
 {
     SWSS_LOG_ENTER();
 
+    if (&timer == m_detectionTimer)
+    {
+        detectStorms();
+        return;
+    }
+
     for (auto& handlerPair : m_entryMap)
     {
         if (handlerPair.second.handler != nullptr)
@@ -931,6 +989,184 @@ void PfcWdSwOrch<DropHandler, ForwardHandler>::doTask(SelectableTimer &timer)
 
 }
 
+template <typename DropHandler, typename ForwardHandler>
+void PfcWdSwOrch<DropHandler, ForwardHandler>::detectStorms()
+{
+    SWSS_LOG_ENTER();
+
+    // Same as the plugins, the queues are not watched in BIG_RED_SWITCH mode
+    if (m_bigRedSwitchFlag || m_detector.getQueues().empty())
+    {
+        return;
+    }
+
+    const auto &queues = m_detector.getQueues();
+    vector<PfcWdQueueCounters> counters(queues.size());
+    vector<bool> stormed(queues.size(), false);
+
+    readDetectionCounters(counters);
+
+    for (size_t i = 0; i < queues.size(); i++)
+    {
+        auto entry = m_entryMap.find(queues[i]);
+        stormed[i] = entry != m_entryMap.end() && entry->second.handler != nullptr;
+    }
+
+    uint64_t now = static_cast<uint64_t>(chrono::duration_cast<chrono::microseconds>(
+            chrono::system_clock::now().time_since_epoch()).count());
+
+    vector<PfcWdDetector::Transition> transitions;
+    vector<PfcWdDetector::PauseEstimate> estimates;
+    m_detector.update(counters, stormed, now, transitions, estimates);
+
+    writePauseEstimates(estimates);
+
+    for (const auto &transition : transitions)
+    {
+        string event = transition.event == PfcWdDetector::Event::STORM ? PFC_WD_IN_STORM : "restore";
+
+        if (!startWdActionOnQueue(event, transition.queueId))
+        {
+            SWSS_LOG_ERROR("Failed to start PFC watchdog %s event action on queue 0x%" PRIx64,
+                    event.c_str(), transition.queueId);
+        }
+    }
+}
+
+template <typename DropHandler, typename ForwardHandler>
+void PfcWdSwOrch<DropHandler, ForwardHandler>::readDetectionCounters(vector<PfcWdQueueCounters> &counters)
+{
+    SWSS_LOG_ENTER();
+
+    const auto &queues = m_detector.getQueues();
+    redisContext *ctx = this->getCountersDb()->getContext();
+    string prefix = this->getCountersTable()->getTableName() + this->getCountersTable()->getTableNameSeparator();
+
+    // Read the counters of all the queues in one round trip, pipelining
+    // an HMGET of the queue and one of its port per queue
+    vector<bool> requested(queues.size(), false);
+
+    for (size_t i = 0; i < queues.size(); i++)
+    {
+        auto entry = m_entryMap.find(queues[i]);
+        if (entry == m_entryMap.end())
+        {
+            continue;
+        }
+
+        string queueKey = prefix + sai_serialize_object_id(queues[i]);
+        string portKey = prefix + sai_serialize_object_id(entry->second.portId);
+        string pfcPrefix = SAI_PORT_STAT_PFC_PREFIX + to_string(entry->second.index);
+        string rxField = pfcPrefix + "_RX_PKTS";
+        string on2OffField = pfcPrefix + "_ON2OFF_RX_PKTS";
+
+        const char *queueArgv[] = { "HMGET", queueKey.c_str(),
+            "SAI_QUEUE_STAT_PACKETS", "SAI_QUEUE_ATTR_PAUSE_STATUS", "DEBUG_STORM" };
+        const char *portArgv[] = { "HMGET", portKey.c_str(), rxField.c_str(), on2OffField.c_str() };
+
+        redisAppendCommandArgv(ctx, 5, queueArgv, NULL);
+        redisAppendCommandArgv(ctx, 4, portArgv, NULL);
+        requested[i] = true;
+    }
+
+    for (size_t i = 0; i < queues.size(); i++)
+    {
+        if (!requested[i])
+        {
+            continue;
+        }
+
+        redisReply *queueReply = NULL;
+        redisReply *portReply = NULL;
+        if (redisGetReply(ctx, reinterpret_cast<void **>(&queueReply)) != REDIS_OK
+            || redisGetReply(ctx, reinterpret_cast<void **>(&portReply)) != REDIS_OK)
+        {
+            SWSS_LOG_THROW("Failed to read the PFC watchdog counters: %s", ctx->errstr);
+        }
+
+        RedisReply queueCounters(queueReply);
+        RedisReply portCounters(portReply);
+
+        if (queueReply->type != REDIS_REPLY_ARRAY || queueReply->elements != 3
+            || portReply->type != REDIS_REPLY_ARRAY || portReply->elements != 2)
+        {
+            continue;
+        }
+
+        auto packets = queueReply->element[0];
+        auto pauseStatus = queueReply->element[1];
+        auto debugStorm = queueReply->element[2];
+        auto pfcRxPackets = portReply->element[0];
+        auto pfcOn2OffRxPackets = portReply->element[1];
+
+        // Not polled yet
+        if (packets->type != REDIS_REPLY_STRING || pauseStatus->type != REDIS_REPLY_STRING
+            || pfcRxPackets->type != REDIS_REPLY_STRING || pfcOn2OffRxPackets->type != REDIS_REPLY_STRING)
+        {
+            continue;
+        }
+
+        auto &c = counters[i];
+        c.valid = true;
+        c.packets = strtoull(packets->str, NULL, 10);
+        c.pfcRxPackets = strtoull(pfcRxPackets->str, NULL, 10);
+        c.pfcOn2OffRxPackets = strtoull(pfcOn2OffRxPackets->str, NULL, 10);
+        c.paused = string(pauseStatus->str) == "true";
+        c.debugStorm = debugStorm->type == REDIS_REPLY_STRING && string(debugStorm->str) == "enabled";
+    }
+}
+
+template <typename DropHandler, typename ForwardHandler>
+void PfcWdSwOrch<DropHandler, ForwardHandler>::writePauseEstimates(const vector<PfcWdDetector::PauseEstimate> &estimates)
+{
+    SWSS_LOG_ENTER();
+
+    if (estimates.empty())
+    {
+        return;
+    }
+
+    string prefix = this->getCountersTable()->getTableName() + this->getCountersTable()->getTableNameSeparator();
+
+    // Same fields as the ones estimated by the plugins
+    for (const auto &estimate : estimates)
+    {
+        auto entry = m_entryMap.find(estimate.queueId);
+        if (entry == m_entryMap.end())
+        {
+            continue;
+        }
+
+        string portKey = prefix + sai_serialize_object_id(entry->second.portId);
+        string estPrefix = "EST_PORT_STAT_PFC_" + to_string(entry->second.index);
+        string recentTimeField = estPrefix + "_RECENT_PAUSE_TIME_US";
+        RedisCommand cmd;
+
+        if (estimate.restart)
+        {
+            cmd.format("HSET %s %s %s", portKey.c_str(), (estPrefix + "_RECENT_PAUSE_TIMESTAMP").c_str(),
+                    to_string(estimate.lastPoll).c_str());
+            m_countersPipeline->push(cmd, REDIS_REPLY_INTEGER);
+            cmd.format("HSET %s %s 0", portKey.c_str(), recentTimeField.c_str());
+            m_countersPipeline->push(cmd, REDIS_REPLY_INTEGER);
+        }
+
+        cmd.format("HINCRBY %s %s %s", portKey.c_str(), recentTimeField.c_str(),
+                to_string(estimate.pauseTime).c_str());
+        m_countersPipeline->push(cmd, REDIS_REPLY_INTEGER);
+
+        // The total is only estimated when not polled
+        if (!m_pauseDurationPolled)
+        {
+            cmd.format("HINCRBY %s %s %s", portKey.c_str(), (estPrefix + "_RX_PAUSE_DURATION_US").c_str(),
+                    to_string(estimate.pauseTime).c_str());
+            m_countersPipeline->push(cmd, REDIS_REPLY_INTEGER);
+        }
+    }
+
+    m_countersPipeline->flush();
+}
+
 template <typename DropHandler, typename ForwardHandler>
 void PfcWdSwOrch<DropHandler, ForwardHandler>::report_pfc_storm(
         sai_object_id_t id, const PfcWdQueueEntry *entry, const string &info)
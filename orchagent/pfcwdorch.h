@@ -4,6 +4,7 @@
 #include "orch.h"
 #include "port.h"
 #include "pfcactionhandler.h"
+#include "pfcwddetector.h"
 #include "producertable.h"
 #include "notificationconsumer.h"
 #include "timer.h"
@@ -84,7 +85,8 @@ public:
             const vector<sai_port_stat_t> &portStatIds,
             const vector<sai_queue_stat_t> &queueStatIds,
             const vector<sai_queue_attr_t> &queueAttrIds,
-            int pollInterval);
+            int pollInterval,
+            bool nativeDetection = false);
     virtual ~PfcWdSwOrch(void);
 
     void doTask(Consumer& consumer) override;
@@ -134,6 +136,10 @@ private:
 
     void report_pfc_storm(sai_object_id_t id, const PfcWdQueueEntry *, const string&);
 
+    void detectStorms();
+    void readDetectionCounters(vector<PfcWdQueueCounters> &counters);
+    void writePauseEstimates(const vector<PfcWdDetector::PauseEstimate> &estimates);
+
     map<sai_object_id_t, PfcWdQueueEntry> m_entryMap;
     map<sai_object_id_t, PfcWdQueueEntry> m_brsEntryMap;
 
@@ -147,6 +153,13 @@ private:
     shared_ptr<DBConnector> m_applDb = nullptr;
     // Track queues in storm
     shared_ptr<Table> m_applTable = nullptr;
+
+    // Storms detected in orchagent instead of by the plugins run by syncd
+    bool m_nativeDetection = false;
+    PfcWdDetector m_detector;
+    SelectableTimer *m_detectionTimer = nullptr;
+    shared_ptr<RedisPipeline> m_countersPipeline = nullptr;
+    bool m_pauseDurationPolled = false;
 };
 
 #endif
@@ -0,0 +1,84 @@
+#ifndef SWSS_TASKSLICER_H
+#define SWSS_TASKSLICER_H
+
+#include <algorithm>
+#include <chrono>
+#include <functional>
+#include <utility>
+#include <vector>
+
+/*
+ * Runs the items of a task pass by decreasing priority within a time slice.
+ *
+ * Items at or above the urgent priority always run. The others run until the
+ * slice of the pass is used up and are deferred past that point, the next pass
+ * then starts with the first deferred item. At least one of them runs per pass,
+ * so bulk tables still make progress but never hold urgent ones back for more
+ * than a single step.
+ */
+template <typename T>
+class TaskSlicer
+{
+public:
+    TaskSlicer(int urgentPri) : m_urgentPri(urgentPri)
+    {
+    }
+
+    /* Insert after the items of the same priority, keeping their order */
+    void add(T item, int pri)
+    {
+        auto it = std::upper_bound(m_items.begin(), m_items.end(), pri,
+                                   [](int p, const std::pair<T, int> &e) { return p > e.second; });
+        m_items.emplace(it, std::move(item), pri);
+        m_next = 0;
+    }
+
+    void clear()
+    {
+        m_items.clear();
+        m_next = 0;
+    }
+
+    size_t size() const { return m_items.size(); }
+
+    /* Index of the first item run by the next pass among the non urgent ones */
+    size_t getNext() const { return m_next; }
+
+    /* Returns the number of items deferred to the next pass */
+    size_t run(int sliceMsecs, const std::function<void(T &)> &func)
+    {
+        auto start = std::chrono::steady_clock::now();
+
+        size_t urgent = 0;
+        while (urgent < m_items.size() && m_items[urgent].second >= m_urgentPri)
+        {
+            func(m_items[urgent].first);
+            urgent++;
+        }
+
+        size_t count = m_items.size() - urgent;
+        for (size_t i = 0; i < count; i++)
+        {
+            size_t index = (m_next + i) % count;
+
+            if (i > 0 && sliceMsecs > 0
+                && std::chrono::steady_clock::now() - start >= std::chrono::milliseconds(sliceMsecs))
+            {
+                m_next = index;
+                return count - i;
+            }
+
+            func(m_items[urgent + index].first);
+        }
+
+        m_next = 0;
+        return 0;
+    }
+
+private:
+    int m_urgentPri;
+    std::vector<std::pair<T, int>> m_items;
+    size_t m_next = 0;
+};
+
+#endif /* SWSS_TASKSLICER_H */
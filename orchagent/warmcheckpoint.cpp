@@ -0,0 +1,390 @@
+#include <errno.h>
+#include <fcntl.h>
+#include <inttypes.h>
+#include <string.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include <set>
+
+#include "warmcheckpoint.h"
+#include "logger.h"
+
+using namespace std;
+using namespace swss;
+
+#define WARM_CHECKPOINT_HEADER_SIZE 24
+
+#define FNV_OFFSET_BASIS 2166136261u
+#define FNV_PRIME        16777619u
+
+static uint32_t fnv1a(uint32_t hash, const char *data, size_t len)
+{
+    for (size_t i = 0; i < len; i++)
+    {
+        hash ^= static_cast<uint8_t>(data[i]);
+        hash *= FNV_PRIME;
+    }
+    return hash;
+}
+
+WarmCheckpointWriter::WarmCheckpointWriter(const string &path) :
+    m_path(path),
+    m_tmpPath(path + ".tmp"),
+    m_checksum(FNV_OFFSET_BASIS)
+{
+    SWSS_LOG_ENTER();
+
+    m_file = fopen(m_tmpPath.c_str(), "wb");
+    if (!m_file)
+    {
+        SWSS_LOG_ERROR("Failed to open warm checkpoint %s: %s", m_tmpPath.c_str(), strerror(errno));
+        return;
+    }
+
+    // Completed by commit()
+    char header[WARM_CHECKPOINT_HEADER_SIZE] = {};
+    if (fwrite(header, 1, sizeof(header), m_file) != sizeof(header))
+    {
+        m_failed = true;
+    }
+}
+
+WarmCheckpointWriter::~WarmCheckpointWriter()
+{
+    if (m_file)
+    {
+        fclose(m_file);
+        unlink(m_tmpPath.c_str());
+    }
+}
+
+void WarmCheckpointWriter::write(const void *data, size_t len)
+{
+    if (!m_file || m_failed)
+    {
+        return;
+    }
+
+    if (fwrite(data, 1, len, m_file) != len)
+    {
+        m_failed = true;
+        return;
+    }
+
+    m_size += len;
+    m_checksum = fnv1a(m_checksum, static_cast<const char *>(data), len);
+}
+
+void WarmCheckpointWriter::writeU32(uint32_t value)
+{
+    write(&value, sizeof(value));
+}
+
+void WarmCheckpointWriter::writeString(const string &str)
+{
+    writeU32(static_cast<uint32_t>(str.size()));
+    write(str.data(), str.size());
+}
+
+void WarmCheckpointWriter::addTable(const string &name, const vector<KeyOpFieldsValuesTuple> &entries)
+{
+    writeString(name);
+    writeU32(static_cast<uint32_t>(entries.size()));
+
+    for (const auto &entry : entries)
+    {
+        writeString(kfvKey(entry));
+
+        const auto &fvs = kfvFieldsValues(entry);
+        writeU32(static_cast<uint32_t>(fvs.size()));
+        for (const auto &fv : fvs)
+        {
+            writeString(fvField(fv));
+            writeString(fvValue(fv));
+        }
+    }
+
+    m_tableCount++;
+}
+
+bool WarmCheckpointWriter::commit()
+{
+    SWSS_LOG_ENTER();
+
+    if (!m_file)
+    {
+        return false;
+    }
+
+    uint32_t magic = WARM_CHECKPOINT_MAGIC;
+    uint32_t version = WARM_CHECKPOINT_VERSION;
+
+    char header[WARM_CHECKPOINT_HEADER_SIZE];
+    memcpy(header, &magic, 4);
+    memcpy(header + 4, &version, 4);
+    memcpy(header + 8, &m_size, 8);
+    memcpy(header + 16, &m_checksum, 4);
+    memcpy(header + 20, &m_tableCount, 4);
+
+    if (!m_failed)
+    {
+        m_failed = fseek(m_file, 0, SEEK_SET) != 0
+            || fwrite(header, 1, sizeof(header), m_file) != sizeof(header)
+            || fflush(m_file) != 0
+            || fsync(fileno(m_file)) != 0;
+    }
+
+    int ret = fclose(m_file);
+    m_file = nullptr;
+
+    if (m_failed || ret != 0 || rename(m_tmpPath.c_str(), m_path.c_str()) != 0)
+    {
+        SWSS_LOG_ERROR("Failed to write warm checkpoint %s: %s", m_path.c_str(), strerror(errno));
+        unlink(m_tmpPath.c_str());
+        return false;
+    }
+
+    SWSS_LOG_NOTICE("Wrote warm checkpoint %s, %u tables, %" PRIu64 " bytes",
+                    m_path.c_str(), m_tableCount, m_size + WARM_CHECKPOINT_HEADER_SIZE);
+    return true;
+}
+
+WarmCheckpoint::~WarmCheckpoint()
+{
+    unmap();
+}
+
+void WarmCheckpoint::unmap()
+{
+    if (m_data)
+    {
+        munmap(const_cast<char *>(m_data), m_size);
+        m_data = nullptr;
+        m_size = 0;
+    }
+    m_tables.clear();
+}
+
+bool WarmCheckpoint::readU32(size_t &offset, uint32_t &value) const
+{
+    if (m_size - offset < sizeof(value))
+    {
+        return false;
+    }
+
+    memcpy(&value, m_data + offset, sizeof(value));
+    offset += sizeof(value);
+    return true;
+}
+
+bool WarmCheckpoint::skipString(size_t &offset) const
+{
+    uint32_t len;
+    if (!readU32(offset, len) || m_size - offset < len)
+    {
+        return false;
+    }
+
+    offset += len;
+    return true;
+}
+
+bool WarmCheckpoint::readString(size_t &offset, string &str) const
+{
+    size_t start = offset;
+    if (!skipString(offset))
+    {
+        return false;
+    }
+
+    str.assign(m_data + start + sizeof(uint32_t), offset - start - sizeof(uint32_t));
+    return true;
+}
+
+bool WarmCheckpoint::skipEntries(size_t &offset, uint32_t count) const
+{
+    for (uint32_t i = 0; i < count; i++)
+    {
+        uint32_t fields;
+        if (!skipString(offset) || !readU32(offset, fields))
+        {
+            return false;
+        }
+
+        for (uint64_t j = 0; j < 2ULL * fields; j++)
+        {
+            if (!skipString(offset))
+            {
+                return false;
+            }
+        }
+    }
+    return true;
+}
+
+bool WarmCheckpoint::load(const string &path)
+{
+    SWSS_LOG_ENTER();
+
+    unmap();
+
+    int fd = open(path.c_str(), O_RDONLY);
+    if (fd < 0)
+    {
+        SWSS_LOG_NOTICE("No warm checkpoint %s: %s", path.c_str(), strerror(errno));
+        return false;
+    }
+
+    struct stat st;
+    if (fstat(fd, &st) != 0 || st.st_size < WARM_CHECKPOINT_HEADER_SIZE)
+    {
+        SWSS_LOG_ERROR("Invalid warm checkpoint %s", path.c_str());
+        close(fd);
+        return false;
+    }
+
+    void *data = mmap(nullptr, st.st_size, PROT_READ, MAP_PRIVATE, fd, 0);
+    close(fd);
+    if (data == MAP_FAILED)
+    {
+        SWSS_LOG_ERROR("Failed to map warm checkpoint %s: %s", path.c_str(), strerror(errno));
+        return false;
+    }
+
+    m_data = static_cast<const char *>(data);
+    m_size = st.st_size;
+
+    uint32_t magic, version, checksum, tableCount;
+    uint64_t payloadSize;
+    memcpy(&magic, m_data, 4);
+    memcpy(&version, m_data + 4, 4);
+    memcpy(&payloadSize, m_data + 8, 8);
+    memcpy(&checksum, m_data + 16, 4);
+    memcpy(&tableCount, m_data + 20, 4);
+
+    if (magic != WARM_CHECKPOINT_MAGIC || version != WARM_CHECKPOINT_VERSION)
+    {
+        SWSS_LOG_ERROR("Unsupported warm checkpoint %s, version %u", path.c_str(), version);
+        unmap();
+        return false;
+    }
+
+    if (payloadSize != m_size - WARM_CHECKPOINT_HEADER_SIZE
+        || fnv1a(FNV_OFFSET_BASIS, m_data + WARM_CHECKPOINT_HEADER_SIZE, payloadSize) != checksum)
+    {
+        SWSS_LOG_ERROR("Corrupted warm checkpoint %s", path.c_str());
+        unmap();
+        return false;
+    }
+
+    size_t offset = WARM_CHECKPOINT_HEADER_SIZE;
+    for (uint32_t i = 0; i < tableCount; i++)
+    {
+        string name;
+        TableIndex index;
+        if (!readString(offset, name) || !readU32(offset, index.count))
+        {
+            break;
+        }
+
+        index.offset = offset;
+        if (!skipEntries(offset, index.count))
+        {
+            break;
+        }
+        m_tables[name] = index;
+    }
+
+    if (m_tables.size() != tableCount || offset != m_size)
+    {
+        SWSS_LOG_ERROR("Malformed warm checkpoint %s", path.c_str());
+        unmap();
+        return false;
+    }
+
+    SWSS_LOG_NOTICE("Loaded warm checkpoint %s, %u tables", path.c_str(), tableCount);
+    return true;
+}
+
+bool WarmCheckpoint::getTable(const string &name, TableSnapshot &entries) const
+{
+    auto it = m_tables.find(name);
+    if (it == m_tables.end())
+    {
+        return false;
+    }
+
+    // Bounds were checked by load()
+    size_t offset = it->second.offset;
+    entries.reserve(it->second.count);
+    for (uint32_t i = 0; i < it->second.count; i++)
+    {
+        string key;
+        uint32_t count;
+        readString(offset, key);
+        readU32(offset, count);
+
+        auto &fvs = entries[key];
+        fvs.resize(count);
+        for (auto &fv : fvs)
+        {
+            readString(offset, fvField(fv));
+            readString(offset, fvValue(fv));
+        }
+    }
+
+    return true;
+}
+
+bool WarmCheckpoint::save(const string &path, const vector<Orch *> &orchs)
+{
+    SWSS_LOG_ENTER();
+
+    WarmCheckpointWriter writer(path);
+    if (!writer.isOpen())
+    {
+        return false;
+    }
+
+    set<string> saved;
+    for (auto *orch : orchs)
+    {
+        for (auto *selectable : orch->getSelectables())
+        {
+            auto *consumer = dynamic_cast<ConsumerBase *>(selectable);
+            if (!consumer)
+            {
+                continue;
+            }
+
+            string name = consumer->getSnapshotName();
+            if (name.empty() || !saved.insert(name).second)
+            {
+                continue;
+            }
+
+            auto *consumerTable = static_cast<ConsumerTableBase *>(consumer->getSelectable());
+            Table table(consumerTable->getDbConnector(), consumer->getTableName());
+
+            vector<KeyOpFieldsValuesTuple> entries;
+            vector<string> keys;
+            table.getKeys(keys);
+            entries.reserve(keys.size());
+            for (const auto &key : keys)
+            {
+                KeyOpFieldsValuesTuple kco;
+                kfvKey(kco) = key;
+                if (table.get(key, kfvFieldsValues(kco)))
+                {
+                    entries.push_back(std::move(kco));
+                }
+            }
+
+            writer.addTable(name, entries);
+        }
+    }
+
+    return writer.commit();
+}
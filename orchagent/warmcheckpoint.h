@@ -0,0 +1,101 @@
+#ifndef SWSS_WARMCHECKPOINT_H
+#define SWSS_WARMCHECKPOINT_H
+
+#include <cstdint>
+#include <cstdio>
+#include <map>
+#include <string>
+#include <vector>
+
+#include "orch.h"
+
+#define WARM_CHECKPOINT_MAGIC   0x53574350
+#define WARM_CHECKPOINT_VERSION 1
+
+/*
+ * Binary checkpoint of the tables consumed by orchagent, taken when it is
+ * frozen for warm restart and used in place of the tables by the refill of
+ * the consumers on the next start.
+ *
+ * Layout, integers in host byte order:
+ *   header:  u32 magic, u32 version, u64 payload size, u32 payload checksum,
+ *            u32 table count
+ *   table:   string name, u32 entry count, entries
+ *   entry:   string key, u32 field count, fields as string field, string value
+ *   string:  u32 length, bytes
+ *
+ * The writer streams into a temporary file renamed once complete, so a
+ * checkpoint is either whole or missing. A checkpoint from another version or
+ * host byte order, truncated or corrupted, is rejected as a whole.
+ */
+class WarmCheckpointWriter
+{
+public:
+    WarmCheckpointWriter(const std::string &path);
+    ~WarmCheckpointWriter();
+
+    // Disable copying
+    WarmCheckpointWriter(const WarmCheckpointWriter&) = delete;
+    WarmCheckpointWriter& operator=(const WarmCheckpointWriter&) = delete;
+
+    bool isOpen() const { return m_file != nullptr; }
+
+    void addTable(const std::string &name, const std::vector<swss::KeyOpFieldsValuesTuple> &entries);
+
+    /* Complete the header and move the checkpoint in place */
+    bool commit();
+
+private:
+    void write(const void *data, size_t len);
+    void writeU32(uint32_t value);
+    void writeString(const std::string &str);
+
+    std::string m_path;
+    std::string m_tmpPath;
+    FILE *m_file = nullptr;
+    bool m_failed = false;
+
+    uint64_t m_size = 0;
+    uint32_t m_checksum;
+    uint32_t m_tableCount = 0;
+};
+
+class WarmCheckpoint : public WarmStartSnapshot
+{
+public:
+    WarmCheckpoint() = default;
+    ~WarmCheckpoint();
+
+    // Disable copying
+    WarmCheckpoint(const WarmCheckpoint&) = delete;
+    WarmCheckpoint& operator=(const WarmCheckpoint&) = delete;
+
+    /* Memory map the checkpoint and index its tables, false if missing or invalid */
+    bool load(const std::string &path);
+
+    bool getTable(const std::string &name, TableSnapshot &entries) const override;
+
+    size_t getTableCount() const { return m_tables.size(); }
+
+    /* Checkpoint the consumer tables of the orchs */
+    static bool save(const std::string &path, const std::vector<Orch *> &orchs);
+
+private:
+    struct TableIndex
+    {
+        size_t offset;
+        uint32_t count;
+    };
+
+    void unmap();
+    bool skipEntries(size_t &offset, uint32_t count) const;
+    bool readU32(size_t &offset, uint32_t &value) const;
+    bool readString(size_t &offset, std::string &str) const;
+    bool skipString(size_t &offset) const;
+
+    const char *m_data = nullptr;
+    size_t m_size = 0;
+    std::map<std::string, TableIndex> m_tables;
+};
+
+#endif /* SWSS_WARMCHECKPOINT_H */
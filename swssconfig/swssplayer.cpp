@@ -1,8 +1,18 @@
+#include <algorithm>
+#include <chrono>
+#include <deque>
 #include <fstream>
+#include <iomanip>
 #include <iostream>
+#include <thread>
+#include <getopt.h>
+#include <time.h>
 
 #include <dbconnector.h>
+#include <notificationconsumer.h>
 #include <producerstatetable.h>
+#include <redisreply.h>
+#include <select.h>
 #include "zmqclient.h"
 #include "zmqproducerstatetable.h"
 #include "orch_zmq_config.h"
@@ -15,12 +25,70 @@ using namespace swss;
 static int line_index = 0;
 static DBConnector db("APPL_DB", 0, true);
 
+#define DEFAULT_WAIT_TIMEOUT  60
+#define DEFAULT_PIPELINE_SIZE 128
+
+typedef chrono::steady_clock Clock;
+
+/*
+ * Benchmark state of one table.
+ *
+ * An operation completes when orchagent publishes its response, i.e. once
+ * the SAI call of the entry returned and the object reached ASIC_DB. Several
+ * operations on a key may be merged by orchagent into a single response,
+ * which completes all of them. Tables without responses only complete when
+ * orchagent has consumed all their keys.
+ */
+struct TableStats
+{
+	size_t sent = 0;
+	size_t completed = 0;
+	bool responding = false;
+	Clock::time_point firstSent;
+	Clock::time_point consumed;
+	Clock::time_point lastCompleted;
+	vector<int64_t> latencies;
+	unordered_map<string, deque<Clock::time_point>> pending;
+	shared_ptr<NotificationConsumer> responses;
+};
+
+struct Benchmark
+{
+	bool enabled = false;
+	double speed = 0;
+	int waitTimeout = DEFAULT_WAIT_TIMEOUT;
+	string reportFile;
+
+	shared_ptr<DBConnector> stateDb;
+	shared_ptr<RedisPipeline> pipeline;
+	Select select;
+	map<string, TableStats> tables;
+};
+
 void usage()
 {
-	cout << "Usage: swssplayer <file>" << endl;
+	cout << "Usage: swssplayer [-b] [-s speed] [-t timeout] [-o report_file] <file>" << endl;
+	cout << "    -b: benchmark mode, report APPL_DB to ASIC_DB latency and throughput per table" << endl;
+	cout << "    -s speed: replay at <speed> times the recorded pace, 0 for as fast as possible (default 0)" << endl;
+	cout << "    -t timeout: seconds to wait for pending operations after the replay (default " << DEFAULT_WAIT_TIMEOUT << ")" << endl;
+	cout << "    -o report_file: also write the report as CSV to <report_file>" << endl;
 	/* TODO: Add sample input file */
 }
 
+/* Recorder timestamp, e.g. 2024-01-01.12:00:00.123456, in microseconds */
+int64_t parseTimestamp(const string &ts)
+{
+	struct tm tm = {};
+	const char *rest = strptime(ts.c_str(), "%Y-%m-%d.%H:%M:%S", &tm);
+	if (!rest || *rest != '.')
+	{
+		return -1;
+	}
+
+	tm.tm_isdst = -1;
+	return static_cast<int64_t>(mktime(&tm)) * 1000000 + atol(rest + 1);
+}
+
 vector<FieldValueTuple> processFieldsValuesTuple(string s)
 {
 	vector<FieldValueTuple> result;
@@ -28,6 +96,11 @@ vector<FieldValueTuple> processFieldsValuesTuple(string s)
 	auto tuples = tokenize(s, '|');
 	for (auto tuple : tuples)
 	{
+		if (tuple.empty())
+		{
+			continue;
+		}
+
 		auto v_tuple = tokenize(tuple, ':', 1);
 		auto field = v_tuple[0];
 		auto value = v_tuple.size() == 1 ? "" : v_tuple[1];
@@ -37,7 +110,7 @@ vector<FieldValueTuple> processFieldsValuesTuple(string s)
 	return result;
 }
 
-shared_ptr<ProducerStateTable> get_table(unordered_map<string, shared_ptr<ProducerStateTable>>& table_map, string table_name, set<string>  zmq_tables, std::shared_ptr<ZmqClient> zmq_client)
+shared_ptr<ProducerStateTable> get_table(unordered_map<string, shared_ptr<ProducerStateTable>>& table_map, string table_name, set<string>  zmq_tables, std::shared_ptr<ZmqClient> zmq_client, RedisPipeline *pipeline)
 {
     shared_ptr<ProducerStateTable> p_table= nullptr;
     auto findResult = table_map.find(table_name);
@@ -46,6 +119,9 @@ shared_ptr<ProducerStateTable> get_table(unordered_map<string, shared_ptr<Produc
         if ((zmq_tables.find(table_name) != zmq_tables.end()) && (zmq_client != nullptr)) {
             p_table = make_shared<ZmqProducerStateTable>(&db, table_name, *zmq_client, true);
         }
+        else if (pipeline != nullptr) {
+            p_table = make_shared<ProducerStateTable>(pipeline, table_name, true);
+        }
         else {
             p_table = make_shared<ProducerStateTable>(&db, table_name);
         }
@@ -60,16 +136,186 @@ shared_ptr<ProducerStateTable> get_table(unordered_map<string, shared_ptr<Produc
     return p_table;
 }
 
-void processTokens(vector<string> tokens, unordered_map<string, shared_ptr<ProducerStateTable>>& table_map, set<string>  zmq_tables, std::shared_ptr<ZmqClient> zmq_client)
+TableStats &getTableStats(Benchmark &bench, const string &table_name)
+{
+	auto it = bench.tables.find(table_name);
+	if (it != bench.tables.end())
+	{
+		return it->second;
+	}
+
+	/* Subscribe before the first operation is sent */
+	auto &stats = bench.tables[table_name];
+	stats.responses = make_shared<NotificationConsumer>(bench.stateDb.get(), "APPL_DB_" + table_name + "_RESPONSE_CHANNEL");
+	bench.select.addSelectable(stats.responses.get());
+	return stats;
+}
+
+void completeKey(TableStats &stats, const string &key, Clock::time_point now)
+{
+	auto it = stats.pending.find(key);
+	if (it == stats.pending.end())
+	{
+		return;
+	}
+
+	for (auto sent : it->second)
+	{
+		stats.latencies.push_back(chrono::duration_cast<chrono::microseconds>(now - sent).count());
+		stats.completed++;
+	}
+	stats.pending.erase(it);
+	stats.lastCompleted = now;
+}
+
+void processResponses(Benchmark &bench, int timeout)
+{
+	Selectable *sel;
+	while (bench.select.select(&sel, timeout) == Select::OBJECT)
+	{
+		auto now = Clock::now();
+		for (auto &table : bench.tables)
+		{
+			auto &stats = table.second;
+			if (stats.responses.get() != sel)
+			{
+				continue;
+			}
+
+			/* The status code is the operation, the key the data */
+			string status, key;
+			vector<FieldValueTuple> values;
+			while (stats.responses->peek() > 0)
+			{
+				stats.responses->pop(status, key, values);
+				stats.responding = true;
+				completeKey(stats, key, now);
+			}
+		}
+		timeout = 0;
+	}
+}
+
+bool isTableConsumed(const string &table_name)
+{
+	RedisCommand scard;
+	scard.format("SCARD %s_KEY_SET", table_name.c_str());
+	RedisReply r(&db, scard, REDIS_REPLY_INTEGER);
+	return r.getContext()->integer == 0;
+}
+
+void waitForCompletion(Benchmark &bench)
+{
+	auto deadline = Clock::now() + chrono::seconds(bench.waitTimeout);
+	while (Clock::now() < deadline)
+	{
+		processResponses(bench, 100);
+
+		bool done = true;
+		for (auto &table : bench.tables)
+		{
+			auto &stats = table.second;
+			if (stats.pending.empty())
+			{
+				continue;
+			}
+
+			/*
+			 * Tables without responses complete once orchagent popped all their
+			 * keys, responses may still be on their way for a short while.
+			 */
+			if (!stats.responding && isTableConsumed(table.first))
+			{
+				auto now = Clock::now();
+				if (stats.consumed == Clock::time_point())
+				{
+					stats.consumed = now;
+				}
+				else if (now - stats.consumed >= chrono::seconds(1))
+				{
+					while (!stats.pending.empty())
+					{
+						completeKey(stats, stats.pending.begin()->first, stats.consumed);
+					}
+					continue;
+				}
+			}
+			done = false;
+		}
+
+		if (done)
+		{
+			return;
+		}
+	}
+}
+
+int64_t percentile(const vector<int64_t> &sorted, unsigned int pct)
+{
+	if (sorted.empty())
+	{
+		return 0;
+	}
+	return sorted[min(sorted.size() - 1, (sorted.size() * pct + 99) / 100 - 1)];
+}
+
+void report(Benchmark &bench)
+{
+	ofstream csv;
+	if (!bench.reportFile.empty())
+	{
+		csv.open(bench.reportFile);
+		csv << "table,mode,sent,completed,ops_per_sec,p50_usecs,p90_usecs,p99_usecs,max_usecs" << endl;
+	}
+
+	cout << left << setw(32) << "TABLE" << right << setw(9) << "MODE" << setw(10) << "SENT"
+	     << setw(10) << "DONE" << setw(10) << "OPS/S" << setw(10) << "P50(us)" << setw(10) << "P90(us)"
+	     << setw(10) << "P99(us)" << setw(10) << "MAX(us)" << endl;
+
+	for (auto &table : bench.tables)
+	{
+		auto &stats = table.second;
+		sort(stats.latencies.begin(), stats.latencies.end());
+
+		double secs = chrono::duration<double>(stats.lastCompleted - stats.firstSent).count();
+		auto ops = static_cast<int64_t>(secs > 0 ? stats.completed / secs : 0);
+		string mode = stats.responding ? "response" : "consumed";
+
+		cout << left << setw(32) << table.first << right << setw(9) << mode << setw(10) << stats.sent
+		     << setw(10) << stats.completed << setw(10) << ops;
+		cout << setw(10) << percentile(stats.latencies, 50) << setw(10) << percentile(stats.latencies, 90)
+		     << setw(10) << percentile(stats.latencies, 99) << setw(10) << percentile(stats.latencies, 100) << endl;
+
+		if (csv.is_open())
+		{
+			csv << table.first << "," << mode << "," << stats.sent << "," << stats.completed << "," << ops << ","
+			    << percentile(stats.latencies, 50) << "," << percentile(stats.latencies, 90) << ","
+			    << percentile(stats.latencies, 99) << "," << percentile(stats.latencies, 100) << endl;
+		}
+	}
+}
+
+void processTokens(vector<string> tokens, unordered_map<string, shared_ptr<ProducerStateTable>>& table_map, set<string>  zmq_tables, std::shared_ptr<ZmqClient> zmq_client, Benchmark &bench)
 {
 	auto key = tokens[1];
 
 	/* Process the key */
 	auto v_key = tokenize(key, ':', 1);
 	auto table_name = v_key[0];
-	auto key_name = v_key[1];
+	auto key_name = v_key.size() == 1 ? "" : v_key[1];
+
+	auto p_producer= get_table(table_map, table_name, zmq_tables, zmq_client, bench.pipeline.get());
 
-	auto p_producer= get_table(table_map, table_name, zmq_tables, zmq_client);
+	if (bench.enabled)
+	{
+		auto &stats = getTableStats(bench, table_name);
+		auto now = Clock::now();
+		if (stats.sent++ == 0)
+		{
+			stats.firstSent = now;
+		}
+		stats.pending[key_name].push_back(now);
+	}
 
 	/* Process the operation */
 	auto op = tokens[2];
@@ -86,15 +332,55 @@ void processTokens(vector<string> tokens, unordered_map<string, shared_ptr<Produ
 
 int main(int argc, char **argv)
 {
-	if (argc != 2)
+	Benchmark bench;
+
+	int opt;
+	while ((opt = getopt(argc, argv, "bs:t:o:h")) != -1)
+	{
+		switch (opt)
+		{
+		case 'b':
+			bench.enabled = true;
+			break;
+		case 's':
+			bench.speed = atof(optarg);
+			break;
+		case 't':
+			bench.waitTimeout = atoi(optarg);
+			break;
+		case 'o':
+			bench.reportFile = optarg;
+			break;
+		default:
+			usage();
+			exit(EXIT_FAILURE);
+		}
+	}
+
+	if (optind != argc - 1 || bench.speed < 0)
 	{
 		usage();
 		exit(EXIT_FAILURE);
 	}
 
-	ifstream file(argv[1]);
+	ifstream file(argv[optind]);
+	if (!file)
+	{
+		cerr << "Failed to open " << argv[optind] << endl;
+		exit(EXIT_FAILURE);
+	}
 	string line;
 
+	if (bench.enabled)
+	{
+		bench.stateDb = make_shared<DBConnector>("APPL_STATE_DB", 0, true);
+		/* Paced replays send every operation right away to keep the timing */
+		if (bench.speed == 0)
+		{
+			bench.pipeline = make_shared<RedisPipeline>(&db, DEFAULT_PIPELINE_SIZE);
+		}
+	}
+
     auto zmq_tables = load_zmq_tables();
     std::shared_ptr<ZmqClient> zmq_client = nullptr;
     if (zmq_tables.size() > 0)
@@ -103,11 +389,58 @@ int main(int argc, char **argv)
     }
 
     unordered_map<string, shared_ptr<ProducerStateTable>> table_map;
+	int64_t firstTimestamp = -1;
+	auto start = Clock::now();
 	while (getline(file, line))
 	{
 		auto tokens = tokenize(line, '|', 3);
-		processTokens(tokens, table_map, zmq_tables, zmq_client);
-
 		line_index++;
+
+		/* Skip recorder markers, e.g. recording started */
+		if (tokens.size() < 3 || (tokens[2] != SET_COMMAND && tokens[2] != DEL_COMMAND))
+		{
+			continue;
+		}
+
+		if (bench.speed > 0)
+		{
+			auto timestamp = parseTimestamp(tokens[0]);
+			if (firstTimestamp < 0)
+			{
+				firstTimestamp = timestamp;
+			}
+			if (timestamp >= 0 && timestamp >= firstTimestamp)
+			{
+				auto target = start + chrono::microseconds(static_cast<int64_t>((timestamp - firstTimestamp) / bench.speed));
+				while (bench.enabled && Clock::now() < target)
+				{
+					auto wait = chrono::duration_cast<chrono::milliseconds>(target - Clock::now()).count();
+					processResponses(bench, static_cast<int>(wait));
+				}
+				this_thread::sleep_until(target);
+			}
+		}
+
+		if (tokens.size() == 3)
+		{
+			tokens.push_back("");
+		}
+		processTokens(tokens, table_map, zmq_tables, zmq_client, bench);
+
+		if (bench.enabled && line_index % DEFAULT_PIPELINE_SIZE == 0)
+		{
+			processResponses(bench, 0);
+		}
+	}
+
+	if (bench.enabled)
+	{
+		if (bench.pipeline)
+		{
+			bench.pipeline->flush();
+		}
+
+		waitForCompletion(bench);
+		report(bench);
 	}
 }
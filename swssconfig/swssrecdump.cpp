@@ -0,0 +1,69 @@
+#include <getopt.h>
+
+#include <fstream>
+#include <iostream>
+
+#include "recorder.h"
+
+using namespace std;
+using namespace swss;
+
+void usage()
+{
+    cout << "Usage: swssrecdump [-o output_file] <file>..." << endl;
+    cout << "    Convert binary recordings, e.g. swss.rec.bin, to the text format replayed by swssplayer" << endl;
+    cout << "    -o output_file: write to <output_file> instead of the standard output" << endl;
+}
+
+int main(int argc, char **argv)
+{
+    string output;
+    int opt;
+
+    while ((opt = getopt(argc, argv, "o:h")) != -1)
+    {
+        switch (opt)
+        {
+        case 'o':
+            output = optarg;
+            break;
+        case 'h':
+            usage();
+            return EXIT_SUCCESS;
+        default:
+            usage();
+            return EXIT_FAILURE;
+        }
+    }
+
+    if (optind >= argc)
+    {
+        usage();
+        return EXIT_FAILURE;
+    }
+
+    ofstream file;
+    if (!output.empty())
+    {
+        file.open(output);
+        if (!file.is_open())
+        {
+            cerr << "Failed to open " << output << endl;
+            return EXIT_FAILURE;
+        }
+    }
+    ostream &out = output.empty() ? cout : file;
+
+    int ret = EXIT_SUCCESS;
+    for (int i = optind; i < argc; i++)
+    {
+        // Records before an invalid or truncated part are still converted
+        if (!convertBinaryRecording(argv[i], out))
+        {
+            cerr << "Failed to fully convert " << argv[i] << endl;
+            ret = EXIT_FAILURE;
+        }
+    }
+
+    return ret;
+}
@@ -18,7 +18,7 @@ from datetime import datetime
 
 from swsscommon import swsscommon
 from dvslib.dvs_database import DVSDatabase
-from dvslib.dvs_common import PollingConfig, wait_for_result
+from dvslib.dvs_common import PollingConfig, wait_for_result, get_wait_statistics
 from dvslib.dvs_acl import DVSAcl
 from dvslib.dvs_pbh import DVSPbh
 from dvslib.dvs_route import DVSRoute
@@ -120,6 +120,27 @@ def pytest_addoption(parser):
                      type=str,
                      help="Set switch mode information")
 
+    parser.addoption("--wait-stats",
+                     action="store",
+                     default=0,
+                     type=int,
+                     help="Report the N tests that spent the most time in wait_for_result")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    num_tests = config.getoption("--wait-stats")
+    if not num_tests:
+        return
+
+    stats = sorted(get_wait_statistics().items(), key=lambda item: item[1].wait_time, reverse=True)
+
+    terminalreporter.section("wait_for_result statistics")
+    terminalreporter.write_line(f"{'wait (s)':>10} {'calls':>7} {'polls':>9} {'timeouts':>9}  test")
+    for test_id, stat in stats[:num_tests]:
+        terminalreporter.write_line(
+            f"{stat.wait_time:10.2f} {stat.calls:7d} {stat.polls:9d} {stat.timeouts:9d}  {test_id}"
+        )
+
 
 def random_string(size=4, chars=string.ascii_uppercase + string.digits):
     return "".join(random.choice(chars) for x in range(size))
@@ -159,9 +180,8 @@ class AsicDbValidator(DVSDatabase):
         self.hostifoidmap = {}
         self.hostifnamemap = {}
 
-        host_intfs = self.get_keys("ASIC_STATE:SAI_OBJECT_TYPE_HOSTIF")
-        for intf in host_intfs:
-            fvs = self.get_entry("ASIC_STATE:SAI_OBJECT_TYPE_HOSTIF", intf)
+        host_intfs = self.get_table_snapshot("ASIC_STATE:SAI_OBJECT_TYPE_HOSTIF")
+        for intf, fvs in host_intfs.items():
             port_oid = fvs.get("SAI_HOSTIF_ATTR_OBJ_ID")
             port_name = fvs.get("SAI_HOSTIF_ATTR_NAME")
 
@@ -976,12 +996,9 @@ class DockerVirtualSwitch:
     # deps: fdb_update, fdb
     def get_map_iface_bridge_port_id(self, asic_db):
         port_id_2_iface = self.asicdb.portoidmap
-        tbl = swsscommon.Table(asic_db, "ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT")
+        bridge_ports = self.asicdb.get_table_snapshot("ASIC_STATE:SAI_OBJECT_TYPE_BRIDGE_PORT")
         iface_2_bridge_port_id = {}
-        for key in tbl.getKeys():
-            status, data = tbl.get(key)
-            assert status
-            values = dict(data)
+        for key, values in bridge_ports.items():
             if "SAI_BRIDGE_PORT_ATTR_PORT_ID" in values:
                 iface_id = values["SAI_BRIDGE_PORT_ATTR_PORT_ID"]
                 iface_name = port_id_2_iface[iface_id]
@@ -1,9 +1,12 @@
 """Common infrastructure for writing VS tests."""
 
+import os
+import random
 import time
 
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any, Callable, Tuple
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
 
 @dataclass
@@ -14,21 +17,89 @@ class PollingConfig:
         polling_interval: How often to poll, in seconds.
         timeout: The maximum amount of time to wait, in seconds.
         strict: If the strict flag is set, reaching the timeout will cause tests to fail.
+        event_driven: If the event driven flag is set, waits that support change notifications
+            (e.g. redis keyspace notifications) will re-check the result only when a change is
+            reported instead of on every polling interval.
+        event_fallback_interval: How often to re-check the result in event driven mode if no
+            change is reported, in seconds.
+        deadline_scheduling: If the deadline scheduling flag is set, the timeout is enforced
+            against a monotonic deadline (so time spent inside the polling function counts
+            towards it) and the polling interval grows exponentially between attempts.
+        backoff_factor: The factor by which the polling interval grows after each attempt when
+            deadline scheduling is enabled.
+        max_polling_interval: The upper bound on the polling interval when deadline scheduling
+            is enabled, in seconds.
+        jitter: The fraction of each backed-off polling interval that is randomized when deadline
+            scheduling is enabled.
     """
 
     polling_interval: float = 0.01
     timeout: float = 20.00
     strict: bool = True
+    event_driven: bool = False
+    event_fallback_interval: float = 1.00
+    deadline_scheduling: bool = False
+    backoff_factor: float = 2.0
+    max_polling_interval: float = 0.5
+    jitter: float = 0.1
 
     def iterations(self) -> int:
         """Return the number of iterations needed to poll with the given interval and timeout."""
         return 1 if self.polling_interval == 0 else int(self.timeout // self.polling_interval) + 1
 
+    def backoff_intervals(self) -> Iterator[float]:
+        """Yield the sleep intervals to use between attempts when deadline scheduling is enabled."""
+        interval = self.polling_interval
+        while True:
+            yield interval * (1 + random.uniform(-self.jitter, self.jitter))
+            interval = min(interval * self.backoff_factor, max(self.max_polling_interval, self.polling_interval))
+
+
+@dataclass
+class WaitStatistics:
+    """Class containing the accumulated cost of the waits issued by a single test.
+
+    Attributes:
+        calls: The number of calls to `wait_for_result`.
+        polls: The total number of times the polling function was run.
+        wait_time: The total time spent inside `wait_for_result`, in seconds.
+        timeouts: The number of calls that reached their timeout.
+    """
+
+    calls: int = 0
+    polls: int = 0
+    wait_time: float = 0.0
+    timeouts: int = 0
+
+
+_wait_statistics: Dict[str, WaitStatistics] = defaultdict(WaitStatistics)
+
+
+def get_wait_statistics() -> Dict[str, WaitStatistics]:
+    """Return the wait statistics recorded so far, keyed by the ID of the test that waited."""
+    return dict(_wait_statistics)
+
+
+def reset_wait_statistics() -> None:
+    """Discard all of the wait statistics recorded so far."""
+    _wait_statistics.clear()
+
+
+def _record_wait(polls: int, wait_time: float, timed_out: bool) -> None:
+    test_id = os.environ.get("PYTEST_CURRENT_TEST", "").split(" ")[0] or "<no test>"
+
+    stats = _wait_statistics[test_id]
+    stats.calls += 1
+    stats.polls += polls
+    stats.wait_time += wait_time
+    stats.timeouts += int(timed_out)
+
 
 def wait_for_result(
     polling_function: Callable[[], Tuple[bool, Any]],
     polling_config: PollingConfig = PollingConfig(),
     failure_message: str = None,
+    wait_for_change: Optional[Callable[[float], bool]] = None,
 ) -> Tuple[bool, Any]:
     """Run `polling_function` periodically using the specified `polling_config`.
 
@@ -39,6 +110,9 @@ def wait_for_result(
         polling_config: The parameters to use to poll the polling function.
         failure_message: The message to print if the call times out. This will only take effect
             if the PollingConfig is set to strict.
+        wait_for_change: A function that blocks until the polled state may have changed or the
+            given number of seconds has elapsed. If it is provided and the PollingConfig is event
+            driven, it replaces the fixed polling interval.
 
     Returns:
         If the polling function succeeds, then this method will return True and the output of the
@@ -47,13 +121,48 @@ def wait_for_result(
         If it does not succeed within the provided timeout, it will return False and whatever the
         output of the polling function was on the final attempt.
     """
-    for _ in range(polling_config.iterations()):
-        status, result = polling_function()
+    start = time.monotonic()
+    polls = 0
+
+    if wait_for_change is not None and polling_config.event_driven:
+        def wait(remaining: float) -> None:
+            wait_for_change(min(remaining, polling_config.event_fallback_interval))
+    elif polling_config.deadline_scheduling:
+        intervals = polling_config.backoff_intervals()
+
+        def wait(remaining: float) -> None:
+            time.sleep(min(remaining, next(intervals)))
+    else:
+        wait = None
+
+    if wait is not None:
+        deadline = start + polling_config.timeout
+
+        while True:
+            status, result = polling_function()
+            polls += 1
+
+            if status:
+                _record_wait(polls, time.monotonic() - start, False)
+                return (True, result)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            wait(remaining)
+    else:
+        for _ in range(polling_config.iterations()):
+            status, result = polling_function()
+            polls += 1
+
+            if status:
+                _record_wait(polls, time.monotonic() - start, False)
+                return (True, result)
 
-        if status:
-            return (True, result)
+            time.sleep(polling_config.polling_interval)
 
-        time.sleep(polling_config.polling_interval)
+    _record_wait(polls, time.monotonic() - start, True)
 
     if polling_config.strict:
         message = failure_message or f"Operation timed out after {polling_config.timeout} seconds with result {result}"
@@ -4,7 +4,16 @@ FIXME:
     - Reference DBs by name rather than ID/socket
     - Add support for ProducerStateTable
 """
-from typing import Dict, List, Callable
+import dataclasses
+import time
+import uuid
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, Callable, Iterator, Optional, Set
+
+import redis
+
 from swsscommon import swsscommon
 from swsscommon.swsscommon import SonicDBConfig
 from dvslib.dvs_common import wait_for_result, PollingConfig
@@ -13,6 +22,20 @@ from dvslib.dvs_common import wait_for_result, PollingConfig
 class DVSDatabase:
     """DVSDatabase provides access to redis databases on the virtual switch."""
 
+    # Number of requests sent in a single pipeline by the bulk methods.
+    BULK_BATCH_SIZE = 1000
+
+    _TABLE_SNAPSHOT_SCRIPT = """
+        local result = {}
+        for _, key in ipairs(redis.call('KEYS', ARGV[1])) do
+            if redis.call('TYPE', key).ok == 'hash' then
+                table.insert(result, key)
+                table.insert(result, redis.call('HGETALL', key))
+            end
+        end
+        return result
+    """
+
     def __init__(self, db_id: int, connector: str):
         """Initialize a DVSDatabase instance.
 
@@ -23,6 +46,10 @@ class DVSDatabase:
         """
         self.db_connection = swsscommon.DBConnector(db_id, connector, 0)
         self._separator = SonicDBConfig.getSeparator(self.db_connection)
+        self._db_id = db_id
+        self._connector = connector
+        self._redis = None
+        self._keyspace_events_enabled = None
 
     @property
     def separator(self) -> str:
@@ -140,6 +167,77 @@ class DVSDatabase:
 
         return keys if keys else []
 
+    def create_entries(self, table_name: str, entries: Dict[str, Dict[str, str]]) -> None:
+        """Add all of the mappings {`key` -> `entry`} in `entries` to the specified table.
+
+        The entries are written with pipelined requests rather than one round trip per key.
+
+        Args:
+            table_name: The name of the table to add the entries to.
+            entries: A mapping from each key to the set of key-value pairs to be stored.
+        """
+        for batch in self._batches(list(entries.items())):
+            pipe = self._get_redis().pipeline(transaction=False)
+            for key, entry in batch:
+                if entry:
+                    pipe.hset(self._redis_key(table_name, key), mapping=entry)
+            pipe.execute()
+
+    def get_entries(self, table_name: str, keys: List[str]) -> Dict[str, Dict[str, str]]:
+        """Get the entries stored at `keys` in the specified table.
+
+        The entries are read with pipelined requests rather than one round trip per key.
+
+        Args:
+            table_name: The name of the table where the entries are stored.
+            keys: The keys that map to the entries being retrieved.
+
+        Returns:
+            A mapping from each key to the entry stored at that key. If no entry is found for a
+            key, then it maps to an empty Dict.
+        """
+        entries = {}
+        for batch in self._batches(list(keys)):
+            pipe = self._get_redis().pipeline(transaction=False)
+            for key in batch:
+                pipe.hgetall(self._redis_key(table_name, key))
+            entries.update(zip(batch, pipe.execute()))
+
+        return entries
+
+    def get_table_snapshot(self, table_name: str) -> Dict[str, Dict[str, str]]:
+        """Get all of the entries stored in the specified table.
+
+        The keys and their contents are read by a single server-side script, so the result is a
+        consistent snapshot of the table.
+
+        Args:
+            table_name: The name of the table to read.
+
+        Returns:
+            A mapping from each key in the table to the entry stored at that key. If no keys are
+            found, then an empty Dict is returned.
+        """
+        prefix = self._redis_key(table_name, "")
+        result = self._get_redis().eval(self._TABLE_SNAPSHOT_SCRIPT, 0, self._escape_glob(prefix) + "*")
+
+        snapshot = {}
+        for redis_key, fv_list in zip(result[::2], result[1::2]):
+            snapshot[redis_key[len(prefix):]] = dict(zip(fv_list[::2], fv_list[1::2]))
+
+        return snapshot
+
+    def take_snapshot(self, table_names: List[str]) -> "TableSnapshot":
+        """Record the current contents of the specified tables.
+
+        Args:
+            table_names: The names of the tables to record.
+
+        Returns:
+            A TableSnapshot that reports how the tables change after this call.
+        """
+        return TableSnapshot(self, table_names)
+
     def wait_for_entry(
         self,
         table_name: str,
@@ -165,7 +263,8 @@ class DVSDatabase:
             return (bool(fv_pairs), fv_pairs)
 
         message = failure_message or f'Entry not found: key="{key}", table="{table_name}"'
-        _, result = wait_for_result(access_function, polling_config, message)
+        with self._keyspace_waiter(table_name, key, polling_config) as wait_for_change:
+            _, result = wait_for_result(access_function, polling_config, message, wait_for_change)
 
         return result
 
@@ -198,9 +297,12 @@ class DVSDatabase:
             fv_pairs = self.get_entry(table_name, key)
             return (all(field in fv_pairs for field in expected_fields), fv_pairs)
 
-        status, result = wait_for_result(
-            access_function, self._disable_strict_polling(polling_config)
-        )
+        with self._keyspace_waiter(table_name, key, polling_config) as wait_for_change:
+            status, result = wait_for_result(
+                access_function,
+                self._disable_strict_polling(polling_config),
+                wait_for_change=wait_for_change,
+            )
 
         if not status:
             message = failure_message or (
@@ -249,9 +351,12 @@ class DVSDatabase:
                 fv_pairs,
             )
 
-        status, result = wait_for_result(
-            access_function, self._disable_strict_polling(polling_config)
-        )
+        with self._keyspace_waiter(table_name, key, polling_config) as wait_for_change:
+            status, result = wait_for_result(
+                access_function,
+                self._disable_strict_polling(polling_config),
+                wait_for_change=wait_for_change,
+            )
 
         if not status:
             message = failure_message or (
@@ -294,9 +399,12 @@ class DVSDatabase:
                 fv_pairs,
             )
 
-        status, result = wait_for_result(
-            access_function, self._disable_strict_polling(polling_config)
-        )
+        with self._keyspace_waiter(table_name, key, polling_config) as wait_for_change:
+            status, result = wait_for_result(
+                access_function,
+                self._disable_strict_polling(polling_config),
+                wait_for_change=wait_for_change,
+            )
 
         if not status:
             message = failure_message or (
@@ -335,9 +443,12 @@ class DVSDatabase:
             fv_pairs = self.get_entry(table_name, key)
             return (fv_pairs == expected_entry, fv_pairs)
 
-        status, result = wait_for_result(
-            access_function, self._disable_strict_polling(polling_config)
-        )
+        with self._keyspace_waiter(table_name, key, polling_config) as wait_for_change:
+            status, result = wait_for_result(
+                access_function,
+                self._disable_strict_polling(polling_config),
+                wait_for_change=wait_for_change,
+            )
 
         if not status:
             message = failure_message or (
@@ -372,9 +483,12 @@ class DVSDatabase:
             fv_pairs = self.get_entry(table_name, key)
             return (not bool(fv_pairs), fv_pairs)
 
-        status, result = wait_for_result(
-            access_function, self._disable_strict_polling(polling_config)
-        )
+        with self._keyspace_waiter(table_name, key, polling_config) as wait_for_change:
+            status, result = wait_for_result(
+                access_function,
+                self._disable_strict_polling(polling_config),
+                wait_for_change=wait_for_change,
+            )
 
         if not status:
             message = failure_message or (
@@ -412,9 +526,12 @@ class DVSDatabase:
             else:
                 return (len(keys) == num_keys, keys)
 
-        status, result = wait_for_result(
-            access_function, self._disable_strict_polling(polling_config)
-        )
+        with self._keyspace_waiter(table_name, None, polling_config) as wait_for_change:
+            status, result = wait_for_result(
+                access_function,
+                self._disable_strict_polling(polling_config),
+                wait_for_change=wait_for_change,
+            )
 
         if not status:
             message = failure_message or (
@@ -449,9 +566,12 @@ class DVSDatabase:
             keys = self.get_keys(table_name)
             return (all(key in keys for key in expected_keys), keys)
 
-        status, result = wait_for_result(
-            access_function, self._disable_strict_polling(polling_config)
-        )
+        with self._keyspace_waiter(table_name, None, polling_config) as wait_for_change:
+            status, result = wait_for_result(
+                access_function,
+                self._disable_strict_polling(polling_config),
+                wait_for_change=wait_for_change,
+            )
 
         if not status:
             message = failure_message or (
@@ -486,9 +606,12 @@ class DVSDatabase:
             keys = self.get_keys(table_name)
             return (all(key not in keys for key in deleted_keys), keys)
 
-        status, result = wait_for_result(
-            access_function, self._disable_strict_polling(polling_config)
-        )
+        with self._keyspace_waiter(table_name, None, polling_config) as wait_for_change:
+            status, result = wait_for_result(
+                access_function,
+                self._disable_strict_polling(polling_config),
+                wait_for_change=wait_for_change,
+            )
 
         if not status:
             expected = [key for key in result if key not in deleted_keys]
@@ -500,9 +623,248 @@ class DVSDatabase:
 
         return result
 
+    @contextmanager
+    def _keyspace_waiter(
+        self,
+        table_name: str,
+        key: Optional[str],
+        polling_config: PollingConfig
+    ) -> Iterator[Optional[Callable[[float], bool]]]:
+        """Subscribe to keyspace notifications for `key` (or the whole table if `key` is None).
+
+        The subscription is established before the first check of the polled state so that no
+        change can be missed between the check and the wait.
+
+        Yields:
+            A function that blocks until a change is reported or the given timeout expires, or
+            None if the polling config is not event driven or keyspace notifications are disabled
+            in redis.
+        """
+        if not polling_config.event_driven or not self._keyspace_notifications_enabled():
+            yield None
+            return
+
+        pubsub = self._get_redis().pubsub(ignore_subscribe_messages=True)
+        channel = f"__keyspace@{self._db_id}__:{table_name}{self.separator}"
+
+        try:
+            if key is None:
+                pubsub.psubscribe(self._escape_glob(channel) + "*")
+            else:
+                pubsub.subscribe(channel + key)
+
+            def wait_for_change(timeout: float) -> bool:
+                deadline = time.monotonic() + timeout
+                while pubsub.get_message(timeout=max(deadline - time.monotonic(), 0)) is None:
+                    if time.monotonic() >= deadline:
+                        return False
+
+                # Collapse a burst of notifications into a single re-check.
+                while pubsub.get_message() is not None:
+                    pass
+
+                return True
+
+            yield wait_for_change
+        finally:
+            pubsub.close()
+
+    def _redis_key(self, table_name: str, key: str) -> str:
+        return f"{table_name}{self.separator}{key}"
+
+    def _batches(self, items: List) -> Iterator[List]:
+        for i in range(0, len(items), self.BULK_BATCH_SIZE):
+            yield items[i:i + self.BULK_BATCH_SIZE]
+
+    def _get_redis(self) -> redis.Redis:
+        if self._redis is None:
+            self._redis = redis.Redis(unix_socket_path=self._connector, db=self._db_id,
+                                      encoding="utf-8", decode_responses=True)
+        return self._redis
+
+    def _keyspace_notifications_enabled(self) -> bool:
+        """Check whether redis publishes the keyspace events needed to detect table changes."""
+        if self._keyspace_events_enabled is None:
+            try:
+                flags = self._get_redis().config_get("notify-keyspace-events").get("notify-keyspace-events", "")
+            except redis.exceptions.RedisError:
+                flags = ""
+
+            self._keyspace_events_enabled = "K" in flags and ("A" in flags or ("h" in flags and "g" in flags))
+
+        return self._keyspace_events_enabled
+
+    @staticmethod
+    def _escape_glob(pattern: str) -> str:
+        return "".join("\\" + c if c in "*?[]\\" else c for c in pattern)
+
     @staticmethod
     def _disable_strict_polling(polling_config: PollingConfig) -> PollingConfig:
-        disabled_config = PollingConfig(
-            polling_config.polling_interval, polling_config.timeout, False
-        )
-        return disabled_config
+        return dataclasses.replace(polling_config, strict=False)
+
+
+@dataclass
+class TableDiff:
+    """Class containing the changes made to a table since a TableSnapshot was taken.
+
+    Attributes:
+        added: The keys that did not exist in the snapshot and exist now.
+        removed: The keys that existed in the snapshot and do not exist now.
+        modified: The keys that exist in both but whose field/value pairs are different.
+    """
+
+    added: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+    modified: Set[str] = field(default_factory=set)
+
+
+class TableSnapshot:
+    """TableSnapshot records the keys and field hashes of a set of tables at one point in time.
+
+    The snapshot subscribes to keyspace notifications for the recorded tables, so computing what
+    changed only reads back the keys that were actually touched rather than rescanning each
+    table. If keyspace notifications are disabled in redis, every diff falls back to a full
+    rescan of the recorded tables.
+    """
+
+    def __init__(self, db: DVSDatabase, table_names: List[str]):
+        """Initialize a TableSnapshot instance.
+
+        Args:
+            db: The database containing the tables.
+            table_names: The names of the tables to record.
+        """
+        self._db = db
+        self._table_names = list(table_names)
+        self._pubsub = None
+        self._dirty: Dict[str, Set[str]] = {table_name: set() for table_name in self._table_names}
+
+        if db._keyspace_notifications_enabled():
+            # Subscribe before reading the tables so no change can slip in between.
+            self._channel_prefix = f"__keyspace@{db._db_id}__:"
+            self._pubsub = db._get_redis().pubsub()
+            for table_name in self._table_names:
+                self._pubsub.psubscribe(
+                    db._escape_glob(self._channel_prefix + db._redis_key(table_name, "")) + "*"
+                )
+
+        self._hashes = {
+            table_name: self._hash_entries(db.get_table_snapshot(table_name))
+            for table_name in self._table_names
+        }
+
+    def __del__(self):
+        self.close()
+
+    def close(self) -> None:
+        """Stop tracking changes to the recorded tables."""
+        if self._pubsub is not None:
+            self._pubsub.close()
+            self._pubsub = None
+
+    def keys(self, table_name: str) -> Set[str]:
+        """Get the keys that existed in the specified table when the snapshot was (last) taken."""
+        return set(self._hashes[table_name])
+
+    def diff(self, table_name: str) -> TableDiff:
+        """Compute the changes made to the specified table since the snapshot was (last) taken.
+
+        Args:
+            table_name: The name of the table to check.
+
+        Returns:
+            The keys that were added, removed and modified.
+        """
+        current = self._current_hashes(table_name)
+        baseline = self._hashes[table_name]
+
+        result = TableDiff()
+        for key, entry_hash in current.items():
+            if key not in baseline:
+                if entry_hash is not None:
+                    result.added.add(key)
+            elif entry_hash is None:
+                result.removed.add(key)
+            elif entry_hash != baseline[key]:
+                result.modified.add(key)
+
+        return result
+
+    def get_added_keys(self, table_name: str) -> Set[str]:
+        """Get the keys added to the specified table since the snapshot was (last) taken."""
+        return self.diff(table_name).added
+
+    def get_removed_keys(self, table_name: str) -> Set[str]:
+        """Get the keys removed from the specified table since the snapshot was (last) taken."""
+        return self.diff(table_name).removed
+
+    def update(self, table_name: Optional[str] = None) -> None:
+        """Move the snapshot of the specified table (or of all tables) to the current contents.
+
+        Args:
+            table_name: The name of the table to update. If None, all of the tables are updated.
+        """
+        for name in [table_name] if table_name else self._table_names:
+            current = self._current_hashes(name)
+            baseline = self._hashes[name]
+
+            for key, entry_hash in current.items():
+                if entry_hash is None:
+                    baseline.pop(key, None)
+                else:
+                    baseline[key] = entry_hash
+
+            self._dirty[name].clear()
+
+    def _current_hashes(self, table_name: str) -> Dict[str, Optional[int]]:
+        """Get the current hash of each key that may have changed, None if it was deleted."""
+        if self._pubsub is None:
+            current = self._hash_entries(self._db.get_table_snapshot(table_name))
+            return {
+                **{key: None for key in self._hashes[table_name] if key not in current},
+                **current,
+            }
+
+        self._drain_notifications()
+
+        dirty = list(self._dirty[table_name])
+        entries = self._db.get_entries(table_name, dirty)
+        return {key: self._hash_entry(entries[key]) if entries[key] else None for key in dirty}
+
+    def _drain_notifications(self, timeout: float = 5.0) -> None:
+        """Consume all of the notifications published before this call.
+
+        A PING is sent on the subscription connection; redis replies to it only after every
+        notification queued ahead of it, so reading up to the reply is guaranteed to see all of
+        the changes made so far.
+        """
+        token = uuid.uuid4().hex
+        self._pubsub.ping(token)
+
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            message = self._pubsub.get_message(timeout=max(deadline - time.monotonic(), 0))
+            if message is None:
+                continue
+
+            if message["type"] == "pong" and message["data"] == token:
+                return
+
+            if message["type"] == "pmessage":
+                self._mark_dirty(message["channel"][len(self._channel_prefix):])
+
+        assert False, f"Timed out waiting for keyspace notifications for {self._table_names}"
+
+    def _mark_dirty(self, redis_key: str) -> None:
+        for table_name in self._table_names:
+            prefix = self._db._redis_key(table_name, "")
+            if redis_key.startswith(prefix):
+                self._dirty[table_name].add(redis_key[len(prefix):])
+
+    @classmethod
+    def _hash_entries(cls, entries: Dict[str, Dict[str, str]]) -> Dict[str, int]:
+        return {key: cls._hash_entry(entry) for key, entry in entries.items()}
+
+    @staticmethod
+    def _hash_entry(entry: Dict[str, str]) -> int:
+        return hash(frozenset(entry.items()))
@@ -37,6 +37,23 @@ namespace consumer_test
         long m_notification_count;
     };
 
+    class PriorityOrch : public Orch
+    {
+    public:
+        PriorityOrch(swss::DBConnector *db, const vector<table_name_with_pri_t> &tables)
+            :Orch(db, tables)
+        {
+        }
+
+        void doTask(Consumer& consumer)
+        {
+            m_drained.push_back(consumer.getName());
+            consumer.m_toSync.clear();
+        }
+
+        vector<string> m_drained;
+    };
+
     enum class ThrowType
     {
         None,
@@ -457,6 +474,72 @@ namespace consumer_test
 
     }
 
+    TEST_F(ConsumerTest, ConsumerAddToSync_Set_Set_Merge_Large)
+    {
+        // Test case, SET then SET on tuples large enough to index the updated fields
+        vector<FieldValueTuple> fva, fvb;
+        for (int i = 0; i < 32; i++)
+        {
+            fva.emplace_back("f" + to_string(i), "a");
+        }
+        for (int i = 16; i < 48; i++)
+        {
+            fvb.emplace_back("f" + to_string(i), "b");
+        }
+        // a field repeated in the same update is applied last
+        fvb.emplace_back("f16", "c");
+
+        kofv_q.push_back(KeyOpFieldsValuesTuple(key, SET_COMMAND, fva));
+        kofv_q.push_back(KeyOpFieldsValuesTuple(key, SET_COMMAND, fvb));
+        consumer->addToSync(std::move(kofv_q));
+
+        vector<FieldValueTuple> fvs;
+        for (int i = 0; i < 16; i++)
+        {
+            fvs.emplace_back("f" + to_string(i), "a");
+        }
+        for (int i = 17; i < 48; i++)
+        {
+            fvs.emplace_back("f" + to_string(i), "b");
+        }
+        fvs.emplace_back("f16", "c");
+
+        exp_kofv = KeyOpFieldsValuesTuple(key, SET_COMMAND, fvs);
+        validate_syncmap(consumer->m_toSync, 1, key, exp_kofv);
+    }
+
+    TEST_F(ConsumerTest, ConsumerAddToSync_Set_Del_Set_Moved)
+    {
+        // Test case, SET, DEL then SET moved into m_toSync
+        auto entrya = KeyOpFieldsValuesTuple(
+            { key,
+                SET_COMMAND,
+                { { f1, v1a },
+                    { f2, v2a } } });
+
+        auto entryb = KeyOpFieldsValuesTuple(
+            { key,
+                DEL_COMMAND,
+                { { } } });
+
+        auto entryc = KeyOpFieldsValuesTuple(
+            { key,
+                SET_COMMAND,
+                { { f3, v3a },
+                    { f1, v1b } } });
+
+        kofv_q.push_back(entrya);
+        kofv_q.push_back(entryb);
+        kofv_q.push_back(entryc);
+        EXPECT_EQ(consumer->addToSync(std::move(kofv_q)), 3);
+
+        // expect DEL then the last SET only
+        exp_kofv = entryb;
+        validate_syncmap(consumer->m_toSync, 2, key, exp_kofv);
+        exp_kofv = entryc;
+        validate_syncmap(consumer->m_toSync, 1, key, exp_kofv);
+    }
+
     TEST_F(ConsumerTest, ConsumerPops_notification_count)
     {
         int consumer_pops_batch_size = 10;
@@ -479,11 +562,36 @@ namespace consumer_test
         // consumer should pops consumer_pops_batch_size notifications 
         test_consumer.execute();
         ASSERT_EQ(test_orch.m_notification_count, consumer_pops_batch_size);
+        ASSERT_EQ(test_consumer.m_stats.popBatchSize.count(), 1);
+        ASSERT_EQ(test_consumer.m_stats.popBatchSize.max(), consumer_pops_batch_size);
 
         test_consumer.execute();
         ASSERT_EQ(test_orch.m_notification_count, consumer_pops_batch_size*2);
     }
 
+    TEST_F(ConsumerTest, ConsumerKeepsTablePriority)
+    {
+        // The select loop sees the priority of the underlying table
+        EXPECT_EQ(consumer->getPri(), 1);
+
+        PriorityOrch orch(m_app_db.get(), {
+            { "BULK_TABLE_A", 0 },
+            { "ROUTE_TABLE", 5 },
+            { "PORT_TABLE", 45 },
+            { "BULK_TABLE_B", 0 } });
+        EXPECT_EQ(orch.getPriority(), 45);
+
+        for (auto table : { "BULK_TABLE_A", "BULK_TABLE_B", "PORT_TABLE", "ROUTE_TABLE" })
+        {
+            orch.getConsumerBase(table)->addToSync(KeyOpFieldsValuesTuple(key, SET_COMMAND, { { f1, v1a } }));
+        }
+
+        // Drained by priority, tables of the same priority in name order
+        static_cast<Orch *>(&orch)->doTask();
+        vector<string> expected = { "PORT_TABLE", "ROUTE_TABLE", "BULK_TABLE_A", "BULK_TABLE_B" };
+        EXPECT_EQ(orch.m_drained, expected);
+    }
+
     TEST_F(ConsumerTest, AsyncSwssRecorderWritesBatchRecords)
     {
         char dir_template[] = "/tmp/swss-consumer-ut-XXXXXX";
@@ -636,6 +744,54 @@ namespace consumer_test
         ASSERT_TRUE(consumer->m_toSync.empty());
     }
 
+    TEST_F(ExceptionHandlingTest, DrainUpdatesConsumerStats)
+    {
+        auto *consumer = dynamic_cast<Consumer *>(m_orch->getExecutor("APP_TEST_TABLE"));
+        ASSERT_NE(consumer, nullptr);
+
+        populateConsumer(*consumer, 3);
+        consumer->drain();
+
+        // nothing pending, doTask is not invoked and nothing is sampled
+        consumer->drain();
+
+        ASSERT_EQ(consumer->m_stats.pendingTasks.count(), 1);
+        ASSERT_EQ(consumer->m_stats.pendingTasks.max(), 3);
+        ASSERT_EQ(consumer->m_stats.doTaskUsecs.count(), 1);
+
+        std::map<std::string, std::vector<FieldValueTuple>> stats;
+        m_orch->getConsumerStats(stats);
+        ASSERT_EQ(stats.size(), 1);
+
+        auto it = stats.find("APPL_DB:APP_TEST_TABLE");
+        ASSERT_NE(it, stats.end());
+
+        std::map<std::string, std::string> values(it->second.begin(), it->second.end());
+        ASSERT_EQ(values["pending_tasks_max"], "3");
+        ASSERT_EQ(values["dotask_count"], "1");
+        ASSERT_EQ(values["pop_count"], "0");
+    }
+
+    TEST(ConsumerStatsTest, HistogramPercentiles)
+    {
+        StatHistogram histogram;
+        ASSERT_EQ(histogram.percentile(99), 0);
+
+        for (uint64_t i = 0; i < 100; i++)
+        {
+            histogram.add(i);
+        }
+
+        ASSERT_EQ(histogram.count(), 100);
+        ASSERT_EQ(histogram.sum(), 4950);
+        ASSERT_EQ(histogram.avg(), 49);
+        ASSERT_EQ(histogram.max(), 99);
+        // percentiles are reported as the upper bound of the log2 bucket
+        ASSERT_EQ(histogram.percentile(50), 63);
+        ASSERT_EQ(histogram.percentile(99), 99);
+        ASSERT_EQ(histogram.percentile(1), 0);
+    }
+
     TEST_F(ExceptionHandlingTest, OrchDoTaskCatchesExceptionPerConsumer)
     {
         auto *consumer = dynamic_cast<Consumer *>(m_orch->getExecutor("APP_TEST_TABLE"));
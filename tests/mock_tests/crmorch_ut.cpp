@@ -0,0 +1,113 @@
+#include "ut_helper.h"
+#include "mock_orchagent_main.h"
+#include "mock_table.h"
+#include <gtest/gtest.h>
+
+#define private public
+#include "crmorch.h"
+#undef private
+
+namespace crmorch_test
+{
+    using namespace std;
+    using namespace swss;
+
+    struct CrmOrchTest : public ::testing::Test
+    {
+        shared_ptr<DBConnector> m_config_db;
+        shared_ptr<DBConnector> m_counters_db;
+        shared_ptr<Table> m_counters_crm_table;
+        unique_ptr<CrmOrch> m_crmOrch;
+
+        void SetUp() override
+        {
+            ::testing_db::reset();
+
+            m_config_db = make_shared<DBConnector>("CONFIG_DB", 0);
+            m_counters_db = make_shared<DBConnector>("COUNTERS_DB", 0);
+            m_counters_crm_table = make_shared<Table>(m_counters_db.get(), COUNTERS_CRM_TABLE);
+            m_crmOrch.reset(new CrmOrch(m_config_db.get(), CFG_CRM_TABLE_NAME));
+        }
+
+        void TearDown() override
+        {
+            m_crmOrch.reset();
+            ::testing_db::reset();
+        }
+
+        string getCounter(const string &key, const string &field)
+        {
+            string value;
+            m_counters_crm_table->hget(key, field, value);
+            return value;
+        }
+    };
+
+    TEST_F(CrmOrchTest, OnlyChangedCountersArePushed)
+    {
+        auto &cnt = m_crmOrch->m_resourcesMap.at(CrmResourceType::CRM_IPV4_ROUTE).countersMap["STATS"];
+        cnt.usedCounter = 5;
+        cnt.availableCounter = 100;
+
+        m_crmOrch->updateCrmCountersTable();
+        EXPECT_EQ(getCounter("STATS", "crm_stats_ipv4_route_used"), "5");
+        EXPECT_EQ(getCounter("STATS", "crm_stats_ipv4_route_available"), "100");
+
+        // Unchanged counters are not written again
+        m_counters_crm_table->hset("STATS", "crm_stats_ipv4_route_used", "stale");
+        m_crmOrch->updateCrmCountersTable();
+        EXPECT_EQ(getCounter("STATS", "crm_stats_ipv4_route_used"), "stale");
+
+        cnt.usedCounter = 6;
+        m_crmOrch->updateCrmCountersTable();
+        EXPECT_EQ(getCounter("STATS", "crm_stats_ipv4_route_used"), "6");
+
+        // Deleted keys are pushed in full on the next update
+        m_crmOrch->delCrmCounters("STATS");
+        m_crmOrch->updateCrmCountersTable();
+        EXPECT_EQ(getCounter("STATS", "crm_stats_ipv4_route_used"), "6");
+        EXPECT_EQ(getCounter("STATS", "crm_stats_ipv4_route_available"), "100");
+    }
+
+    TEST_F(CrmOrchTest, PollResultIsMerged)
+    {
+        sai_object_id_t tableId = 0x7000000000001;
+        m_crmOrch->incCrmAclTableUsedCounter(CrmResourceType::CRM_ACL_ENTRY, tableId);
+        string tableKey = m_crmOrch->getCrmAclTableKey(tableId);
+
+        CrmOrch::CrmResourceMap polled;
+        auto add = [&](CrmResourceType type) -> CrmOrch::CrmResourceEntry & {
+            return polled.emplace(type, m_crmOrch->m_resourcesMap.at(type)).first->second;
+        };
+
+        add(CrmResourceType::CRM_IPV4_ROUTE).countersMap["STATS"].availableCounter = 1000;
+        add(CrmResourceType::CRM_FDB_ENTRY).resStatus = CrmResourceStatus::CRM_RES_NOT_SUPPORTED;
+
+        auto &aclEntry = add(CrmResourceType::CRM_ACL_ENTRY);
+        aclEntry.countersMap[tableKey].availableCounter = 10;
+
+        // ACL table removed while the poll was running
+        string removedKey = m_crmOrch->getCrmAclTableKey(tableId + 1);
+        aclEntry.countersMap[removedKey].id = tableId + 1;
+        aclEntry.countersMap[removedKey].availableCounter = 20;
+
+        // Used counters changed meanwhile are kept
+        m_crmOrch->incCrmAclTableUsedCounter(CrmResourceType::CRM_ACL_ENTRY, tableId);
+
+        m_crmOrch->m_pollResult.reset(new CrmOrch::CrmResourceMap(std::move(polled)));
+        m_crmOrch->doPollResult();
+        EXPECT_FALSE(m_crmOrch->m_pollResult);
+
+        const auto &resources = m_crmOrch->m_resourcesMap;
+        EXPECT_EQ(resources.at(CrmResourceType::CRM_IPV4_ROUTE).countersMap.at("STATS").availableCounter, 1000u);
+        EXPECT_EQ(resources.at(CrmResourceType::CRM_FDB_ENTRY).resStatus, CrmResourceStatus::CRM_RES_NOT_SUPPORTED);
+
+        const auto &aclCounters = resources.at(CrmResourceType::CRM_ACL_ENTRY).countersMap;
+        EXPECT_EQ(aclCounters.at(tableKey).availableCounter, 10u);
+        EXPECT_EQ(aclCounters.at(tableKey).usedCounter, 2u);
+        EXPECT_EQ(aclCounters.count(removedKey), 0u);
+
+        EXPECT_EQ(getCounter("STATS", "crm_stats_ipv4_route_available"), "1000");
+        EXPECT_EQ(getCounter(tableKey, "crm_stats_acl_entry_used"), "2");
+    }
+}
@@ -2,22 +2,11 @@
 #include <swss/logger.h>
 #include <netlink/route/route.h>
 
-static rtnl_link* g_fakeLink = [](){
-    auto fakeLink = rtnl_link_alloc();
-    rtnl_link_set_ifindex(fakeLink, 42);
-    return fakeLink;
-}();
-
 extern int rt_build_ret;
 extern bool nlmsg_alloc_ret;
 extern "C"
 {
 
-struct rtnl_link* rtnl_link_get_by_name(struct nl_cache *cache, const char *name)
-{
-    return g_fakeLink;
-}
-
 static int build_route_msg(struct rtnl_route *tmpl, int cmd, int flags,
 			   struct nl_msg **result)
 {
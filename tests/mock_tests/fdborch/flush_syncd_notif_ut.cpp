@@ -509,6 +509,52 @@ namespace fdb_syncd_flush_test
         ASSERT_EQ(m_fdborch->m_fdbStateTable.hget("Vlan40:7c:fe:90:12:22:ec", "type", entry_type), false);
     }
 
+    /* Test Flush Per Port only visits the entries indexed by the port */
+    TEST_F(FdbOrchTest, FlushPerPortUpdatesIndexes)
+    {
+        ASSERT_NE(m_portsOrch, nullptr);
+        setUpVlan(m_portsOrch.get());
+        setUpPort(m_portsOrch.get());
+        ASSERT_NE(m_portsOrch->m_portList.find(VLAN40), m_portsOrch->m_portList.end());
+        ASSERT_NE(m_portsOrch->m_portList.find(ETH0), m_portsOrch->m_portList.end());
+        setUpVlanMember(m_portsOrch.get());
+
+        auto bridge_port_oid = m_portsOrch->m_portList[ETH0].m_bridge_port_id;
+        auto vlan_oid = m_portsOrch->m_portList[VLAN40].m_vlan_info.vlan_oid;
+
+        /* Event 1: Learn two dynamic FDB Entries */
+        vector<uint8_t> mac_addr_1 = {124, 254, 144, 18, 34, 236};
+        vector<uint8_t> mac_addr_2 = {124, 254, 144, 18, 34, 237};
+        triggerUpdate(m_fdborch.get(), SAI_FDB_EVENT_LEARNED, mac_addr_1, bridge_port_oid, vlan_oid);
+        triggerUpdate(m_fdborch.get(), SAI_FDB_EVENT_LEARNED, mac_addr_2, bridge_port_oid, vlan_oid);
+
+        ASSERT_EQ(m_fdborch->m_entries.size(), 2u);
+        ASSERT_EQ(m_fdborch->m_entriesByBridgePort[bridge_port_oid].size(), 2u);
+        ASSERT_EQ(m_fdborch->m_entriesByBvId[vlan_oid].size(), 2u);
+
+        /* Event 2: Generate a non-consolidated FDB Flush per port */
+        for (map<FdbEntry, FdbData>::iterator it = m_fdborch->m_entries.begin(); it != m_fdborch->m_entries.end(); it++)
+        {
+            it->second.is_flush_pending = true;
+        }
+        triggerUpdate(m_fdborch.get(), SAI_FDB_EVENT_FLUSHED, mac_addr_1, bridge_port_oid, SAI_NULL_OBJECT_ID);
+
+        ASSERT_EQ(m_fdborch->m_entries.size(), 1u);
+        ASSERT_EQ(m_fdborch->m_entriesByBridgePort[bridge_port_oid].size(), 1u);
+        ASSERT_EQ(m_fdborch->m_entriesByBvId[vlan_oid].size(), 1u);
+        ASSERT_EQ(m_portsOrch->m_portList[ETH0].m_fdb_count, 1);
+
+        /* Event 3: Generate a consolidated FDB Flush per port */
+        vector<uint8_t> flush_mac_addr = {0, 0, 0, 0, 0, 0};
+        triggerUpdate(m_fdborch.get(), SAI_FDB_EVENT_FLUSHED, flush_mac_addr, bridge_port_oid, SAI_NULL_OBJECT_ID);
+
+        ASSERT_TRUE(m_fdborch->m_entries.empty());
+        ASSERT_TRUE(m_fdborch->m_entriesByBridgePort.empty());
+        ASSERT_TRUE(m_fdborch->m_entriesByBvId.empty());
+        ASSERT_EQ(m_portsOrch->m_portList[VLAN40].m_fdb_count, 0);
+        ASSERT_EQ(m_portsOrch->m_portList[ETH0].m_fdb_count, 0);
+    }
+
     /* Test Consolidated Flush with origin VXLAN */
     TEST_F(FdbOrchTest, ConsolidatedFlushAllVxLAN)
     {
@@ -852,6 +852,91 @@ TEST_F(FpmSyncdResponseTest, TestNextHopGroupAdd)
     free(group_nlh);
 }
 
+TEST_F(FpmSyncdResponseTest, LinkMessagesUpdateLinkMap)
+{
+    char if_name[IFNAMSIZ];
+
+    rtnl_link* link = rtnl_link_alloc();
+    rtnl_link_set_ifindex(link, 100);
+    rtnl_link_set_name(link, "Vrf100");
+
+    m_routeSync.onMsg(RTM_NEWLINK, (nl_object*)link);
+    EXPECT_TRUE(m_routeSync.getIfName(100, if_name, IFNAMSIZ));
+    EXPECT_STREQ(if_name, "Vrf100");
+    EXPECT_EQ(m_routeSync.getIfIndex("Vrf100"), 100);
+
+    // Renamed link
+    rtnl_link_set_name(link, "Vrf101");
+    m_routeSync.onMsg(RTM_NEWLINK, (nl_object*)link);
+    EXPECT_TRUE(m_routeSync.getIfName(100, if_name, IFNAMSIZ));
+    EXPECT_STREQ(if_name, "Vrf101");
+    EXPECT_EQ(m_routeSync.m_ifIndexes.count("Vrf100"), 0);
+
+    // Removed link, not known by the kernel either
+    m_routeSync.onMsg(RTM_DELLINK, (nl_object*)link);
+    EXPECT_EQ(m_routeSync.m_ifNames.count(100), 0);
+    EXPECT_EQ(m_routeSync.m_ifIndexes.count("Vrf101"), 0);
+    EXPECT_FALSE(m_routeSync.getIfName(100, if_name, IFNAMSIZ));
+
+    // Unknown link, queried from the kernel once and kept
+    EXPECT_TRUE(m_routeSync.getIfName(10, if_name, IFNAMSIZ));
+    EXPECT_STREQ(if_name, "Vrf10");
+    EXPECT_EQ(m_routeSync.m_ifNames.count(10), 1);
+
+    rtnl_link_put(link);
+}
+
+TEST_F(FpmSyncdResponseTest, RouteUpdatesCoalescedUntilFlush)
+{
+    Table route_table(m_db.get(), APP_ROUTE_TABLE_NAME);
+    auto createBlackholeRoute = [](const char* prefix) -> rtnl_route* {
+        rtnl_route* route = rtnl_route_alloc();
+        nl_addr* dst_addr;
+        nl_addr_parse(prefix, AF_INET, &dst_addr);
+        rtnl_route_set_dst(route, dst_addr);
+        rtnl_route_set_type(route, RTN_BLACKHOLE);
+        rtnl_route_set_protocol(route, RTPROT_STATIC);
+        rtnl_route_set_family(route, AF_INET);
+        rtnl_route_set_table(route, RT_TABLE_MAIN);
+        nl_addr_put(dst_addr);
+        return route;
+    };
+
+    const char* flapping_prefix = "10.2.0.0/24";
+    const char* withdrawn_prefix = "10.3.0.0/24";
+    rtnl_route* flapping_route = createBlackholeRoute(flapping_prefix);
+    rtnl_route* withdrawn_route = createBlackholeRoute(withdrawn_prefix);
+
+    m_routeSync.setRouteCoalescingEnabled(true);
+
+    m_routeSync.onRouteMsg(RTM_NEWROUTE, (nl_object*)flapping_route, nullptr);
+    m_routeSync.onRouteMsg(RTM_DELROUTE, (nl_object*)flapping_route, nullptr);
+    m_routeSync.onRouteMsg(RTM_NEWROUTE, (nl_object*)flapping_route, nullptr);
+    m_routeSync.onRouteMsg(RTM_NEWROUTE, (nl_object*)withdrawn_route, nullptr);
+    m_routeSync.onRouteMsg(RTM_DELROUTE, (nl_object*)withdrawn_route, nullptr);
+
+    // Only the last state of each prefix is kept, nothing is written yet
+    EXPECT_EQ(m_routeSync.getPendingRouteCount(), 2);
+    vector<FieldValueTuple> fvs;
+    EXPECT_FALSE(route_table.get(flapping_prefix, fvs));
+    EXPECT_FALSE(route_table.get(withdrawn_prefix, fvs));
+
+    m_routeSync.flushRoutes();
+    EXPECT_EQ(m_routeSync.getPendingRouteCount(), 0);
+
+    EXPECT_TRUE(route_table.get(flapping_prefix, fvs));
+    EXPECT_NE(std::find(fvs.begin(), fvs.end(), FieldValueTuple("blackhole", "true")), fvs.end());
+    EXPECT_FALSE(route_table.get(withdrawn_prefix, fvs));
+
+    // Updates are written right away once coalescing is disabled
+    m_routeSync.setRouteCoalescingEnabled(false);
+    m_routeSync.onRouteMsg(RTM_DELROUTE, (nl_object*)flapping_route, nullptr);
+    EXPECT_FALSE(route_table.get(flapping_prefix, fvs));
+
+    rtnl_route_put(flapping_route);
+    rtnl_route_put(withdrawn_route);
+}
+
 TEST_F(FpmSyncdResponseTest, TestRouteMsgWithNHG)
 {
     Table route_table(m_db.get(), APP_ROUTE_TABLE_NAME);
@@ -3,29 +3,62 @@
 #include "ipprefix.h"
 #include <linux/netlink.h>
 #include <linux/rtnetlink.h>
+#include <netlink/errno.h>
+#include <netlink/route/link.h>
+
+#include <map>
+#include <string>
 
 #define IPV6_MAX_BYTE      16
 #define IPV6_MAX_BITLEN    128
 
 /*
- * Mock rtnl_link_i2name() call
- * We simulate the existence of a VRF called Vrf10 with ifindex 10.
- * Calling rtnl_link_i2name(_, 10, _, _) will return the name of the VRF (i.e., "Vrf10" string)
+ * Mock the kernel links seen by RouteSync
+ * No link is dumped at startup, links are then queried one by one with rtnl_link_get_kernel().
+ * We simulate the existence of a VRF called Vrf10 with ifindex 10 and of an invalid VRF with
+ * ifindex 30. Any other name is resolved to ifindex 42.
  */
 extern "C" {
-char *__wrap_rtnl_link_i2name(struct nl_cache *cache, int ifindex, char *dst, size_t len)
+int __wrap_rtnl_link_alloc_cache(struct nl_sock *sk, int family, struct nl_cache **result)
+{
+    *result = NULL;
+    return -NLE_FAILURE;
+}
+
+int __wrap_rtnl_link_get_kernel(struct nl_sock *sk, int ifindex, const char *name, struct rtnl_link **result)
 {
-    switch (ifindex)
+    static const std::map<int, std::string> links = {
+        { 10, "Vrf10" },
+        { 30, "invalidVrf" },
+    };
+
+    *result = NULL;
+
+    if (name)
     {
-        case 10:
-            strncpy(dst, "Vrf10", 6);
-            return dst;
-        case 30:
-            strncpy(dst, "invalidVrf", 11);
-            return dst;
-        default:
-            return NULL;
+        ifindex = 42;
+        for (const auto &link : links)
+        {
+            if (link.second == name)
+            {
+                ifindex = link.first;
+            }
+        }
+    }
+    else
+    {
+        auto it = links.find(ifindex);
+        if (it == links.end())
+        {
+            return -NLE_OBJ_NOTFOUND;
+        }
+        name = it->second.c_str();
     }
+
+    *result = rtnl_link_alloc();
+    rtnl_link_set_ifindex(*result, ifindex);
+    rtnl_link_set_name(*result, name);
+    return 0;
 }
 }
 
@@ -0,0 +1,97 @@
+#include "iptablesbatch.h"
+#include "gtest/gtest.h"
+
+#include <fstream>
+#include <sstream>
+
+extern int (*callback)(const std::string &cmd, std::string &stdout);
+
+namespace iptablesbatch_ut
+{
+    using namespace swss;
+    using namespace std;
+
+    vector<string> restored;
+
+    // Records the rules given to iptables-restore, rejecting the ones containing "invalid"
+    int restore(const string &cmd, string &stdout)
+    {
+        size_t pos = cmd.find("--noflush < ");
+        if (pos == string::npos)
+        {
+            return 1;
+        }
+
+        string path = cmd.substr(pos + 12);
+        ifstream file(path.substr(0, path.find(' ')));
+        stringstream rules;
+        rules << file.rdbuf();
+        restored.push_back(rules.str());
+
+        return restored.back().find("invalid") == string::npos ? 0 : 1;
+    }
+
+    struct IptablesBatchTest : public ::testing::Test
+    {
+        void SetUp() override
+        {
+            restored.clear();
+            callback = restore;
+        }
+
+        void TearDown() override
+        {
+            callback = nullptr;
+        }
+    };
+
+    TEST_F(IptablesBatchTest, ApplyRightAway)
+    {
+        IptablesBatch batch;
+
+        EXPECT_TRUE(batch.apply("nat", { "-I PREROUTING -j DNAT -d 1.1.1.1 --to-destination 2.2.2.2",
+                                         "-I POSTROUTING -j SNAT -s 2.2.2.2 --to-source 1.1.1.1" }));
+        ASSERT_EQ(restored.size(), 1u);
+        EXPECT_EQ(restored[0], "*nat\n"
+                               "-I PREROUTING -j DNAT -d 1.1.1.1 --to-destination 2.2.2.2\n"
+                               "-I POSTROUTING -j SNAT -s 2.2.2.2 --to-source 1.1.1.1\n"
+                               "COMMIT\n");
+
+        EXPECT_FALSE(batch.apply("nat", { "-D POSTROUTING invalid" }));
+    }
+
+    TEST_F(IptablesBatchTest, OneRestorePerTable)
+    {
+        IptablesBatch batch;
+
+        batch.begin();
+        EXPECT_TRUE(batch.apply("nat", { "-I PREROUTING a" }));
+        EXPECT_TRUE(batch.apply("mangle", { "-A PREROUTING b" }));
+        EXPECT_TRUE(batch.apply("nat", { "-D POSTROUTING c" }));
+        EXPECT_TRUE(restored.empty());
+
+        EXPECT_TRUE(batch.end());
+        ASSERT_EQ(restored.size(), 2u);
+        EXPECT_EQ(restored[0], "*nat\n-I PREROUTING a\n-D POSTROUTING c\nCOMMIT\n");
+        EXPECT_EQ(restored[1], "*mangle\n-A PREROUTING b\nCOMMIT\n");
+
+        // Closed by end()
+        EXPECT_TRUE(batch.apply("nat", { "-I PREROUTING d" }));
+        EXPECT_EQ(restored.size(), 3u);
+    }
+
+    TEST_F(IptablesBatchTest, FailedBatchIsAppliedPerEntry)
+    {
+        IptablesBatch batch;
+
+        batch.begin();
+        batch.apply("nat", { "-I PREROUTING a" });
+        batch.apply("nat", { "-I PREROUTING invalid" });
+        batch.apply("nat", { "-I PREROUTING c" });
+        EXPECT_FALSE(batch.end());
+
+        ASSERT_EQ(restored.size(), 4u);
+        EXPECT_EQ(restored[1], "*nat\n-I PREROUTING a\nCOMMIT\n");
+        EXPECT_EQ(restored[3], "*nat\n-I PREROUTING c\nCOMMIT\n");
+    }
+}
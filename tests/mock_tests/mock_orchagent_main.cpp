@@ -19,6 +19,7 @@ string gMyHostName = "Linecard1";
 string gMyAsicName = "Asic0";
 bool gTraditionalFlexCounter = false;
 bool gSyncMode = false;
+bool gPfcWdNativeDetection = false;
 sai_redis_communication_mode_t gRedisCommunicationMode = SAI_REDIS_COMMUNICATION_MODE_REDIS_ASYNC;
 bool gOrchUnhealthy = false;
 string gSaiErrorString;
@@ -0,0 +1,120 @@
+#include "orchscheduler.h"
+
+#include <atomic>
+#include <chrono>
+#include <thread>
+#include <gtest/gtest.h>
+
+namespace orchscheduler_test
+{
+    using namespace std;
+
+    class TestOrch : public Orch
+    {
+    public:
+        TestOrch() : Orch()
+        {
+        }
+    };
+
+    TEST(OrchScheduler, InvalidWorkers)
+    {
+        EXPECT_THROW(OrchScheduler(0), std::invalid_argument);
+    }
+
+    TEST(OrchScheduler, ShardsFollowDependencies)
+    {
+        TestOrch route, neigh, intfs, ports, fdb, mlag, acl, pfcwd, crm, other;
+
+        OrchScheduler scheduler(4);
+        scheduler.schedule(&fdb, "FdbOrch");
+        scheduler.schedule(&acl, "AclOrch");
+        scheduler.schedule(&pfcwd, "PfcWdOrch");
+        scheduler.schedule(&crm, "CrmOrch");
+
+        scheduler.addDependency(&fdb, &ports);
+        scheduler.addDependency(&fdb, &mlag);
+        scheduler.addDependency(&fdb, &neigh);
+        scheduler.addDependency(&pfcwd, &acl);
+        scheduler.addDependency(&route, &neigh);
+        scheduler.addDependency(&neigh, &intfs);
+
+        scheduler.start();
+
+        // FdbOrch, AclOrch+PfcWdOrch and CrmOrch are independent shards
+        EXPECT_EQ(scheduler.getWorkerCount(), 3);
+        EXPECT_EQ(scheduler.getWorker(&acl), scheduler.getWorker(&pfcwd));
+        EXPECT_NE(scheduler.getWorker(&fdb), scheduler.getWorker(&acl));
+        EXPECT_NE(scheduler.getWorker(&fdb), scheduler.getWorker(&crm));
+        EXPECT_NE(scheduler.getWorker(&acl), scheduler.getWorker(&crm));
+        EXPECT_EQ(scheduler.getWorkerName(scheduler.getWorker(&acl)), "AclOrch+PfcWdOrch");
+
+        EXPECT_EQ(scheduler.getWorker(&route), -1);
+        EXPECT_FALSE(scheduler.isScheduled(&route));
+
+        // Main thread orchs reaching FdbOrch directly or through other orchs
+        vector<size_t> fdbWorker = { static_cast<size_t>(scheduler.getWorker(&fdb)) };
+        EXPECT_EQ(scheduler.getExclusiveWorkers(&ports), fdbWorker);
+        EXPECT_EQ(scheduler.getExclusiveWorkers(&neigh), fdbWorker);
+        EXPECT_EQ(scheduler.getExclusiveWorkers(&route), fdbWorker);
+        EXPECT_EQ(scheduler.getExclusiveWorkers(&intfs), fdbWorker);
+        EXPECT_TRUE(scheduler.getExclusiveWorkers(&other).empty());
+
+        scheduler.stop();
+    }
+
+    TEST(OrchScheduler, WorkersAreCapped)
+    {
+        TestOrch a, b, c;
+
+        OrchScheduler scheduler(2);
+        scheduler.schedule(&a, "a");
+        scheduler.schedule(&b, "b");
+        scheduler.schedule(&c, "c");
+        scheduler.start();
+
+        EXPECT_EQ(scheduler.getWorkerCount(), 2);
+        EXPECT_EQ(scheduler.getWorker(&a), scheduler.getWorker(&c));
+        EXPECT_NE(scheduler.getWorker(&a), scheduler.getWorker(&b));
+
+        EXPECT_THROW(scheduler.schedule(&a, "a"), std::runtime_error);
+    }
+
+    TEST(OrchScheduler, RunExclusive)
+    {
+        TestOrch fdb, ports, other;
+
+        OrchScheduler scheduler(1);
+        scheduler.schedule(&fdb, "FdbOrch");
+        scheduler.addDependency(&fdb, &ports);
+
+        // Not started yet, tasks run in place
+        bool executed = false;
+        scheduler.runExclusive(&ports, [&](){ executed = true; });
+        EXPECT_TRUE(executed);
+
+        scheduler.start();
+
+        // Holding the workers blocks the orchs depending on them only
+        scheduler.pause();
+
+        executed = false;
+        scheduler.runExclusive(&other, [&](){ executed = true; });
+        EXPECT_TRUE(executed);
+
+        std::atomic<bool> done(false);
+        std::thread t([&](){
+            scheduler.runExclusive(&ports, [&](){ done = true; });
+        });
+
+        std::this_thread::sleep_for(std::chrono::milliseconds(100));
+        EXPECT_FALSE(done);
+
+        scheduler.resume();
+        t.join();
+        EXPECT_TRUE(done);
+
+        scheduler.stop();
+        EXPECT_TRUE(scheduler.isStarted());
+    }
+}
@@ -0,0 +1,144 @@
+#include "pfcwddetector.h"
+#include "gtest/gtest.h"
+
+namespace pfcwddetector_ut
+{
+    using namespace std;
+
+    const sai_object_id_t queueId = 0x15000000000001;
+
+    PfcWdQueueCounters counters(uint64_t packets, uint64_t pfcRxPackets, bool paused)
+    {
+        PfcWdQueueCounters c;
+        c.valid = true;
+        c.packets = packets;
+        c.pfcRxPackets = pfcRxPackets;
+        c.paused = paused;
+        return c;
+    }
+
+    struct PfcWdDetectorTest : public ::testing::Test
+    {
+        PfcWdDetector detector;
+        bool stormed = false;
+        uint64_t now = 0;
+
+        void SetUp() override
+        {
+            detector.setPollInterval(100);
+        }
+
+        vector<PfcWdDetector::Transition> poll(const PfcWdQueueCounters &c)
+        {
+            vector<PfcWdDetector::Transition> transitions;
+            vector<PfcWdDetector::PauseEstimate> estimates;
+
+            now += 100000;
+            detector.update({ c }, { stormed }, now, transitions, estimates);
+            return transitions;
+        }
+    };
+
+    TEST_F(PfcWdDetectorTest, StormAfterDetectionTime)
+    {
+        detector.addQueue(queueId, 200, 0, false, false);
+
+        EXPECT_TRUE(poll(counters(10, 0, true)).empty());
+        EXPECT_TRUE(poll(counters(10, 5, true)).empty());
+
+        auto transitions = poll(counters(10, 10, true));
+        ASSERT_EQ(transitions.size(), 1u);
+        EXPECT_EQ(transitions[0].queueId, queueId);
+        EXPECT_EQ(transitions[0].event, PfcWdDetector::Event::STORM);
+    }
+
+    TEST_F(PfcWdDetectorTest, TrafficRestartsDetection)
+    {
+        detector.addQueue(queueId, 200, 0, false, false);
+
+        poll(counters(10, 0, true));
+        EXPECT_TRUE(poll(counters(10, 5, true)).empty());
+        // PFC frames stopped and the queue resumed
+        EXPECT_TRUE(poll(counters(20, 5, false)).empty());
+        EXPECT_TRUE(poll(counters(20, 10, true)).empty());
+        EXPECT_TRUE(poll(counters(20, 15, true)).empty());
+        EXPECT_EQ(poll(counters(20, 20, true)).size(), 1u);
+    }
+
+    TEST_F(PfcWdDetectorTest, UnchangedCountersHoldDetection)
+    {
+        detector.addQueue(queueId, 200, 0, false, false);
+
+        poll(counters(10, 0, true));
+        EXPECT_TRUE(poll(counters(10, 5, true)).empty());
+        // Not polled again by syncd yet
+        EXPECT_TRUE(poll(counters(10, 5, true)).empty());
+        EXPECT_EQ(poll(counters(10, 10, true)).size(), 1u);
+    }
+
+    TEST_F(PfcWdDetectorTest, RestoreAfterRestorationTime)
+    {
+        detector.addQueue(queueId, 200, 300, false, false);
+
+        poll(counters(10, 0, true));
+        poll(counters(10, 5, true));
+        ASSERT_EQ(poll(counters(10, 10, true)).size(), 1u);
+
+        stormed = true;
+        EXPECT_TRUE(poll(counters(10, 15, true)).empty());
+        EXPECT_TRUE(poll(counters(10, 15, false)).empty());
+        EXPECT_TRUE(poll(counters(10, 15, false)).empty());
+
+        auto transitions = poll(counters(10, 15, false));
+        ASSERT_EQ(transitions.size(), 1u);
+        EXPECT_EQ(transitions[0].event, PfcWdDetector::Event::RESTORE);
+    }
+
+    TEST_F(PfcWdDetectorTest, AlertReportsTransitionsOnly)
+    {
+        detector.addQueue(queueId, 100, 0, true, false);
+
+        poll(counters(10, 0, true));
+        ASSERT_EQ(poll(counters(10, 5, true)).size(), 1u);
+
+        stormed = true;
+        EXPECT_TRUE(poll(counters(10, 10, true)).empty());
+        EXPECT_TRUE(poll(counters(10, 15, true)).empty());
+
+        auto transitions = poll(counters(20, 15, false));
+        ASSERT_EQ(transitions.size(), 1u);
+        EXPECT_EQ(transitions[0].event, PfcWdDetector::Event::RESTORE);
+    }
+
+    TEST_F(PfcWdDetectorTest, RemoveQueue)
+    {
+        const sai_object_id_t otherQueueId = queueId + 1;
+
+        detector.addQueue(queueId, 200, 0, false, false);
+        detector.addQueue(otherQueueId, 200, 0, false, false);
+        detector.removeQueue(queueId);
+
+        ASSERT_EQ(detector.getQueues().size(), 1u);
+        EXPECT_EQ(detector.getQueues()[0], otherQueueId);
+    }
+
+    TEST_F(PfcWdDetectorTest, PauseEstimates)
+    {
+        detector.addQueue(queueId, 1000, 0, false, true);
+
+        vector<PfcWdDetector::Transition> transitions;
+        vector<PfcWdDetector::PauseEstimate> estimates;
+
+        detector.update({ counters(10, 0, false) }, { false }, 1000000, transitions, estimates);
+        detector.update({ counters(10, 5, true) }, { false }, 1100000, transitions, estimates);
+        detector.update({ counters(10, 5, true) }, { false }, 1250000, transitions, estimates);
+        detector.update({ counters(20, 5, false) }, { false }, 1350000, transitions, estimates);
+
+        ASSERT_EQ(estimates.size(), 2u);
+        EXPECT_TRUE(estimates[0].restart);
+        EXPECT_EQ(estimates[0].lastPoll, 1000000u);
+        EXPECT_EQ(estimates[0].pauseTime, 100000u);
+        EXPECT_FALSE(estimates[1].restart);
+        EXPECT_EQ(estimates[1].pauseTime, 150000u);
+    }
+}
@@ -0,0 +1,86 @@
+#include "taskslicer.h"
+
+#include <chrono>
+#include <string>
+#include <thread>
+#include <vector>
+#include <gtest/gtest.h>
+
+namespace taskslicer_test
+{
+    using namespace std;
+
+    const int urgent_pri = 30;
+
+    TEST(TaskSlicer, RunsByPriority)
+    {
+        TaskSlicer<string> slicer(urgent_pri);
+        slicer.add("fdb", 20);
+        slicer.add("route", 5);
+        slicer.add("port", 45);
+        slicer.add("acl", 0);
+        slicer.add("neigh", 30);
+        slicer.add("label_route", 5);
+
+        vector<string> order;
+        EXPECT_EQ(slicer.run(0, [&](string &item){ order.push_back(item); }), 0);
+
+        vector<string> expected = { "port", "neigh", "fdb", "route", "label_route", "acl" };
+        EXPECT_EQ(order, expected);
+        EXPECT_EQ(slicer.getNext(), 0);
+    }
+
+    TEST(TaskSlicer, DefersBulkItems)
+    {
+        TaskSlicer<string> slicer(urgent_pri);
+        slicer.add("port", 45);
+        slicer.add("neigh", 30);
+        slicer.add("route", 5);
+        slicer.add("acl", 0);
+        slicer.add("crm", 0);
+
+        vector<string> order;
+        auto slow = [&](string &item)
+        {
+            order.push_back(item);
+            if (item == "route")
+            {
+                std::this_thread::sleep_for(std::chrono::milliseconds(20));
+            }
+        };
+
+        // Route uses up the slice, the remaining bulk items are deferred
+        EXPECT_EQ(slicer.run(10, slow), 2);
+        vector<string> expected = { "port", "neigh", "route" };
+        EXPECT_EQ(order, expected);
+        EXPECT_EQ(slicer.getNext(), 1);
+
+        // Urgent items still run first, then the pass resumes with the deferred ones
+        order.clear();
+        EXPECT_EQ(slicer.run(10, slow), 0);
+        expected = { "port", "neigh", "acl", "crm", "route" };
+        EXPECT_EQ(order, expected);
+        EXPECT_EQ(slicer.getNext(), 0);
+    }
+
+    TEST(TaskSlicer, UrgentItemsAreNeverDeferred)
+    {
+        TaskSlicer<string> slicer(urgent_pri);
+        slicer.add("port", 45);
+        slicer.add("lag", 44);
+        slicer.add("neigh", 30);
+        slicer.add("route", 5);
+        slicer.add("acl", 0);
+
+        vector<string> order;
+        EXPECT_EQ(slicer.run(1, [&](string &item)
+        {
+            order.push_back(item);
+            std::this_thread::sleep_for(std::chrono::milliseconds(2));
+        }), 1);
+
+        // At least one bulk item runs per pass
+        vector<string> expected = { "port", "lag", "neigh", "route" };
+        EXPECT_EQ(order, expected);
+    }
+}
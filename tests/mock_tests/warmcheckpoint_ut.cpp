@@ -0,0 +1,126 @@
+#include "ut_helper.h"
+#include "mock_orchagent_main.h"
+#include "mock_table.h"
+#include "warmcheckpoint.h"
+
+#include <cstdio>
+#include <unistd.h>
+#include <gtest/gtest.h>
+
+namespace warmcheckpoint_test
+{
+    using namespace std;
+    using namespace swss;
+
+    const string CHECKPOINT_FILE = "warmcheckpoint_ut.bin";
+
+    struct WarmCheckpointTest : public ::testing::Test
+    {
+        shared_ptr<DBConnector> m_app_db;
+        unique_ptr<Consumer> m_consumer;
+
+        void SetUp() override
+        {
+            ::testing_db::reset();
+
+            m_app_db = make_shared<DBConnector>("APPL_DB", 0);
+            m_consumer.reset(new Consumer(
+                new ConsumerStateTable(m_app_db.get(), "TEST_TABLE", 1, 1), nullptr, "TEST_TABLE"));
+        }
+
+        void TearDown() override
+        {
+            ConsumerBase::gWarmStartSnapshot = nullptr;
+            unlink(CHECKPOINT_FILE.c_str());
+            ::testing_db::reset();
+        }
+
+        void writeCheckpoint(const string &name, const vector<KeyOpFieldsValuesTuple> &entries)
+        {
+            WarmCheckpointWriter writer(CHECKPOINT_FILE);
+            ASSERT_TRUE(writer.isOpen());
+            writer.addTable(name, entries);
+            writer.addTable("0:EMPTY_TABLE", {});
+            ASSERT_TRUE(writer.commit());
+        }
+
+        vector<FieldValueTuple> getToSync(const string &key)
+        {
+            auto it = m_consumer->m_toSync.find(key);
+            return it == m_consumer->m_toSync.end() ? vector<FieldValueTuple>() : kfvFieldsValues(it->second);
+        }
+    };
+
+    TEST_F(WarmCheckpointTest, RoundTrip)
+    {
+        vector<KeyOpFieldsValuesTuple> entries;
+        for (int i = 0; i < 100; i++)
+        {
+            entries.emplace_back("10.0." + to_string(i) + ".0/24", SET_COMMAND,
+                vector<FieldValueTuple>{ { "nexthop", "10.1.0." + to_string(i) }, { "ifname", "Ethernet0" } });
+        }
+        writeCheckpoint("0:ROUTE_TABLE", entries);
+
+        WarmCheckpoint checkpoint;
+        ASSERT_TRUE(checkpoint.load(CHECKPOINT_FILE));
+        EXPECT_EQ(checkpoint.getTableCount(), 2u);
+
+        TableSnapshot snapshot;
+        ASSERT_TRUE(checkpoint.getTable("0:ROUTE_TABLE", snapshot));
+        ASSERT_EQ(snapshot.size(), 100u);
+        vector<FieldValueTuple> expected = { { "nexthop", "10.1.0.42" }, { "ifname", "Ethernet0" } };
+        EXPECT_EQ(snapshot["10.0.42.0/24"], expected);
+
+        snapshot.clear();
+        EXPECT_TRUE(checkpoint.getTable("0:EMPTY_TABLE", snapshot));
+        EXPECT_TRUE(snapshot.empty());
+        EXPECT_FALSE(checkpoint.getTable("0:NEIGH_TABLE", snapshot));
+    }
+
+    TEST_F(WarmCheckpointTest, InvalidCheckpointIsRejected)
+    {
+        WarmCheckpoint checkpoint;
+        EXPECT_FALSE(checkpoint.load(CHECKPOINT_FILE));
+
+        writeCheckpoint("0:ROUTE_TABLE", { KeyOpFieldsValuesTuple("key", SET_COMMAND, { { "field", "value" } }) });
+
+        // Corrupted payload
+        FILE *file = fopen(CHECKPOINT_FILE.c_str(), "r+b");
+        ASSERT_NE(file, nullptr);
+        fseek(file, -1, SEEK_END);
+        fputc('x', file);
+        fclose(file);
+        EXPECT_FALSE(checkpoint.load(CHECKPOINT_FILE));
+        EXPECT_EQ(checkpoint.getTableCount(), 0u);
+
+        // Truncated
+        writeCheckpoint("0:ROUTE_TABLE", { KeyOpFieldsValuesTuple("key", SET_COMMAND, { { "field", "value" } }) });
+        ASSERT_EQ(truncate(CHECKPOINT_FILE.c_str(), 30), 0);
+        EXPECT_FALSE(checkpoint.load(CHECKPOINT_FILE));
+    }
+
+    TEST_F(WarmCheckpointTest, RefillDiffsCheckpointAgainstTable)
+    {
+        Table table(m_app_db.get(), "TEST_TABLE");
+        table.set("saved", { { "field", "table" } });
+        table.set("added", { { "field", "added" } });
+
+        writeCheckpoint(m_consumer->getSnapshotName(), {
+            KeyOpFieldsValuesTuple("saved", SET_COMMAND, { { "field", "checkpoint" } }),
+            KeyOpFieldsValuesTuple("deleted", SET_COMMAND, { { "field", "deleted" } }),
+        });
+
+        WarmCheckpoint checkpoint;
+        ASSERT_TRUE(checkpoint.load(CHECKPOINT_FILE));
+        ConsumerBase::gWarmStartSnapshot = &checkpoint;
+
+        EXPECT_EQ(m_consumer->refillToSync(), 2u);
+
+        // Saved entries are taken from the checkpoint, new ones from the table
+        vector<FieldValueTuple> saved = { { "field", "checkpoint" } };
+        vector<FieldValueTuple> added = { { "field", "added" } };
+        EXPECT_EQ(getToSync("saved"), saved);
+        EXPECT_EQ(getToSync("added"), added);
+        EXPECT_EQ(m_consumer->m_toSync.count("deleted"), 0u);
+    }
+}
@@ -339,3 +339,98 @@ TEST(swssrec, signalSafeStatsDumpFormatsOutput)
     EXPECT_NE(output.find("enqueued=1"), string::npos);
     EXPECT_NE(output.find("drained=1"), string::npos);
 }
+
+TEST(swssrec, binaryRecordingConvertsToText)
+{
+    char dir_template[] = "/tmp/swss-recorder-ut-XXXXXX";
+    auto dir = mkdtemp(dir_template);
+    ASSERT_NE(dir, nullptr);
+
+    const string dirname(dir);
+    const string filename = "swss-binary.rec";
+    const string fullpath = dirname + "/" + filename + Recorder::BINARY_SUFFIX;
+    const string prefix = "TEST_TABLE:";
+
+    {
+        SwSSRec recorder;
+        recorder.setRecord(true);
+        recorder.setLocation(dirname);
+        recorder.setFileName(filename);
+        recorder.setBinary(true);
+        recorder.startRec(true);
+
+        deque<KeyOpFieldsValuesTuple> entries;
+        for (int i = 0; i < 1000; i++)
+        {
+            entries.push_back(KeyOpFieldsValuesTuple(
+                { "binary-key-" + to_string(i),
+                  SET_COMMAND,
+                  { { "field1", "value" + to_string(i) }, { "field2", "" } } }));
+        }
+        recorder.recordTuplesAsync(prefix, entries);
+        recorder.recordTupleAsync(prefix, KeyOpFieldsValuesTuple({ "binary-key-0", DEL_COMMAND, {} }));
+    }
+
+    ostringstream out;
+    ASSERT_TRUE(convertBinaryRecording(fullpath, out));
+
+    istringstream in(out.str());
+    vector<string> lines;
+    string line;
+    while (getline(in, line))
+    {
+        lines.push_back(line);
+    }
+
+    ASSERT_EQ(lines.size(), 1002u);
+    EXPECT_NE(lines[0].find(Recorder::REC_START), string::npos);
+    EXPECT_EQ(lines[1].substr(lines[1].find('|')), "|TEST_TABLE:binary-key-0|SET|field1:value0|field2:");
+    EXPECT_EQ(lines[1000].substr(lines[1000].find('|')), "|TEST_TABLE:binary-key-999|SET|field1:value999|field2:");
+    EXPECT_EQ(lines[1001].substr(lines[1001].find('|')), "|TEST_TABLE:binary-key-0|DEL");
+
+    ASSERT_EQ(remove(fullpath.c_str()), 0);
+    ASSERT_EQ(rmdir(dirname.c_str()), 0);
+}
+
+TEST(swssrec, binaryRecordingDropsPastMemoryBudget)
+{
+    char dir_template[] = "/tmp/swss-recorder-ut-XXXXXX";
+    auto dir = mkdtemp(dir_template);
+    ASSERT_NE(dir, nullptr);
+
+    const string dirname(dir);
+    const string fullpath = dirname + "/swss-budget.rec.bin";
+
+    {
+        BinRecWriter writer(1);
+        ASSERT_TRUE(writer.open(fullpath));
+
+        struct timeval tv;
+        gettimeofday(&tv, nullptr);
+        KeyOpFieldsValuesTuple tuple({ "budget-key", SET_COMMAND, { { "field1", "value1" } } });
+        for (int i = 0; i < 3; i++)
+        {
+            EXPECT_FALSE(writer.recordTuple(tv, "TEST_TABLE:", tuple));
+        }
+
+        writer.close();
+        auto stats = writer.getStats();
+        EXPECT_EQ(stats.written_total, 0u);
+        EXPECT_EQ(stats.dropped_total, 3u);
+        EXPECT_EQ(stats.queued_bytes, 0u);
+    }
+
+    ostringstream out;
+    ASSERT_TRUE(convertBinaryRecording(fullpath, out));
+    EXPECT_NE(out.str().find("|recorder dropped 3 records"), string::npos);
+    EXPECT_EQ(out.str().find("budget-key"), string::npos);
+
+    // A text recording is not converted
+    ofstream text(fullpath);
+    text << "2026-03-25.17:13:05.185522|recording started" << endl;
+    text.close();
+    EXPECT_FALSE(convertBinaryRecording(fullpath, out));
+
+    ASSERT_EQ(remove(fullpath.c_str()), 0);
+    ASSERT_EQ(rmdir(dirname.c_str()), 0);
+}
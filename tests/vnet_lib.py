@@ -482,13 +482,8 @@ def update_monitor_session_state(dvs, addr, monitor, state):
     )
 
 def get_bfd_session_id(dvs, addr):
-    asic_db = swsscommon.DBConnector(swsscommon.ASIC_DB, dvs.redis_sock, 0)
-    tbl =  swsscommon.Table(asic_db, "ASIC_STATE:SAI_OBJECT_TYPE_BFD_SESSION")
-    entries = set(tbl.getKeys())
-    for entry in entries:
-        status, fvs = tbl.get(entry)
-        fvs = dict(fvs)
-        assert status, "Got an error when get a key"
+    entries = dvs.get_asic_db().get_table_snapshot("ASIC_STATE:SAI_OBJECT_TYPE_BFD_SESSION")
+    for entry, fvs in entries.items():
         if fvs["SAI_BFD_SESSION_ATTR_DST_IP_ADDRESS"] == addr and fvs["SAI_BFD_SESSION_ATTR_MULTIHOP"] == "true":
             return entry
 
@@ -1119,52 +1114,45 @@ class VnetVxlanVrfTunnel(object):
     def check_next_hop_group_member(self, dvs, nhg, ordered_ecmp, expected_endpoint, expected_attrs):
         expected_endpoint_str = self.serialize_endpoint_group(expected_endpoint)
         asic_db = swsscommon.DBConnector(swsscommon.ASIC_DB, dvs.redis_sock, 0)
-        tbl_nhgm =  swsscommon.Table(asic_db, self.ASIC_NEXT_HOP_GROUP_MEMBER)
-        tbl_nh =  swsscommon.Table(asic_db, self.ASIC_NEXT_HOP)
-        entries = set(tbl_nhgm.getKeys())
+        members = self.get_nexthop_group_members(dvs, nhg)
         endpoints = []
-        for entry in entries:
-            status, fvs = tbl_nhgm.get(entry)
-            fvs = dict(fvs)
-            assert status, "Got an error when get a key"
-            if fvs["SAI_NEXT_HOP_GROUP_MEMBER_ATTR_NEXT_HOP_GROUP_ID"] == nhg:
-                nh_key = fvs["SAI_NEXT_HOP_GROUP_MEMBER_ATTR_NEXT_HOP_ID"]
-                status, nh_fvs = tbl_nh.get(nh_key)
-                nh_fvs = dict(nh_fvs)
-                assert status, "Got an error when get a key"
-                endpoint = nh_fvs["SAI_NEXT_HOP_ATTR_IP"]
-                endpoints.append(endpoint)
-                assert endpoint in expected_attrs
-                if ordered_ecmp == "true":
-                    assert fvs["SAI_NEXT_HOP_GROUP_MEMBER_ATTR_SEQUENCE_ID"] == expected_attrs[endpoint]['SAI_NEXT_HOP_GROUP_MEMBER_ATTR_SEQUENCE_ID']
-                    del expected_attrs[endpoint]['SAI_NEXT_HOP_GROUP_MEMBER_ATTR_SEQUENCE_ID']
-                else:
-                    assert fvs.get("SAI_NEXT_HOP_GROUP_MEMBER_ATTR_SEQUENCE_ID") is None
+        for fvs, nh_fvs in members:
+            nh_key = fvs["SAI_NEXT_HOP_GROUP_MEMBER_ATTR_NEXT_HOP_ID"]
+            endpoint = nh_fvs["SAI_NEXT_HOP_ATTR_IP"]
+            endpoints.append(endpoint)
+            assert endpoint in expected_attrs
+            if ordered_ecmp == "true":
+                assert fvs["SAI_NEXT_HOP_GROUP_MEMBER_ATTR_SEQUENCE_ID"] == expected_attrs[endpoint]['SAI_NEXT_HOP_GROUP_MEMBER_ATTR_SEQUENCE_ID']
+                del expected_attrs[endpoint]['SAI_NEXT_HOP_GROUP_MEMBER_ATTR_SEQUENCE_ID']
+            else:
+                assert fvs.get("SAI_NEXT_HOP_GROUP_MEMBER_ATTR_SEQUENCE_ID") is None
 
-                check_object(asic_db, self.ASIC_NEXT_HOP, nh_key, expected_attrs[endpoint])
+            check_object(asic_db, self.ASIC_NEXT_HOP, nh_key, expected_attrs[endpoint])
 
         assert self.serialize_endpoint_group(endpoints) == expected_endpoint_str
 
     def get_nexthop_groups(self, dvs, nhg):
-        asic_db = swsscommon.DBConnector(swsscommon.ASIC_DB, dvs.redis_sock, 0)
-        tbl_nhgm =  swsscommon.Table(asic_db, self.ASIC_NEXT_HOP_GROUP_MEMBER)
-        tbl_nh =  swsscommon.Table(asic_db, self.ASIC_NEXT_HOP)
         nhg_data = {}
         nhg_data['id'] = nhg
-        entries = set(tbl_nhgm.getKeys())
         nhg_data['endpoints'] = []
-        for entry in entries:
-            status, fvs = tbl_nhgm.get(entry)
-            fvs = dict(fvs)
-            assert status, "Got an error when get a key"
-            if fvs["SAI_NEXT_HOP_GROUP_MEMBER_ATTR_NEXT_HOP_GROUP_ID"] == nhg:
-                nh_key = fvs["SAI_NEXT_HOP_GROUP_MEMBER_ATTR_NEXT_HOP_ID"]
-                status, nh_fvs = tbl_nh.get(nh_key)
-                nh_fvs = dict(nh_fvs)
-                assert status, "Got an error when get a key"
-                endpoint = nh_fvs["SAI_NEXT_HOP_ATTR_IP"]
-                nhg_data['endpoints'].append(endpoint)
+        for _, nh_fvs in self.get_nexthop_group_members(dvs, nhg):
+            nhg_data['endpoints'].append(nh_fvs["SAI_NEXT_HOP_ATTR_IP"])
         return nhg_data
+
+    def get_nexthop_group_members(self, dvs, nhg):
+        asic_db = dvs.get_asic_db()
+        nhgms = asic_db.get_table_snapshot(self.ASIC_NEXT_HOP_GROUP_MEMBER)
+        nhgms = [fvs for fvs in nhgms.values()
+                 if fvs["SAI_NEXT_HOP_GROUP_MEMBER_ATTR_NEXT_HOP_GROUP_ID"] == nhg]
+        nhs = asic_db.get_entries(self.ASIC_NEXT_HOP,
+                                  [fvs["SAI_NEXT_HOP_GROUP_MEMBER_ATTR_NEXT_HOP_ID"] for fvs in nhgms])
+        members = []
+        for fvs in nhgms:
+            nh_fvs = nhs[fvs["SAI_NEXT_HOP_GROUP_MEMBER_ATTR_NEXT_HOP_ID"]]
+            assert nh_fvs, "Got an error when get a key"
+            members.append((fvs, nh_fvs))
+        return members
+
     def check_vnet_ecmp_routes(self, dvs, name, endpoints, tunnel, mac=[], vni=[], route_ids=[], nhg="", ordered_ecmp="false", nh_seq_id=None):
         asic_db = swsscommon.DBConnector(swsscommon.ASIC_DB, dvs.redis_sock, 0)
         endpoint_str = name + "|" + self.serialize_endpoint_group(endpoints)